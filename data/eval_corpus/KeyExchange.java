@@ -0,0 +1,16 @@
+import java.security.KeyPair;
+import java.security.KeyPairGenerator;
+import javax.crypto.KeyAgreement;
+
+public class KeyExchange {
+    public static byte[] agree(java.security.PublicKey peer) throws Exception {
+        KeyPairGenerator generator = KeyPairGenerator.getInstance("DH");
+        generator.initialize(2048);
+        KeyPair pair = generator.generateKeyPair();
+
+        KeyAgreement agreement = KeyAgreement.getInstance("DH");
+        agreement.init(pair.getPrivate());
+        agreement.doPhase(peer, true);
+        return agreement.generateSecret();
+    }
+}
@@ -0,0 +1,22 @@
+"""파일 무결성 확인과 경로 정리를 위한 유틸리티 (공개키 암호 없음)"""
+
+import hashlib
+import os
+
+
+def file_digest(path: str, chunk_size: int = 65536) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize(path: str) -> str:
+    return os.path.normpath(os.path.expanduser(path))
+
+
+def traverse(root: str):
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            yield os.path.join(dirpath, name)
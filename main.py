@@ -1,12 +1,24 @@
 # File: main.py
 # 🚀 PQC Inspector 애플리케이션을 시작하기 위한 최상위 진입점(Entrypoint) 파일입니다.
-# 이 파일을 직접 실행하면 웹 서버가 구동됩니다.
+# 이 파일을 직접 실행하면 웹 서버가 구동되고, `python main.py worker`로 실행하면 분산 워커가 구동됩니다.
 
+import argparse
+import asyncio
+import logging
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.core.logging_config import setup_logging
+from pqc_inspector_server.core.telemetry import registry
 from pqc_inspector_server.api.endpoints import api_router
 
+# 0. 로깅 설정
+# 모든 로그는 큐 기반 핸들러를 거쳐 별도 스레드에서 출력되므로 이벤트 루프를 막지 않습니다.
+# 레벨과 형식은 LOG_LEVEL, LOG_FORMAT 설정을 따릅니다.
+setup_logging()
+logger = logging.getLogger("pqc_inspector")
+
 # 1. FastAPI 애플리케이션 객체 생성
 # 이 'app' 객체가 전체 웹 애플리케이션의 중심이 됩니다.
 app = FastAPI(
@@ -24,6 +36,14 @@ def read_root():
     return {"message": "PQC Inspector 서버가 정상적으로 실행 중입니다!"}
 
 
+# Prometheus가 수집(scrape)하는 지표 엔드포인트입니다.
+# 단계별 처리 시간, 에이전트/모델별 지연, 토큰 사용량, 캐시 적중률, 오류 유형별 실패 수를 노출합니다.
+@app.get("/metrics", tags=["Status"], response_class=PlainTextResponse)
+def read_metrics():
+    """Prometheus 텍스트 형식의 지표를 반환합니다."""
+    return PlainTextResponse(registry.render_prometheus(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # 3. API 라우터(Router) 등록
 # pqc_inspector_server/api/endpoints.py 파일에 정의된 모든 API 경로들을
 # '/api/v1' 이라는 접두사(prefix)와 함께 애플리케이션에 포함시킵니다.
@@ -33,16 +53,28 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 
 # 4. 서버 실행을 위한 메인 블록
 # 'python main.py' 명령어로 이 파일을 직접 실행했을 때만 아래 코드가 동작합니다.
+# 'python main.py worker'는 웹 서버 대신 작업 대기열(JOB_QUEUE_PATH)을 처리하는 워커를 실행합니다.
 if __name__ == "__main__":
-    print("PQC Inspector 서버를 시작합니다.")
-    print(f"API 문서(Swagger UI): http://127.0.0.1:{settings.SERVER_PORT}/docs")
-    
-    # Uvicorn을 사용하여 FastAPI 앱을 실행합니다.
-    uvicorn.run(
-        "main:app",                      # 실행할 대상: 'main.py' 파일의 'app' 객체
-        host=settings.SERVER_HOST,       # 서버 호스트 주소 (e.g., "127.0.0.1")
-        port=settings.SERVER_PORT,       # 서버 포트 번호 (e.g., 8000)
-        reload=True                      # 소스 코드가 변경될 때마다 서버를 자동으로 재시작합니다.
-    )
-
-      
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="PQC Inspector 서버")
+    parser.add_argument("role", nargs="?", choices=["server", "worker"], default="server",
+                        help="server: API 서버 (기본값), worker: 작업 대기열 워커")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="워커가 동시에 처리하는 작업 수 (기본값: WORKER_CONCURRENCY)")
+    args = parser.parse_args()
+
+    if args.role == "worker":
+        from pqc_inspector_server.orchestrator.worker import run_worker
+
+        asyncio.run(run_worker(args.concurrency))
+    else:
+        logger.info("PQC Inspector 서버를 시작합니다.")
+        logger.info(f"API 문서(Swagger UI): http://127.0.0.1:{settings.SERVER_PORT}/docs")
+
+        # Uvicorn을 사용하여 FastAPI 앱을 실행합니다.
+        uvicorn.run(
+            "main:app",                      # 실행할 대상: 'main.py' 파일의 'app' 객체
+            host=settings.SERVER_HOST,       # 서버 호스트 주소 (e.g., "127.0.0.1")
+            port=settings.SERVER_PORT,       # 서버 포트 번호 (e.g., 8000)
+            reload=True,                     # 소스 코드가 변경될 때마다 서버를 자동으로 재시작합니다.
+            log_config=None                  # uvicorn 로그도 애플리케이션의 큐 기반 로깅 설정을 따릅니다.
+        )
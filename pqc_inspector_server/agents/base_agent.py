@@ -1,29 +1,40 @@
 # File: pqc_inspector_server/agents/base_agent.py
 # 🤖 모든 전문 분석 에이전트들이 상속받을 추상 기본 클래스입니다.
 
+import asyncio
+import json
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from ..services.ollama_service import OllamaService, get_ollama_service
+from ..services.chunking import group_chunks, scored_chunks
+from ..services.prompt_budget import PromptBudget, get_prompt_budget
+from ..services.result_cache import ChunkResultCache, get_chunk_cache
 from ..api.schemas import AgentAnalysisResult
+from ..core.config import settings
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_cache
+
+logger = logging.getLogger(__name__)
 
 class BaseAgent(ABC):
     """
     모든 에이전트의 기본이 되는 추상 클래스입니다.
     모든 에이전트는 'analyze' 메소드를 반드시 구현해야 합니다.
     """
-    
+
     def __init__(self, model_name: str):
         self.model_name = model_name
         self.ollama_service = get_ollama_service()
         self.system_prompt = self._get_system_prompt()
-    
+
     @abstractmethod
     def _get_system_prompt(self) -> str:
         """
         각 에이전트별 시스템 프롬프트를 반환합니다.
         """
         pass
-    
+
     @abstractmethod
     async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
         """
@@ -37,17 +48,127 @@ class BaseAgent(ABC):
             Dict[str, Any]: AgentAnalysisResult 스키마와 호환되는 분석 결과
         """
         pass
-    
+
+    @abstractmethod
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        """
+        내용 창(window) 하나에 대한 분석 프롬프트를 만듭니다. _analyze_text가 창마다 호출합니다.
+        """
+        pass
+
     async def _call_llm(self, prompt: str) -> Dict[str, Any]:
         """
         Ollama 모델을 호출하고 응답을 받습니다.
         """
+        budget = await get_prompt_budget(self.model_name)
         return await self.ollama_service.generate_response(
             model=self.model_name,
             prompt=prompt,
-            system_prompt=self.system_prompt
+            system_prompt=self.system_prompt,
+            prompt_tokens=budget.count(self.system_prompt) + budget.count(prompt)
         )
-    
+
+    async def _analyze_text(self, content_text: str, file_name: str) -> Dict[str, Any]:
+        """
+        텍스트를 하나 이상의 창으로 만들어 LLM으로 분석하고 결과를 병합합니다.
+        창 크기는 모델 토크나이저로 센 토큰 수로 정하며, 시스템 프롬프트와 프롬프트 틀을 뺀 컨텍스트를 채웁니다.
+        CHUNK_CACHE_ENABLED면 같은 내용의 창은 이전 분석 결과를 쓰고, 캐시에 없는 창 중 관련도가 높은 순으로
+        최대 AGENT_MAX_CHUNKS개만 LLM에 보냅니다.
+        """
+        budget = await get_prompt_budget(self.model_name)
+        limit = budget.available(self.system_prompt, self._build_prompt(file_name, ""))
+        if settings.AGENT_MAX_CONTENT_TOKENS > 0:
+            limit = min(limit, settings.AGENT_MAX_CONTENT_TOKENS)
+        windows, scores = await self._content_windows(content_text, budget, limit)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(windows)
+        cache, keys = None, []
+        if settings.CHUNK_CACHE_ENABLED:
+            cache = get_chunk_cache(settings.CHUNK_CACHE_SIZE)
+            keys = [ChunkResultCache.key(type(self).__name__, self.model_name, file_name, window) for window in windows]
+            results = [cache.get(key) for key in keys]
+            for result in results:
+                record_cache("chunk", result is not None)
+        misses = [index for index, result in enumerate(results) if result is None]
+        # AGENT_MAX_CHUNKS가 0 이하여도 창 하나는 분석합니다.
+        pending = sorted(sorted(misses, key=lambda index: -scores[index])[:max(1, settings.AGENT_MAX_CHUNKS)])
+
+        llm_responses = await asyncio.gather(
+            *(self._call_llm(self._build_prompt(file_name, windows[index])) for index in pending)
+        )
+        for index, response in zip(pending, llm_responses):
+            results[index] = self._parse_llm_response(response, file_name)
+            # 실패한 결과(신뢰도 0)는 다음 스캔에서 다시 분석하도록 캐시하지 않습니다.
+            if cache is not None and (results[index].get("confidence_score") or 0) > 0:
+                cache.put(keys[index], results[index])
+        analyzed = [result for result in results if result is not None]
+        if not analyzed:
+            return self._get_default_result(file_name, "분석한 창 없음")
+        return merge_agent_results(analyzed)
+
+    async def _content_windows(self, content_text: str, budget: PromptBudget, limit: int) -> Tuple[List[str], List[int]]:
+        """
+        분석할 내용 창 목록과 창별 관련도 점수를 반환합니다.
+        파일을 AGENT_MAX_CONTENT_CHARS 글자 이하의 내용 기반 청크로 나누고 청크마다 암호 관련도를 매깁니다.
+        - 파일 전체가 limit 토큰에 들어가면 원문 그대로 창 하나입니다.
+        - AGENT_CHUNKING_ENABLED면 청크마다 창 하나입니다.
+        - CHUNK_CACHE_ENABLED면 이어지는 청크들을 내용 기반 경계로 묶어 limit 토큰 이하의 창 여러 개를 만듭니다.
+          관련도로 골라 한 창에 모으면 어느 청크를 고쳐도 그 창 전체가 바뀌어 캐시가 맞지 않기 때문입니다.
+        - 둘 다 꺼져 있으면 관련도가 높은 청크부터 limit 토큰이 찰 때까지 골라 창 하나로 모읍니다.
+        """
+        chunks = await run_cpu_bound("prompt_chunks", scored_chunks, content_text.encode("utf-8", errors="replace"),
+                                     settings.AGENT_MAX_CONTENT_CHARS)
+        texts = [chunk for chunk, _ in chunks]
+        scores = [score for _, score in chunks]
+        if len(chunks) <= 1:
+            return [budget.fit("".join(texts), limit)], [max(scores, default=0)]
+        if settings.AGENT_CHUNKING_ENABLED:
+            return [budget.fit(text, limit) for text in texts], scores
+        sizes = [budget.count(text) for text in texts]
+        if sum(sizes) <= limit or not settings.CHUNK_CACHE_ENABLED:
+            return [budget.pack(texts, limit, scores)], [max(scores)]
+        # 창 크기의 절반쯤에서 닫히도록 평균 청크 토큰 수(청크 평균 max_chars // 2 글자, 토큰당 4글자로 어림)로 나눕니다.
+        # 설정에만 의존하므로 재스캔해도 경계가 그대로입니다.
+        every = (limit // 2) // max(1, settings.AGENT_MAX_CONTENT_CHARS // 8)
+        groups = group_chunks(texts, sizes, limit, every)
+        # 창이 limit을 넘는 경우는 limit보다 큰 청크 하나뿐입니다.
+        return ([budget.fit(texts[group[0]], limit) if sizes[group[0]] > limit else "".join(texts[index] for index in group)
+                 for group in groups],
+                [max(scores[index] for index in group) for group in groups])
+
+    def _parse_llm_response(self, llm_response: Dict[str, Any], file_name: str) -> Dict[str, Any]:
+        """
+        LLM 응답에서 JSON 결과를 추출합니다. 실패하면 기본 결과를 반환합니다.
+        """
+        if not llm_response.get("success"):
+            logger.warning("LLM 호출 실패", extra={"error": llm_response.get("error")})
+            return self._get_default_result(file_name, "LLM 호출 실패")
+
+        try:
+            response_text = llm_response["content"]
+            json_start = response_text.find('{')
+            json_end = response_text.rfind('}') + 1
+
+            if json_start >= 0 and json_end > json_start:
+                json_text = response_text[json_start:json_end]
+                return json.loads(json_text)
+            else:
+                raise ValueError("JSON 형식을 찾을 수 없음")
+
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning("LLM 응답 파싱 오류", extra={"error": str(e)})
+            return self._get_default_result(file_name, "LLM 응답 파싱 실패")
+
+    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
+        """기본/오류 결과를 반환합니다."""
+        return {
+            "is_pqc_vulnerable": False,
+            "vulnerability_details": f"분석 불가: {error_detail}",
+            "detected_algorithms": [],
+            "recommendations": "수동 검토 필요",
+            "evidence": f"파일: {file_name}",
+            "confidence_score": 0.0
+        }
+
     def _parse_file_content(self, file_content: bytes) -> str:
         """
         바이트 파일 내용을 텍스트로 변환합니다.
@@ -59,3 +180,43 @@ class BaseAgent(ABC):
                 return file_content.decode('latin-1')
             except UnicodeDecodeError:
                 return str(file_content)  # 바이너리 파일의 경우
+
+
+def merge_agent_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    여러 창(청크)의 분석 결과를 하나로 합칩니다.
+    하나라도 취약하면 취약으로 판정하고, 알고리즘/근거는 순서를 유지하며 합치고, 신뢰도는 최댓값을 사용합니다.
+    results는 비어 있지 않아야 합니다.
+    """
+    if not results:
+        raise ValueError("병합할 분석 결과가 없습니다")
+    if len(results) == 1:
+        return results[0]
+
+    # 분석에 성공한 결과(신뢰도 > 0)만 병합하고, 모두 실패했다면 첫 번째 결과를 그대로 반환합니다.
+    analyzed = [r for r in results if (r.get("confidence_score") or 0) > 0] or results[:1]
+    vulnerable = [r for r in analyzed if r.get("is_pqc_vulnerable")]
+    primary = vulnerable or analyzed
+
+    def _join(key: str) -> str:
+        seen = []
+        for r in primary:
+            value = r.get(key)
+            if value and value not in seen:
+                seen.append(str(value))
+        return "\n".join(seen)
+
+    algorithms: List[str] = []
+    for r in primary:
+        for algorithm in r.get("detected_algorithms") or []:
+            if algorithm not in algorithms:
+                algorithms.append(algorithm)
+
+    return {
+        "is_pqc_vulnerable": bool(vulnerable),
+        "vulnerability_details": _join("vulnerability_details"),
+        "detected_algorithms": algorithms,
+        "recommendations": next((r.get("recommendations") for r in primary if r.get("recommendations")), None),
+        "evidence": _join("evidence"),
+        "confidence_score": max((r.get("confidence_score") or 0.0) for r in primary),
+    }
@@ -1,15 +1,23 @@
 # File: pqc_inspector_server/agents/binary.py
 # 🔧 바이너리 파일 분석을 담당하는 전문 에이전트입니다.
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, merge_agent_results
 from typing import Dict, Any
 from ..core.config import settings
-import json
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_rule_decision
+from ..scanners.carving import carve
+from ..scanners.findings import findings_to_result
+from ..scanners.jvm import is_class_file, is_jvm_archive, scan_jvm_content
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
 
 class BinaryAgent(BaseAgent):
     def __init__(self):
         super().__init__(settings.BINARY_MODEL)
-        print("BinaryAgent가 초기화되었습니다.")
+        logger.debug("BinaryAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
         return """당신은 바이너리 파일에서 비양자내성암호(Non-PQC) 사용을 탐지하는 전문 보안 분석가입니다.
@@ -30,48 +38,70 @@ class BinaryAgent(BaseAgent):
 }"""
 
     async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
-        print(f"BinaryAgent: '{file_name}' 파일 분석 중...")
+        logger.debug("BinaryAgent 분석 시작", extra={"file_name": file_name})
         
         try:
+            # JVM 클래스/JAR은 상수 풀과 바이트코드에서 암호 API 호출을 직접 복원합니다.
+            if is_class_file(file_content) or is_jvm_archive(file_name, file_content):
+                result = await self._analyze_jvm(file_content, file_name)
+                if result is not None:
+                    return result
+
             # 바이너리 파일의 경우 헥스 덤프 또는 문자열 추출
             content_text = self._extract_strings_from_binary(file_content)
-            
-            prompt = f"""다음 바이너리 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
+            carved = await run_cpu_bound("binary", carve, file_content, file_name)
+            if not carved.objects:
+                record_rule_decision("binary", "text")
+                return await self._analyze_text(content_text, file_name)
+
+            # 문자열로는 보이지 않는 임베디드 인증서/키는 카빙 결과로 확정하고, 라이브러리 문자열은 LLM 결과와 병합합니다.
+            record_rule_decision("binary", "partial")
+            rule_result = findings_to_result(carved.scan.findings, f"바이너리 카빙(키/인증서 {len(carved.objects)}개)")
+            rule_result["evidence"] = "\n".join(filter(None, ["\n".join(carved.summary() + carved.scan.notes[:5]),
+                                                               rule_result["evidence"]]))
+            logger.info("바이너리 카빙 완료", extra={
+                "file_name": file_name, "candidates": carved.candidates, "objects": len(carved.objects),
+                "high_entropy_regions": len(carved.high_entropy),
+            })
+            llm_result = await self._analyze_text(content_text, file_name)
+            return merge_agent_results([rule_result, llm_result])
+
+        except Exception as e:
+            logger.exception("BinaryAgent 분석 중 오류")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    async def _analyze_jvm(self, file_content: bytes, file_name: str):
+        """JVM 바이트코드 분석 결과를 반환합니다. 클래스가 하나도 없으면 None (일반 바이너리로 분석)."""
+        # CPU 작업이므로 이벤트 루프 밖에서 실행합니다. 클래스가 많으면 내부에서 프로세스 풀로 나눕니다.
+        scan = await asyncio.to_thread(scan_jvm_content, file_content, file_name, settings.JVM_SCAN_WORKERS)
+        if scan.classes == 0:
+            return None
+        record_rule_decision("binary", "rules")
+
+        result = findings_to_result(scan.findings, f"JVM 바이트코드 분석(클래스 {scan.classes}개)")
+        if not result["is_pqc_vulnerable"] and scan.dynamic:
+            # 알고리즘 이름을 실행 시점에 정하는 호출은 정적으로 판정할 수 없습니다.
+            result["vulnerability_details"] += f" 단, 알고리즘 인자가 상수가 아닌 호출 {len(scan.dynamic)}건은 확인하지 못했습니다."
+            result["confidence_score"] = 0.6
+        result["evidence"] = "\n".join(filter(None, ["\n".join(scan.summary() + scan.notes[:5]), result["evidence"]]))
+        result["orchestrator_summary"] = "결정적 바이트코드 분석 결과 (LLM 검증 생략)"
+        logger.info("JVM 바이트코드 분석 완료", extra={
+            "file_name": file_name, "classes": scan.classes, "archives": scan.archives,
+            "findings": len(scan.findings), "dynamic_calls": len(scan.dynamic),
+        })
+        return result
+
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        return f"""다음 바이너리 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
 
 파일명: {file_name}
 추출된 문자열:
 ```
-{content_text[:1500]}  # 처음 1500자만 분석
+{content_window}
 ```
 
 JSON 형식으로만 응답해주세요."""
 
-            llm_response = await self._call_llm(prompt)
-            
-            if llm_response.get("success"):
-                try:
-                    response_text = llm_response["content"]
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        result = json.loads(json_text)
-                        return result
-                    else:
-                        raise ValueError("JSON 형식을 찾을 수 없음")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"LLM 응답 파싱 오류: {e}")
-                    return self._get_default_result(file_name, "LLM 응답 파싱 실패")
-            else:
-                print(f"LLM 호출 실패: {llm_response.get('error')}")
-                return self._get_default_result(file_name, "LLM 호출 실패")
-                
-        except Exception as e:
-            print(f"BinaryAgent 분석 중 오류: {e}")
-            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
-
     def _extract_strings_from_binary(self, file_content: bytes) -> str:
         """바이너리에서 의미있는 문자열을 추출합니다."""
         try:
@@ -94,14 +124,3 @@ JSON 형식으로만 응답해주세요."""
             
         except Exception as e:
             return f"문자열 추출 실패: {str(e)}"
-
-    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
-        """기본/오류 결과를 반환합니다."""
-        return {
-            "is_pqc_vulnerable": False,
-            "vulnerability_details": f"분석 불가: {error_detail}",
-            "detected_algorithms": [],
-            "recommendations": "수동 검토 필요",
-            "evidence": f"파일: {file_name}",
-            "confidence_score": 0.0
-        }
@@ -0,0 +1,78 @@
+# File: pqc_inspector_server/agents/certificate.py
+# 📜 인증서, 키, 키스토어(PEM/DER, PKCS#7, PKCS#12, JKS, OpenSSH 키) 분석을 담당하는 전문 에이전트입니다.
+
+from .base_agent import BaseAgent
+from typing import Dict, Any
+from ..core.config import settings
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_rule_decision
+from ..scanners.certificates import scan_key_material
+from ..scanners.findings import findings_to_result
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CertificateAgent(BaseAgent):
+    def __init__(self):
+        super().__init__(settings.CERTIFICATE_MODEL)
+        logger.debug("CertificateAgent가 초기화되었습니다.")
+
+    def _get_system_prompt(self) -> str:
+        return """당신은 인증서와 키 파일에서 비양자내성암호(Non-PQC) 사용을 탐지하는 전문 보안 분석가입니다.
+
+주요 탐지 대상:
+- X.509 인증서의 공개키 알고리즘과 서명 알고리즘 (RSA, ECDSA, Ed25519 등)
+- 개인키/공개키 파일의 알고리즘과 키 크기
+- 키스토어(PKCS#12, JKS)에 포함된 인증서 체인
+
+응답 형식 (JSON만 반환):
+{
+    "is_pqc_vulnerable": true/false,
+    "vulnerability_details": "발견된 취약점 설명",
+    "detected_algorithms": ["RSA", "ECDSA"],
+    "recommendations": "PQC 전환 권장사항",
+    "evidence": "관련 인증서/키 정보",
+    "confidence_score": 0.0-1.0
+}"""
+
+    async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+        logger.debug("CertificateAgent 분석 시작", extra={"file_name": file_name})
+
+        try:
+            # 1. ASN.1 구조를 직접 파싱합니다. 해석할 수 없는 파일만 원문 텍스트를 LLM으로 분석합니다.
+            scan = await run_cpu_bound("certificate", scan_key_material, file_content, file_name)
+            if scan is None or not (scan.objects or scan.notes):
+                record_rule_decision("certificate", "text")
+                content_text = self._parse_file_content(file_content)
+                return await self._analyze_text(content_text, file_name)
+
+            # 2. 객체마다 키/서명 알고리즘이 확정되므로 LLM 분석과 검증을 모두 생략합니다.
+            #    암호화된 키처럼 알고리즘을 알 수 없는 항목은 근거에 메모로 남깁니다.
+            record_rule_decision("certificate", "rules")
+            result = findings_to_result(scan.findings, f"인증서/키 분석({scan.format}, 객체 {len(scan.objects)}개)")
+            if not result["is_pqc_vulnerable"] and scan.notes:
+                # 암호화된 키스토어 등 내용을 확인하지 못한 항목이 있으면 '안전'으로 단정하지 않습니다.
+                result["vulnerability_details"] += " 단, 암호화되었거나 해석하지 못한 항목이 있어 판정이 불완전합니다."
+                result["confidence_score"] = 0.5
+            summary = scan.summary() + scan.notes[:10]
+            result["evidence"] = "\n".join(filter(None, ["\n".join(summary), result["evidence"]]))
+            result["orchestrator_summary"] = "결정적 인증서/키 분석 결과 (LLM 검증 생략)"
+            logger.info("인증서/키 규칙 분석 완료", extra={
+                "file_name": file_name, "format": scan.format, "objects": len(scan.objects), "notes": len(scan.notes),
+            })
+            return result
+
+        except Exception as e:
+            logger.exception("CertificateAgent 분석 중 오류")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        return f"""다음 인증서/키 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
+
+파일명: {file_name}
+내용:
+```
+{content_window}
+```
+
+JSON 형식으로만 응답해주세요."""
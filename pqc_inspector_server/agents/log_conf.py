@@ -1,15 +1,24 @@
 # File: pqc_inspector_server/agents/log_conf.py
 # 📜 로그 및 기타 설정 파일 분석을 담당하는 전문 에이전트입니다.
 
-from .base_agent import BaseAgent
-from typing import Dict, Any
+from .base_agent import BaseAgent, merge_agent_results
+from typing import Dict, Any, Optional
 from ..core.config import settings
-import json
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_rule_decision
+from ..scanners.findings import findings_to_result
+from ..scanners.log_stream import scan_with_templates
+from ..scanners.server_config import detect_dialect, scan_server_config_blob
+from ..services.ollama_service import DEFAULT_NUM_CTX
+from ..services.prompt_budget import get_prompt_budget
+import logging
+
+logger = logging.getLogger(__name__)
 
 class LogConfAgent(BaseAgent):
     def __init__(self):
         super().__init__(settings.LOG_CONF_MODEL)
-        print("LogConfAgent가 초기화되었습니다.")
+        logger.debug("LogConfAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
         return """당신은 로그 파일과 설정 파일에서 비양자내성암호(Non-PQC) 사용을 탐지하는 전문 보안 분석가입니다.
@@ -31,54 +40,118 @@ class LogConfAgent(BaseAgent):
 }"""
 
     async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
-        print(f"LogConfAgent: '{file_name}' 파일 분석 중...")
+        logger.debug("LogConfAgent 분석 시작", extra={"file_name": file_name})
         
         try:
-            content_text = self._parse_file_content(file_content)
-            
-            prompt = f"""다음 로그/설정 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
+            # 0. nginx/Apache/HAProxy/sshd/OpenSSL 설정 파일은 지시어 단위로 파싱해 모델 호출 없이 판정합니다.
+            if detect_dialect(file_name, file_content):
+                result = await self.analyze_server_configs({file_name: file_content})
+                if result is not None:
+                    return result
+
+            # 1. 전체 내용을 디코딩하지 않고 스트리밍으로 훑어 암호 관련 값을 집계하고,
+            #    같은 패스에서 줄들을 템플릿으로 묶어 반복을 제거합니다.
+            scanner = await run_cpu_bound("log_conf", scan_with_templates, file_content)
+            miner = scanner.miner
+            if scanner.total_hits == 0 and not miner.top(limit=1, crypto_only=True):
+                # 집계할 값이 없으면 모델이 볼 수 있는 분량의 앞부분만 디코딩해 기존 방식으로 분석합니다.
+                record_rule_decision("log_conf", "text")
+                content_text = self._parse_file_content(file_content[:self._text_budget_bytes()])
+                return await self._analyze_text(content_text, file_name)
+
+            # 2. LLM에는 원문 대신 집계 요약과 암호 관련 템플릿만 전달하고, 규칙으로 판정한 결과와 병합합니다.
+            #    프롬프트 크기는 로그 길이가 아니라 고유 값/템플릿 수에 비례합니다.
+            record_rule_decision("log_conf", "partial")
+            rule_result = findings_to_result(scanner.findings(), "로그 스트림 집계")
+            # 3. 집계 요약은 내용에 쓸 수 있는 토큰의 절반까지 넣고, 남은 토큰을 템플릿으로 채웁니다.
+            budget = await get_prompt_budget(self.model_name)
+            frame = budget.available(self.system_prompt, self._build_aggregate_prompt(file_name, "", ""))
+            aggregate = budget.fit(scanner.render(), frame // 2)
+            limit = budget.available(self.system_prompt, self._build_aggregate_prompt(file_name, aggregate, ""))
+            if settings.AGENT_MAX_CONTENT_TOKENS > 0:
+                limit = min(limit, settings.AGENT_MAX_CONTENT_TOKENS)
+            templates = miner.render(limit, size=budget.count)
+            llm_response = await self._call_llm(self._build_aggregate_prompt(file_name, aggregate, templates))
+            llm_result = self._parse_llm_response(llm_response, file_name)
+            return merge_agent_results([rule_result, llm_result])
+
+        except Exception as e:
+            logger.exception("LogConfAgent 분석 중 오류")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    async def analyze_server_configs(self, files: Dict[str, bytes], archive_name: str = "") -> Optional[Dict[str, Any]]:
+        """
+        서버 설정 파일 묶음(단일 파일 또는 압축 파일 항목)을 규칙으로 분석합니다.
+        include 지시어는 같은 묶음 안에서 찾아 펼칩니다. 생략된 암호 지시어는 서버 기본값으로 판정합니다.
+        설정 파일이 없거나, 공개키 알고리즘을 하나도 판정하지 못했으면(TLS를 쓰지 않는 설정 등) None을 반환해 LLM 분석에 맡깁니다.
+        """
+        if not any(detect_dialect(path, content) for path, content in files.items()):
+            return None
+        # 파싱/암호 문자열 전개는 CPU 풀에서 합니다. include 대상이 될 수 없는 바이너리 항목은 넘기지 않습니다.
+        files = {path: content for path, content in files.items() if b"\x00" not in content[:8192]}
+        layout = [(path, len(content)) for path, content in files.items()]
+        scan = await run_cpu_bound("server_config", scan_server_config_blob, b"".join(files.values()), layout)
+        if scan is None:
+            return None
+        if not scan.findings:
+            logger.info("서버 설정에서 판정할 암호 지시어 없음, LLM 분석으로 넘김", extra={
+                "file_name": archive_name or next(iter(files)), "dialects": dict(scan.dialects),
+            })
+            return None
+        record_rule_decision("log_conf", "rules")
+
+        dialects = ", ".join(sorted(scan.dialects))
+        result = findings_to_result(scan.findings, f"서버 설정 분석({dialects})")
+        classification = scan.classification()
+        result["vulnerability_details"] += (
+            f" [키 교환: {classification['key_exchange']}, 서명: {classification['signature']}]"
+        )
+        notes = scan.notes + [f"include 대상 없음: {pattern}" for pattern in scan.unresolved_includes]
+        if notes:
+            result["evidence"] = "\n".join(filter(None, [result["evidence"], *notes[:10]]))
+        result["orchestrator_summary"] = "결정적 설정 파일 분석 결과 (LLM 검증 생략)"
+        logger.info("서버 설정 규칙 분석 완료", extra={
+            "file_name": archive_name or next(iter(files)), "dialects": dict(scan.dialects),
+            "files": len(scan.files), "directives": scan.directives, "classification": classification,
+        })
+        return result
+
+    def _text_budget_bytes(self) -> int:
+        """
+        텍스트 분석 경로에서 모델이 볼 수 있는 분량만 디코딩합니다.
+        컨텍스트 토큰당 최대 4글자, UTF-8 최대 4바이트/글자로 넉넉히 잡습니다.
+        """
+        if settings.AGENT_CHUNKING_ENABLED:
+            return settings.AGENT_MAX_CONTENT_CHARS * settings.AGENT_MAX_CHUNKS * 4
+        window = (settings.LLM_NUM_CTX or DEFAULT_NUM_CTX) * 4 * 4
+        # 청크 캐시를 쓰면 컨텍스트 크기의 창을 최대 AGENT_MAX_CHUNKS개 보냅니다.
+        return window * settings.AGENT_MAX_CHUNKS if settings.CHUNK_CACHE_ENABLED else window
+
+    def _build_aggregate_prompt(self, file_name: str, aggregate: str, templates: str) -> str:
+        return f"""다음은 로그 파일 전체를 스캔하여 집계한 암호 관련 값(고유 값과 출현 횟수)과, 반복되는 줄을 묶은 암호 관련 로그 템플릿입니다.
+템플릿의 <*>는 줄마다 달라지는 값입니다.
+협상된 암호군, 키 교환 그룹, 서명 알고리즘, SSH 알고리즘을 보고 비양자내성암호 사용 여부를 판단해주세요.
 
 파일명: {file_name}
-내용:
+집계 요약:
 ```
-{content_text[:2000]}  # 처음 2000자만 분석
+{aggregate}
+```
+
+로그 템플릿:
+```
+{templates}
 ```
 
 JSON 형식으로만 응답해주세요."""
 
-            llm_response = await self._call_llm(prompt)
-            
-            if llm_response.get("success"):
-                try:
-                    response_text = llm_response["content"]
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        result = json.loads(json_text)
-                        return result
-                    else:
-                        raise ValueError("JSON 형식을 찾을 수 없음")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"LLM 응답 파싱 오류: {e}")
-                    return self._get_default_result(file_name, "LLM 응답 파싱 실패")
-            else:
-                print(f"LLM 호출 실패: {llm_response.get('error')}")
-                return self._get_default_result(file_name, "LLM 호출 실패")
-                
-        except Exception as e:
-            print(f"LogConfAgent 분석 중 오류: {e}")
-            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        return f"""다음 로그/설정 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
 
-    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
-        """기본/오류 결과를 반환합니다."""
-        return {
-            "is_pqc_vulnerable": False,
-            "vulnerability_details": f"분석 불가: {error_detail}",
-            "detected_algorithms": [],
-            "recommendations": "수동 검토 필요",
-            "evidence": f"파일: {file_name}",
-            "confidence_score": 0.0
-        }
+파일명: {file_name}
+내용:
+```
+{content_window}
+```
+
+JSON 형식으로만 응답해주세요."""
@@ -1,15 +1,22 @@
 # File: pqc_inspector_server/agents/parameter.py
 # ⚙️ 파라미터(JSON, YAML 등) 분석을 담당하는 전문 에이전트입니다.
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, merge_agent_results
 from typing import Dict, Any
 from ..core.config import settings
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_rule_decision
+from ..scanners.config_tree import scan_config
+from ..scanners.findings import findings_to_result
 import json
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ParameterAgent(BaseAgent):
     def __init__(self):
         super().__init__(settings.PARAMETER_MODEL)
-        print("ParameterAgent가 초기화되었습니다.")
+        logger.debug("ParameterAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
         return """당신은 설정 파일에서 비양자내성암호(Non-PQC) 사용을 탐지하는 전문 보안 분석가입니다.
@@ -31,54 +38,39 @@ class ParameterAgent(BaseAgent):
 }"""
 
     async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
-        print(f"ParameterAgent: '{file_name}' 파일 분석 중...")
+        logger.debug("ParameterAgent 분석 시작", extra={"file_name": file_name})
         
         try:
-            content_text = self._parse_file_content(file_content)
-            
-            prompt = f"""다음 설정 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
+            # 1. 구조 파싱 + 규칙 테이블: 파싱할 수 없는 파일만 원문 텍스트를 LLM으로 분석합니다.
+            scan = await run_cpu_bound("parameter", scan_config, file_content, file_name)
+            if scan is None:
+                record_rule_decision("parameter", "text")
+                content_text = self._parse_file_content(file_content)
+                return await self._analyze_text(content_text, file_name)
+
+            rule_result = findings_to_result(scan.findings, f"설정 규칙 분석({scan.format})")
+            if scan.decided:
+                # 2. 규칙만으로 결론이 나면 LLM을 호출하지 않습니다.
+                record_rule_decision("parameter", "rules")
+                return rule_result
+
+            # 3. 규칙으로 판정하지 못한 키 경로와 값만 LLM에 보여줍니다.
+            record_rule_decision("parameter", "partial")
+            excerpt = json.dumps(scan.undecided, ensure_ascii=False, indent=1, default=str)
+            llm_result = await self._analyze_text(excerpt, file_name)
+            return merge_agent_results([rule_result, llm_result])
+
+        except Exception as e:
+            logger.exception("ParameterAgent 분석 중 오류")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        return f"""다음 설정 파일을 분석하여 비양자내성암호 사용 여부를 확인해주세요.
 
 파일명: {file_name}
 설정 내용:
 ```
-{content_text[:2000]}  # 처음 2000자만 분석
+{content_window}
 ```
 
 JSON 형식으로만 응답해주세요."""
-
-            llm_response = await self._call_llm(prompt)
-            
-            if llm_response.get("success"):
-                try:
-                    response_text = llm_response["content"]
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        result = json.loads(json_text)
-                        return result
-                    else:
-                        raise ValueError("JSON 형식을 찾을 수 없음")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"LLM 응답 파싱 오류: {e}")
-                    return self._get_default_result(file_name, "LLM 응답 파싱 실패")
-            else:
-                print(f"LLM 호출 실패: {llm_response.get('error')}")
-                return self._get_default_result(file_name, "LLM 호출 실패")
-                
-        except Exception as e:
-            print(f"ParameterAgent 분석 중 오류: {e}")
-            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
-
-    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
-        """기본/오류 결과를 반환합니다."""
-        return {
-            "is_pqc_vulnerable": False,
-            "vulnerability_details": f"분석 불가: {error_detail}",
-            "detected_algorithms": [],
-            "recommendations": "수동 검토 필요",
-            "evidence": f"파일: {file_name}",
-            "confidence_score": 0.0
-        }
@@ -1,15 +1,25 @@
 # File: pqc_inspector_server/agents/source_code.py
 # 👨‍💻 소스코드 분석을 담당하는 전문 에이전트입니다.
 
-from .base_agent import BaseAgent
+from .base_agent import BaseAgent, merge_agent_results
 from typing import Dict, Any
 from ..core.config import settings
+from ..core.process_pool import run_cpu_bound
+from ..core.telemetry import record_rule_decision, registry
+from ..scanners.custom_crypto import scan_custom_crypto
+from ..scanners.findings import findings_to_result
+from ..services.prompt_budget import get_prompt_budget
+from ..services.source_minifier import minify_source
 import json
+import logging
+import re
+
+logger = logging.getLogger(__name__)
 
 class SourceCodeAgent(BaseAgent):
     def __init__(self):
         super().__init__(settings.SOURCE_CODE_MODEL)
-        print("SourceCodeAgent가 초기화되었습니다.")
+        logger.debug("SourceCodeAgent가 초기화되었습니다.")
 
     def _get_system_prompt(self) -> str:
         return """You are a security analyst specializing in detecting non-quantum-resistant cryptography in source code.
@@ -32,18 +42,63 @@ Response format (JSON ONLY):
 }"""
 
     async def analyze(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
-        print(f"   🔬 SourceCodeAgent 분석 시작: {file_name}")
-        
+        logger.debug("SourceCodeAgent 분석 시작", extra={"file_name": file_name})
+
         try:
-            content_text = self._parse_file_content(file_content)
-            print(f"   📝 소스코드 파싱 완료 (길이: {len(content_text)} chars)")
-            
-            prompt = f"""Analyze the following source code file for non-quantum-resistant cryptography usage.
+            # 1. 이름을 위장한 자체 구현 RSA/DH/ECC는 모델이 보는 내용 창에 다 들어오지 않으므로
+            #    AST 데이터 흐름으로 먼저 찾아 두고, 라이브러리 사용 등은 기존대로 LLM이 분석한 결과와 병합합니다.
+            findings = await run_cpu_bound("source_code", scan_custom_crypto, file_content, file_name)
+            if not findings:
+                record_rule_decision("source_code", "text")
+                return await self._analyze_source(file_content, file_name)
+
+            record_rule_decision("source_code", "partial")
+            rule_result = findings_to_result(findings, "자체 구현 암호 데이터 흐름 분석")
+            signals = [f"{finding['value']}: {signal}" for finding in findings for signal in finding["signals"]]
+            rule_result["evidence"] = "\n".join(filter(None, [rule_result["evidence"], "\n".join(signals)]))
+            llm_result = await self._analyze_source(file_content, file_name)
+            return merge_agent_results([rule_result, llm_result])
+
+        except Exception as e:
+            logger.exception("SourceCodeAgent 분석 중 오류")
+            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+
+    async def _analyze_source(self, file_content: bytes, file_name: str) -> Dict[str, Any]:
+        """
+        MINIFY_ENABLED면 주석/독스트링/빈 줄을 걷어낸 축소본을 LLM으로 분석하고, 줄인 토큰 수를 기록합니다.
+        모델이 인용한 근거는 축소본의 줄 번호 지도로 원본 줄 번호를 찾아 덧붙입니다.
+        """
+        content_text = self._parse_file_content(file_content)
+        if not settings.MINIFY_ENABLED:
+            return await self._analyze_text(content_text, file_name)
+
+        source = await run_cpu_bound("minify", minify_source, file_content, file_name, settings.MINIFY_MAX_LITERAL_CHARS)
+        # 토크나이저(TokenCounter)는 이벤트 루프에서만 쓸 수 있으므로 여기서 셉니다. 조각별 캐시 덕에 축소본의 조각은
+        # 바로 뒤 _content_windows에서 청크를 셀 때 사전 조회 한 번으로 끝납니다.
+        budget = await get_prompt_budget(self.model_name)
+        original_tokens, minified_tokens = budget.count(content_text), budget.count(source.text)
+        registry.inc("pqc_source_minify_tokens_total", original_tokens, kind="original")
+        registry.inc("pqc_source_minify_tokens_total", minified_tokens, kind="minified")
+        logger.info("소스 축소", extra={
+            "file_name": file_name, "language": source.language or "text",
+            "original_tokens": original_tokens, "minified_tokens": minified_tokens,
+            "reduction": round(1 - minified_tokens / original_tokens, 3) if original_tokens else 0.0,
+        })
+
+        # 결과 딕셔너리는 청크 캐시에 들어 있는 객체일 수 있으므로 복사해서 고칩니다.
+        result = dict(await self._analyze_text(source.text, file_name))
+        lines = source.original_lines(str(result.get("evidence") or ""))
+        if lines:
+            result["evidence"] = f"{result['evidence']} (원본 {', '.join(map(str, lines))}행)"
+        return result
+
+    def _build_prompt(self, file_name: str, content_window: str) -> str:
+        return f"""Analyze the following source code file for non-quantum-resistant cryptography usage.
 
 File: {file_name}
 Code:
 ```
-{content_text[:2000]}
+{content_window}
 ```
 
 You MUST respond ONLY with valid JSON in exactly this format:
@@ -58,63 +113,51 @@ You MUST respond ONLY with valid JSON in exactly this format:
 
 Do not include any explanation or text outside the JSON."""
 
-            print(f"   🤖 CodeLlama 모델 호출 준비 중...")
-            llm_response = await self._call_llm(prompt)
-            
-            if llm_response.get("success"):
-                print(f"   ✅ CodeLlama 응답 수신 완료")
+    def _parse_llm_response(self, llm_response: Dict[str, Any], file_name: str) -> Dict[str, Any]:
+        """
+        CodeLlama 응답에서 JSON을 추출합니다. JSON이 깨져 있으면 키워드 기반 추정 결과를 만듭니다.
+        """
+        if not llm_response.get("success"):
+            logger.warning("LLM 호출 실패", extra={"error": llm_response.get("error")})
+            return self._get_default_result(file_name, "LLM 호출 실패")
+
+        try:
+            # LLM 응답에서 JSON 추출 시도
+            response_text = llm_response["content"]
+            logger.debug("LLM 원본 응답", extra={"response_chars": len(response_text), "response": response_text})
+
+            # JSON 부분만 추출
+            json_start = response_text.find('{')
+            json_end = response_text.rfind('}') + 1
+
+            if json_start >= 0 and json_end > json_start:
+                json_text = response_text[json_start:json_end]
+
+                # JSON 유효성 검사를 위한 추가 처리
                 try:
-                    # LLM 응답에서 JSON 추출 시도
-                    response_text = llm_response["content"]
-                    print(f"   📄 응답 내용 (처음 100자): {response_text[:100]}...")
-                    
-                    # 응답 내용 디버깅을 위해 출력
-                    print(f"   [DEBUG] 원본 LLM 응답:")
-                    print(f"   {response_text}")
-                    print(f"   [DEBUG] 응답 길이: {len(response_text)}")
-                    
-                    # JSON 부분만 추출
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        print(f"   [DEBUG] 추출된 JSON:")
-                        print(f"   {json_text}")
-                        
-                        # JSON 유효성 검사를 위한 추가 처리
-                        try:
-                            # 잘못된 문자들 정리
-                            json_text = json_text.replace('\n', ' ').replace('\r', ' ')
-                            # 연속된 공백 제거
-                            import re
-                            json_text = re.sub(r'\s+', ' ', json_text)
-                            
-                            result = json.loads(json_text)
-                            print(f"   [SUCCESS] JSON 파싱 성공!")
-                            print(f"      - 취약점: {result.get('is_pqc_vulnerable', 'Unknown')}")
-                            print(f"      - 알고리즘: {result.get('detected_algorithms', [])}")
-                            return result
-                            
-                        except json.JSONDecodeError as json_err:
-                            print(f"   [ERROR] JSON 파싱 실패: {json_err}")
-                            print(f"   [ERROR] 문제가 된 JSON: {json_text}")
-                            # 수동으로 기본값 생성
-                            return self._create_fallback_result(response_text, file_name)
-                    else:
-                        raise ValueError("JSON 형식을 찾을 수 없음")
-                        
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"   ❌ LLM 응답 파싱 오류: {e}")
-                    # 기본값 반환
-                    return self._get_default_result(file_name, "LLM 응답 파싱 실패")
+                    # 잘못된 문자들 정리
+                    json_text = json_text.replace('\n', ' ').replace('\r', ' ')
+                    # 연속된 공백 제거
+                    json_text = re.sub(r'\s+', ' ', json_text)
+
+                    result = json.loads(json_text)
+                    logger.debug("JSON 파싱 성공", extra={
+                        "is_pqc_vulnerable": result.get("is_pqc_vulnerable"),
+                        "detected_algorithms": result.get("detected_algorithms", []),
+                    })
+                    return result
+
+                except json.JSONDecodeError as json_err:
+                    logger.warning("JSON 파싱 실패", extra={"error": str(json_err), "json_text": json_text})
+                    # 수동으로 기본값 생성
+                    return self._create_fallback_result(response_text, file_name)
             else:
-                print(f"   ❌ LLM 호출 실패: {llm_response.get('error')}")
-                return self._get_default_result(file_name, "LLM 호출 실패")
-                
-        except Exception as e:
-            print(f"   ❌ SourceCodeAgent 분석 중 오류: {e}")
-            return self._get_default_result(file_name, f"분석 오류: {str(e)}")
+                raise ValueError("JSON 형식을 찾을 수 없음")
+
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning("LLM 응답 파싱 오류", extra={"error": str(e)})
+            # 기본값 반환
+            return self._get_default_result(file_name, "LLM 응답 파싱 실패")
 
     def _create_fallback_result(self, llm_response: str, file_name: str) -> Dict[str, Any]:
         """LLM 응답을 기반으로 fallback 결과를 생성합니다."""
@@ -137,14 +180,3 @@ Do not include any explanation or text outside the JSON."""
             "evidence": f"LLM 응답 키워드 분석 기반",
             "confidence_score": 0.3  # 낮은 신뢰도
         }
-
-    def _get_default_result(self, file_name: str, error_detail: str) -> Dict[str, Any]:
-        """기본/오류 결과를 반환합니다."""
-        return {
-            "is_pqc_vulnerable": False,
-            "vulnerability_details": f"분석 불가: {error_detail}",
-            "detected_algorithms": [],
-            "recommendations": "수동 검토 필요",
-            "evidence": f"파일: {file_name}",
-            "confidence_score": 0.0
-        }
@@ -2,19 +2,64 @@
 # 🌐 사용자의 HTTP 요청을 처리하는 API 엔드포인트를 정의하는 파일입니다.
 # FastAPI의 APIRouter를 사용하여 관련 엔드포인트들을 그룹화합니다.
 
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, BackgroundTasks
-from typing import Annotated
+from fastapi import APIRouter, UploadFile, File, Form, Depends, HTTPException, BackgroundTasks, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Annotated, Literal, Optional, Tuple
+import asyncio
+import math
+import os
 import uuid
 
 from .schemas import AnalysisRequestResponse, AnalysisResultSchema
 from ..orchestrator.controller import OrchestratorController, get_orchestrator_controller
+from ..core.config import settings
+from ..core.telemetry import registry
+from ..services.archive import is_archive
+from ..services.job_queue import get_job_queue
+from ..services.scheduler import BULK, INTERACTIVE, get_llm_scheduler, parse_lane_weights
+from ..services.scan_manifest import load_delta
+from ..services.reporting import REPORT_MEDIA_TYPES, render_report
 
 # API 라우터 객체 생성
 api_router = APIRouter()
 
+
+def _request_class(request: Request, default_lane: str) -> Tuple[str, str]:
+    """
+    요청의 lane과 클라이언트 식별자를 정합니다. 클라이언트는 X-Client-ID 헤더, 없으면 접속 IP입니다.
+    X-Scan-Lane 헤더로 lane을 지정할 수 있습니다 (예: CI가 단일 파일을 대량으로 올릴 때 bulk).
+    """
+    lane = request.headers.get("x-scan-lane", default_lane)
+    if lane not in parse_lane_weights(settings.SCHEDULER_LANE_WEIGHTS):
+        lane = default_lane
+    client = request.headers.get("x-client-id") or (request.client.host if request.client else "")
+    return lane, client
+
+
+async def _admit(lane: str) -> None:
+    """
+    예상 대기 시간이 ADMISSION_MAX_WAIT를 넘으면 요청을 받지 않고 429로 거절합니다.
+    작업 대기열 모드에서는 이 프로세스가 LLM을 호출하지 않으므로 대기열에 밀린 작업으로 예상 대기 시간을 셉니다.
+    """
+    if settings.ADMISSION_MAX_WAIT <= 0:
+        return
+    if settings.JOB_QUEUE_ENABLED:
+        queue = get_job_queue(settings.JOB_QUEUE_PATH, settings.JOB_MAX_ATTEMPTS)
+        wait = await asyncio.to_thread(queue.estimated_wait, lane, parse_lane_weights(settings.SCHEDULER_LANE_WEIGHTS))
+    else:
+        wait = get_llm_scheduler().estimated_wait(lane)
+    if wait > settings.ADMISSION_MAX_WAIT:
+        registry.inc("pqc_admission_rejected_total", lane=lane)
+        raise HTTPException(
+            status_code=429,
+            detail=f"분석 대기열이 가득 찼습니다 (예상 대기 {wait:.0f}초). 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(max(1, math.ceil(wait - settings.ADMISSION_MAX_WAIT)))},
+        )
+
 # --- 엔드포인트 정의 ---
 @api_router.post("/analyze", response_model=AnalysisRequestResponse, status_code=202)
 async def analyze_file(
+    request: Request,
     background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
@@ -23,9 +68,12 @@ async def analyze_file(
     파일을 업로드하여 비양자내성암호(Non-PQC) 사용 여부 분석을 요청합니다.
     
     분석은 백그라운드에서 처리되며, 요청 즉시 작업 ID를 반환합니다.
+    분석 대기열의 예상 대기 시간이 ADMISSION_MAX_WAIT를 넘으면 429(Retry-After 포함)로 거절합니다.
     """
     if not file.filename:
         raise HTTPException(status_code=400, detail="파일 이름이 없습니다.")
+    lane, client = _request_class(request, INTERACTIVE)
+    await _admit(lane)
 
     task_id = str(uuid.uuid4())
     
@@ -34,11 +82,130 @@ async def analyze_file(
     filename = file.filename
     
     # 실제 분석 작업은 백그라운드에서 실행하여 응답 시간을 단축합니다.
-    background_tasks.add_task(orchestrator.start_analysis_with_content, filename, file_content, task_id)
+    await orchestrator.schedule_analysis(background_tasks, filename, file_content, task_id, lane=lane, client=client)
     
     return {"task_id": task_id, "message": "파일 분석 요청이 성공적으로 접수되었습니다. 백그라운드에서 분석이 진행됩니다."}
 
 
+@api_router.post("/analyze/project", response_model=AnalysisRequestResponse, status_code=202)
+async def analyze_project(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
+):
+    """
+    저장소/프로젝트 압축 파일(zip, tar, tar.gz 등)을 업로드하여 파일별 분석을 요청합니다.
+    
+    프로젝트 전체의 함수 정의와 호출 지점을 색인하므로, 다른 파일의 암호 래퍼 함수를 부르는 호출자도 함께 탐지됩니다.
+    파일별 결과는 같은 작업 ID로 저장됩니다.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="파일 이름이 없습니다.")
+    lane, client = _request_class(request, BULK)
+    await _admit(lane)
+
+    file_content = await file.read()
+    if not is_archive(file_content):
+        raise HTTPException(status_code=400, detail="프로젝트 분석은 압축 파일(zip, tar, tar.gz 등)만 지원합니다.")
+
+    task_id = str(uuid.uuid4())
+    await orchestrator.schedule_analysis(background_tasks, file.filename, file_content, task_id, project=True,
+                                         lane=lane, client=client)
+
+    return {"task_id": task_id, "message": "프로젝트 분석 요청이 성공적으로 접수되었습니다. 백그라운드에서 파일별 분석이 진행됩니다."}
+
+
+@api_router.post("/analyze/repository", response_model=AnalysisRequestResponse, status_code=202)
+async def analyze_repository(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    bundle: Optional[UploadFile] = File(None),
+    repo_path: Optional[str] = Form(None),
+    ref: str = Form("HEAD"),
+    name: Optional[str] = Form(None),
+    orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
+):
+    """
+    git 저장소를 증분 스캔합니다. 서버의 로컬 저장소 경로(repo_path) 또는 git 번들 파일(bundle) 중 하나를 지정합니다.
+    
+    이전 스캔의 경로별 blob 해시와 비교해 추가/수정된 파일만 분석하고, 나머지 파일의 결과는 그대로 이어받습니다.
+    이전 스캔 대비 변경 보고서는 GET /analyze/repository/{name}/delta 로 조회합니다.
+    """
+    if (bundle is None) == (repo_path is None):
+        raise HTTPException(status_code=400, detail="repo_path와 bundle 중 하나만 지정해주세요.")
+    lane, client = _request_class(request, BULK)
+    await _admit(lane)
+
+    if repo_path is not None:
+        if not settings.REPO_SCAN_ROOT:
+            raise HTTPException(status_code=403, detail="로컬 저장소 경로 스캔이 비활성화되어 있습니다 (REPO_SCAN_ROOT 미설정).")
+        root = os.path.realpath(settings.REPO_SCAN_ROOT)
+        repo_path = os.path.realpath(repo_path)
+        if os.path.commonpath([root, repo_path]) != root:
+            raise HTTPException(status_code=403, detail="REPO_SCAN_ROOT 밖의 경로는 스캔할 수 없습니다.")
+        if not os.path.isdir(repo_path):
+            raise HTTPException(status_code=400, detail="저장소 경로를 찾을 수 없습니다.")
+        repository = name or os.path.basename(repo_path)
+        content = None
+    else:
+        content = await bundle.read()
+        repository = name or os.path.splitext(bundle.filename or "")[0] or "repository"
+
+    task_id = str(uuid.uuid4())
+    await orchestrator.schedule_repository_analysis(background_tasks, repository, task_id, ref, repo_path, content,
+                                                    lane=lane, client=client)
+
+    return {"task_id": task_id, "message": f"저장소 '{repository}' 증분 분석 요청이 접수되었습니다. 변경된 파일만 백그라운드에서 분석됩니다."}
+
+
+@api_router.get("/analyze/repository/{name}/delta")
+async def get_repository_delta(name: str):
+    """
+    저장소의 가장 최근 증분 스캔 변경 보고서를 조회합니다.
+    
+    추가/수정/삭제된 경로, 새로 취약해진 파일, 해소된 파일, 알고리즘이 바뀐 파일이 포함됩니다.
+    """
+    delta = load_delta(settings.REPO_SCAN_DIR, name)
+    if delta is None:
+        raise HTTPException(status_code=404, detail="해당 저장소의 스캔 기록이 없습니다.")
+    return delta
+
+
+@api_router.get("/jobs/{task_id}")
+async def get_job_status(task_id: str):
+    """
+    작업 대기열 모드(JOB_QUEUE_ENABLED)에서 작업의 처리 상태(queued, running, done, failed)를 조회합니다.
+
+    결과는 처리가 끝난 뒤 GET /report/{task_id} 로 조회합니다.
+    """
+    if not settings.JOB_QUEUE_ENABLED:
+        raise HTTPException(status_code=404, detail="작업 대기열 모드가 아닙니다 (JOB_QUEUE_ENABLED 미설정).")
+    queue = get_job_queue(settings.JOB_QUEUE_PATH, settings.JOB_MAX_ATTEMPTS)
+    jobs = await asyncio.to_thread(queue.status, task_id)
+    if not jobs:
+        raise HTTPException(status_code=404, detail="해당 ID의 작업을 찾을 수 없습니다.")
+    return {"task_id": task_id, "status": jobs[-1]["status"], "jobs": jobs}
+
+
+@api_router.get("/report")
+async def export_report(
+    report_format: Literal["markdown", "csv", "jsonl", "sarif"] = Query("markdown", alias="format"),
+    orchestrator: OrchestratorController = Depends(get_orchestrator_controller)
+):
+    """
+    저장된 전체 분석 결과를 지정한 형식(markdown, csv, jsonl, sarif)의 보고서로 내려받습니다.
+    
+    결과는 저장소에서 한 건씩 읽어 바로 렌더링되므로, 대량 스캔에서도 메모리 사용량이 일정합니다.
+    """
+    extension = {"markdown": "md", "csv": "csv", "jsonl": "jsonl", "sarif": "sarif"}[report_format]
+    return StreamingResponse(
+        render_report(orchestrator.iter_analysis_results(), report_format),
+        media_type=REPORT_MEDIA_TYPES[report_format],
+        headers={"Content-Disposition": f'attachment; filename="pqc-report.{extension}"'}
+    )
+
+
 @api_router.get("/report/{task_id}", response_model=AnalysisResultSchema)
 async def get_analysis_report(
     task_id: str,
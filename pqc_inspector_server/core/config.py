@@ -26,14 +26,66 @@ class Settings(BaseSettings):
 
     # --- 애플리케이션 설정 ---
     LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"  # "text" (key=value) 또는 "json" (한 줄당 JSON 객체)
 
     # --- Ollama 모델 설정 ---
     OLLAMA_BASE_URL: str = "http://localhost:11434"
+    OLLAMA_HOSTS: str = ""                # 여러 추론 서버를 쓸 때 쉼표로 구분한 주소 목록 (비어 있으면 OLLAMA_BASE_URL 하나만 사용)
+    OLLAMA_HEALTH_INTERVAL: float = 30.0  # 서버별 모델 목록(상태) 재조회 주기(초)
+    OLLAMA_FAILURE_THRESHOLD: int = 3     # 연속 실패가 이 횟수에 이르면 회로를 열어 서버를 잠시 제외
+    OLLAMA_CIRCUIT_COOLDOWN: float = 30.0 # 회로를 연 뒤 다시 요청을 보내 보기까지 기다리는 시간(초)
+    OLLAMA_HEDGE_DELAY: float = 0.0       # 이 시간(초) 안에 응답이 없으면 다른 서버에도 같은 요청을 보냄 (0이면 사용 안 함)
+    LLM_NUM_CTX: int = 4096               # 요청마다 지정하는 컨텍스트 길이(토큰). 프롬프트는 이 안에 맞춰 만듦 (0이면 서버 기본값 2048)
+    LLM_RESPONSE_TOKENS: int = 512        # 컨텍스트 중 응답(JSON)용으로 남겨 두는 토큰 수
     ORCHESTRATOR_MODEL: str = "gemma:7b"
     SOURCE_CODE_MODEL: str = "codellama:7b"
     BINARY_MODEL: str = "codellama:7b"
     PARAMETER_MODEL: str = "gemma:7b"
     LOG_CONF_MODEL: str = "gemma:7b"
+    CERTIFICATE_MODEL: str = "gemma:7b"   # 인증서/키 파일은 규칙으로 분석하며, 파싱할 수 없는 파일에만 사용
+    DEPENDENCY_MODEL: str = "gemma:7b"    # 의존성 매니페스트도 규칙으로 분석하며, 파싱에 실패한 파일에만 사용
+
+    # --- 분석 파이프라인 설정 ---
+    # scripts/evaluate.py로 탐지 정확도와 처리 시간을 비교하며 조정합니다.
+    AGENT_MAX_CONTENT_CHARS: int = 2000   # 파일을 나누는 청크 하나의 최대 글자 수 (관련도로 고르는 단위, 청크 분석 시 창 하나)
+    AGENT_MAX_CONTENT_TOKENS: int = 0     # 프롬프트에 넣는 내용의 최대 토큰 수 (0이면 LLM_NUM_CTX에서 시스템 프롬프트/응답 몫을 뺀 만큼 채움)
+    AGENT_CHUNKING_ENABLED: bool = False  # True면 관련도 높은 청크를 한 창에 모으지 않고 청크마다 따로 분석
+    AGENT_MAX_CHUNKS: int = 4             # 청크 분석(또는 CHUNK_CACHE_ENABLED로 창을 나눈 경우) 시 파일당 최대 LLM 호출 수 (0 이하면 1)
+    MINIFY_ENABLED: bool = True           # 소스코드의 주석/독스트링/빈 줄을 지우고 긴 문자열을 줄인 뒤 LLM에 보냄
+    MINIFY_MAX_LITERAL_CHARS: int = 80    # 이보다 긴 문자열 리터럴은 앞부분만 남김 (0이면 줄이지 않음)
+    PRESCAN_ENABLED: bool = False         # True면 암호 키워드가 전혀 없는 파일은 LLM 호출 없이 안전으로 판정
+    VALIDATION_ENABLED: bool = True       # False면 오케스트레이터 검증 단계를 생략
+    CPU_POOL_WORKERS: int = 0             # 규칙 스캐너(정규식/AST/ASN.1/로그 집계)를 실행하는 프로세스 수 (0이면 CPU 코어 수, 1이면 스레드에서 실행)
+    JVM_SCAN_WORKERS: int = 0             # JAR 클래스 병렬 분석 프로세스 수 (0이면 CPU 코어 수, 1이면 병렬 처리 안 함)
+    SYMBOL_INDEX_WORKERS: int = 0         # 프로젝트 심볼 색인 병렬 추출 프로세스 수 (0이면 CPU 코어 수, 1이면 병렬 처리 안 함)
+    SYMBOL_INDEX_DIR: str = "data/symbol_index"  # 저장소 스냅샷별 심볼 색인 저장 위치 (빈 문자열이면 저장하지 않음)
+    REPO_SCAN_DIR: str = "data/repo_scans"    # 저장소 증분 스캔 매니페스트(경로별 blob 해시와 결과)와 변경 보고서 저장 위치
+    REPO_SCAN_ROOT: str = ""              # 로컬 체크아웃 경로 스캔을 허용할 상위 디렉터리 (빈 문자열이면 git 번들 업로드만 허용)
+    RESULT_CACHE_ENABLED: bool = True     # 같은 내용 또는 조금만 고친 복사본(SimHash 스케치)이면 이전 분석 결과를 재사용
+    RESULT_CACHE_SIZE: int = 100000       # 결과 캐시에 보관하는 파일 수 (초과하면 가장 오래 쓰지 않은 것부터 제거)
+    SIMILARITY_MAX_DISTANCE: int = 3      # 비슷한 파일로 볼 SimHash 해밍 거리 (64비트 중, 클수록 느슨하고 조회가 느림, 음수면 같은 내용만)
+    # 창(청크) 내용별 LLM 분석 결과를 캐시해 일부만 고친 파일은 바뀐 창만 다시 분석.
+    # 켜져 있으면 AGENT_CHUNKING_ENABLED가 꺼져 있어도 컨텍스트에 다 들어가지 않는 파일은 관련도로 골라 한 창에 모으지 않고,
+    # 이어지는 청크를 내용 기반 경계로 묶은 창 여러 개(최대 AGENT_MAX_CHUNKS개 호출)로 나눕니다.
+    CHUNK_CACHE_ENABLED: bool = True
+    CHUNK_CACHE_SIZE: int = 50000         # 청크 결과 캐시에 보관하는 청크 수
+
+    # --- 요청 스케줄링 설정 ---
+    # LLM 호출 슬롯을 요청 종류(lane)별 가중 공정 큐로 나눕니다. /analyze는 interactive, 프로젝트/저장소 스캔은 bulk입니다.
+    LLM_MAX_CONCURRENCY: int = 4          # 동시에 보내는 LLM 호출 수 (Ollama 서버들의 병렬 처리 수 합계에 맞춤, 0이면 제한 없음)
+    SCHEDULER_LANE_WEIGHTS: str = "interactive=4,bulk=1"  # lane별 슬롯 배정 가중치
+    CLIENT_MAX_CONCURRENCY: int = 0       # 클라이언트(X-Client-ID 헤더, 없으면 접속 IP) 하나가 동시에 쓰는 LLM 슬롯 수 (0이면 제한 없음)
+    PROJECT_FILE_CONCURRENCY: int = 8     # 프로젝트(압축 파일) 스캔에서 동시에 분석하는 파일 수 (LLM 호출 수는 LLM_MAX_CONCURRENCY가 따로 제한)
+    ADMISSION_MAX_WAIT: float = 60.0      # 예상 대기 시간(초)이 이를 넘으면 분석 요청을 429로 거절 (0이면 거절하지 않음)
+
+    # --- 분산 워커 설정 ---
+    # JOB_QUEUE_ENABLED가 True면 API 서버는 작업을 대기열에 넣기만 하고, `python main.py worker` 프로세스들이 꺼내 분석합니다.
+    JOB_QUEUE_ENABLED: bool = False
+    JOB_QUEUE_PATH: str = "data/jobs.sqlite3"  # 작업 대기열 SQLite 파일 (여러 머신이면 모든 노드가 보는 공유 파일시스템 경로)
+    JOB_LEASE_SECONDS: float = 300.0      # 워커가 작업을 임대하는 시간(초). 처리 중에는 주기적으로 연장하며, 만료되면 다른 워커가 가져감
+    JOB_MAX_ATTEMPTS: int = 3             # 작업 하나를 시도하는 최대 횟수 (워커 오류/비정상 종료 포함)
+    JOB_POLL_INTERVAL: float = 1.0        # 대기열이 비었을 때 워커가 다시 확인하기까지 기다리는 시간(초)
+    WORKER_CONCURRENCY: int = 4           # 워커 프로세스 하나가 동시에 처리하는 작업 수
 
 # @lru_cache 데코레이터를 사용하여 Settings 객체를 한 번만 생성하도록 캐싱합니다.
 # 이렇게 하면 애플리케이션 전체에서 동일한 설정 객체를 공유하게 됩니다.
@@ -0,0 +1,102 @@
+# File: pqc_inspector_server/core/logging_config.py
+# 📝 애플리케이션 전역 로깅 설정 파일입니다.
+# 이벤트 루프에서 동기식 stdout 쓰기가 일어나지 않도록, 로그 레코드는 큐에만 넣고
+# 별도 스레드(QueueListener)가 실제 출력을 담당합니다.
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+from contextvars import ContextVar
+from typing import Optional
+
+from .config import settings
+
+# 현재 처리 중인 작업 ID. 에이전트 등 하위 모듈의 로그에도 자동으로 붙습니다.
+current_task_id: ContextVar[Optional[str]] = ContextVar("current_task_id", default=None)
+
+# LogRecord 기본 속성. 이 외의 속성은 logger.info(..., extra={...})로 전달된 구조화 필드입니다.
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "task_id"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class TaskContextFilter(logging.Filter):
+    """레코드에 현재 작업 ID를 주입합니다."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "task_id"):
+            record.task_id = current_task_id.get()
+        return True
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    구조화 필드(extra)를 함께 출력하는 포매터입니다.
+    LOG_FORMAT이 "json"이면 한 줄에 하나의 JSON 객체를, 그렇지 않으면 key=value 형식을 사용합니다.
+    """
+
+    def __init__(self, json_output: bool = False):
+        super().__init__(datefmt="%Y-%m-%dT%H:%M:%S")
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = {k: v for k, v in vars(record).items() if k not in _RESERVED_ATTRS}
+        task_id = getattr(record, "task_id", None)
+
+        if self.json_output:
+            payload = {
+                "time": self.formatTime(record, self.datefmt),
+                "level": record.levelname,
+                "logger": record.name,
+                "message": record.getMessage(),
+            }
+            if task_id:
+                payload["task_id"] = task_id
+            payload.update(fields)
+            if record.exc_info:
+                payload["exc_info"] = self.formatException(record.exc_info)
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = f"{self.formatTime(record, self.datefmt)} {record.levelname:<7} {record.name}: {record.getMessage()}"
+        if task_id:
+            line += f" task_id={task_id}"
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+def setup_logging(level: Optional[str] = None, log_format: Optional[str] = None) -> None:
+    """
+    루트 로거에 큐 기반 비동기 핸들러를 설치합니다. 여러 번 호출해도 한 번만 적용됩니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(StructuredFormatter(json_output=(log_format or settings.LOG_FORMAT).lower() == "json"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(TaskContextFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel((level or settings.LOG_LEVEL).upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,157 @@
+# File: pqc_inspector_server/core/process_pool.py
+# 🧵 CPU를 많이 쓰는 결정적 분석(JAR 클래스 분석, 프로젝트 심볼 색인 등)이 함께 쓰는 프로세스 풀입니다.
+# 워커 수별로 풀을 하나씩만 만들어 재사용하므로 요청마다 프로세스를 새로 띄우지 않습니다.
+#
+# 에이전트의 규칙 스캐너(정규식, AST, ASN.1, 로그 스트림 등)는 run_cpu_bound로 실행합니다.
+# 이벤트 루프에서 직접 돌리면 GIL 때문에 다른 요청의 I/O가 멈추므로, CPU_POOL_WORKERS(기본: 코어 수)개 프로세스에서 실행하고
+# 큰 파일 내용은 피클로 파이프에 밀어 넣는 대신 공유 메모리에 한 번 복사해 이름만 넘깁니다.
+# 풀 프로세스는 보통 공유 메모리를 bytes로 한 번 더 복사해 스캐너에 넘기지만(정규식/AST/ASN.1 스캐너는 bytes 메서드를 씀),
+# @accepts_buffer로 표시한 스캐너(로그 스트림 집계)는 공유 메모리의 memoryview를 그대로 받아 청크 단위로만 복사합니다.
+# 그래서 1GB 로그도 업로드 내용과 공유 메모리 두 벌만 메모리에 둡니다.
+# 풀 프로세스 하나가 죽으면(OOM, 악성 파일로 인한 비정상 종료) 풀 전체를 쓸 수 없게 되므로, 그 풀은 버리고 새 풀을 만듭니다.
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, NamedTuple, Tuple, TypeVar, Union
+
+from .config import settings
+from .telemetry import registry
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# 이보다 작은 내용은 프로세스 간 전달 비용이 스캔 시간보다 크므로 이벤트 루프에서 바로 스캔합니다.
+INLINE_MAX_BYTES = 16 * 1024
+# 이보다 큰 내용은 공유 메모리로 전달합니다. (작은 내용은 피클이 공유 메모리 생성/해제보다 쌉니다)
+SHARED_MEMORY_MIN_BYTES = 1024 * 1024
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def resolve_workers(workers: int) -> int:
+    """설정값 0은 CPU 코어 수를 뜻합니다."""
+    return workers or os.cpu_count() or 1
+
+
+def get_process_pool(workers: int) -> ProcessPoolExecutor:
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            # 서버 프로세스의 이벤트 루프/로깅 스레드를 fork로 복제하지 않도록 forkserver(없으면 spawn)를 사용합니다.
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+            _pools[workers] = pool
+        return pool
+
+
+def discard_process_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    """고장 난(BrokenProcessPool) 풀을 캐시에서 빼서 다음 get_process_pool이 새 풀을 만들게 합니다."""
+    with _pools_lock:
+        if _pools.get(workers) is pool:
+            del _pools[workers]
+        else:
+            return  # 다른 요청이 이미 교체함
+    registry.inc("pqc_cpu_pool_restarts_total")
+    logger.warning("CPU 풀 프로세스가 비정상 종료되어 풀을 새로 만듭니다", extra={"workers": workers})
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _SharedBuffer(NamedTuple):
+    name: str
+    size: int
+
+
+def accepts_buffer(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    func가 bytes 대신 memoryview를 받을 수 있다고 표시합니다. 공유 메모리로 넘긴 내용을 복사하지 않고 그대로 전달합니다.
+    func는 반환값이나 다른 곳에 버퍼 조각을 남기지 말아야 합니다. (공유 메모리를 닫을 때 남아 있으면 BufferError)
+    """
+    func.accepts_buffer = True  # type: ignore[attr-defined]
+    return func
+
+
+def _run_task(func: Callable[..., T], content: Union[bytes, _SharedBuffer], args: Tuple[Any, ...]) -> Tuple[float, float, T]:
+    """풀 프로세스에서 실행됩니다. 결과와 함께 시작/종료 시각을 돌려주어 대기 시간과 실행 시간을 따로 기록합니다."""
+    started = time.time()
+    if not isinstance(content, _SharedBuffer):
+        return started, time.time(), func(content, *args)
+    # 공유 메모리는 만든 쪽(부모)이 해제하므로 여기서는 읽기만 하고 연결만 끊습니다.
+    segment = shared_memory.SharedMemory(name=content.name)
+    try:
+        if not getattr(func, "accepts_buffer", False):
+            data = bytes(segment.buf[:content.size])
+            segment.close()
+            return started, time.time(), func(data, *args)
+        view = segment.buf[:content.size]
+        try:
+            result = func(view, *args)
+        except BaseException as e:
+            # traceback의 프레임이 버퍼 조각을 지역 변수로 잡고 있으면 close가 BufferError로 원래 예외를 가립니다.
+            traceback.clear_frames(e.__traceback__)
+            raise
+        finally:
+            view.release()
+        return started, time.time(), result
+    finally:
+        segment.close()
+
+
+async def run_cpu_bound(stage: str, func: Callable[..., T], content: bytes, *args: Any) -> T:
+    """
+    func(content, *args)를 CPU 풀에서 실행하고 결과를 기다립니다. func와 반환값은 피클할 수 있어야 합니다(모듈 수준 함수).
+    CPU_POOL_WORKERS가 1이면 프로세스 대신 스레드에서 실행합니다.
+    지표: pqc_cpu_pool_in_flight(제출했지만 끝나지 않은 작업), pqc_cpu_pool_saturation(in_flight / 워커 수, 1 이상이면 대기 발생),
+    pqc_cpu_pool_wait_seconds(제출부터 시작까지), pqc_cpu_task_duration_seconds{stage}(실행 시간)
+    풀이 고장 나 있으면 새 풀에서 한 번 더 시도합니다. 같은 내용이 새 풀도 죽이면 BrokenProcessPool을 그대로 올립니다.
+    """
+    if len(content) < INLINE_MAX_BYTES:
+        return func(content, *args)
+    workers = resolve_workers(settings.CPU_POOL_WORKERS)
+    if workers <= 1:
+        return await asyncio.to_thread(func, content, *args)
+
+    segment = None
+    payload: Union[bytes, _SharedBuffer] = content
+    if len(content) >= SHARED_MEMORY_MIN_BYTES:
+        segment = shared_memory.SharedMemory(create=True, size=len(content))
+        segment.buf[:len(content)] = content
+        payload = _SharedBuffer(segment.name, len(content))
+        registry.inc("pqc_cpu_pool_shared_bytes_total", len(content))
+
+    _track_in_flight(workers, 1)
+    submitted = time.time()
+    try:
+        for attempt in (1, 2):
+            pool = get_process_pool(workers)
+            try:
+                started, finished, result = await asyncio.wrap_future(pool.submit(_run_task, func, payload, args))
+                break
+            except BrokenProcessPool:
+                discard_process_pool(workers, pool)
+                if attempt == 2:
+                    raise
+    finally:
+        _track_in_flight(workers, -1)
+        if segment is not None:
+            segment.close()
+            segment.unlink()
+    registry.observe("pqc_cpu_pool_wait_seconds", max(0.0, started - submitted))
+    registry.observe("pqc_cpu_task_duration_seconds", finished - started, stage=stage)
+    return result
+
+
+def _track_in_flight(workers: int, delta: int) -> None:
+    registry.set_gauge("pqc_cpu_pool_workers", workers)
+    registry.add_gauge("pqc_cpu_pool_in_flight", delta)
+    in_flight = registry.gauges["pqc_cpu_pool_in_flight"][()]
+    registry.set_gauge("pqc_cpu_pool_saturation", in_flight / workers)
@@ -0,0 +1,234 @@
+# File: pqc_inspector_server/core/telemetry.py
+# ⏱️ 파이프라인 단계별 실행 시간과 LLM 사용량을 기록하는 계측(Instrumentation) 모듈입니다.
+# 분류(classify) → 에이전트(agent) → 검증(validate) → 저장(save) 각 단계를 span으로 감싸고,
+# 소요 시간과 Ollama가 반환한 토큰/로딩 시간을 히스토그램으로 누적합니다.
+# 누적된 값은 /metrics 엔드포인트에서 Prometheus 형식으로 노출됩니다.
+
+import logging
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 히스토그램 구간 (초 단위). LLM 호출은 수 초~수십 초가 걸리므로 위쪽을 넉넉히 둡니다.
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+# 토큰 수 구간
+TOKEN_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """고정 구간 히스토그램. 각 구간의 개수, 합계, 전체 개수만 보관합니다."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"buckets": list(self.buckets), "counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+
+class MetricsRegistry:
+    """
+    이름과 레이블 조합별로 카운터, 게이지, 히스토그램을 관리하는 프로세스 내 레지스트리입니다.
+    기록은 모두 이벤트 루프 스레드에서 일어나므로 락 없이 딕셔너리/리스트 값을 직접 갱신합니다.
+    """
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self.histogram_buckets: Dict[str, Tuple[float, ...]] = {}
+
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        series = self.counters.setdefault(name, {})
+        key = self._key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def add_gauge(self, name: str, delta: float, **labels: Any) -> None:
+        series = self.gauges.setdefault(name, {})
+        key = self._key(labels)
+        series[key] = series.get(key, 0) + delta
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        self.gauges.setdefault(name, {})[self._key(labels)] = value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DURATION_BUCKETS, **labels: Any) -> None:
+        series = self.histograms.get(name)
+        if series is None:
+            series = self.histograms[name] = {}
+            self.histogram_buckets[name] = tuple(buckets)
+        key = self._key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.histogram_buckets[name])
+        histogram.observe(value)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {
+            name: [{"labels": dict(key), **histogram.snapshot()} for key, histogram in series.items()]
+            for name, series in self.histograms.items()
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식(0.0.4)으로 모든 지표를 직렬화합니다."""
+        lines: List[str] = []
+        for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+            for name, series in sorted(metrics.items()):
+                _describe(lines, name, kind)
+                for key, value in list(series.items()):
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+
+        for name, series in sorted(self.histograms.items()):
+            _describe(lines, name, "histogram")
+            for key, histogram in list(series.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(key, le=_format_value(bound))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(key, le='+Inf')} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+# 지표 설명 (HELP 라인)
+METRIC_HELP = {
+    "pqc_files_total": "Files that finished the analysis pipeline",
+    "pqc_analysis_queue_depth": "Accepted analysis tasks that have not started yet",
+    "pqc_analysis_in_progress": "Analysis tasks currently running",
+    "pqc_failures_total": "Pipeline failures by stage and error type",
+    "pqc_cache_requests_total": "Cache lookups by cache and result (hit/miss)",
+    "pqc_rule_decisions_total": "Agent verdicts by how they were reached (rules, partial LLM, full-text LLM)",
+    "pqc_llm_tokens_total": "Tokens consumed by Ollama models (prompt/completion)",
+    "pqc_stage_duration_seconds": "Duration of orchestrator pipeline stages",
+    "pqc_agent_duration_seconds": "Duration of specialist agent analysis per agent",
+    "pqc_llm_request_duration_seconds": "Wall time of Ollama chat requests per model",
+    "pqc_llm_prompt_tokens": "prompt_eval_count per Ollama request",
+    "pqc_llm_completion_tokens": "eval_count per Ollama request",
+    "pqc_llm_load_duration_seconds": "Ollama model load_duration per request",
+    "pqc_llm_total_duration_seconds": "Ollama total_duration per request",
+    "pqc_source_minify_tokens_total": "Prompt tokens of source files before (original) and after (minified) minification",
+    "pqc_llm_slots_in_use": "LLM call slots currently held (bounded by LLM_MAX_CONCURRENCY)",
+    "pqc_llm_queue_depth": "LLM calls waiting for a slot per request lane",
+    "pqc_llm_queue_wait_seconds": "Time LLM calls waited for a slot per request lane",
+    "pqc_admission_rejected_total": "Analysis requests rejected with 429 because the estimated wait was too long",
+    "pqc_cpu_pool_workers": "Processes in the CPU pool used by deterministic scanners",
+    "pqc_cpu_pool_in_flight": "Scanner tasks submitted to the CPU pool that have not finished",
+    "pqc_cpu_pool_saturation": "CPU pool in-flight tasks per worker (above 1 means tasks are queuing)",
+    "pqc_cpu_pool_wait_seconds": "Time scanner tasks waited for a free CPU pool worker",
+    "pqc_cpu_task_duration_seconds": "Scanner run time inside the CPU pool per stage",
+    "pqc_cpu_pool_shared_bytes_total": "File bytes passed to the CPU pool through shared memory",
+    "pqc_cpu_pool_restarts_total": "CPU pools replaced after a worker process died (BrokenProcessPool)",
+}
+
+
+def _describe(lines: List[str], name: str, kind: str) -> None:
+    if name in METRIC_HELP:
+        lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_labels(key: LabelKey, **extra: str) -> str:
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+registry = MetricsRegistry()
+
+# span 종료 시 호출되는 콜백 목록 (stage, duration, status, labels). 벤치마크처럼 원본 측정값이 필요한 곳에서 사용합니다.
+SpanListener = Callable[[str, float, str, Dict[str, str]], None]
+_span_listeners: List[SpanListener] = []
+
+
+def add_span_listener(listener: SpanListener) -> None:
+    _span_listeners.append(listener)
+
+
+def remove_span_listener(listener: SpanListener) -> None:
+    if listener in _span_listeners:
+        _span_listeners.remove(listener)
+
+
+@contextmanager
+def span(stage: str, labels: Optional[Dict[str, str]] = None, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """
+    하나의 파이프라인 단계를 측정합니다.
+    labels는 히스토그램 레이블로, yield된 딕셔너리에 넣은 값은 종료 로그의 구조화 필드로 기록됩니다.
+    예외가 발생하면 단계와 예외 타입별 실패 카운터도 증가시킵니다.
+    """
+    labels = labels or {}
+    fields: Dict[str, Any] = dict(attributes, **labels)
+    status = "ok"
+    start = time.perf_counter()
+    try:
+        yield fields
+    except BaseException as e:
+        status = "error"
+        record_failure(stage, e)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        registry.observe("pqc_stage_duration_seconds", duration, stage=stage, status=status)
+        if labels:
+            registry.observe(f"pqc_{stage}_duration_seconds", duration, **labels)
+        for listener in _span_listeners:
+            listener(stage, duration, status, labels)
+        logger.debug("span 종료", extra={"stage": stage, "status": status, "duration_s": round(duration, 4), **fields})
+
+
+def record_failure(stage: str, error: BaseException) -> None:
+    """단계별, 예외 타입별 실패 횟수를 기록합니다."""
+    registry.inc("pqc_failures_total", stage=stage, error_type=type(error).__name__)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 조회 결과를 기록합니다. 적중률은 hit / (hit + miss)로 계산합니다."""
+    registry.inc("pqc_cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+
+def record_rule_decision(agent: str, outcome: str) -> None:
+    """결정적 규칙 단계의 판정 방식을 기록합니다. outcome: rules(LLM 미호출) | partial(일부만 LLM) | text(원문 LLM 분석)"""
+    registry.inc("pqc_rule_decisions_total", agent=agent, outcome=outcome)
+
+
+def record_llm_usage(model: str, response: Dict[str, Any], duration: Optional[float] = None) -> None:
+    """
+    Ollama 응답에 포함된 토큰 수와 로딩/전체 시간(나노초)을 히스토그램에 기록합니다.
+    """
+    prompt_tokens = response.get("prompt_eval_count") or 0
+    completion_tokens = response.get("eval_count") or 0
+    if duration is not None:
+        registry.observe("pqc_llm_request_duration_seconds", duration, model=model)
+    registry.observe("pqc_llm_prompt_tokens", prompt_tokens, TOKEN_BUCKETS, model=model)
+    registry.observe("pqc_llm_completion_tokens", completion_tokens, TOKEN_BUCKETS, model=model)
+    registry.observe("pqc_llm_load_duration_seconds", (response.get("load_duration") or 0) / 1e9, model=model)
+    registry.observe("pqc_llm_total_duration_seconds", (response.get("total_duration") or 0) / 1e9, model=model)
+    registry.inc("pqc_llm_tokens_total", prompt_tokens, model=model, kind="prompt")
+    registry.inc("pqc_llm_tokens_total", completion_tokens, model=model, kind="completion")
@@ -3,8 +3,13 @@
 
 import httpx
 import asyncio
-from typing import Dict, Any, Optional
+import json
+import logging
+from typing import Dict, Any, Optional, AsyncIterator
 from ..core.config import settings
+from ..core.telemetry import record_failure
+
+logger = logging.getLogger(__name__)
 
 class ExternalAPIClient:
     def __init__(self):
@@ -16,7 +21,7 @@ class ExternalAPIClient:
             timeout=self.timeout,
             headers={"Authorization": f"Bearer {self.api_key}"}
         )
-        print("ExternalAPIClient가 초기화되었습니다.")
+        logger.debug("ExternalAPIClient가 초기화되었습니다.")
 
     async def save_analysis_result(self, task_id: str, result_data: Dict[str, Any]) -> bool:
         """
@@ -27,18 +32,20 @@ class ExternalAPIClient:
             # JSONPlaceholder의 posts 엔드포인트를 사용하여 테스트
             payload = {
                 "title": f"PQC Analysis Result - {task_id}",
-                "body": str(result_data),
+                "body": json.dumps({"task_id": task_id, **result_data}, ensure_ascii=False),
                 "userId": 1
             }
             response = await self.client.post("/posts", json=payload)
             response.raise_for_status()
-            print(f"작업 ID [{task_id}] - 외부 API에 결과 저장 성공 (테스트)")
+            logger.debug("외부 API에 결과 저장 성공 (테스트)", extra={"task_id": task_id})
             return True
         except httpx.HTTPStatusError as e:
-            print(f"외부 API 오류 (저장): {e.response.status_code} - {e.response.text}")
+            record_failure("save", e)
+            logger.error("외부 API 오류 (저장)", extra={"status_code": e.response.status_code, "response": e.response.text})
             return False
         except httpx.RequestError as e:
-            print(f"외부 API 연결 오류 (저장): {e}")
+            record_failure("save", e)
+            logger.error("외부 API 연결 오류 (저장)", extra={"error": str(e)})
             return False
 
     async def get_analysis_result(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -65,15 +72,47 @@ class ExternalAPIClient:
                 "analysis_timestamp": "2024-01-01T00:00:00Z"
             }
             
-            print(f"작업 ID [{task_id}] - 외부 API에서 결과 조회 성공 (테스트)")
+            logger.debug("외부 API에서 결과 조회 성공 (테스트)", extra={"task_id": task_id})
             return mock_result
         except httpx.HTTPStatusError as e:
-            print(f"외부 API 오류 (조회): {e.response.status_code} - {e.response.text}")
+            logger.error("외부 API 오류 (조회)", extra={"status_code": e.response.status_code, "response": e.response.text})
             return None
         except httpx.RequestError as e:
-            print(f"외부 API 연결 오류 (조회): {e}")
+            logger.error("외부 API 연결 오류 (조회)", extra={"error": str(e)})
             return None
 
+    async def iter_analysis_results(self, page_size: int = 100) -> AsyncIterator[Dict[str, Any]]:
+        """
+        저장된 분석 결과를 페이지 단위로 조회하여 한 건씩 반환하는 비동기 제너레이터입니다.
+        전체 결과를 메모리에 올리지 않으므로 대량 스캔 보고서 생성에 사용합니다.
+        테스트용으로 JSONPlaceholder API의 페이지네이션(_start, _limit)을 사용합니다.
+        """
+        start = 0
+        while True:
+            try:
+                response = await self.client.get("/posts", params={"_start": start, "_limit": page_size})
+                response.raise_for_status()
+                page = response.json()
+            except httpx.HTTPStatusError as e:
+                logger.error("외부 API 오류 (목록 조회)", extra={"status_code": e.response.status_code, "response": e.response.text})
+                return
+            except httpx.RequestError as e:
+                logger.error("외부 API 연결 오류 (목록 조회)", extra={"error": str(e)})
+                return
+
+            for post in page:
+                # save_analysis_result가 저장한 JSON 본문만 결과로 인정합니다.
+                try:
+                    result = json.loads(post.get("body") or "")
+                except (TypeError, ValueError):
+                    continue
+                if isinstance(result, dict) and "file_name" in result:
+                    yield result
+
+            if len(page) < page_size:
+                return
+            start += page_size
+
     async def close(self):
         """클라이언트 연결을 종료합니다."""
         await self.client.aclose()
@@ -1,7 +1,7 @@
 # File: pqc_inspector_server/orchestrator/controller.py
 # 🧠 파일 분류, 에이전트 호출, 결과 취합 및 DB 저장을 총괄하는 오케스트레이터 컨트롤러입니다.
 
-from fastapi import UploadFile, Depends
+from fastapi import UploadFile, Depends, BackgroundTasks
 
 # --- 의존성 임포트 변경 및 추가 ---
 from ..db.api_client import ExternalAPIClient, get_api_client
@@ -9,10 +9,42 @@ from ..agents.source_code import SourceCodeAgent
 from ..agents.binary import BinaryAgent
 from ..agents.parameter import ParameterAgent
 from ..agents.log_conf import LogConfAgent
+from ..agents.certificate import CertificateAgent
+from ..agents.dependency import DependencyAgent
+from ..agents.base_agent import merge_agent_results
 from ..api.schemas import AnalysisResultCreate
 from ..services.ollama_service import OllamaService, get_ollama_service
+from ..scanners.prescan import prescan, prescan_indicators
+from ..scanners.custom_crypto import source_language
+from ..scanners.server_config import detect_dialect
+from ..scanners.file_types import rule_based_file_type
+from ..scanners.jvm import is_jvm_archive
+from ..scanners.symbol_index import ProjectIndex, build_project_index
+from ..scanners.findings import findings_to_result
+from ..services.archive import is_archive, read_archive
+from ..services.result_cache import CacheEntry, CacheHit, get_result_cache, sketch_with_indicators
+from ..services.git_repository import GitError, bundle_repository, list_tree, read_blobs
+from ..services.scan_manifest import ScanManifest, build_delta, repository_key, save_delta
+from ..services.job_queue import Job, get_job_queue
+from ..services.scheduler import BULK, INTERACTIVE, request_class
 from ..core.config import settings
+from ..core.process_pool import run_cpu_bound
+from ..core.logging_config import current_task_id
+from ..core.telemetry import record_cache, record_rule_decision, registry, span
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import contextlib
+import hashlib
 import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 같은 저장소의 증분 스캔이 동시에 매니페스트를 덮어쓰지 않도록 저장소별로 직렬화합니다.
+_repository_locks: Dict[str, asyncio.Lock] = {}
+# 진행 중인 분석 (내용 해시, 파일 이름, 설정 지문) → 결과 Future. 같은 파일이 동시에 여러 번 올라오면 하나만 분석합니다.
+_inflight: Dict[Tuple[str, str, str], "asyncio.Future[Optional[AnalysisResultCreate]]"] = {}
 
 class OrchestratorController:
     def __init__(self, api_client: ExternalAPIClient):
@@ -24,9 +56,11 @@ class OrchestratorController:
             "source_code": SourceCodeAgent(),
             "binary": BinaryAgent(),
             "parameter": ParameterAgent(),
-            "log_conf": LogConfAgent()
+            "log_conf": LogConfAgent(),
+            "certificate": CertificateAgent(),
+            "dependency": DependencyAgent()
         }
-        print("OrchestratorController가 AI 오케스트레이터와 함께 초기화되었습니다.")
+        logger.debug("OrchestratorController가 AI 오케스트레이터와 함께 초기화되었습니다.")
 
     async def classify_file_type(self, file: UploadFile) -> str:
         """
@@ -36,80 +70,10 @@ class OrchestratorController:
         if not file.filename:
             return "unknown"
 
-        try:
-            # 파일 내용 읽기 (처음 1KB만)
-            content = await file.read(1024)
-            await file.seek(0)  # 포인터 초기화
-            
-            # 텍스트 변환 시도
-            try:
-                content_preview = content.decode('utf-8')
-            except UnicodeDecodeError:
-                # 바이너리 파일의 경우 헥스 미리보기
-                content_preview = f"Binary file (hex preview): {content[:50].hex()}"
-
-            # AI 오케스트레이터 프롬프트
-            classification_prompt = f"""파일 분류 전문가로서 다음 파일을 분석하여 적절한 카테고리로 분류해주세요.
-
-파일 정보:
-- 파일명: {file.filename}
-- 크기: {len(content)} bytes
-- 내용 미리보기:
-```
-{content_preview[:500]}
-```
-
-분류 카테고리:
-1. source_code: 프로그래밍 언어 소스코드 (.py, .java, .c, .go, .js 등)
-2. binary: 실행 파일, 라이브러리 (.exe, .so, .dll 등)
-3. parameter: 설정 파일, 매개변수 (.json, .yaml, .xml, .config 등)
-4. log_conf: 로그 파일, 서버 설정 (.log, .conf, .ini 등)
-
-JSON 형식으로만 응답:
-{{"file_type": "카테고리명", "confidence": 0.0-1.0, "reasoning": "분류 근거"}}"""
-
-            # AI 모델 호출
-            ai_response = await self.ollama_service.generate_response(
-                model=self.orchestrator_model,
-                prompt=classification_prompt,
-                system_prompt="당신은 파일 타입 분류 전문가입니다. 파일명, 확장자, 내용을 종합적으로 분석하여 정확한 분류를 수행합니다."
-            )
-
-            if ai_response.get("success"):
-                try:
-                    # JSON 응답 파싱
-                    response_text = ai_response["content"]
-                    json_start = response_text.find('{')
-                    json_end = response_text.rfind('}') + 1
-                    
-                    if json_start >= 0 and json_end > json_start:
-                        json_text = response_text[json_start:json_end]
-                        classification_result = json.loads(json_text)
-                        
-                        file_type = classification_result.get("file_type", "unknown")
-                        confidence = classification_result.get("confidence", 0.0)
-                        reasoning = classification_result.get("reasoning", "")
-                        
-                        # 유효한 타입인지 검증
-                        valid_types = ["source_code", "binary", "parameter", "log_conf"]
-                        if file_type not in valid_types:
-                            file_type = self._fallback_classification(file.filename)
-                        
-                        print(f"AI 분류 결과 - 파일: '{file.filename}' → 타입: '{file_type}' (신뢰도: {confidence:.2f})")
-                        print(f"분류 근거: {reasoning}")
-                        
-                        return file_type
-                        
-                except (json.JSONDecodeError, KeyError) as e:
-                    print(f"AI 분류 응답 파싱 실패: {e}")
-                    return self._fallback_classification(file.filename)
-            else:
-                print(f"AI 분류 실패: {ai_response.get('error')}")
-                return self._fallback_classification(file.filename)
-                
-        except Exception as e:
-            print(f"파일 분류 중 오류 발생: {e}")
-            return self._fallback_classification(file.filename)
+        # 파일 내용 읽기 (처음 1KB만)
+        content = await file.read(1024)
+        await file.seek(0)  # 포인터 초기화
+        return await self._classify_file_type_from_content(file.filename, content)
 
     def _fallback_classification(self, filename: str) -> str:
         """AI 분류 실패시 확장자 기반 폴백 분류"""
@@ -121,91 +85,532 @@ JSON 형식으로만 응답:
             '.go': 'source_code', '.js': 'source_code', '.ts': 'source_code', '.rs': 'source_code',
             '.json': 'parameter', '.yaml': 'parameter', '.yml': 'parameter', '.xml': 'parameter',
             '.toml': 'parameter', '.ini': 'parameter', '.cfg': 'parameter', '.config': 'parameter',
-            '.log': 'log_conf', '.conf': 'log_conf', '.txt': 'log_conf'
+            '.log': 'log_conf', '.conf': 'log_conf', '.txt': 'log_conf',
+            '.pem': 'certificate', '.crt': 'certificate', '.cer': 'certificate', '.der': 'certificate',
+            '.key': 'certificate', '.csr': 'certificate', '.p7b': 'certificate', '.p12': 'certificate',
+            '.pfx': 'certificate', '.jks': 'certificate', '.keystore': 'certificate',
+            '.lock': 'dependency', '.sum': 'dependency', '.mod': 'dependency'
         }
         
         file_ext = "." + filename.split('.')[-1].lower()
         file_type = extension_map.get(file_ext, "binary")
         
-        print(f"폴백 분류: '{filename}' → '{file_type}' (확장자 기반)")
+        logger.info("폴백 분류 (확장자 기반)", extra={"file_name": filename, "file_type": file_type})
         return file_type
 
-    async def start_analysis_with_content(self, filename: str, file_content: bytes, task_id: str):
+    async def schedule_analysis(self, background_tasks: BackgroundTasks, filename: str, file_content: bytes, task_id: str,
+                                project: bool = False, lane: Optional[str] = None, client: str = ""):
+        """
+        분석 작업을 백그라운드 태스크로 등록합니다. 시작 전까지는 대기열 깊이 지표에 포함됩니다.
+        project가 True면 압축한 저장소를 파일별로 분석합니다.
+        lane(기본: 단일 파일은 interactive, 프로젝트는 bulk)과 client는 분석 중 LLM 호출 슬롯을 배정할 때 씁니다.
+        JOB_QUEUE_ENABLED면 이 프로세스에서 분석하지 않고 작업 대기열에 넣어 워커 프로세스가 처리하게 합니다.
+        """
+        lane = lane or (BULK if project else INTERACTIVE)
+        if settings.JOB_QUEUE_ENABLED:
+            await self._enqueue("project" if project else "file", task_id, filename, file_content,
+                                {"lane": lane, "client": client})
+            return
+        registry.add_gauge("pqc_analysis_queue_depth", 1)
+        background_tasks.add_task(self._run_queued_analysis, filename, file_content, task_id, project, lane, client)
+
+    async def _enqueue(self, kind: str, task_id: str, filename: str, payload: Optional[bytes] = None,
+                       options: Optional[Dict[str, Any]] = None):
+        queue = get_job_queue(settings.JOB_QUEUE_PATH, settings.JOB_MAX_ATTEMPTS)
+        lane = (options or {}).get("lane") or (INTERACTIVE if kind == "file" else BULK)
+        job_id = await asyncio.to_thread(queue.enqueue, kind, task_id, filename, payload, options, lane)
+        registry.inc("pqc_jobs_enqueued_total", kind=kind)
+        logger.info("작업 대기열에 등록", extra={"job_id": job_id, "kind": kind, "lane": lane, "file_name": filename})
+
+    async def run_job(self, job: Job):
+        """워커 프로세스가 대기열에서 꺼낸 작업을 실행합니다. (schedule_* 에서 등록한 작업)"""
+        lane = job.options.get("lane") or (INTERACTIVE if job.kind == "file" else BULK)
+        with request_class(lane, job.options.get("client", "")):
+            await self._run_job(job)
+
+    async def _run_job(self, job: Job):
+        # 실패(저장 실패 등)는 워커에 그대로 올려 대기열이 재시도/실패 상태를 기록하게 합니다.
+        if job.kind == "repository":
+            await self.start_repository_analysis(job.filename, job.task_id, job.options["ref"],
+                                                 job.options.get("repo_path"), job.payload, raise_errors=True)
+        elif job.kind == "project":
+            await self.start_project_analysis_with_content(job.filename, job.payload, job.task_id, raise_errors=True)
+        elif job.kind == "file":
+            await self.start_analysis_with_content(job.filename, job.payload, job.task_id, raise_errors=True)
+        else:
+            raise ValueError(f"알 수 없는 작업 종류: {job.kind}")
+
+    async def _run_queued_analysis(self, filename: str, file_content: bytes, task_id: str, project: bool = False,
+                                   lane: str = INTERACTIVE, client: str = ""):
+        registry.add_gauge("pqc_analysis_queue_depth", -1)
+        with request_class(lane, client):
+            if project:
+                await self.start_project_analysis_with_content(filename, file_content, task_id)
+            else:
+                await self.start_analysis_with_content(filename, file_content, task_id)
+
+    async def start_analysis_with_content(self, filename: str, file_content: bytes, task_id: str,
+                                          raise_errors: bool = False):
         """
         파일 내용을 받아서 분석 프로세스 전체를 관리하는 메인 메소드입니다.
-        AI 오케스트레이터가 분류, 분석, 검증, 요약까지 수행합니다.
+        AI 오케스트레이터가 분류, 분석, 검증, 요약까지 수행한 뒤 결과를 외부 API에 저장합니다.
+        백그라운드 태스크에서는 예외를 기록만 하고, raise_errors면 (워커) 호출자에게 다시 올립니다.
         """
-        print("=" * 80)
-        print(f"🚀 [작업 ID: {task_id}] PQC 분석 시작")
-        print(f"📁 파일명: {filename}")
-        print(f"📏 파일 크기: {len(file_content):,} bytes")
-        print("=" * 80)
-        
+        token = current_task_id.set(task_id)
+        registry.add_gauge("pqc_analysis_in_progress", 1)
+        try:
+            logger.info("PQC 분석 시작", extra={"file_name": filename, "file_size": len(file_content)})
+            final_result = await self.analyze_content(filename, file_content)
+            registry.inc("pqc_files_total", file_type=final_result.file_type)
+
+            with span("save"):
+                await self._save_result(task_id, final_result, raise_errors)
+            logger.info("PQC 분석 완료", extra={
+                "file_type": final_result.file_type,
+                "is_pqc_vulnerable": final_result.is_pqc_vulnerable,
+                "detected_algorithms": final_result.detected_algorithms,
+                "confidence_score": final_result.confidence_score,
+            })
+        except Exception:
+            if raise_errors:
+                raise
+            logger.exception("분석 결과 저장 실패")
+        finally:
+            registry.add_gauge("pqc_analysis_in_progress", -1)
+            current_task_id.reset(token)
+
+    async def start_project_analysis_with_content(self, filename: str, file_content: bytes, task_id: str,
+                                                  raise_errors: bool = False):
+        """
+        압축한 저장소/프로젝트를 파일별로 분석하고, 파일마다 결과를 같은 작업 ID로 외부 API에 저장합니다.
+        """
+        token = current_task_id.set(task_id)
+        registry.add_gauge("pqc_analysis_in_progress", 1)
+        try:
+            logger.info("프로젝트 분석 시작", extra={"file_name": filename, "file_size": len(file_content)})
+            results = await self.analyze_project(filename, file_content)
+            with span("save"):
+                for result in results:
+                    registry.inc("pqc_files_total", file_type=result.file_type)
+                    await self._save_result(task_id, result, raise_errors)
+            logger.info("프로젝트 분석 완료", extra={
+                "file_name": filename, "files": len(results),
+                "vulnerable_files": sum(1 for result in results if result.is_pqc_vulnerable),
+            })
+        except Exception:
+            if raise_errors:
+                raise
+            logger.exception("프로젝트 분석 결과 저장 실패")
+        finally:
+            registry.add_gauge("pqc_analysis_in_progress", -1)
+            current_task_id.reset(token)
+
+    async def _save_result(self, task_id: str, result: AnalysisResultCreate, raise_errors: bool) -> bool:
+        """
+        결과를 외부 API에 저장하고 저장했는지를 반환합니다. 저장하지 못했는데(False) raise_errors면 워커가 재시도하도록 예외를 냅니다.
+        워커(raise_errors)에서는 (작업 ID, 파일 이름)별로 저장한 결과를 작업 대기열에 기록해 두고, 재시도한 작업은
+        이미 저장한 결과를 건너뜁니다. (외부 API 저장 직후 기록 전에 워커가 죽은 경우만 중복될 수 있습니다)
+        """
+        queue = get_job_queue(settings.JOB_QUEUE_PATH, settings.JOB_MAX_ATTEMPTS) if raise_errors else None
+        if queue is not None and await asyncio.to_thread(queue.is_saved, task_id, result.file_name):
+            logger.info("이미 저장한 결과 건너뜀", extra={"file_name": result.file_name})
+            return True
+        saved = await self.api_client.save_analysis_result(task_id, result.model_dump())
+        if saved is False:
+            if raise_errors:
+                raise RuntimeError(f"외부 API 결과 저장 실패: {result.file_name}")
+            return False
+        if queue is not None:
+            await asyncio.to_thread(queue.mark_saved, task_id, result.file_name)
+        return True
+
+    async def analyze_project(self, filename: str, file_content: bytes) -> List[AnalysisResultCreate]:
+        """
+        압축한 저장소/프로젝트의 파일별 결과를 반환합니다. 압축 파일이 아니면 단일 파일로 분석합니다.
+        먼저 프로젝트 심볼 색인을 만들어, 다른 파일의 암호 래퍼(utils/crypto.py의 secure_send 등)를 부르는 호출 지점을 찾습니다.
+        자체적으로는 암호를 쓰지 않고 래퍼만 부르는 파일은 LLM 호출 없이 색인 결과로 판정합니다.
+        """
+        with span("archive") as fields:
+            members = await run_cpu_bound("archive", read_archive, file_content, filename)
+            fields["members"] = len(members)
+        if not members:
+            return [await self.analyze_content(filename, file_content)]
+
+        index = await self._build_symbol_index(filename, members)
+        results: List[AnalysisResultCreate] = []
+        configs = await self._analyze_config_bundle(filename, members)
+        if configs is not None:
+            results.append(configs[1])
+        # 파일마다 순서대로 기다리면 LLM 슬롯이 남아도 한 번에 호출 하나만 나가므로 묶어서 동시에 분석합니다.
+        # 동시에 분석하는 파일 수는 PROJECT_FILE_CONCURRENCY로 제한하고, 결과는 압축 파일 안의 순서를 지킵니다.
+        limit = asyncio.Semaphore(max(1, settings.PROJECT_FILE_CONCURRENCY))
+
+        async def analyze_member(path: str, content: bytes) -> AnalysisResultCreate:
+            async with limit:
+                return (await self._analyze_project_file(path, content, index))[1]
+
+        skipped = configs[0] if configs is not None else set()
+        results.extend(await asyncio.gather(*(
+            analyze_member(path, content) for path, content in members.items() if path not in skipped
+        )))
+        return results
+
+    async def schedule_repository_analysis(self, background_tasks: BackgroundTasks, repository: str, task_id: str,
+                                           ref: str = "HEAD", repo_path: Optional[str] = None, bundle: Optional[bytes] = None,
+                                           lane: str = BULK, client: str = ""):
+        """저장소 증분 스캔을 백그라운드 태스크로 등록합니다. repo_path(로컬 저장소)와 bundle(git 번들) 중 하나를 줍니다."""
+        if settings.JOB_QUEUE_ENABLED:
+            await self._enqueue("repository", task_id, repository, bundle,
+                                {"ref": ref, "repo_path": repo_path, "lane": lane, "client": client})
+            return
+        registry.add_gauge("pqc_analysis_queue_depth", 1)
+        background_tasks.add_task(self._run_queued_repository_analysis, repository, task_id, ref, repo_path, bundle,
+                                  lane, client)
+
+    async def _run_queued_repository_analysis(self, repository: str, task_id: str, ref: str,
+                                              repo_path: Optional[str], bundle: Optional[bytes],
+                                              lane: str = BULK, client: str = ""):
+        registry.add_gauge("pqc_analysis_queue_depth", -1)
+        with request_class(lane, client):
+            await self.start_repository_analysis(repository, task_id, ref, repo_path, bundle)
+
+    async def start_repository_analysis(self, repository: str, task_id: str, ref: str,
+                                        repo_path: Optional[str], bundle: Optional[bytes], raise_errors: bool = False):
+        """저장소 증분 스캔을 실행하고 새로 분석한 파일의 결과를 같은 작업 ID로 외부 API에 저장합니다."""
+        token = current_task_id.set(task_id)
+        registry.add_gauge("pqc_analysis_in_progress", 1)
+        try:
+            with contextlib.ExitStack() as stack:
+                git_dir = repo_path
+                if bundle is not None:
+                    git_dir = await asyncio.to_thread(stack.enter_context, bundle_repository(bundle))
+
+                async def store(results: List[AnalysisResultCreate]) -> bool:
+                    stored = True
+                    with span("save"):
+                        for result in results:
+                            registry.inc("pqc_files_total", file_type=result.file_type)
+                            stored = await self._save_result(task_id, result, raise_errors) and stored
+                    return stored
+
+                results, delta = await self.analyze_repository(git_dir, ref, repository, store)
+            logger.info("저장소 증분 분석 완료", extra={
+                "repository": repository, "commit": delta["commit"], "base_commit": delta["base_commit"],
+                "analyzed": delta["analyzed"], "reevaluated": len(delta["reevaluated"]),
+                "carried_forward": delta["carried_forward"], "newly_vulnerable": len(delta["newly_vulnerable"]),
+                "resolved": len(delta["resolved"]),
+            })
+        except GitError as e:
+            if raise_errors:
+                raise
+            logger.error("저장소 읽기 실패", extra={"repository": repository, "ref": ref, "error": str(e)})
+        except Exception:
+            if raise_errors:
+                raise
+            logger.exception("저장소 증분 분석 실패")
+        finally:
+            registry.add_gauge("pqc_analysis_in_progress", -1)
+            current_task_id.reset(token)
+
+    async def analyze_repository(self, git_dir: str, ref: str, repository: str,
+                                 store: Optional[Callable[[List[AnalysisResultCreate]], Awaitable[bool]]] = None
+                                 ) -> Tuple[List[AnalysisResultCreate], Dict[str, Any]]:
+        """
+        git 저장소의 ref를 이전 스캔 매니페스트(경로별 blob ID)와 비교해 추가/수정된 blob만 분석합니다.
+        바뀌지 않은 파일은 이전 결과를 이어받되, 다른 파일의 암호 래퍼가 바뀌어 심볼 색인 결과가 달라졌으면
+        저장해 둔 파일 자체 분석 결과에 색인 결과만 다시 합칩니다 (LLM 호출 없음).
+        이번에 새로 만든 결과 목록과 변경(delta) 보고서를 반환합니다.
+        store가 있으면 새 결과를 먼저 저장하고, 모두 저장했을 때만 매니페스트를 갱신합니다. 저장하다 실패(예외 또는 False)하면
+        매니페스트가 그대로이므로 다음 스캔(워커 재시도 포함)이 같은 파일을 다시 분석해 저장합니다.
+        """
+        lock = _repository_locks.setdefault(repository_key(repository), asyncio.Lock())
+        async with lock:
+            previous = ScanManifest.load(settings.REPO_SCAN_DIR, repository)
+            with span("git_tree") as fields:
+                commit, entries = await asyncio.to_thread(list_tree, git_dir, ref)
+                fields["files"] = len(entries)
+            before = previous.files if previous else {}
+            added = sorted(path for path in entries if path not in before)
+            modified = sorted(path for path in entries if path in before and before[path]["blob"] != entries[path].blob)
+            removed = sorted(path for path in before if path not in entries)
+            changed = set(added) | set(modified)
+            # 분석에 실패했던 결과(신뢰도 0)는 이어받지 않고 다시 분석합니다.
+            retry = {path for path, entry in before.items() if path in entries and not entry.get("config")
+                     and not (entry.get("result") or {}).get("confidence_score")}
+
+            # 바뀐 파일과 심볼 색인에 필요한 소스 파일만 읽습니다.
+            wanted = changed | retry | {path for path in entries if source_language(path)}
+            with span("git_read") as fields:
+                contents = await asyncio.to_thread(read_blobs, git_dir, {path: entries[path] for path in wanted})
+                fields["files"] = len(contents)
+            index = await self._build_symbol_index(repository, contents, previous.symbol_snapshot if previous else "")
+            current = ScanManifest(repository, commit, index.snapshot)
+
+            async def read(path: str) -> bytes:
+                if path not in contents:
+                    contents.update(await asyncio.to_thread(read_blobs, git_dir, {path: entries[path]}))
+                return contents.get(path, b"")
+
+            # 설정 묶음은 설정 파일이 추가/수정/삭제되었을 때만 다시 분석합니다.
+            fresh: List[AnalysisResultCreate] = []
+            analyzed: List[str] = []
+            reevaluated: List[str] = []
+            new_configs = {path for path in changed if detect_dialect(path, contents[path])}
+            config_paths = {path for path, entry in before.items() if entry.get("config") and path in entries} - changed
+            if new_configs or any(before[path].get("config") for path in modified + removed):
+                config_paths |= new_configs
+                configs = await self._analyze_config_bundle(repository, {path: await read(path) for path in config_paths})
+                config_paths = configs[0] if configs else set()
+                if configs:
+                    # 묶음에 든 설정 파일도 이번에 분석한 것이므로 이어받은 파일로 세지 않습니다.
+                    analyzed.extend(sorted(config_paths))
+                    fresh.append(configs[1])
+                    current.config_result = configs[1].model_dump()
+            elif previous:
+                current.config_result = previous.config_result
+
+            for path, entry in sorted(entries.items()):
+                if path in config_paths:
+                    current.files[path] = {"blob": entry.blob, "config": True}
+                    continue
+                findings = index.findings(path) if path in index.files else []
+                symbols = _symbol_fingerprint(findings)
+                old = before.get(path) or {}
+                if path not in changed and path not in retry and not old.get("config"):
+                    if symbols == old.get("symbols"):
+                        current.files[path] = old
+                        continue
+                    if old.get("base") or findings:
+                        reevaluated.append(path)
+                        base = AnalysisResultCreate(**old["base"]) if old.get("base") else None
+                        result = (self._with_symbol_findings(base, findings, index) if base
+                                  else self._symbol_only_result(path, findings, index))
+                        current.files[path] = {"blob": entry.blob, "symbols": symbols,
+                                               "base": old.get("base"), "result": result.model_dump()}
+                        fresh.append(result)
+                        continue
+                analyzed.append(path)
+                base, result = await self._analyze_project_file(path, await read(path), index)
+                current.files[path] = {"blob": entry.blob, "symbols": symbols,
+                                       "base": base.model_dump() if base else None, "result": result.model_dump()}
+                fresh.append(result)
+
+            delta = build_delta(previous, current, added, modified, removed, analyzed, reevaluated)
+            if store is not None and not await store(fresh):
+                logger.warning("결과를 모두 저장하지 못해 스캔 매니페스트를 갱신하지 않음", extra={"repository": repository})
+                return fresh, delta
+            current.save(settings.REPO_SCAN_DIR)
+            save_delta(settings.REPO_SCAN_DIR, delta)
+        return fresh, delta
+
+    async def _build_symbol_index(self, label: str, members: Dict[str, bytes], base_snapshot: str = "") -> ProjectIndex:
+        with span("symbol_index") as fields:
+            index = await asyncio.to_thread(
+                build_project_index, members, settings.SYMBOL_INDEX_WORKERS, settings.SYMBOL_INDEX_DIR, base_snapshot
+            )
+            fields["files"] = len(index.files)
+            fields["reused"] = index.reused if not index.loaded else len(index.files)
+        logger.info("프로젝트 심볼 색인 완료", extra={"file_name": label, "summary": index.summary()})
+        return index
+
+    async def _analyze_config_bundle(self, label: str, members: Dict[str, bytes]):
+        """
+        서버 설정은 include를 같은 묶음 안에서 펼쳐야 하므로 한꺼번에 분석합니다.
+        설정 파일이 있으면 (설정 파일 경로 집합, 결과), 없으면 None.
+        """
+        configs = {path: content for path, content in members.items() if detect_dialect(path, content)}
+        agent_result = await self.agents["log_conf"].analyze_server_configs(configs, label) if configs else None
+        if agent_result is None:
+            return None
+        return set(configs), AnalysisResultCreate(file_name=label, file_type="log_conf", **agent_result)
+
+    async def _analyze_project_file(self, path: str, content: bytes, index: ProjectIndex):
+        """
+        프로젝트 안의 파일 하나를 분석해 (파일 자체 분석 결과, 최종 결과)를 반환합니다.
+        래퍼 호출만 있는 파일은 파일 자체 분석 결과 없이(None) 색인 결과로 판정합니다.
+        """
+        findings = index.findings(path)
+        if findings and path not in index.direct_paths and not await run_cpu_bound("prescan", prescan, content):
+            return None, self._symbol_only_result(path, findings, index)
+        base = await self.analyze_content(path, content)
+        return base, self._with_symbol_findings(base, findings, index)
+
+    def _symbol_only_result(self, path: str, findings: List[Dict[str, Any]], index: ProjectIndex) -> AnalysisResultCreate:
+        record_rule_decision("source_code", "rules")
+        result = self._symbol_index_result(findings, index)
+        result["orchestrator_summary"] = "프로젝트 심볼 색인 전이 결과 (LLM 분석/검증 생략)"
+        return AnalysisResultCreate(file_name=path, file_type="source_code", **result)
+
+    def _with_symbol_findings(self, base: AnalysisResultCreate, findings: List[Dict[str, Any]],
+                              index: ProjectIndex) -> AnalysisResultCreate:
+        """파일 자체 분석 결과에 다른 파일의 래퍼를 부르는 호출 지점을 더합니다."""
+        if not findings:
+            return base
+        merged = merge_agent_results([
+            base.model_dump(exclude={"file_name", "file_type", "orchestrator_summary"}),
+            self._symbol_index_result(findings, index),
+        ])
+        merged["orchestrator_summary"] = base.orchestrator_summary
+        return AnalysisResultCreate(file_name=base.file_name, file_type=base.file_type, **merged)
+
+    def _symbol_index_result(self, findings: List[Dict[str, Any]], index: ProjectIndex) -> Dict[str, Any]:
+        result = findings_to_result(findings, "프로젝트 심볼 색인(암호 래퍼 호출)")
+        chains = [f"{finding['location']}: {' → '.join(finding['chain'])}" for finding in findings[:10]]
+        result["evidence"] = "\n".join(filter(None, [result["evidence"], "호출 경로:", *chains, *index.summary()]))
+        return result
+
+    async def analyze_content(self, filename: str, file_content: bytes) -> AnalysisResultCreate:
+        """
+        분류 → 전문 에이전트 분석 → 오케스트레이터 검증 단계를 실행하고 최종 결과 모델을 반환합니다.
+        저장은 하지 않으므로 평가/벤치마크 등에서도 그대로 재사용할 수 있습니다.
+        같은 파일(내용, 파일 이름, 설정)의 분석이 이미 진행 중이면 새로 시작하지 않고 그 결과를 함께 받고,
+        같은 내용이나 조금만 고친 복사본을 이미 분석했으면 (RESULT_CACHE_ENABLED) 그 결과를 이어받습니다.
+        """
+        key = (hashlib.sha256(file_content).hexdigest(), os.path.basename(filename), _settings_fingerprint())
+        running = _inflight.get(key)
+        record_cache("inflight", running is not None)
+        if running is not None:
+            with span("coalesced"):
+                result = await asyncio.shield(running)
+            if result is not None:
+                return result.model_copy(update={"file_name": filename}, deep=True)
+            # 먼저 시작한 분석이 예외로 끝났으면 직접 분석합니다.
+            return await self._analyze_with_cache(filename, file_content)
+
+        future: "asyncio.Future[Optional[AnalysisResultCreate]]" = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            result = await self._analyze_with_cache(filename, file_content)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.set_result(None)
+            del _inflight[key]
+
+    async def _analyze_with_cache(self, filename: str, file_content: bytes) -> AnalysisResultCreate:
+        # 구조 판별(DER 파싱 포함)은 CPU 풀에서 한 번만 하고 캐시 서명, 사전 스캔 생략, 분류에 함께 씁니다.
+        rule_type = await run_cpu_bound("file_type", rule_based_file_type, file_content, filename)
+        if not settings.RESULT_CACHE_ENABLED:
+            return await self._analyze_content(filename, file_content, rule_type)
+
+        cache = get_result_cache(settings.SIMILARITY_MAX_DISTANCE, settings.RESULT_CACHE_SIZE)
+        with span("result_cache") as fields:
+            # 스케치와 사전 스캔 근거는 CPU 풀에서 함께 계산하고, 근거는 캐시를 놓쳤을 때 사전 스캔 단계에 그대로 넘깁니다.
+            sketch, indicators = await run_cpu_bound("result_cache", sketch_with_indicators, file_content, filename)
+            # 결과를 재사용하기 전에 비교하는 값싼 규칙 판정 (규칙 분류, 사전 스캔 알고리즘 계열)
+            signature = (rule_type, tuple(sorted(indicators)))
+            hit = cache.lookup(sketch)
+            # 비슷한 파일이라도 값싼 규칙 판정이 다르면 새로 분석합니다.
+            reusable = hit is not None and hit.entry.signature == signature
+            fields["outcome"] = "miss" if hit is None else "mismatch" if not reusable else "exact" if hit.exact else "similar"
+            record_cache("result", reusable)
+        if reusable:
+            return self._reused_result(filename, hit)
+
+        result = await self._analyze_content(filename, file_content, rule_type, indicators)
+        # 분석에 실패한 결과(신뢰도 0)는 다시 시도할 수 있도록 캐시하지 않습니다.
+        if result.confidence_score > 0:
+            cache.store(CacheEntry(filename, sketch, signature, result.model_dump()))
+        return result
+
+    def _reused_result(self, filename: str, hit: CacheHit) -> AnalysisResultCreate:
+        source = hit.entry.file_name
+        note = (f"동일한 내용의 파일({source})" if hit.exact
+                else f"유사한 파일({source}, SimHash 거리 {hit.distance})")
+        logger.info("이전 분석 결과 재사용", extra={"file_name": filename, "source": source, "distance": hit.distance})
+        result = dict(hit.entry.result, file_name=filename)
+        result["orchestrator_summary"] = f"{note}의 분석 결과 재사용 (규칙 판정 일치). {result.get('orchestrator_summary') or ''}".strip()
+        return AnalysisResultCreate(**result)
+
+    async def _analyze_content(self, filename: str, file_content: bytes, rule_type: Optional[str],
+                               indicators: Optional[Dict[str, List[str]]] = None) -> AnalysisResultCreate:
+        # 압축 파일 안의 서버 설정 묶음은 include를 함께 펼쳐 규칙으로 분석합니다. (JAR/WAR은 바이너리 에이전트가 처리)
+        if is_archive(file_content) and not is_jvm_archive(filename, file_content):
+            archive_result = await self._analyze_archive_configs(filename, file_content)
+            if archive_result is not None:
+                return archive_result
+
+        # 0단계: 결정적 사전 스캔 (선택)
+        # 암호 관련 키워드가 하나도 없으면 분류/분석/검증 LLM 호출을 모두 생략합니다.
+        # 구조로 판별되는 파일(서버 설정, DER/PEM 인증서)은 키워드가 없어도 암호 설정이므로 사전 스캔하지 않습니다.
+        if settings.PRESCAN_ENABLED and rule_type is None:
+            with span("prescan") as fields:
+                # 알고리즘 이름이 없어도 공개키 연산을 직접 구현한 소스는 안전으로 판정하지 않습니다.
+                # 결과 캐시 단계에서 이미 계산했으면 그 근거를 씁니다.
+                if indicators is None:
+                    indicators = await run_cpu_bound("prescan", prescan_indicators, file_content, filename)
+                fields["families"] = sorted(indicators)
+            if not indicators:
+                return self._create_prescan_clean_result(filename)
+
         # 1단계: AI 기반 파일 분류
-        print("\n🔍 [1단계] AI 오케스트레이터 파일 분류 시작...")
-        file_type = await self._classify_file_type_from_content(filename, file_content)
-        print(f"✅ [1단계 완료] 파일 타입: {file_type}")
-        
+        with span("classify") as fields:
+            if rule_type:
+                logger.info("규칙 기반 분류", extra={"file_name": filename, "file_type": rule_type})
+            file_type = rule_type or await self._classify_file_type_from_content(filename, file_content, check_rules=False)
+            fields["file_type"] = file_type
+
         agent = self.agents.get(file_type)
-        final_result = None
+        if not agent:
+            logger.error("처리할 에이전트가 없는 파일 타입", extra={"file_type": file_type})
+            return self._create_error_result(filename, file_type, "지원하지 않는 파일 타입")
 
-        if agent:
-            try:
-                # 2단계: 전문 에이전트 분석
-                print(f"\n🔬 [2단계] {file_type.upper()} 전문 에이전트 분석 시작...")
-                print(f"🤖 사용 에이전트: {agent.__class__.__name__}")
-                
+        try:
+            # 2단계: 전문 에이전트 분석
+            with span("agent", labels={"agent": agent.__class__.__name__}) as fields:
                 agent_result = await agent.analyze(file_content, filename)
-                
-                print(f"✅ [2단계 완료] 에이전트 분석 결과:")
-                print(f"   - 취약점 발견: {agent_result.get('is_pqc_vulnerable', 'Unknown')}")
-                print(f"   - 신뢰도: {agent_result.get('confidence_score', 0):.2f}")
-                
-                # 3단계: AI 오케스트레이터 결과 검증 및 요약
-                print(f"\n🧠 [3단계] AI 오케스트레이터 결과 검증 및 요약 시작...")
-                validated_result = await self._validate_and_summarize_result(
-                    filename, file_type, agent_result, file_content
-                )
-                print(f"✅ [3단계 완료] 오케스트레이터 검증 완료")
-                
-                # 최종 결과 모델 생성
-                final_result = AnalysisResultCreate(
-                    file_name=filename,
-                    file_type=file_type,
-                    **validated_result
-                )
-                
-                print(f"\n📊 [최종 결과]")
-                print(f"   - 파일: {filename}")
-                print(f"   - 타입: {file_type}")
-                print(f"   - PQC 취약점: {validated_result.get('is_pqc_vulnerable')}")
-                print(f"   - 탐지된 알고리즘: {validated_result.get('detected_algorithms', [])}")
-                print(f"   - 최종 신뢰도: {validated_result.get('confidence_score', 0):.2f}")
-
-            except Exception as e:
-                print(f"❌ [오류] 작업 ID [{task_id}] - 분석 중 오류 발생: {e}")
-                # 오류 발생시에도 기본 결과 생성
-                final_result = self._create_error_result(filename, file_type, str(e))
-        else:
-            print(f"❌ [오류] 작업 ID [{task_id}] - '{file_type}' 타입을 처리할 에이전트가 없습니다.")
-            final_result = self._create_error_result(filename, file_type, "지원하지 않는 파일 타입")
-
-        if final_result:
-            # 외부 API에 최종 결과 저장
-            print(f"\n💾 [4단계] 외부 API에 결과 저장 중...")
-            await self.api_client.save_analysis_result(task_id, final_result.model_dump())
-            print(f"✅ [4단계 완료] 분석 결과 저장됨")
-            print("=" * 80)
-            print(f"🎉 [완료] 작업 ID [{task_id}] 전체 분석 프로세스 완료!")
-            print("=" * 80)
-        else:
-            print(f"❌ [실패] 작업 ID [{task_id}] - 분석 결과 생성 실패")
-            print("=" * 80)
+                fields["is_pqc_vulnerable"] = agent_result.get("is_pqc_vulnerable")
+                fields["confidence_score"] = agent_result.get("confidence_score")
+
+            # 3단계: AI 오케스트레이터 결과 검증 및 요약
+            # 규칙만으로 확정된 결과(orchestrator_summary가 이미 있음)는 검증하지 않습니다.
+            if agent_result.get("orchestrator_summary"):
+                validated_result = agent_result
+            elif settings.VALIDATION_ENABLED:
+                with span("validate"):
+                    validated_result = await self._validate_and_summarize_result(
+                        filename, file_type, agent_result, file_content
+                    )
+            else:
+                validated_result = dict(agent_result, orchestrator_summary="검증 단계 생략 (VALIDATION_ENABLED=False)")
 
-    async def _classify_file_type_from_content(self, filename: str, content: bytes) -> str:
+            # 최종 결과 모델 생성
+            return AnalysisResultCreate(
+                file_name=filename,
+                file_type=file_type,
+                **validated_result
+            )
+        except Exception as e:
+            logger.exception("분석 중 오류 발생", extra={"file_type": file_type})
+            # 오류 발생시에도 기본 결과 생성
+            return self._create_error_result(filename, file_type, str(e))
+
+    async def _analyze_archive_configs(self, filename: str, file_content: bytes):
+        """압축 파일에 서버 설정 파일이 있으면 log_conf 에이전트로 한꺼번에 분석합니다. 없으면 None."""
+        with span("archive") as fields:
+            members = await run_cpu_bound("archive", read_archive, file_content, filename)
+            fields["members"] = len(members)
+        if not members:
+            return None
+        with span("agent", labels={"agent": LogConfAgent.__name__}) as fields:
+            agent_result = await self.agents["log_conf"].analyze_server_configs(members, filename)
+            fields["is_pqc_vulnerable"] = agent_result.get("is_pqc_vulnerable") if agent_result else None
+        if agent_result is None:
+            return None
+        return AnalysisResultCreate(file_name=filename, file_type="log_conf", **agent_result)
+
+    async def _classify_file_type_from_content(self, filename: str, content: bytes, check_rules: bool = True) -> str:
         """
         AI 오케스트레이터를 사용하여 파일 내용으로부터 타입을 분류합니다.
+        check_rules가 False면 호출자가 이미 구조 판별(rule_based_file_type)을 한 것입니다.
         """
+        # 서버 TLS/SSH 설정, 인증서/키 파일, 의존성 매니페스트는 구조로 확실히 판별되므로 LLM 분류를 생략합니다.
+        file_type = rule_based_file_type(content, filename) if check_rules else None
+        if file_type:
+            logger.info("규칙 기반 분류", extra={"file_name": filename, "file_type": file_type})
+            return file_type
+
         try:
             # 텍스트 변환 시도
             try:
@@ -230,6 +635,8 @@ JSON 형식으로만 응답:
 2. binary: 실행 파일, 라이브러리 (.exe, .so, .dll 등)
 3. parameter: 설정 파일, 매개변수 (.json, .yaml, .xml, .config 등)
 4. log_conf: 로그 파일, 서버 설정 (.log, .conf, .ini 등)
+5. certificate: 인증서, 키, 키스토어 (.pem, .crt, .key, .p12, .jks 등)
+6. dependency: 의존성 매니페스트/잠금 파일 (requirements.txt, package-lock.json, go.sum, Cargo.lock, pom.xml 등)
 
 JSON 형식으로만 응답:
 {{"file_type": "카테고리명", "confidence": 0.0-1.0, "reasoning": "분류 근거"}}"""
@@ -257,24 +664,26 @@ JSON 형식으로만 응답:
                         reasoning = classification_result.get("reasoning", "")
                         
                         # 유효한 타입인지 검증
-                        valid_types = ["source_code", "binary", "parameter", "log_conf"]
+                        valid_types = ["source_code", "binary", "parameter", "log_conf", "certificate", "dependency"]
                         if file_type not in valid_types:
                             file_type = self._fallback_classification(filename)
                         
-                        print(f"AI 분류 결과 - 파일: '{filename}' → 타입: '{file_type}' (신뢰도: {confidence:.2f})")
-                        print(f"분류 근거: {reasoning}")
+                        logger.info("AI 분류 결과", extra={
+                            "file_name": filename, "file_type": file_type,
+                            "confidence": confidence, "reasoning": reasoning,
+                        })
                         
                         return file_type
                         
                 except (json.JSONDecodeError, KeyError) as e:
-                    print(f"AI 분류 응답 파싱 실패: {e}")
+                    logger.warning("AI 분류 응답 파싱 실패", extra={"error": str(e)})
                     return self._fallback_classification(filename)
             else:
-                print(f"AI 분류 실패: {ai_response.get('error')}")
+                logger.warning("AI 분류 실패", extra={"error": ai_response.get("error")})
                 return self._fallback_classification(filename)
                 
-        except Exception as e:
-            print(f"파일 분류 중 오류 발생: {e}")
+        except Exception:
+            logger.exception("파일 분류 중 오류 발생")
             return self._fallback_classification(filename)
 
     async def _validate_and_summarize_result(self, filename: str, file_type: str, agent_result: dict, file_content: bytes) -> dict:
@@ -332,23 +741,25 @@ JSON 형식으로만 응답:
                         json_text = response_text[json_start:json_end]
                         validated_result = json.loads(json_text)
                         
-                        print(f"오케스트레이터 검증 완료 - 파일: {filename}")
-                        print(f"최종 신뢰도: {validated_result.get('confidence_score', 0.0):.2f}")
+                        logger.info("오케스트레이터 검증 완료", extra={
+                            "file_name": filename,
+                            "confidence_score": validated_result.get("confidence_score", 0.0),
+                        })
                         
                         return validated_result
                         
                 except (json.JSONDecodeError, KeyError) as e:
-                    print(f"검증 결과 파싱 실패: {e}")
+                    logger.warning("검증 결과 파싱 실패", extra={"error": str(e)})
                     # 원본 에이전트 결과에 오케스트레이터 요약 추가
                     agent_result["orchestrator_summary"] = "검증 과정에서 파싱 오류 발생"
                     return agent_result
             else:
-                print(f"검증 과정 실패: {validation_response.get('error')}")
+                logger.warning("검증 과정 실패", extra={"error": validation_response.get("error")})
                 agent_result["orchestrator_summary"] = "AI 검증 실패로 원본 결과 반환"
                 return agent_result
                 
         except Exception as e:
-            print(f"결과 검증 중 오류: {e}")
+            logger.exception("결과 검증 중 오류")
             agent_result["orchestrator_summary"] = f"검증 중 오류 발생: {str(e)}"
             return agent_result
 
@@ -365,13 +776,45 @@ JSON 형식으로만 응답:
             confidence_score=0.0
         )
 
+    def _create_prescan_clean_result(self, filename: str) -> AnalysisResultCreate:
+        """사전 스캔에서 암호 키워드가 발견되지 않은 파일의 결과를 생성합니다."""
+        return AnalysisResultCreate(
+            file_name=filename,
+            file_type=self._fallback_classification(filename),
+            is_pqc_vulnerable=False,
+            vulnerability_details="사전 스캔에서 암호 알고리즘 관련 키워드가 발견되지 않았습니다.",
+            detected_algorithms=[],
+            recommendations=None,
+            evidence=None,
+            confidence_score=0.5,
+            orchestrator_summary="결정적 사전 스캔 결과 (LLM 분석 생략)"
+        )
+
     async def get_analysis_result(self, task_id: str):
         """
         주어진 작업 ID에 해당하는 분석 결과를 외부 API에서 조회합니다.
         """
-        print(f"작업 ID [{task_id}] - 외부 API에서 분석 결과를 조회합니다.")
+        logger.debug("외부 API에서 분석 결과 조회", extra={"task_id": task_id})
         return await self.api_client.get_analysis_result(task_id)
 
+    def iter_analysis_results(self):
+        """
+        저장된 모든 분석 결과를 한 건씩 스트리밍으로 조회합니다. (보고서 생성용)
+        """
+        return self.api_client.iter_analysis_results()
+
+def _settings_fingerprint() -> str:
+    """분석 결과에 영향을 주는 설정 전체의 지문. 설정이 다른 요청끼리는 진행 중인 분석을 공유하지 않습니다."""
+    return hashlib.sha256(settings.model_dump_json().encode("utf-8")).hexdigest()[:16]
+
+
+def _symbol_fingerprint(findings: List[Dict[str, Any]]) -> str:
+    """심볼 색인 호출 지점 목록의 지문. 래퍼 쪽 변경으로 전이 결과가 달라졌는지 비교하는 데 씁니다."""
+    if not findings:
+        return ""
+    key = [(f["location"], f["value"], f["families"], f["chain"]) for f in findings]
+    return hashlib.sha256(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+
 # FastAPI의 의존성 주입(Dependency Injection) 시스템을 위한 함수입니다.
 # 외부 API 클라이언트를 컨트롤러에 주입합니다.
 def get_orchestrator_controller(api_client: ExternalAPIClient = Depends(get_api_client)):
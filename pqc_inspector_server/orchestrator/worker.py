@@ -0,0 +1,91 @@
+# File: pqc_inspector_server/orchestrator/worker.py
+# 🛠️ 분산 워커입니다. `python main.py worker`로 실행하며, 작업 대기열(JOB_QUEUE_PATH)에서 작업을 꺼내
+# OrchestratorController로 분석하고 결과를 외부 API에 저장합니다. API 서버(JOB_QUEUE_ENABLED=true)는 작업을 넣기만 하므로,
+# 워커 프로세스/머신을 늘리면 Ollama 서버가 감당하는 범위 안에서 처리량이 워커 수에 비례해 늘어납니다.
+# 작업은 lane 가중치(SCHEDULER_LANE_WEIGHTS)에 비례해 꺼내므로 대량 스캔 작업 뒤에 단일 파일 작업이 줄 서지 않습니다.
+
+import asyncio
+import contextlib
+import logging
+import os
+import signal
+import socket
+from typing import Optional
+
+from .controller import OrchestratorController
+from ..core.config import settings
+from ..core.logging_config import current_task_id
+from ..core.telemetry import registry
+from ..db.api_client import get_api_client
+from ..services.job_queue import Job, JobQueue, get_job_queue
+from ..services.scheduler import parse_lane_weights
+
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(concurrency: int = 0, worker_id: Optional[str] = None) -> None:
+    """
+    concurrency개의 작업을 동시에 처리합니다. (0이면 WORKER_CONCURRENCY)
+    SIGTERM/SIGINT를 받으면 새 작업은 가져오지 않고 처리 중인 작업을 마친 뒤 종료합니다.
+    """
+    concurrency = concurrency or settings.WORKER_CONCURRENCY
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = await asyncio.to_thread(get_job_queue, settings.JOB_QUEUE_PATH, settings.JOB_MAX_ATTEMPTS)
+    controller = OrchestratorController(api_client=get_api_client())
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(sig, stop.set)
+
+    logger.info("워커 시작", extra={"worker": worker_id, "concurrency": concurrency, "queue": settings.JOB_QUEUE_PATH})
+    await asyncio.gather(*(_work(controller, queue, worker_id, stop) for _ in range(concurrency)))
+    logger.info("워커 종료", extra={"worker": worker_id})
+
+
+async def _work(controller: OrchestratorController, queue: JobQueue, worker_id: str, stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        try:
+            job = await asyncio.to_thread(queue.claim, worker_id, settings.JOB_LEASE_SECONDS,
+                                          parse_lane_weights(settings.SCHEDULER_LANE_WEIGHTS))
+        except Exception:
+            logger.exception("작업 대기열 조회 실패")
+            job = None
+        if job is None:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(stop.wait(), settings.JOB_POLL_INTERVAL)
+            continue
+        await _process(controller, queue, worker_id, job)
+
+
+async def _process(controller: OrchestratorController, queue: JobQueue, worker_id: str, job: Job) -> None:
+    token = current_task_id.set(job.task_id)
+    keeper = asyncio.create_task(_keep_lease(queue, worker_id, job))
+    registry.add_gauge("pqc_worker_jobs_in_progress", 1)
+    try:
+        logger.info("작업 시작", extra={"job_id": job.id, "kind": job.kind, "attempt": job.attempts})
+        await controller.run_job(job)
+    except Exception as e:
+        logger.exception("작업 실패", extra={"job_id": job.id, "kind": job.kind})
+        registry.inc("pqc_worker_jobs_total", status="failed")
+        await asyncio.to_thread(queue.fail, job.id, worker_id, f"{type(e).__name__}: {e}")
+    else:
+        registry.inc("pqc_worker_jobs_total", status="done")
+        await asyncio.to_thread(queue.complete, job.id, worker_id)
+    finally:
+        keeper.cancel()
+        registry.add_gauge("pqc_worker_jobs_in_progress", -1)
+        current_task_id.reset(token)
+
+
+async def _keep_lease(queue: JobQueue, worker_id: str, job: Job) -> None:
+    """처리하는 동안 임대 시간의 1/3마다 임대를 연장해, 오래 걸리는 저장소 스캔이 다른 워커에 넘어가지 않게 합니다."""
+    while True:
+        await asyncio.sleep(settings.JOB_LEASE_SECONDS / 3)
+        try:
+            if not await asyncio.to_thread(queue.extend, job.id, worker_id, settings.JOB_LEASE_SECONDS):
+                logger.warning("작업 임대를 잃음 (다른 워커가 가져감)", extra={"job_id": job.id})
+                return
+        except Exception:
+            logger.exception("작업 임대 연장 실패", extra={"job_id": job.id})
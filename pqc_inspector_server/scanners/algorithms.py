@@ -0,0 +1,54 @@
+# File: pqc_inspector_server/scanners/algorithms.py
+# 🔑 여러 표기(RS256, ECDHE-RSA, sha256WithRSAEncryption 등)를 표준 알고리즘 계열로 정규화하는 테이블입니다.
+# 결정적(deterministic) 스캐너와 평가 도구가 같은 이름 체계를 사용하도록 공유합니다.
+
+import re
+from typing import Iterable, List, Set
+
+# 양자 컴퓨터(Shor 알고리즘)에 취약한 고전 공개키 알고리즘 계열
+CLASSICAL_FAMILIES = ("RSA", "DSA", "ECDSA", "EdDSA", "ECDH", "DH")
+# 양자내성 알고리즘 계열 (NIST 표준 + OpenSSH 기본 하이브리드 KEX에 쓰이는 Streamlined NTRU Prime)
+PQC_FAMILIES = ("ML-KEM", "ML-DSA", "SLH-DSA", "NTRU-Prime")
+
+# (정규식, 계열) 목록. 하나의 이름이 여러 계열에 해당할 수 있습니다 (예: ECDHE-RSA → ECDH, RSA).
+_FAMILY_PATTERNS = [
+    (re.compile(r"ML-?KEM|KYBER|MLKEM", re.IGNORECASE), "ML-KEM"),
+    (re.compile(r"ML-?DSA|DILITHIUM", re.IGNORECASE), "ML-DSA"),
+    (re.compile(r"SLH-?DSA|SPHINCS", re.IGNORECASE), "SLH-DSA"),
+    (re.compile(r"SNTRUP", re.IGNORECASE), "NTRU-Prime"),
+    # 단어 중간의 rsa(universal, conversation, TRAVERSAL)는 제외하고, 식별자 경계의 RSA는 인정합니다.
+    # (sha256WithRSAEncryption, BCRSAPublicKey, JsonRsaKey 처럼 대소문자가 바뀌는 곳은 대소문자를 구분해 봅니다)
+    (re.compile(
+        r"(?<![A-Z])RSA|(?-i:(?<=[a-z\d])RSA|RSA(?=[A-Z][a-z]|[^A-Za-z]|$)|(?<=[a-z\d])Rsa(?![a-z]))|\b[RP]S(256|384|512)\b",
+        re.IGNORECASE,
+    ), "RSA"),
+    (re.compile(r"ECDSA|\bES(256|384|512)K?\b|ecdsa-sha2", re.IGNORECASE), "ECDSA"),
+    (re.compile(r"ED25519|ED448|EDDSA", re.IGNORECASE), "EdDSA"),
+    (re.compile(r"ECDHE?|X25519|X448|CURVE25519|SECP\d+R1MLKEM|\bECIES\b", re.IGNORECASE), "ECDH"),
+    (re.compile(r"(?<![A-Z])(EC)?DHE?(?![A-Z])|DIFFIE|\bFFDHE", re.IGNORECASE), "DH"),
+    (re.compile(r"(?<!EC)(?<!EC-)(?<![A-Z])DSA(?![A-Z])|ssh-dss|\bDSS\b", re.IGNORECASE), "DSA"),
+]
+
+
+def canonical_families(name: str) -> Set[str]:
+    """하나의 알고리즘 표기를 표준 계열 집합으로 변환합니다. 알 수 없으면 빈 집합을 반환합니다."""
+    families = {family for pattern, family in _FAMILY_PATTERNS if pattern.search(name)}
+    # "ECDHE"의 "DHE" 부분이 DH로 잡히는 경우를 제거합니다.
+    if "ECDH" in families and not re.search(r"(?<![A-Z])(?<!EC)DHE?(?![A-Z])|DIFFIE|FFDHE", name, re.IGNORECASE):
+        families.discard("DH")
+    # "ML-DSA", "SLH-DSA", "ECDSA"의 "DSA" 부분 제거
+    if families & {"ML-DSA", "SLH-DSA"} and not re.search(r"(?<![-A-Z])DSA(?![A-Z])|ssh-dss", name, re.IGNORECASE):
+        families.discard("DSA")
+    return families
+
+
+def canonicalize(names: Iterable[str]) -> List[str]:
+    """여러 표기를 정규화된 계열 목록(중복 제거, 정렬)으로 변환합니다."""
+    result: Set[str] = set()
+    for name in names:
+        result |= canonical_families(str(name))
+    return sorted(result)
+
+
+def is_classical(family: str) -> bool:
+    return family in CLASSICAL_FAMILIES
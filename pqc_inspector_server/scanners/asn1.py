@@ -0,0 +1,164 @@
+# File: pqc_inspector_server/scanners/asn1.py
+# 🧱 인증서/키 파일 분석용 최소 DER(BER) 워커입니다.
+# 트리 객체를 만들지 않고 (태그, 내용 시작, 내용 끝, 다음 위치) 오프셋만 돌려주므로
+# 수천 개의 인증서가 든 번들도 한 번의 패스로 빠르게 훑을 수 있습니다.
+# PKCS#12/PKCS#7에서 가끔 쓰이는 BER 무한 길이(indefinite length)와 분할된 OCTET STRING도 처리합니다.
+
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 자주 쓰는 범용 태그
+INTEGER = 0x02
+BIT_STRING = 0x03
+OCTET_STRING = 0x04
+NULL = 0x05
+OID = 0x06
+UTF8_STRING = 0x0C
+PRINTABLE_STRING = 0x13
+IA5_STRING = 0x16
+UTC_TIME = 0x17
+GENERALIZED_TIME = 0x18
+BMP_STRING = 0x1E
+SEQUENCE = 0x30
+SET = 0x31
+CONSTRUCTED = 0x20
+
+# 중첩 깊이 상한 (악의적으로 깊게 중첩된 입력 방지)
+MAX_DEPTH = 64
+
+Element = Tuple[int, int, int, int]
+
+
+class DERError(ValueError):
+    """DER/BER 구조가 잘못되었거나 잘렸을 때 발생합니다."""
+
+
+def read(data: bytes, offset: int, limit: Optional[int] = None, depth: int = 0) -> Element:
+    """
+    offset 위치의 요소 하나를 읽어 (태그, 내용 시작, 내용 끝, 다음 요소 위치)를 반환합니다.
+    무한 길이 요소는 내용 끝이 EOC(00 00) 위치이고 다음 위치는 그 뒤입니다.
+    """
+    limit = len(data) if limit is None else limit
+    if offset + 2 > limit:
+        raise DERError("잘린 요소")
+    tag = data[offset]
+    if tag & 0x1F == 0x1F:
+        raise DERError("다중 바이트 태그는 지원하지 않습니다")
+    length = data[offset + 1]
+    start = offset + 2
+    if length < 0x80:
+        end = start + length
+    elif length == 0x80:
+        if not tag & CONSTRUCTED or depth >= MAX_DEPTH:
+            raise DERError("잘못된 무한 길이 요소")
+        position = start
+        while True:
+            if position + 2 > limit:
+                raise DERError("EOC 없음")
+            if data[position] == 0 and data[position + 1] == 0:
+                return tag, start, position, position + 2
+            position = read(data, position, limit, depth + 1)[3]
+    else:
+        size = length & 0x7F
+        if size > 4 or start + size > limit:
+            raise DERError("잘못된 길이")
+        end = start + size + int.from_bytes(data[start:start + size], "big")
+        start += size
+    if end > limit:
+        raise DERError("잘린 요소")
+    return tag, start, end, end
+
+
+def children(data: bytes, start: int, end: int) -> Iterator[Element]:
+    """[start, end) 구간에 나열된 요소들을 차례로 돌려줍니다."""
+    position = start
+    while position < end:
+        element = read(data, position, end)
+        yield element
+        position = element[3]
+
+
+def child_list(data: bytes, element: Element) -> List[Element]:
+    return list(children(data, element[1], element[2]))
+
+
+def octets(data: bytes, element: Element) -> bytes:
+    """OCTET/BIT STRING 내용을 반환합니다. BER로 분할된(constructed) 문자열은 이어 붙입니다."""
+    tag, start, end, _ = element
+    if tag & CONSTRUCTED:
+        return b"".join(octets(data, child) for child in children(data, start, end))
+    return data[start:end]
+
+
+def integer_bits(data: bytes, element: Element) -> int:
+    """INTEGER의 비트 길이 (앞의 0 바이트 제외)."""
+    start, end = element[1], element[2]
+    while start < end and data[start] == 0:
+        start += 1
+    if start == end:
+        return 0
+    return (end - start - 1) * 8 + data[start].bit_length()
+
+
+def encode_oid(dotted: str) -> bytes:
+    """점 표기 OID를 DER 내용 바이트로 인코딩합니다. (조회 테이블을 원본 바이트로 만들기 위해 사용)"""
+    arcs = [int(arc) for arc in dotted.split(".")]
+    body = [arcs[0] * 40 + arcs[1]] + arcs[2:]
+    encoded = bytearray()
+    for arc in body:
+        chunk = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            chunk.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        encoded.extend(reversed(chunk))
+    return bytes(encoded)
+
+
+def decode_oid(raw: bytes) -> str:
+    arcs: List[int] = []
+    value = 0
+    for byte in raw:
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            arcs.append(value)
+            value = 0
+    if not arcs:
+        return ""
+    first = min(arcs[0] // 40, 2)
+    return ".".join(str(arc) for arc in [first, arcs[0] - first * 40] + arcs[1:])
+
+
+def oid_table(names: Dict[str, str]) -> Dict[bytes, str]:
+    """{점 표기 OID: 이름} → {DER 내용 바이트: 이름}. 요소마다 OID를 문자열로 디코딩하지 않고 바로 조회합니다."""
+    return {encode_oid(dotted): name for dotted, name in names.items()}
+
+
+def parse_time(data: bytes, element: Element) -> Optional[datetime]:
+    """UTCTime/GeneralizedTime을 UTC datetime으로 변환합니다. 해석할 수 없으면 None."""
+    tag, start, end, _ = element
+    raw = data[start:end]
+    try:
+        # strptime보다 수 배 빠른 고정 위치 파싱 (대형 번들에서 시각 파싱이 병목이 됨)
+        if tag == UTC_TIME:
+            year = int(raw[:2])
+            year += 1900 if year >= 50 else 2000
+            raw = raw[2:]
+        elif tag == GENERALIZED_TIME:
+            year = int(raw[:4])
+            raw = raw[4:]
+        else:
+            return None
+        return datetime(year, int(raw[0:2]), int(raw[2:4]), int(raw[4:6]), int(raw[6:8]),
+                        int(raw[8:10]) if raw[8:10].isdigit() else 0, tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def text_value(data: bytes, element: Element) -> str:
+    """DirectoryString 계열 값을 문자열로 변환합니다."""
+    tag, start, end, _ = element
+    raw = data[start:end]
+    if tag == BMP_STRING:
+        return raw.decode("utf-16-be", errors="replace")
+    return raw.decode("utf-8", errors="replace")
@@ -0,0 +1,289 @@
+# File: pqc_inspector_server/scanners/carving.py
+# 🪓 펌웨어/실행 파일 안에 박혀 있는 인증서, PEM 블록, 원시 공개키를 찾아내는 카빙(carving) 단계입니다.
+# - 입력 bytes를 1 MB 청크로 한 번만 훑으며 같은 배열에서
+#   (1) 슬라이딩 윈도 엔트로피 지도(numpy 벡터 연산),
+#   (2) 30 81/30 82 DER SEQUENCE 헤더와 짧은 길이의 EC/EdDSA SPKI 접두부,
+#   (3) -----BEGIN 마커, SSH 와이어 형식 공개키, Windows CNG/CryptoAPI 키 블롭 매직을 함께 모읍니다.
+# - 후보마다 해당 구간만 잘라 certificates 파서로 해석하고, 길이/크기 검증을 통과한 객체만 오프셋과 함께 남깁니다.
+
+import math
+import posixpath
+import struct
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import asn1
+from .certificates import KeyMaterialScan, parse_der_object, parse_pem_blocks, parse_ssh_key_blob
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 겹치지 않는 윈도로 엔트로피를 계산하고 헤더는 bytes.find로 찾습니다.
+    np = None
+
+CHUNK_BYTES = 1024 * 1024
+ENTROPY_WINDOW = 1024
+ENTROPY_STEP = 256
+HIGH_ENTROPY = 7.2          # bits/byte. 이 이상이 이어지면 압축/암호화된 구간으로 봅니다.
+MAX_CANDIDATES = 50000
+MAX_PEM_BYTES = 64 * 1024
+MAX_SSH_BLOB = 4096
+MIN_MODULUS_BITS = 512      # 이보다 작은 RSA/DSA/DH는 우연히 맞아떨어진 구조로 보고 버립니다.
+MAX_MODULUS_BITS = 16384
+
+_SPKI_PREFIXES = (
+    bytes.fromhex("3059301306072a8648ce3d0201"),   # EC P-256 / secp256k1
+    bytes.fromhex("3076301006072a8648ce3d0201"),   # EC P-384
+    bytes.fromhex("302a300506032b6570"),           # Ed25519
+    bytes.fromhex("302a300506032b656e"),           # X25519
+    bytes.fromhex("3043300506032b6571"),           # Ed448
+)
+_SSH_KEY_TYPES = (b"ssh-rsa", b"ssh-dss", b"ssh-ed25519", b"ecdsa-sha2-nistp256", b"ecdsa-sha2-nistp384",
+                  b"ecdsa-sha2-nistp521")
+# Windows CNG(BCRYPT_*_BLOB) / CryptoAPI(PUBLICKEYBLOB, PRIVATEKEYBLOB) 키 블롭 매직
+_RSA_BLOBS = {b"RSA1": "public_key", b"RSA2": "private_key", b"RSA3": "private_key"}
+_ECC_BLOBS = {
+    b"ECS1": ("EC", "P-256", 32, "public_key"), b"ECS2": ("EC", "P-256", 32, "private_key"),
+    b"ECS3": ("EC", "P-384", 48, "public_key"), b"ECS4": ("EC", "P-384", 48, "private_key"),
+    b"ECS5": ("EC", "P-521", 66, "public_key"), b"ECS6": ("EC", "P-521", 66, "private_key"),
+    b"ECK1": ("ECDH", "P-256", 32, "public_key"), b"ECK2": ("ECDH", "P-256", 32, "private_key"),
+    b"ECK3": ("ECDH", "P-384", 48, "public_key"), b"ECK4": ("ECDH", "P-384", 48, "private_key"),
+    b"ECK5": ("ECDH", "P-521", 66, "public_key"), b"ECK6": ("ECDH", "P-521", 66, "private_key"),
+}
+_MARKERS = (
+    [(b"-----BEGIN ", "pem")]
+    + [(prefix, "der") for prefix in _SPKI_PREFIXES]
+    + [(struct.pack(">I", len(name)) + name, "ssh") for name in _SSH_KEY_TYPES]
+    + [(magic, "cng") for magic in list(_RSA_BLOBS) + list(_ECC_BLOBS)]
+)
+# 청크 경계에 걸친 마커/헤더를 놓치지 않기 위해 다음 청크 앞부분을 겹쳐 읽는 크기
+_OVERLAP = max(len(marker) for marker, _ in _MARKERS) + 4
+
+if np is not None:
+    # c·log2(c) 표. 윈도 엔트로피 = log2(W) - Σ c·log2(c) / W
+    _XLOGX = np.array([0.0] + [c * math.log2(c) for c in range(1, ENTROPY_WINDOW + 1)], dtype=np.float32)
+
+
+class CarveResult:
+    """카빙 결과: 오프셋 순으로 정렬된 키/인증서 객체와 엔트로피 지도."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.scan = KeyMaterialScan("carved")
+        self.candidates = 0
+        self.entropy: List[float] = []            # 윈도별 엔트로피 (bits/byte)
+        self.entropy_step = ENTROPY_STEP if np is not None else ENTROPY_WINDOW
+        self.high_entropy: List[Tuple[int, int]] = []
+
+    @property
+    def objects(self) -> List[Dict[str, Any]]:
+        return self.scan.objects
+
+    def summary(self) -> List[str]:
+        lines = [f"카빙: {self.size} 바이트, 후보 {self.candidates}개 중 키/인증서 {len(self.objects)}개"]
+        if self.high_entropy:
+            covered = sum(end - start for start, end in self.high_entropy)
+            lines.append(f"고엔트로피 구간(압축/암호화 추정) {len(self.high_entropy)}개, {covered} 바이트 "
+                         f"({covered * 100 // max(self.size, 1)}%) - 압축된 구간 안의 키는 풀어야 확인할 수 있습니다.")
+        return lines + self.scan.summary()
+
+
+def carve(data: Any, file_name: str) -> CarveResult:
+    """bytes(또는 bytes처럼 자를 수 있는 버퍼)에서 임베디드 키와 인증서를 찾아냅니다."""
+    size = len(data)
+    result = CarveResult(size)
+    name = posixpath.basename(file_name.replace("\\", "/")) or "content"
+
+    # 1. 단일 패스: 청크마다 엔트로피와 후보 오프셋을 함께 계산합니다.
+    candidates: List[Tuple[int, str]] = []
+    carry = None
+    for start in range(0, size, CHUNK_BYTES):
+        chunk = bytes(data[start:start + CHUNK_BYTES + _OVERLAP])
+        body = min(CHUNK_BYTES, size - start)
+        if np is not None:
+            array = np.frombuffer(chunk, dtype=np.uint8)
+            carry = _entropy_numpy(array[:body], carry, result.entropy)
+            _der_headers_numpy(array, start, body, candidates)
+        else:
+            _entropy_python(chunk[:body], result.entropy)
+            _der_headers_python(chunk, start, body, candidates)
+        for marker, kind in _MARKERS:
+            position = chunk.find(marker)
+            while 0 <= position < body:
+                candidates.append((start + position, kind))
+                position = chunk.find(marker, position + 1)
+    result.high_entropy = _high_entropy_regions(result.entropy, result.entropy_step)
+
+    # 2. 후보 해석: 이미 해석한 객체 안쪽(인증서 안의 SPKI 등)은 건너뜁니다.
+    candidates.sort()
+    result.candidates = len(candidates)
+    if len(candidates) > MAX_CANDIDATES:
+        result.scan.notes.append(f"후보가 {len(candidates)}개로 많아 앞쪽 {MAX_CANDIDATES}개만 해석했습니다.")
+        candidates = candidates[:MAX_CANDIDATES]
+    covered = 0
+    for offset, kind in candidates:
+        if offset < covered:
+            continue
+        end = _PARSERS[kind](data, offset, f"{name}@0x{offset:08x}", result.scan)
+        if end:
+            covered = end
+    return result
+
+
+# --- 엔트로피 지도 ---
+
+def _entropy_numpy(body: "np.ndarray", carry: Optional["np.ndarray"], out: List[float]) -> Optional["np.ndarray"]:
+    """
+    ENTROPY_STEP 블록마다 바이트 히스토그램을 bincount 한 번으로 만들고, 이웃한 블록 히스토그램을 더해
+    ENTROPY_WINDOW 크기 윈도의 히스토그램을 얻습니다. 다음 청크를 위해 마지막 블록들을 돌려줍니다.
+    """
+    blocks = len(body) // ENTROPY_STEP
+    if blocks == 0:
+        return carry
+    index = (np.arange(blocks, dtype=np.int32).repeat(ENTROPY_STEP) << 8) + body[:blocks * ENTROPY_STEP]
+    histograms = np.bincount(index, minlength=blocks * 256).reshape(blocks, 256).astype(np.int16)
+    if carry is not None:
+        histograms = np.concatenate([carry, histograms])
+    per_window = ENTROPY_WINDOW // ENTROPY_STEP
+    count = len(histograms) - per_window + 1
+    if count > 0:
+        windows = histograms[:count].copy()
+        for shift in range(1, per_window):
+            windows += histograms[shift:shift + count]
+        entropy = math.log2(ENTROPY_WINDOW) - _XLOGX[windows].sum(axis=1, dtype=np.float32) / ENTROPY_WINDOW
+        out.extend(entropy.tolist())
+    return histograms[len(histograms) - per_window + 1:]
+
+
+def _entropy_python(body: bytes, out: List[float]) -> None:
+    for start in range(0, len(body) - ENTROPY_WINDOW + 1, ENTROPY_WINDOW):
+        counts = Counter(body[start:start + ENTROPY_WINDOW]).values()
+        out.append(math.log2(ENTROPY_WINDOW) - sum(c * math.log2(c) for c in counts) / ENTROPY_WINDOW)
+
+
+def _high_entropy_regions(entropy: List[float], step: int) -> List[Tuple[int, int]]:
+    regions: List[Tuple[int, int]] = []
+    for index, value in enumerate(entropy):
+        if value < HIGH_ENTROPY:
+            continue
+        start, end = index * step, index * step + ENTROPY_WINDOW
+        if regions and start <= regions[-1][1]:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    # 한두 윈도짜리 구간(키 하나, 해시 테이블 등)은 압축 구간으로 보지 않습니다.
+    return [(start, end) for start, end in regions if end - start >= 4 * ENTROPY_WINDOW]
+
+
+# --- 후보 수집 ---
+
+def _der_headers_numpy(array: "np.ndarray", base: int, body: int, out: List[Tuple[int, str]]) -> None:
+    """30 81 LL / 30 82 LL LL 뒤에 SEQUENCE 또는 INTEGER가 오는 위치. 무작위 바이트의 우연한 일치를 대부분 걸러냅니다."""
+    heads = np.flatnonzero((array[:-1] == 0x30) & ((array[1:] == 0x81) | (array[1:] == 0x82)))
+    heads = heads[(heads < body) & (heads + 4 < len(array))]
+    if not len(heads):
+        return
+    long_form = array[heads + 1] == 0x82
+    tags = np.where(long_form, array[heads + 4], array[heads + 3])
+    lengths = np.where(long_form, (array[heads + 2].astype(np.int64) << 8) | array[heads + 3], array[heads + 2])
+    heads = heads[((tags == 0x30) | (tags == 0x02)) & (lengths >= 0x80)]
+    out.extend((base + int(head), "der") for head in heads)
+
+
+def _der_headers_python(chunk: bytes, base: int, body: int, out: List[Tuple[int, str]]) -> None:
+    for header in (b"\x30\x81", b"\x30\x82"):
+        position = chunk.find(header)
+        while 0 <= position < body:
+            tag = chunk[position + (4 if header[1] == 0x82 else 3):][:1]
+            if tag in (b"\x30", b"\x02"):
+                out.append((base + position, "der"))
+            position = chunk.find(header, position + 1)
+
+
+# --- 후보 해석 ---
+
+def _plausible(obj: Dict[str, Any]) -> bool:
+    if obj["key_algorithm"] in ("RSA", "DSA", "DH"):
+        return MIN_MODULUS_BITS <= (obj["key_size"] or 0) <= MAX_MODULUS_BITS
+    return obj["kind"] in ("certificate", "csr") or obj["key_algorithm"] is not None or obj.get("encrypted", False)
+
+
+def _keep(parsed: KeyMaterialScan, offset: int, scan: KeyMaterialScan) -> bool:
+    objects = [obj for obj in parsed.objects if _plausible(obj)]
+    for obj in objects:
+        obj["offset"] = offset
+    scan.objects.extend(objects)
+    if objects:
+        scan.notes.extend(parsed.notes)
+    return bool(objects)
+
+
+def _parse_der(data: Any, offset: int, location: str, scan: KeyMaterialScan) -> Optional[int]:
+    length = data[offset + 1]
+    if length == 0x82:
+        total = 4 + int.from_bytes(data[offset + 2:offset + 4], "big")
+    elif length == 0x81:
+        total = 3 + data[offset + 2]
+    else:
+        total = 2 + length
+    if offset + total > len(data):
+        return None
+    blob = bytes(data[offset:offset + total])
+    parsed = KeyMaterialScan("der")
+    try:
+        if parse_der_object(blob, location, parsed) != total:
+            return None
+    except asn1.DERError:
+        return None
+    return offset + total if _keep(parsed, offset, scan) else None
+
+
+def _parse_pem(data: Any, offset: int, location: str, scan: KeyMaterialScan) -> Optional[int]:
+    end = data.find(b"-----END ", offset, offset + MAX_PEM_BYTES)
+    close = data.find(b"-----", end + 9, end + 9 + 80) if end >= 0 else -1
+    if close < 0:
+        return None
+    parsed = KeyMaterialScan("pem")
+    parse_pem_blocks(bytes(data[offset:close + 5]), location, parsed)
+    return close + 5 if _keep(parsed, offset, scan) else None
+
+
+def _parse_ssh(data: Any, offset: int, location: str, scan: KeyMaterialScan) -> Optional[int]:
+    blob = bytes(data[offset:offset + MAX_SSH_BLOB])
+    try:
+        key_type, size, curve = parse_ssh_key_blob(blob)
+        if key_type == "ssh-ed25519" and struct.unpack_from(">I", blob, 4 + len(key_type))[0] != 32:
+            return None
+    except (asn1.DERError, struct.error):
+        return None
+    if key_type.startswith("ecdsa-") and (curve is None or not key_type.endswith(curve)):
+        return None
+    parsed = KeyMaterialScan("ssh")
+    parsed.add("ssh_public_key", location, key_type, size, curve)
+    return offset + 4 + len(key_type) if _keep(parsed, offset, scan) else None
+
+
+def _parse_cng(data: Any, offset: int, location: str, scan: KeyMaterialScan) -> Optional[int]:
+    magic = bytes(data[offset:offset + 4])
+    header = bytes(data[offset + 4:offset + 24])
+    parsed = KeyMaterialScan("cng")
+    if magic in _RSA_BLOBS and len(header) >= 8:
+        bits, exponent_bytes = struct.unpack_from("<II", header)
+        # CryptoAPI: 8바이트 BLOBHEADER(PUBLICKEYBLOB=6/PRIVATEKEYBLOB=7, 버전 2, ALG_ID RSA) 뒤에 매직이 옵니다.
+        capi = offset >= 8 and data[offset - 8] in (6, 7) and data[offset - 7] == 2 \
+            and bytes(data[offset - 4:offset]) in (b"\x00\xa4\x00\x00", b"\x00\x24\x00\x00")
+        # CNG: 매직, 비트 수, 공개 지수 길이, 모듈러스 길이(= 비트 수 / 8), ...
+        cng = len(header) >= 12 and 1 <= exponent_bytes <= 8 and struct.unpack_from("<I", header, 8)[0] == bits // 8
+        if not (capi or cng) or bits % 8:
+            return None
+        parsed.add(_RSA_BLOBS[magic], location, "RSA", bits)
+    elif magic in _ECC_BLOBS and len(header) >= 4:
+        algorithm, curve, key_bytes, kind = _ECC_BLOBS[magic]
+        if struct.unpack_from("<I", header)[0] != key_bytes:
+            return None
+        parsed.add(kind, location, algorithm, {32: 256, 48: 384, 66: 521}[key_bytes], curve)
+    else:
+        return None
+    return offset + 8 if _keep(parsed, offset, scan) else None
+
+
+_PARSERS = {"der": _parse_der, "pem": _parse_pem, "ssh": _parse_ssh, "cng": _parse_cng}
@@ -0,0 +1,676 @@
+# File: pqc_inspector_server/scanners/certificates.py
+# 📜 X.509 인증서, CSR, 공개키/개인키, PKCS#7/PKCS#12 번들, Java 키스토어(JKS/JCEKS), OpenSSH 키를
+# asn1 워커로 직접 파싱해 객체마다 키 알고리즘, 키 크기, 곡선, 서명 알고리즘, 만료일을 추출합니다.
+# OID는 문자열로 디코딩하지 않고 DER 바이트 그대로 테이블에서 찾으므로 수천 개의 인증서 번들도 한 번에 처리합니다.
+# 비밀번호로 암호화된 항목(암호화된 PKCS#8, PKCS#12 encryptedData)은 복호화하지 않고 메모로 남깁니다.
+
+import binascii
+import posixpath
+import re
+import struct
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from . import asn1
+from .algorithms import canonical_families
+from .findings import classify_families, make_finding
+
+# 파일 형식 판별에 사용하는 앞부분 크기
+_SNIFF_BYTES = 64 * 1024
+# 요약에 표시하는 최대 줄 수
+_MAX_SUMMARY_LINES = 15
+# 이 날짜 이후에 만료되는 고전 알고리즘 인증서는 별도로 집계합니다 (NIST IR 8547: 2030년 이후 112비트 고전 알고리즘 지원 중단).
+CLASSICAL_DEPRECATION = datetime(2030, 12, 31, tzinfo=timezone.utc)
+
+KEY_EXTENSIONS = {
+    ".pem", ".crt", ".cer", ".der", ".key", ".pub", ".csr", ".req", ".p7b", ".p7c", ".p12", ".pfx",
+    ".jks", ".jceks", ".keystore", ".truststore", ".p8", ".pk8", ".ca-bundle",
+}
+_SSH_KEY_FILES = {"authorized_keys", "authorized_keys2", "known_hosts", "ssh_known_hosts"}
+
+_KIND_LABELS = {
+    "certificate": "인증서", "csr": "인증서 요청", "public_key": "공개키", "private_key": "개인키",
+    "parameters": "도메인 파라미터", "ssh_public_key": "SSH 공개키", "ssh_private_key": "SSH 개인키",
+}
+
+_PQC_ALGORITHMS = {
+    "2.16.840.1.101.3.4.3.17": "ML-DSA-44", "2.16.840.1.101.3.4.3.18": "ML-DSA-65",
+    "2.16.840.1.101.3.4.3.19": "ML-DSA-87",
+    "2.16.840.1.101.3.4.3.20": "SLH-DSA-SHA2-128s", "2.16.840.1.101.3.4.3.21": "SLH-DSA-SHA2-128f",
+    "2.16.840.1.101.3.4.3.22": "SLH-DSA-SHA2-192s", "2.16.840.1.101.3.4.3.23": "SLH-DSA-SHA2-192f",
+    "2.16.840.1.101.3.4.3.24": "SLH-DSA-SHA2-256s", "2.16.840.1.101.3.4.3.25": "SLH-DSA-SHA2-256f",
+    "2.16.840.1.101.3.4.3.26": "SLH-DSA-SHAKE-128s", "2.16.840.1.101.3.4.3.27": "SLH-DSA-SHAKE-128f",
+    "2.16.840.1.101.3.4.3.28": "SLH-DSA-SHAKE-192s", "2.16.840.1.101.3.4.3.29": "SLH-DSA-SHAKE-192f",
+    "2.16.840.1.101.3.4.3.30": "SLH-DSA-SHAKE-256s", "2.16.840.1.101.3.4.3.31": "SLH-DSA-SHAKE-256f",
+    "1.3.101.112": "Ed25519", "1.3.101.113": "Ed448",
+}
+
+_KEY_ALGORITHMS = asn1.oid_table({
+    "1.2.840.113549.1.1.1": "RSA", "1.2.840.113549.1.1.10": "RSASSA-PSS", "1.2.840.113549.1.1.7": "RSAES-OAEP",
+    "1.2.840.10040.4.1": "DSA", "1.2.840.10045.2.1": "EC", "1.3.132.1.12": "ECDH", "1.3.132.1.13": "ECMQV",
+    "1.3.101.110": "X25519", "1.3.101.111": "X448",
+    "1.2.840.113549.1.3.1": "DH", "1.2.840.10046.2.1": "DH",
+    "2.16.840.1.101.3.4.4.1": "ML-KEM-512", "2.16.840.1.101.3.4.4.2": "ML-KEM-768",
+    "2.16.840.1.101.3.4.4.3": "ML-KEM-1024",
+    **_PQC_ALGORITHMS,
+})
+# canonical_families로 알 수 없는 키 알고리즘 이름
+_KEY_FAMILY_OVERRIDES = {"EC": {"ECDSA"}, "ECMQV": {"ECDH"}}
+
+_SIGNATURE_ALGORITHMS = asn1.oid_table({
+    "1.2.840.113549.1.1.2": "md2WithRSAEncryption", "1.2.840.113549.1.1.4": "md5WithRSAEncryption",
+    "1.2.840.113549.1.1.5": "sha1WithRSAEncryption", "1.2.840.113549.1.1.14": "sha224WithRSAEncryption",
+    "1.2.840.113549.1.1.11": "sha256WithRSAEncryption", "1.2.840.113549.1.1.12": "sha384WithRSAEncryption",
+    "1.2.840.113549.1.1.13": "sha512WithRSAEncryption", "1.2.840.113549.1.1.10": "RSASSA-PSS",
+    "1.2.840.10040.4.3": "dsa-with-SHA1", "2.16.840.1.101.3.4.3.1": "dsa-with-SHA224",
+    "2.16.840.1.101.3.4.3.2": "dsa-with-SHA256",
+    "1.2.840.10045.4.1": "ecdsa-with-SHA1", "1.2.840.10045.4.3.1": "ecdsa-with-SHA224",
+    "1.2.840.10045.4.3.2": "ecdsa-with-SHA256", "1.2.840.10045.4.3.3": "ecdsa-with-SHA384",
+    "1.2.840.10045.4.3.4": "ecdsa-with-SHA512",
+    **_PQC_ALGORITHMS,
+})
+
+_CURVES = asn1.oid_table({
+    "1.2.840.10045.3.1.1": "P-192", "1.3.132.0.33": "P-224", "1.2.840.10045.3.1.7": "P-256",
+    "1.3.132.0.34": "P-384", "1.3.132.0.35": "P-521", "1.3.132.0.10": "secp256k1",
+    "1.3.36.3.3.2.8.1.1.7": "brainpoolP256r1", "1.3.36.3.3.2.8.1.1.11": "brainpoolP384r1",
+    "1.3.36.3.3.2.8.1.1.13": "brainpoolP512r1", "1.2.156.10197.1.301": "SM2",
+})
+_CURVE_BITS = {
+    "P-192": 192, "P-224": 224, "P-256": 256, "P-384": 384, "P-521": 521, "secp256k1": 256,
+    "brainpoolP256r1": 256, "brainpoolP384r1": 384, "brainpoolP512r1": 512, "SM2": 256,
+    "nistp256": 256, "nistp384": 384, "nistp521": 521,
+}
+# 곡선이 알고리즘에 고정된 키의 크기
+_FIXED_BITS = {"X25519": 256, "Ed25519": 256, "X448": 448, "Ed448": 456}
+
+_OID_COMMON_NAME = asn1.encode_oid("2.5.4.3")
+_OID_ORGANIZATION = asn1.encode_oid("2.5.4.10")
+_OID_DATA = asn1.encode_oid("1.2.840.113549.1.7.1")
+_OID_SIGNED_DATA = asn1.encode_oid("1.2.840.113549.1.7.2")
+_OID_ENVELOPED_DATA = asn1.encode_oid("1.2.840.113549.1.7.3")
+_OID_ENCRYPTED_DATA = asn1.encode_oid("1.2.840.113549.1.7.6")
+_OID_FRIENDLY_NAME = asn1.encode_oid("1.2.840.113549.1.9.20")
+_OID_X509_CERT = asn1.encode_oid("1.2.840.113549.1.9.22.1")
+_BAG_KEY = asn1.encode_oid("1.2.840.113549.1.12.10.1.1")
+_BAG_SHROUDED_KEY = asn1.encode_oid("1.2.840.113549.1.12.10.1.2")
+_BAG_CERT = asn1.encode_oid("1.2.840.113549.1.12.10.1.3")
+_BAG_SAFE_CONTENTS = asn1.encode_oid("1.2.840.113549.1.12.10.1.6")
+
+_PEM = re.compile(rb"-----BEGIN ([A-Z0-9 .#]+)-----\s*(.*?)-----END \1-----", re.DOTALL)
+_PEM_LABELS = (
+    b"CERTIFICATE", b"TRUSTED CERTIFICATE", b"CERTIFICATE REQUEST", b"NEW CERTIFICATE REQUEST", b"PKCS7",
+    b"PUBLIC KEY", b"RSA PUBLIC KEY", b"PRIVATE KEY", b"ENCRYPTED PRIVATE KEY", b"RSA PRIVATE KEY",
+    b"EC PRIVATE KEY", b"DSA PRIVATE KEY", b"OPENSSH PRIVATE KEY", b"DH PARAMETERS", b"X9.42 DH PARAMETERS",
+    b"EC PARAMETERS", b"DSA PARAMETERS",
+)
+_SSH_PUBLIC_KEY = re.compile(
+    rb"(?<![\w-])(ssh-(?:rsa|dss|ed25519|ed448)|ecdsa-sha2-nistp\d+|sk-[\w.@-]+)(?:-cert-v01@openssh\.com)?"
+    rb"[ \t]+(AAAA[A-Za-z0-9+/]+=*)"
+)
+_JKS_MAGIC = b"\xfe\xed\xfe\xed"
+_JCEKS_MAGIC = b"\xce\xce\xce\xce"
+
+
+class KeyMaterialScan:
+    """인증서/키 파일 하나의 분석 결과입니다. objects는 객체별 속성 딕셔너리 목록입니다."""
+
+    def __init__(self, source_format: str):
+        self.format = source_format
+        self.objects: List[Dict[str, Any]] = []
+        self.notes: List[str] = []
+
+    def add(self, kind: str, location: str, key_algorithm: Optional[str], key_size: Optional[int] = None,
+            curve: Optional[str] = None, signature_algorithm: Optional[str] = None, **extra: Any) -> None:
+        self.objects.append({
+            "kind": kind, "location": location, "key_algorithm": key_algorithm, "key_size": key_size,
+            "curve": curve, "signature_algorithm": signature_algorithm, **extra,
+        })
+
+    @property
+    def findings(self) -> List[Dict[str, Any]]:
+        findings = []
+        for obj in self.objects:
+            key_families = _key_families(obj["key_algorithm"])
+            signature_families = _signature_families(obj["signature_algorithm"])
+            subject = f" ({obj['subject']})" if obj.get("subject") else ""
+            finding = make_finding(
+                f"{_KIND_LABELS[obj['kind']]} {obj['key_algorithm']}{subject}", obj["location"], obj["kind"],
+                families=key_families | signature_families,
+                **{k: obj[k] for k in ("key_size", "curve", "signature_algorithm") if obj.get(k)},
+                **({"not_after": f"{obj['not_after']:%Y-%m-%d}"} if obj.get("not_after") else {}),
+            )
+            if finding is None:
+                continue
+            # 키와 서명 중 하나라도 고전 알고리즘이면 양자 취약입니다 (PQC 키라도 RSA로 서명된 인증서는 위조 가능).
+            statuses = {classify_families(key_families), classify_families(signature_families)}
+            if "classical" in statuses:
+                finding["status"] = "classical"
+            findings.append(finding)
+        return findings
+
+    def summary(self, now: Optional[datetime] = None) -> List[str]:
+        """객체 종류/키/서명 알고리즘 조합별 개수와 만료 현황을 요약합니다. (대형 번들용)"""
+        now = now or datetime.now(timezone.utc)
+        groups: Counter = Counter()
+        for obj in self.objects:
+            key = obj["key_algorithm"] or "알 수 없음"
+            if obj["curve"]:
+                key += f" {obj['curve']}"
+            elif obj["key_size"]:
+                key += f"-{obj['key_size']}"
+            signature = f" / {obj['signature_algorithm']}" if obj["signature_algorithm"] else ""
+            groups[f"{_KIND_LABELS[obj['kind']]} {key}{signature}"] += 1
+        lines = [f"×{count} {label}" for label, count in groups.most_common(_MAX_SUMMARY_LINES)]
+        if len(groups) > _MAX_SUMMARY_LINES:
+            lines.append(f"... 외 {len(groups) - _MAX_SUMMARY_LINES}개 조합")
+
+        expiries = [obj for obj in self.objects if obj.get("not_after")]
+        if expiries:
+            expired = sum(1 for obj in expiries if obj["not_after"] < now)
+            long_lived = sum(
+                1 for obj in expiries
+                if obj["not_after"] > CLASSICAL_DEPRECATION and classify_families(_key_families(obj["key_algorithm"])) == "classical"
+            )
+            earliest = min(obj["not_after"] for obj in expiries if obj["not_after"] >= now) if expired < len(expiries) else None
+            line = f"만료: {expired}/{len(expiries)}개 만료됨"
+            if earliest:
+                line += f", 가장 이른 만료 {earliest:%Y-%m-%d}"
+            if long_lived:
+                line += f", {CLASSICAL_DEPRECATION:%Y}년 이후 만료되는 고전 키 인증서 {long_lived}개"
+            lines.append(line)
+        return lines
+
+
+@lru_cache(maxsize=256)
+def _key_families(key_algorithm: Optional[str]) -> FrozenSet[str]:
+    if not key_algorithm:
+        return frozenset()
+    return frozenset(_KEY_FAMILY_OVERRIDES.get(key_algorithm) or canonical_families(key_algorithm))
+
+
+@lru_cache(maxsize=256)
+def _signature_families(signature_algorithm: Optional[str]) -> FrozenSet[str]:
+    return frozenset(canonical_families(signature_algorithm or ""))
+
+
+def detect_key_material(file_name: str, content: bytes) -> Optional[str]:
+    """
+    인증서/키/키스토어 파일이면 형식("pem", "der", "jks", "jceks", "ssh")을, 아니면 None을 반환합니다.
+    확장자가 없어도 내용이 PEM 블록으로 시작하거나 파일 전체가 하나의 DER 구조이면 인정합니다.
+    """
+    if content[:4] == _JKS_MAGIC:
+        return "jks"
+    if content[:4] == _JCEKS_MAGIC:
+        return "jceks"
+    base = posixpath.basename(file_name.replace("\\", "/")).lower()
+    extension = posixpath.splitext(base)[1]
+    head = content[:_SNIFF_BYTES]
+
+    match = _PEM.search(head)
+    if match and match.group(1) in _PEM_LABELS:
+        if extension in KEY_EXTENSIONS or head.lstrip().startswith(b"-----BEGIN "):
+            return "pem"
+    if (extension == ".pub" or base in _SSH_KEY_FILES) and _SSH_PUBLIC_KEY.search(head):
+        return "ssh"
+    if content[:1] == b"\x30":
+        try:
+            end = asn1.read(content, 0)[3]
+        except asn1.DERError:
+            return None
+        if extension in KEY_EXTENSIONS or end == len(content):
+            scan = KeyMaterialScan("der")
+            _parse_der(content, 0, len(content), base or "DER", scan, None)
+            if scan.objects or scan.notes:
+                return "der"
+    return None
+
+
+def scan_key_material(content: bytes, file_name: str) -> Optional[KeyMaterialScan]:
+    """인증서/키 파일을 파싱합니다. 해당 형식이 아니면 None을 반환합니다."""
+    source_format = detect_key_material(file_name, content)
+    if source_format is None:
+        return None
+    scan = KeyMaterialScan(source_format)
+    name = posixpath.basename(file_name.replace("\\", "/")) or "content"
+    if source_format in ("jks", "jceks"):
+        _parse_jks(content, name, scan)
+    elif source_format == "der":
+        _parse_der(content, 0, len(content), name, scan, None)
+    else:
+        _parse_pem(content, name, scan)
+        _parse_ssh_public_keys(content, name, scan)
+    return scan
+
+
+# --- 바이너리 카빙(carving) 등 다른 스캐너가 쓰는 진입점 ---
+
+def parse_pem_blocks(content: bytes, name: str, scan: KeyMaterialScan) -> None:
+    """content 안의 PEM 블록을 모두 파싱해 scan에 추가합니다."""
+    _parse_pem(content, name, scan)
+
+
+def parse_der_object(data: bytes, location: str, scan: KeyMaterialScan) -> int:
+    """data 맨 앞의 DER 객체 하나를 파싱해 scan에 추가하고 객체 길이를 반환합니다. 구조가 아니면 DERError."""
+    try:
+        element = asn1.read(data, 0)
+        _parse_object(data, element, location, scan, None)
+    except IndexError as e:
+        raise asn1.DERError(str(e)) from e
+    return element[3]
+
+
+def parse_ssh_key_blob(blob: bytes) -> Tuple[str, Optional[int], Optional[str]]:
+    """SSH 와이어 형식 공개키 블롭 → (키 타입, 크기, 곡선). 잘린 블롭이면 DERError."""
+    try:
+        return _ssh_key(blob)
+    except struct.error as e:
+        raise asn1.DERError(str(e)) from e
+
+
+# --- PEM / OpenSSH ---
+
+def _parse_pem(content: bytes, name: str, scan: KeyMaterialScan) -> None:
+    for index, match in enumerate(_PEM.finditer(content), 1):
+        label = match.group(1).decode("ascii")
+        body = match.group(2)
+        location = f"{name}#{index}"
+        if b"Proc-Type:" in body:
+            # 레거시 OpenSSL 암호화 키: 알고리즘은 레이블로 알 수 있지만 크기는 복호화해야 알 수 있습니다.
+            scan.add("private_key", location, _LEGACY_KEY_LABELS.get(label), encrypted=True)
+            continue
+        if b":" in body:
+            body = b"\n".join(line for line in body.splitlines() if b":" not in line)
+        try:
+            der = binascii.a2b_base64(body)
+        except binascii.Error:
+            scan.notes.append(f"{location}: {label} base64 디코딩 실패")
+            continue
+        if label == "OPENSSH PRIVATE KEY":
+            _parse_openssh_private(der, location, scan)
+        elif label == "EC PARAMETERS":
+            curve = _CURVES.get(der[2:]) if der[:1] == b"\x06" else None
+            scan.add("parameters", location, "EC", _CURVE_BITS.get(curve or ""), curve)
+        else:
+            try:
+                _parse_der(der, 0, len(der), location, scan, label, single=True)
+            except asn1.DERError as e:
+                scan.notes.append(f"{location}: {label} 구조 오류 ({e})")
+
+
+_LEGACY_KEY_LABELS = {"RSA PRIVATE KEY": "RSA", "EC PRIVATE KEY": "EC", "DSA PRIVATE KEY": "DSA"}
+
+
+def _ssh_strings(blob: bytes, count: int, offset: int = 0) -> Tuple[List[bytes], int]:
+    values = []
+    for _ in range(count):
+        if offset + 4 > len(blob):
+            raise asn1.DERError("잘린 SSH 문자열")
+        (length,) = struct.unpack_from(">I", blob, offset)
+        offset += 4
+        if offset + length > len(blob):
+            raise asn1.DERError("잘린 SSH 문자열")
+        values.append(blob[offset:offset + length])
+        offset += length
+    return values, offset
+
+
+def _ssh_key(blob: bytes) -> Tuple[str, Optional[int], Optional[str]]:
+    """SSH 공개키 블롭 → (키 타입, 크기, 곡선)."""
+    (key_type,), offset = _ssh_strings(blob, 1)
+    name = key_type.decode("ascii", errors="replace")
+    if name.startswith("ssh-rsa"):
+        (_, modulus), _ = _ssh_strings(blob, 2, offset)
+        return name, _mpint_bits(modulus), None
+    if name.startswith("ssh-dss"):
+        (prime,), _ = _ssh_strings(blob, 1, offset)
+        return name, _mpint_bits(prime), None
+    if "ecdsa-sha2-" in name:
+        (curve,), _ = _ssh_strings(blob, 1, offset)
+        curve_name = curve.decode("ascii", errors="replace")
+        return name, _CURVE_BITS.get(curve_name), curve_name
+    if "ed25519" in name:
+        return name, 256, None
+    if "ed448" in name:
+        return name, 456, None
+    return name, None, None
+
+
+def _mpint_bits(value: bytes) -> int:
+    stripped = value.lstrip(b"\x00")
+    return (len(stripped) - 1) * 8 + stripped[0].bit_length() if stripped else 0
+
+
+def _parse_openssh_private(der: bytes, location: str, scan: KeyMaterialScan) -> None:
+    magic = b"openssh-key-v1\x00"
+    try:
+        if not der.startswith(magic):
+            raise asn1.DERError("openssh-key-v1 아님")
+        (cipher, _, _), offset = _ssh_strings(der, 3, len(magic))
+        (count,) = struct.unpack_from(">I", der, offset)
+        # 공개키 부분은 개인키가 암호화되어 있어도 평문입니다.
+        public_keys, _ = _ssh_strings(der, count, offset + 4)
+        for number, blob in enumerate(public_keys):
+            key_type, size, curve = _ssh_key(blob)
+            scan.add("ssh_private_key", f"{location}.{number}" if count > 1 else location, key_type, size, curve,
+                     encrypted=cipher != b"none")
+    except (asn1.DERError, struct.error) as e:
+        scan.notes.append(f"{location}: OpenSSH 개인키 구조 오류 ({e})")
+
+
+def _parse_ssh_public_keys(content: bytes, name: str, scan: KeyMaterialScan) -> None:
+    for match in _SSH_PUBLIC_KEY.finditer(content):
+        line = content.count(b"\n", 0, match.start()) + 1
+        try:
+            key_type, size, curve = _ssh_key(binascii.a2b_base64(match.group(2)))
+        except (binascii.Error, asn1.DERError, struct.error):
+            key_type, size, curve = match.group(1).decode("ascii"), None, None
+        scan.add("ssh_public_key", f"{name}:{line}", key_type, size, curve)
+
+
+# --- DER 구조 ---
+
+def _algorithm(data: bytes, element: asn1.Element) -> Tuple[bytes, Optional[asn1.Element]]:
+    """AlgorithmIdentifier → (OID 원본 바이트, 파라미터 요소)."""
+    parts = asn1.child_list(data, element)
+    if not parts or parts[0][0] != asn1.OID:
+        raise asn1.DERError("AlgorithmIdentifier 아님")
+    return data[parts[0][1]:parts[0][2]], parts[1] if len(parts) > 1 else None
+
+
+def _is_algorithm(data: bytes, element: asn1.Element) -> bool:
+    if element[0] != asn1.SEQUENCE or element[1] >= element[2]:
+        return False
+    return data[element[1]] == asn1.OID
+
+
+def _key_name(oid: bytes) -> str:
+    return _KEY_ALGORITHMS.get(oid) or asn1.decode_oid(oid)
+
+
+def _describe_key(name: str, data: bytes, params: Optional[asn1.Element], key: bytes,
+                  private: bool) -> Tuple[Optional[int], Optional[str]]:
+    """키 알고리즘 이름, 파라미터, 키 바이트(공개키 BIT STRING 내용 또는 개인키 OCTET STRING 내용)에서 (크기, 곡선)을 구합니다."""
+    if name in _FIXED_BITS:
+        return _FIXED_BITS[name], None
+    if name.startswith("RSA"):
+        numbers = asn1.child_list(key, asn1.read(key, 0))
+        # RSAPublicKey = {n, e}, RSAPrivateKey = {version, n, e, ...}
+        return asn1.integer_bits(key, numbers[1 if private else 0]), None
+    if name in ("EC", "ECDH", "ECMQV"):
+        curve = None
+        if params is not None and params[0] == asn1.OID:
+            curve = _CURVES.get(data[params[1]:params[2]]) or asn1.decode_oid(data[params[1]:params[2]])
+        elif private:
+            # SEC1 ECPrivateKey의 [0] 파라미터
+            for element in asn1.child_list(key, asn1.read(key, 0)):
+                if element[0] == 0xA0:
+                    inner = asn1.read(key, element[1])
+                    curve = _CURVES.get(key[inner[1]:inner[2]])
+        elif params is not None:
+            curve = "explicit"
+        return _CURVE_BITS.get(curve or ""), curve
+    if name in ("DSA", "DH") and params is not None and params[0] == asn1.SEQUENCE:
+        return asn1.integer_bits(data, asn1.read(data, params[1])), None
+    return None, None
+
+
+def _spki(data: bytes, element: asn1.Element) -> Tuple[str, Optional[int], Optional[str]]:
+    algorithm, bits = asn1.child_list(data, element)[:2]
+    oid, params = _algorithm(data, algorithm)
+    name = _key_name(oid)
+    key = asn1.octets(data, bits)[1:]  # 첫 바이트는 사용하지 않는 비트 수
+    try:
+        size, curve = _describe_key(name, data, params, key, private=False)
+    except (asn1.DERError, IndexError):
+        size, curve = None, None
+    return name, size, curve
+
+
+def _names(data: bytes, element: asn1.Element) -> Optional[str]:
+    """Name에서 CN(없으면 O)을 꺼냅니다."""
+    found: Dict[bytes, str] = {}
+    for rdn in asn1.children(data, element[1], element[2]):
+        for attribute in asn1.children(data, rdn[1], rdn[2]):
+            parts = asn1.child_list(data, attribute)
+            if len(parts) == 2 and parts[0][0] == asn1.OID:
+                oid = data[parts[0][1]:parts[0][2]]
+                if oid in (_OID_COMMON_NAME, _OID_ORGANIZATION):
+                    found[oid] = asn1.text_value(data, parts[1])
+    value = found.get(_OID_COMMON_NAME) or found.get(_OID_ORGANIZATION)
+    return f"CN={value}" if _OID_COMMON_NAME in found else (f"O={value}" if value else None)
+
+
+def _signature_name(data: bytes, element: asn1.Element) -> str:
+    oid, _ = _algorithm(data, element)
+    return _SIGNATURE_ALGORITHMS.get(oid) or asn1.decode_oid(oid)
+
+
+def _parse_signed(data: bytes, parts: List[asn1.Element], location: str, scan: KeyMaterialScan) -> bool:
+    """서명된 구조(인증서/CSR)이면 객체를 추가하고 True. CRL 등은 건너뜁니다."""
+    tbs = asn1.child_list(data, parts[0])
+    if not tbs:
+        return False
+    signature = _signature_name(data, parts[1])
+    index = 1 if tbs[0][0] == 0xA0 else 0
+    if tbs[index][0] != asn1.INTEGER:
+        return False  # 버전 없는 v1 CRL
+    after = tbs[index + 1]
+    if after[0] == asn1.SEQUENCE and not _is_algorithm(data, after) and len(tbs) > index + 2:
+        # CSR: {version, subject, subjectPKInfo, [0] attributes}
+        name, size, curve = _spki(data, tbs[index + 2])
+        scan.add("csr", location, name, size, curve, signature, subject=_names(data, after))
+        return True
+    if len(tbs) < index + 6 or tbs[index + 3][0] != asn1.SEQUENCE:
+        scan.notes.append(f"{location}: CRL 건너뜀 (서명 {signature})")
+        return True
+    validity = asn1.child_list(data, tbs[index + 3])
+    name, size, curve = _spki(data, tbs[index + 5])
+    scan.add(
+        "certificate", location, name, size, curve, signature,
+        subject=_names(data, tbs[index + 4]),
+        not_before=asn1.parse_time(data, validity[0]) if validity else None,
+        not_after=asn1.parse_time(data, validity[1]) if len(validity) > 1 else None,
+    )
+    return True
+
+
+def _parse_der(data: bytes, start: int, end: int, location: str, scan: KeyMaterialScan, label: Optional[str],
+               single: bool = False) -> None:
+    """
+    [start, end) 구간의 DER 객체들을 구조로 판별해 분석합니다. 이어 붙인 DER 번들도 처리합니다.
+    label은 PEM 레이블로, 구조만으로 모호한 경우(예: RSA 공개키 vs DH 파라미터)에 사용합니다.
+    """
+    count = 0
+    position = start
+    while position < end:
+        count += 1
+        here = location if single or count == 1 else f"{location}#{count}"
+        try:
+            element = asn1.read(data, position, end)
+            _parse_object(data, element, here, scan, label)
+        except (asn1.DERError, IndexError) as e:
+            scan.notes.append(f"{here}: 구조 오류 ({e})")
+            break
+        if single:
+            break  # TRUSTED CERTIFICATE 뒤의 보조 정보 등은 무시
+        position = element[3]
+
+
+def _parse_object(data: bytes, element: asn1.Element, location: str, scan: KeyMaterialScan,
+                  label: Optional[str]) -> None:
+    if element[0] != asn1.SEQUENCE:
+        return
+    parts = asn1.child_list(data, element)
+    if not parts:
+        return
+    tags = [part[0] for part in parts]
+
+    # Certificate / CertificationRequest / CRL: {tbs, signatureAlgorithm, signature}
+    if len(parts) == 3 and tags[:2] == [asn1.SEQUENCE, asn1.SEQUENCE] and tags[2] == asn1.BIT_STRING \
+            and _is_algorithm(data, parts[1]) and not _is_algorithm(data, parts[0]):
+        _parse_signed(data, parts, location, scan)
+        return
+    # ContentInfo (PKCS#7 SignedData)
+    if tags[0] == asn1.OID:
+        if data[parts[0][1]:parts[0][2]] == _OID_SIGNED_DATA and len(parts) > 1:
+            _parse_pkcs7(data, parts[1], location, scan)
+        return
+    # SubjectPublicKeyInfo: {algorithm, subjectPublicKey}
+    if tags == [asn1.SEQUENCE, asn1.BIT_STRING] and _is_algorithm(data, parts[0]):
+        name, size, curve = _spki(data, element)
+        scan.add("public_key", location, name, size, curve)
+        return
+    # EncryptedPrivateKeyInfo: {encryptionAlgorithm, encryptedData}
+    if tags == [asn1.SEQUENCE, asn1.OCTET_STRING] and _is_algorithm(data, parts[0]):
+        scan.add("private_key", location, None, encrypted=True)
+        scan.notes.append(f"{location}: 암호화된 개인키 (비밀번호 없이는 알고리즘 확인 불가)")
+        return
+    if tags[0] != asn1.INTEGER:
+        return
+    first = int.from_bytes(data[parts[0][1]:parts[0][2]], "big")
+
+    # PFX (PKCS#12): {version 3, authSafe ContentInfo, macData}
+    if first == 3 and tags[1:] in ([asn1.SEQUENCE], [asn1.SEQUENCE, asn1.SEQUENCE]):
+        _parse_pkcs12(data, parts[1], location, scan)
+        return
+    # PrivateKeyInfo / OneAsymmetricKey (PKCS#8): {version, algorithm, privateKey, ...}
+    if len(parts) >= 3 and tags[1] == asn1.SEQUENCE and tags[2] == asn1.OCTET_STRING and _is_algorithm(data, parts[1]):
+        oid, params = _algorithm(data, parts[1])
+        name = _key_name(oid)
+        key = asn1.octets(data, parts[2])
+        try:
+            size, curve = _describe_key(name, data, params, key, private=True)
+        except (asn1.DERError, IndexError):
+            size, curve = None, None
+        scan.add("private_key", location, name, size, curve)
+        return
+    # SEC1 ECPrivateKey: {1, privateKey, [0] parameters, [1] publicKey}
+    if first == 1 and len(parts) >= 2 and tags[1] == asn1.OCTET_STRING:
+        curve = None
+        for part in parts[2:]:
+            if part[0] == 0xA0:
+                inner = asn1.read(data, part[1])
+                curve = _CURVES.get(data[inner[1]:inner[2]])
+        scan.add("private_key", location, "EC", _CURVE_BITS.get(curve or ""), curve)
+        return
+    if any(tag != asn1.INTEGER for tag in tags):
+        return
+    # 정수로만 이루어진 구조: PKCS#1 RSA 개인키(9개), OpenSSL DSA 개인키(6개), RSA 공개키/DH 파라미터(2~3개)
+    if len(parts) >= 9 and first in (0, 1):
+        scan.add("private_key", location, "RSA", asn1.integer_bits(data, parts[1]))
+    elif len(parts) == 6 and first == 0:
+        scan.add("private_key", location, "DSA", asn1.integer_bits(data, parts[1]))
+    elif label in ("DH PARAMETERS", "X9.42 DH PARAMETERS") or (
+            label is None and len(parts) in (2, 3) and asn1.integer_bits(data, parts[1]) <= 8):
+        scan.add("parameters", location, "DH", asn1.integer_bits(data, parts[0]))
+    elif label == "DSA PARAMETERS" and len(parts) == 3:
+        scan.add("parameters", location, "DSA", asn1.integer_bits(data, parts[0]))
+    elif len(parts) == 2:
+        scan.add("public_key", location, "RSA", asn1.integer_bits(data, parts[0]))
+
+
+def _parse_pkcs7(data: bytes, explicit: asn1.Element, location: str, scan: KeyMaterialScan) -> None:
+    """SignedData의 certificates [0] 안에 든 인증서들을 분석합니다."""
+    signed = asn1.read(data, explicit[1])
+    number = 0
+    for part in asn1.children(data, signed[1], signed[2]):
+        if part[0] != 0xA0:
+            continue
+        for certificate in asn1.children(data, part[1], part[2]):
+            number += 1
+            _parse_object(data, certificate, f"{location}[{number}]", scan, None)
+
+
+def _parse_pkcs12(data: bytes, auth_safe: asn1.Element, location: str, scan: KeyMaterialScan) -> None:
+    """PFX의 AuthenticatedSafe를 펼칩니다. 비밀번호로 암호화된 SafeContents는 메모로 남깁니다."""
+    content_type, content = asn1.child_list(data, auth_safe)[:2]
+    if data[content_type[1]:content_type[2]] != _OID_DATA:
+        scan.notes.append(f"{location}: 공개키 무결성 모드 PKCS#12는 지원하지 않습니다")
+        return
+    safes = asn1.octets(data, asn1.read(data, content[1]))
+    encrypted = 0
+    for info in asn1.children(safes, *asn1.read(safes, 0)[1:3]):
+        parts = asn1.child_list(safes, info)
+        oid = safes[parts[0][1]:parts[0][2]]
+        if oid == _OID_DATA:
+            contents = asn1.octets(safes, asn1.read(safes, parts[1][1]))
+            _parse_safe_bags(contents, asn1.read(contents, 0), location, scan)
+        elif oid in (_OID_ENCRYPTED_DATA, _OID_ENVELOPED_DATA):
+            encrypted += 1
+    if encrypted:
+        scan.notes.append(f"{location}: 암호화된 SafeContents {encrypted}개 (비밀번호 없이는 내용 확인 불가)")
+
+
+def _parse_safe_bags(data: bytes, safe_contents: asn1.Element, location: str, scan: KeyMaterialScan) -> None:
+    for number, bag in enumerate(asn1.children(data, safe_contents[1], safe_contents[2]), 1):
+        parts = asn1.child_list(data, bag)
+        bag_id = data[parts[0][1]:parts[0][2]]
+        value = asn1.read(data, parts[1][1])
+        alias = _friendly_name(data, parts[2]) if len(parts) > 2 else None
+        here = f"{location}[{alias or number}]"
+        if bag_id == _BAG_CERT:
+            cert_id, cert_value = asn1.child_list(data, value)[:2]
+            if data[cert_id[1]:cert_id[2]] == _OID_X509_CERT:
+                der = asn1.octets(data, asn1.read(data, cert_value[1]))
+                _parse_der(der, 0, len(der), here, scan, None, single=True)
+        elif bag_id in (_BAG_KEY, _BAG_SHROUDED_KEY):
+            _parse_object(data, value, here, scan, None)
+        elif bag_id == _BAG_SAFE_CONTENTS:
+            _parse_safe_bags(data, value, here, scan)
+
+
+def _friendly_name(data: bytes, attributes: asn1.Element) -> Optional[str]:
+    for attribute in asn1.children(data, attributes[1], attributes[2]):
+        parts = asn1.child_list(data, attribute)
+        if len(parts) == 2 and data[parts[0][1]:parts[0][2]] == _OID_FRIENDLY_NAME:
+            values = asn1.child_list(data, parts[1])
+            if values:
+                return asn1.text_value(data, values[0])
+    return None
+
+
+# --- Java 키스토어 ---
+
+def _parse_jks(content: bytes, name: str, scan: KeyMaterialScan) -> None:
+    """
+    JKS/JCEKS: magic, version, 항목 수 뒤에 (태그, 별칭, 시각, 내용) 항목이 이어집니다.
+    개인키는 Sun 전용 방식으로 암호화되어 있으므로 인증서 체인의 공개키로 알고리즘을 판단합니다.
+    """
+    def read_utf(offset: int) -> Tuple[str, int]:
+        (length,) = struct.unpack_from(">H", content, offset)
+        return content[offset + 2:offset + 2 + length].decode("utf-8", errors="replace"), offset + 2 + length
+
+    def read_certificate(offset: int, location: str) -> int:
+        if version == 2:
+            _, offset = read_utf(offset)  # 인증서 타입 ("X.509")
+        (length,) = struct.unpack_from(">I", content, offset)
+        der = content[offset + 4:offset + 4 + length]
+        _parse_der(der, 0, len(der), location, scan, None, single=True)
+        return offset + 4 + length
+
+    try:
+        version, count = struct.unpack_from(">II", content, 4)
+        offset = 12
+        for _ in range(count):
+            (tag,) = struct.unpack_from(">I", content, offset)
+            alias, offset = read_utf(offset + 4)
+            offset += 8  # 생성 시각
+            location = f"{name}[{alias}]"
+            if tag == 1:
+                (length,) = struct.unpack_from(">I", content, offset)
+                offset += 4 + length
+                (chain,) = struct.unpack_from(">I", content, offset)
+                offset += 4
+                for position in range(chain):
+                    offset = read_certificate(offset, location if position == 0 else f"{location}[chain {position}]")
+            elif tag == 2:
+                offset = read_certificate(offset, location)
+            else:
+                # JCEKS 비밀키 항목은 직렬화된 Java 객체라 길이를 알 수 없어 여기서 멈춥니다.
+                scan.notes.append(f"{location}: 비밀키 항목 이후는 해석하지 않았습니다")
+                break
+    except (struct.error, asn1.DERError) as e:
+        scan.notes.append(f"{name}: 키스토어 구조 오류 ({e})")
@@ -0,0 +1,318 @@
+# File: pqc_inspector_server/scanners/config_tree.py
+# 🌳 JSON, YAML, TOML, XML, INI 설정 파일을 파싱해 트리를 순회하며 암호 관련 키/값을 규칙 테이블로 추출합니다.
+# 규칙으로 판정할 수 있는 값(alg: RS256, kty: EC, 암호군 목록 등)은 키 경로와 함께 finding으로 만들고,
+# 암호 관련 키지만 규칙으로 판정하지 못한 값만 모아 LLM에 넘길 수 있도록 돌려줍니다.
+
+import configparser
+import json
+import logging
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .findings import make_finding
+
+try:
+    import yaml
+except ImportError:  # PyYAML이 없으면 YAML은 LLM 경로로 분석합니다.
+    yaml = None
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10 이하
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+logger = logging.getLogger(__name__)
+
+# 파싱을 시도하는 최대 크기. 이보다 큰 파일은 기존 텍스트 분석 경로를 사용합니다.
+MAX_PARSE_BYTES = 5 * 1024 * 1024
+# LLM에 넘기는 미판정 항목의 최대 개수
+MAX_UNDECIDED = 50
+
+_EXTENSION_FORMATS = {
+    ".json": "json", ".jwk": "json", ".jwks": "json",
+    ".yaml": "yaml", ".yml": "yaml",
+    ".toml": "toml",
+    ".xml": "xml", ".plist": "xml", ".config": "xml",
+    ".ini": "ini", ".cfg": "ini", ".properties": "ini",
+}
+
+# --- 규칙 테이블 ---
+# 키 이름(정규화: 소문자, 구분자 제거)에 대한 정규식과 규칙 이름. 위에서부터 처음 맞는 규칙을 적용합니다.
+_KEY_RULES = [
+    (re.compile(r"^(kty|keytype|publickeytype|keyalgorithm|keyalg)$"), "key_type"),
+    (re.compile(r"(cipher|ciphersuite|ciphersuites|sslciphers|tlsciphers)s?$"), "cipher_list"),
+    (re.compile(r"^(crv|curve|namedcurve|eccurve|ecdhcurve|curves|groups|supportedgroups|kexalgorithms|keyexchange|kex)$"), "curve_or_group"),
+    (re.compile(r"(signaturealgorithm|sigalg|sigalgs|signingalg|signingalgorithm|alg|algorithm|algorithms|jwtalgorithm|tokenalgorithm|hostkeyalgorithms|pubkeyacceptedalgorithms)$"), "algorithm"),
+    (re.compile(r"^(keysize|keylength|keybits|bits|modulusbits|moduluslength|rsabits|rsakeysize|size)$"), "key_size"),
+    (re.compile(r"(publickey|privatekey|certificate|cert|pem|x5c)$"), "key_material"),
+]
+
+# 규칙에 걸리지 않아도 암호 관련으로 보는 키 (판정하지 못한 값을 LLM에 넘길 후보)
+_CRYPTO_KEY_HINT = re.compile(r"crypt|cipher|signing|signature|kex|curve|keytype|keyalg|keyscheme")
+
+# 공개키 알고리즘이 아님을 규칙으로 확정할 수 있는 값 (대칭키, 해시, MAC, 버전, 불리언 등)
+_NON_PUBLIC_KEY_VALUE = re.compile(
+    r"^(hs(256|384|512)|a(128|192|256)(gcm|kw|gcmkw|cbc-hs\d+)?|dir|none|aes[\w-]*|chacha20[\w-]*|"
+    r"sha-?\d+|sha3-\d+|md5|hmac[\w-]*|blake2\w*|pbkdf2[\w-]*|bcrypt|scrypt|argon2\w*|oct|"
+    r"tlsv?1(\.\d)?|true|false|on|off|yes|no|enabled|disabled|default|\d+)$",
+    re.IGNORECASE,
+)
+# 환경 변수나 템플릿으로 채워지는 값은 규칙으로 판정할 수 없습니다.
+_PLACEHOLDER = re.compile(r"\$\{|\{\{|%\(|^\$[A-Z_]+$")
+# 명명된 타원곡선 (키 타입 문맥에 따라 ECDSA 또는 ECDH로 판정)
+_EC_CURVE = re.compile(r"^(p-?(192|224|256|384|521)|secp\d+[rk]1|prime\d+v\d|brainpool\w+|nistp\d+)$", re.IGNORECASE)
+# 파일 경로나 URL 값은 알고리즘 지정이 아니므로 미판정으로 보지 않습니다.
+_PATH_OR_URL = re.compile(r"^([a-z][a-z0-9+.-]*://|[/~.]|[A-Za-z]:\\\\)")
+# 규칙 밖의 키에서 알고리즘으로 인정하는 값. 값 전체가 알고리즘 식별자여야 합니다 (부분 일치는 "universal" 같은 오탐을 냄).
+_ALGORITHM_VALUE = re.compile(
+    r"(?:sha-?\d+|md5)?with(?:rsa|ecdsa|dsa)(?:encryption|andmgf1)?|rsaencryption|id-ecpublickey"
+    r"|[rpe]s(?:256|384|512)k?|eddsa|ed25519|ed448|x25519|x448|rsa|dsa|ecdsa|ecdhe?|dhe?"
+    r"|ssh-(?:rsa|dss|ed25519)|ecdsa-sha2-nistp\d+|rsa-sha2-(?:256|512)|diffie-hellman-[\w-]+|curve25519-sha256(?:@libssh\.org)?"
+    # RSA-OAEP-256, ECDH-ES+A128KW, ECDHE-RSA-AES128-GCM-SHA256, TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256 (대문자 표기만)
+    r"|(?-i:(?:TLS_)?(?:RSA|DSA|ECDSA|ECDHE?|DHE?)(?:[-_+][A-Z0-9]+)+)",
+    re.IGNORECASE,
+)
+_LIST_SEPARATOR = re.compile(r"[\s:,;]+")
+_PEM_MARKER = re.compile(r"-----BEGIN ((RSA|EC|DSA|OPENSSH)? ?(PUBLIC|PRIVATE) KEY|CERTIFICATE)-----")
+_PEM_FAMILIES = {"RSA": "RSA", "EC": "ECDSA", "DSA": "DSA"}
+
+
+def _normalize_key(key: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", key.lower())
+
+
+def detect_format(file_name: str, text: str) -> Optional[str]:
+    """확장자로 형식을 정하고, 확장자로 알 수 없으면 내용의 첫 글자로 추정합니다."""
+    lowered = file_name.lower()
+    for extension, fmt in _EXTENSION_FORMATS.items():
+        if lowered.endswith(extension):
+            return fmt
+    stripped = text.lstrip()
+    if stripped.startswith(("{", "[")):
+        return "json"
+    if stripped.startswith("<"):
+        return "xml"
+    if re.match(r"^(---|[\w.-]+:\s)", stripped):
+        return "yaml"
+    return None
+
+
+def parse_config(text: str, fmt: str) -> Any:
+    """형식에 맞는 파서로 트리를 만듭니다. 지원하지 않거나 파싱에 실패하면 예외를 발생시킵니다."""
+    if fmt == "json":
+        return json.loads(text)
+    if fmt == "yaml":
+        if yaml is None:
+            raise ValueError("PyYAML이 설치되어 있지 않습니다")
+        documents = list(yaml.safe_load_all(text))
+        return documents[0] if len(documents) == 1 else documents
+    if fmt == "toml":
+        if tomllib is None:
+            raise ValueError("TOML 파서가 없습니다")
+        return tomllib.loads(text)
+    if fmt == "xml":
+        return _xml_to_tree(ElementTree.fromstring(text))
+    if fmt == "ini":
+        parser = configparser.ConfigParser(interpolation=None, strict=False)
+        # 섹션 없는 .properties 파일도 읽을 수 있도록 기본 섹션을 붙입니다.
+        parser.read_string("[__root__]\n" + text)
+        tree = {section: dict(parser.items(section)) for section in parser.sections()}
+        return {**tree.pop("__root__"), **tree}
+    raise ValueError(f"지원하지 않는 형식: {fmt}")
+
+
+def _xml_to_tree(element: ElementTree.Element) -> Dict[str, Any]:
+    """XML 요소를 {태그: {속성..., 자식 태그..., "#text": 텍스트}} 형태의 딕셔너리로 변환합니다."""
+    node: Dict[str, Any] = dict(element.attrib)
+    for child in element:
+        tag, value = next(iter(_xml_to_tree(child).items()))
+        if tag in node:
+            if not isinstance(node[tag], list):
+                node[tag] = [node[tag]]
+            node[tag].append(value)
+        else:
+            node[tag] = value
+    text = (element.text or "").strip()
+    tag = element.tag.rsplit("}", 1)[-1]  # 네임스페이스 제거
+    if text and not node:
+        return {tag: text}
+    if text:
+        node["#text"] = text
+    return {tag: node}
+
+
+def walk(tree: Any) -> Iterator[Tuple[str, str, Any, Any]]:
+    """트리의 모든 스칼라/스칼라 목록을 (키 경로, 키, 값, 부모 컨테이너) 형태로 순회합니다."""
+    stack: List[Tuple[str, Any]] = [("", tree)]
+    while stack:
+        path, node = stack.pop()
+        if isinstance(node, dict):
+            items = ((str(k), v) for k, v in node.items())
+        elif isinstance(node, list):
+            items = ((f"[{i}]", v) for i, v in enumerate(node))
+        else:
+            continue
+        for key, value in items:
+            child_path = f"{path}{key}" if key.startswith("[") else (f"{path}.{key}" if path else key)
+            if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, (dict, list)) for v in value)):
+                stack.append((child_path, value))
+            else:
+                yield child_path, key, value, node
+
+
+class ConfigScan:
+    """설정 파일 하나의 규칙 기반 분석 결과입니다."""
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        self.findings: List[Dict[str, Any]] = []
+        # 암호 관련 키지만 규칙으로 판정하지 못한 항목 {키 경로: 값}
+        self.undecided: Dict[str, Any] = {}
+
+    @property
+    def decided(self) -> bool:
+        """규칙만으로 결론을 낼 수 있으면 True (LLM 호출 불필요)."""
+        return not self.undecided
+
+
+def scan_config(file_content: bytes, file_name: str) -> Optional[ConfigScan]:
+    """
+    설정 파일을 파싱하여 규칙 테이블을 적용합니다.
+    형식을 알 수 없거나 파싱에 실패하면 None을 반환하며, 이때 호출자는 원문 텍스트 분석으로 돌아갑니다.
+    """
+    if len(file_content) > MAX_PARSE_BYTES:
+        return None
+    text = file_content.decode("utf-8", errors="replace")
+    fmt = detect_format(file_name, text)
+    if fmt is None:
+        return None
+    try:
+        tree = parse_config(text, fmt)
+    except Exception as e:
+        logger.debug("설정 파싱 실패, 텍스트 분석으로 전환", extra={"file_name": file_name, "format": fmt, "error": str(e)})
+        return None
+
+    scan = ConfigScan(fmt)
+    key_sizes: Dict[int, int] = {}
+    findings_by_parent: Dict[int, List[Dict[str, Any]]] = {}
+
+    for path, key, value, parent in walk(tree):
+        normalized = _normalize_key(key)
+        rule = next((name for pattern, name in _KEY_RULES if pattern.search(normalized)), None)
+        values = value if isinstance(value, list) else [value]
+
+        if rule == "key_size":
+            size = _as_int(value)
+            if size:
+                key_sizes[id(parent)] = size
+            continue
+
+        found = []
+        undecided = False
+        for item in values:
+            if item is None or isinstance(item, bool):
+                continue
+            item = str(item).strip()
+            if not item:
+                continue
+            if rule is None:
+                # 규칙 밖의 키는 값 전체가 알고리즘 식별자인 경우만 인정합니다 (예: "SHA256withRSA", "RS256").
+                if _ALGORITHM_VALUE.fullmatch(item):
+                    finding = make_finding(item, path, "value")
+                    if finding:
+                        found.append(finding)
+                continue
+            new_findings, decided = _apply_rule(rule, item, path, parent)
+            found.extend(new_findings)
+            undecided = undecided or not decided
+
+        if rule is None and not found and _CRYPTO_KEY_HINT.search(normalized) and _is_unclear(value):
+            undecided = True
+        if undecided and len(scan.undecided) < MAX_UNDECIDED:
+            scan.undecided[path] = value
+        if found:
+            scan.findings.extend(found)
+            findings_by_parent.setdefault(id(parent), []).extend(found)
+
+    # 같은 컨테이너에 있는 키 크기를 알고리즘 finding에 붙입니다 (예: {"algorithm": "RSA", "keySize": 2048}).
+    for parent_id, size in key_sizes.items():
+        for finding in findings_by_parent.get(parent_id, []):
+            finding.setdefault("key_size", size)
+
+    return scan
+
+
+def _apply_rule(rule: str, value: str, path: str, parent: Any) -> Tuple[List[Dict[str, Any]], bool]:
+    """값 하나에 규칙을 적용해 (findings, 규칙으로 판정했는지)를 반환합니다."""
+    if _PLACEHOLDER.search(value):
+        return [], False
+
+    if rule == "key_material":
+        marker = _PEM_MARKER.search(value)
+        if marker and marker.group(2) in _PEM_FAMILIES:
+            return [make_finding(marker.group(0), path, rule, families=[_PEM_FAMILIES[marker.group(2)]])], True
+        # 일반 PEM(PUBLIC KEY, CERTIFICATE)은 내부 DER을 봐야 알 수 있으므로 LLM 판단에 맡깁니다.
+        return [], not marker
+
+    if rule == "key_type":
+        upper = value.upper()
+        if upper == "EC":
+            return [make_finding(value, path, rule, families=[_curve_family(rule, parent)])], True
+        if upper == "OKP":
+            # OKP 키의 계열은 곡선(crv)이 결정합니다. crv 값 자체는 curve_or_group 규칙이 처리합니다.
+            return [], isinstance(parent, dict) and "crv" in parent
+        finding = make_finding(value, path, rule)
+        return ([finding] if finding else []), bool(finding or _NON_PUBLIC_KEY_VALUE.match(value))
+
+    # cipher_list, curve_or_group, algorithm: 구분자로 나눈 토큰마다 판정합니다.
+    findings = []
+    decided = True
+    for token in _LIST_SEPARATOR.split(value):
+        if not token:
+            continue
+        finding = make_finding(token, path, rule)
+        if finding is None and _EC_CURVE.match(token):
+            finding = make_finding(token, path, rule, families=[_curve_family(rule, parent)], curve=token)
+        if finding:
+            findings.append(finding)
+        elif not _NON_PUBLIC_KEY_VALUE.match(token) and not (rule == "cipher_list" and _symmetric_cipher_token(token)):
+            decided = False
+    return findings, decided
+
+
+def _curve_family(rule: str, parent: Any) -> str:
+    """명명된 곡선/EC 키 타입이 서명용인지 키 교환용인지 주변 키로 판단합니다."""
+    if rule == "curve_or_group":
+        if isinstance(parent, dict) and ("kty" in parent or "alg" in parent):
+            return "ECDH" if str(parent.get("use", "")).lower() == "enc" or str(parent.get("alg", "")).upper().startswith("ECDH") else "ECDSA"
+        return "ECDH"
+    if isinstance(parent, dict) and (str(parent.get("use", "")).lower() == "enc" or str(parent.get("alg", "")).upper().startswith("ECDH")):
+        return "ECDH"
+    return "ECDSA"
+
+
+def _symmetric_cipher_token(token: str) -> bool:
+    # TLS 1.3 암호군(TLS_AES_128_GCM_SHA256 등)과 OpenSSL 키워드(HIGH, !aNULL, AES256-GCM-SHA384 등)는
+    # 공개키 알고리즘을 지정하지 않거나, 지정하더라도 위에서 이미 계열로 판정됩니다.
+    return bool(re.fullmatch(r"[!+@-]?[\w.=-]+", token))
+
+
+def _is_unclear(value: Any) -> bool:
+    values = value if isinstance(value, list) else [value]
+    return any(
+        isinstance(v, str) and v.strip() and len(v) <= 256
+        and not _NON_PUBLIC_KEY_VALUE.match(v.strip()) and not _PATH_OR_URL.match(v.strip())
+        for v in values
+    )
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        size = int(str(value).strip())
+    except ValueError:
+        return None
+    return size if 128 <= size <= 16384 else None
@@ -0,0 +1,182 @@
+# File: pqc_inspector_server/scanners/crypto_packages.py
+# 📚 공개키 암호를 제공하거나 직접 사용하는 서드파티 패키지의 오프라인 지식 테이블입니다.
+# (생태계, 정규화한 패키지 이름) → 노출하는 고전 알고리즘 계열, 설명, PQC 지원이 시작된 버전.
+# 의존성 스캐너가 항목마다 딕셔너리 조회 한 번으로 판정하므로 네트워크나 LLM 호출이 없습니다.
+# 확실히 확인된 버전만 pqc_since로 적고, 불확실하면 비워 둡니다 (고전 전용으로 보고).
+
+import re
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class CryptoPackage(NamedTuple):
+    families: Tuple[str, ...]               # 노출하는 고전 공개키 알고리즘 계열
+    note: str
+    pqc_since: Optional[str] = None         # 이 버전부터 PQC 알고리즘도 제공 ("0"이면 모든 버전)
+    pqc_families: Tuple[str, ...] = ()
+
+
+_ALL_CLASSICAL = ("RSA", "DSA", "ECDSA", "EdDSA", "ECDH", "DH")
+_SSH = ("RSA", "ECDSA", "EdDSA", "ECDH", "DH")
+_JOSE = ("RSA", "ECDSA", "EdDSA")
+_NIST_PQC = ("ML-KEM", "ML-DSA", "SLH-DSA")
+
+_PACKAGES = {
+    "pypi": {
+        "rsa": CryptoPackage(("RSA",), "순수 파이썬 RSA 구현"),
+        "pycryptodome": CryptoPackage(("RSA", "DSA", "ECDSA", "EdDSA", "ECDH"), "PyCryptodome 공개키 모듈"),
+        "pycryptodomex": CryptoPackage(("RSA", "DSA", "ECDSA", "EdDSA", "ECDH"), "PyCryptodome 공개키 모듈"),
+        "pycrypto": CryptoPackage(("RSA", "DSA"), "유지보수 중단된 PyCrypto"),
+        "ecdsa": CryptoPackage(("ECDSA", "ECDH"), "순수 파이썬 ECDSA/ECDH 구현"),
+        "cryptography": CryptoPackage(_ALL_CLASSICAL, "pyca/cryptography hazmat 공개키 API"),
+        "pyopenssl": CryptoPackage(("RSA", "DSA", "ECDSA"), "OpenSSL 바인딩"),
+        "m2crypto": CryptoPackage(("RSA", "DSA", "ECDSA", "DH"), "OpenSSL 바인딩"),
+        "paramiko": CryptoPackage(_SSH, "SSH 키/키 교환"),
+        "asyncssh": CryptoPackage(_SSH, "SSH 키/키 교환"),
+        "pyjwt": CryptoPackage(_JOSE, "JWT RS*/ES*/EdDSA 서명"),
+        "python-jose": CryptoPackage(("RSA", "ECDSA"), "JOSE RS*/ES* 서명"),
+        "jwcrypto": CryptoPackage(_JOSE + ("ECDH",), "JOSE 서명/ECDH-ES 암호화"),
+        "authlib": CryptoPackage(_JOSE, "OAuth/JOSE 서명"),
+        "pynacl": CryptoPackage(("EdDSA", "ECDH"), "libsodium Ed25519/X25519"),
+        "ed25519": CryptoPackage(("EdDSA",), "Ed25519 서명"),
+        "fastecdsa": CryptoPackage(("ECDSA",), "ECDSA 구현"),
+        "coincurve": CryptoPackage(("ECDSA", "ECDH"), "libsecp256k1 바인딩"),
+        "pgpy": CryptoPackage(_ALL_CLASSICAL[:5], "OpenPGP 구현"),
+        "liboqs-python": CryptoPackage((), "Open Quantum Safe 바인딩", "0", _NIST_PQC),
+        "pqcrypto": CryptoPackage((), "PQC 구현", "0", ("ML-KEM", "ML-DSA")),
+        "kyber-py": CryptoPackage((), "ML-KEM 구현", "0", ("ML-KEM",)),
+        "dilithium-py": CryptoPackage((), "ML-DSA 구현", "0", ("ML-DSA",)),
+    },
+    "npm": {
+        "jsonwebtoken": CryptoPackage(("RSA", "ECDSA"), "JWT RS*/ES* 서명"),
+        "jose": CryptoPackage(_JOSE + ("ECDH",), "JOSE 서명/ECDH-ES 암호화"),
+        "node-jose": CryptoPackage(("RSA", "ECDSA", "ECDH"), "JOSE 구현"),
+        "jwa": CryptoPackage(("RSA", "ECDSA"), "JWA 서명 알고리즘"),
+        "jws": CryptoPackage(("RSA", "ECDSA"), "JWS 서명"),
+        "jsrsasign": CryptoPackage(("RSA", "DSA", "ECDSA"), "RSA/ECDSA 서명, X.509"),
+        "node-forge": CryptoPackage(("RSA", "EdDSA"), "순수 JS RSA/X.509/TLS"),
+        "node-rsa": CryptoPackage(("RSA",), "RSA 구현"),
+        "elliptic": CryptoPackage(("ECDSA", "ECDH", "EdDSA"), "타원곡선 구현"),
+        "secp256k1": CryptoPackage(("ECDSA",), "secp256k1 바인딩"),
+        "tweetnacl": CryptoPackage(("EdDSA", "ECDH"), "Ed25519/X25519"),
+        "@noble/curves": CryptoPackage(("ECDSA", "EdDSA", "ECDH"), "타원곡선 구현"),
+        "@noble/secp256k1": CryptoPackage(("ECDSA",), "secp256k1 ECDSA"),
+        "@noble/ed25519": CryptoPackage(("EdDSA",), "Ed25519 서명"),
+        "ssh2": CryptoPackage(_SSH, "SSH 키/키 교환"),
+        "openpgp": CryptoPackage(("RSA", "ECDSA", "EdDSA", "ECDH"), "OpenPGP 구현"),
+        "@noble/post-quantum": CryptoPackage((), "ML-KEM/ML-DSA/SLH-DSA 구현", "0", _NIST_PQC),
+        "crystals-kyber": CryptoPackage((), "Kyber 구현", "0", ("ML-KEM",)),
+    },
+    "go": {
+        "golang.org/x/crypto": CryptoPackage(_SSH, "ssh, curve25519, ed25519 등"),
+        "github.com/golang-jwt/jwt": CryptoPackage(_JOSE, "JWT RS*/ES*/EdDSA 서명"),
+        "github.com/dgrijalva/jwt-go": CryptoPackage(("RSA", "ECDSA"), "유지보수 중단된 JWT 라이브러리"),
+        "github.com/lestrrat-go/jwx": CryptoPackage(_JOSE + ("ECDH",), "JOSE 구현"),
+        "github.com/go-jose/go-jose": CryptoPackage(_JOSE + ("ECDH",), "JOSE 구현"),
+        "github.com/square/go-jose": CryptoPackage(_JOSE + ("ECDH",), "JOSE 구현"),
+        "gopkg.in/square/go-jose.v2": CryptoPackage(_JOSE + ("ECDH",), "JOSE 구현"),
+        "github.com/protonmail/go-crypto": CryptoPackage(_ALL_CLASSICAL[:5], "OpenPGP 구현"),
+        "filippo.io/edwards25519": CryptoPackage(("EdDSA",), "edwards25519 군 연산"),
+        "github.com/decred/dcrd/dcrec/secp256k1": CryptoPackage(("ECDSA",), "secp256k1 ECDSA"),
+        "github.com/btcsuite/btcd/btcec": CryptoPackage(("ECDSA",), "secp256k1 ECDSA"),
+        "github.com/cloudflare/circl": CryptoPackage(("ECDH", "EdDSA"), "고전 + PQC 구현", "0", _NIST_PQC),
+        "filippo.io/mlkem768": CryptoPackage((), "ML-KEM-768 구현", "0", ("ML-KEM",)),
+        "github.com/open-quantum-safe/liboqs-go": CryptoPackage((), "Open Quantum Safe 바인딩", "0", _NIST_PQC),
+    },
+    "cargo": {
+        "rsa": CryptoPackage(("RSA",), "RustCrypto RSA"),
+        "p256": CryptoPackage(("ECDSA", "ECDH"), "NIST P-256"),
+        "p384": CryptoPackage(("ECDSA", "ECDH"), "NIST P-384"),
+        "p521": CryptoPackage(("ECDSA", "ECDH"), "NIST P-521"),
+        "k256": CryptoPackage(("ECDSA", "ECDH"), "secp256k1"),
+        "ecdsa": CryptoPackage(("ECDSA",), "RustCrypto ECDSA"),
+        "dsa": CryptoPackage(("DSA",), "RustCrypto DSA"),
+        "ed25519": CryptoPackage(("EdDSA",), "Ed25519 서명 타입"),
+        "ed25519-dalek": CryptoPackage(("EdDSA",), "Ed25519 서명"),
+        "x25519-dalek": CryptoPackage(("ECDH",), "X25519 키 교환"),
+        "curve25519-dalek": CryptoPackage(("ECDH", "EdDSA"), "Curve25519 군 연산"),
+        "ring": CryptoPackage(("RSA", "ECDSA", "EdDSA", "ECDH"), "ring 공개키 API"),
+        "openssl": CryptoPackage(_ALL_CLASSICAL, "OpenSSL 바인딩"),
+        "jsonwebtoken": CryptoPackage(_JOSE, "JWT RS*/ES*/EdDSA 서명"),
+        "russh": CryptoPackage(_SSH, "SSH 키/키 교환"),
+        "thrussh": CryptoPackage(_SSH, "SSH 키/키 교환"),
+        "ssh-key": CryptoPackage(("RSA", "DSA", "ECDSA", "EdDSA"), "SSH 키 형식"),
+        "rustls": CryptoPackage(("RSA", "ECDSA", "EdDSA", "ECDH"), "TLS (하이브리드 키 교환은 버전/암호 제공자에 따라 다름)"),
+        "ml-kem": CryptoPackage((), "RustCrypto ML-KEM", "0", ("ML-KEM",)),
+        "ml-dsa": CryptoPackage((), "RustCrypto ML-DSA", "0", ("ML-DSA",)),
+        "slh-dsa": CryptoPackage((), "RustCrypto SLH-DSA", "0", ("SLH-DSA",)),
+        "pqcrypto": CryptoPackage((), "PQClean 바인딩", "0", ("ML-KEM", "ML-DSA")),
+        "oqs": CryptoPackage((), "Open Quantum Safe 바인딩", "0", _NIST_PQC),
+    },
+    "maven": {
+        "org.bouncycastle:bcprov-jdk18on": CryptoPackage(_ALL_CLASSICAL, "Bouncy Castle 프로바이더", "1.79", _NIST_PQC),
+        "org.bouncycastle:bcprov-jdk15to18": CryptoPackage(_ALL_CLASSICAL, "Bouncy Castle 프로바이더", "1.79", _NIST_PQC),
+        "org.bouncycastle:bcpkix-jdk18on": CryptoPackage(_ALL_CLASSICAL[:4], "Bouncy Castle PKIX/CMS", "1.79", ("ML-DSA", "SLH-DSA")),
+        "org.bouncycastle:bcprov-jdk15on": CryptoPackage(_ALL_CLASSICAL, "Bouncy Castle 구버전 (1.70에서 중단, 표준 ML-KEM/ML-DSA 없음)"),
+        "org.bouncycastle:bcpkix-jdk15on": CryptoPackage(_ALL_CLASSICAL[:4], "Bouncy Castle 구버전 PKIX"),
+        "io.jsonwebtoken:jjwt": CryptoPackage(_JOSE, "JJWT 서명"),
+        "io.jsonwebtoken:jjwt-api": CryptoPackage(_JOSE, "JJWT 서명"),
+        "io.jsonwebtoken:jjwt-impl": CryptoPackage(_JOSE, "JJWT 서명"),
+        "com.auth0:java-jwt": CryptoPackage(("RSA", "ECDSA"), "JWT RS*/ES* 서명"),
+        "com.nimbusds:nimbus-jose-jwt": CryptoPackage(_JOSE + ("ECDH",), "JOSE 구현"),
+        "org.bitbucket.b_c:jose4j": CryptoPackage(("RSA", "ECDSA", "ECDH"), "JOSE 구현"),
+        "com.jcraft:jsch": CryptoPackage(_ALL_CLASSICAL, "SSH 클라이언트"),
+        "com.github.mwiede:jsch": CryptoPackage(_ALL_CLASSICAL, "SSH 클라이언트"),
+        "org.apache.sshd:sshd-core": CryptoPackage(_SSH, "Apache MINA SSHD"),
+        "org.apache.sshd:sshd-common": CryptoPackage(_SSH, "Apache MINA SSHD"),
+        "com.hierynomus:sshj": CryptoPackage(_SSH, "SSH 클라이언트"),
+        "com.google.crypto.tink:tink": CryptoPackage(("RSA", "ECDSA", "EdDSA", "ECDH"), "Tink 공개키 프리미티브"),
+        "org.web3j:crypto": CryptoPackage(("ECDSA",), "secp256k1 서명"),
+        "org.openquantumsafe:liboqs-java": CryptoPackage((), "Open Quantum Safe 바인딩", "0", _NIST_PQC),
+    },
+}
+
+_GO_MAJOR_SUFFIX = re.compile(r"/v\d+$")
+_PYPI_SEPARATORS = re.compile(r"[-_.]+")
+
+
+def normalize_name(ecosystem: str, name: str) -> str:
+    """생태계별 패키지 이름 정규화 (PEP 503, Go 메이저 버전 접미사 제거 등)."""
+    name = name.strip().lower()
+    if ecosystem == "pypi":
+        return _PYPI_SEPARATORS.sub("-", name)
+    if ecosystem == "go":
+        return _GO_MAJOR_SUFFIX.sub("", name)
+    if ecosystem == "cargo":
+        return name.replace("_", "-")
+    return name
+
+
+# (생태계, 정규화 이름) → CryptoPackage. 모듈 로드 시 한 번 만들어 항목마다 O(1)로 조회합니다.
+INDEX: Dict[Tuple[str, str], CryptoPackage] = {
+    (ecosystem, normalize_name(ecosystem, name)): package
+    for ecosystem, packages in _PACKAGES.items()
+    for name, package in packages.items()
+}
+
+
+def version_key(version: str) -> Tuple[int, ...]:
+    """'v1.79.0', '1.79', '0.31.0+incompatible' → (1, 79, 0). 숫자가 아닌 꼬리는 무시합니다."""
+    parts = []
+    for part in version.lstrip("vV=").split("."):
+        digits = re.match(r"\d+", part)
+        if not digits:
+            break
+        parts.append(int(digits.group()))
+        if digits.end() != len(part):
+            break
+    return tuple(parts)
+
+
+def lookup(ecosystem: str, name: str) -> Optional[CryptoPackage]:
+    return INDEX.get((ecosystem, normalize_name(ecosystem, name)))
+
+
+def supports_pqc(package: CryptoPackage, version: Optional[str]) -> Optional[bool]:
+    """해당 버전이 PQC 알고리즘을 제공하는지. 버전을 알 수 없으면 None."""
+    if package.pqc_since is None:
+        return False
+    if package.pqc_since == "0":
+        return True
+    if not version:
+        return None
+    return version_key(version) >= version_key(package.pqc_since)
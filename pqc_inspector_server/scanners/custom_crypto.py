@@ -0,0 +1,432 @@
+# File: pqc_inspector_server/scanners/custom_crypto.py
+# 🕵️ 라이브러리 없이 직접 구현한(이름을 위장한) RSA, DH, 타원곡선 연산을 찾는 경량 정적 분석입니다.
+# - Python: AST를 한 번 훑어 함수 역할(소수 판정, 소수 생성, 모듈러 역원, 점 덧셈)을 분류한 뒤
+#   대입문을 따라 "소수 → 소수의 곱(모듈러스) → (p-1)(q-1) → 역원(개인 지수)" 흐름을 추적합니다.
+#   변수/함수 이름은 보지 않으므로 composite_modulus, forward_exponent 같은 위장 이름과 무관합니다.
+# - 그 밖의 언어: 제곱-곱셈 루프, 확장 유클리드, (p-1)*(q-1), 빅넘 라이브러리 호출 등의 신호를 정규식으로 모아 판정합니다.
+# 파일당 수 ms 안에 끝나므로 모델 호출 전에 모든 소스 파일을 선별할 수 있습니다.
+
+import ast
+import posixpath
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .findings import make_finding
+
+# 분석할 최대 소스 크기 (이보다 크면 생성된 코드로 보고 건너뜁니다)
+MAX_SOURCE_BYTES = 2 * 1024 * 1024
+
+_LANGUAGES = {
+    ".py": "python", ".pyw": "python",
+    ".c": "c", ".h": "c", ".cc": "c", ".cpp": "c", ".cxx": "c", ".hpp": "c",
+    ".java": "java", ".kt": "java", ".scala": "java",
+    ".go": "go", ".rs": "rust", ".cs": "csharp", ".swift": "swift",
+    ".js": "javascript", ".mjs": "javascript", ".ts": "javascript",
+    ".php": "php", ".rb": "ruby",
+}
+
+# 이름이 알려진 표준 상수. 하드코딩되어 있으면 해당 군/곡선을 직접 구현했다는 강한 신호입니다.
+_CURVE_CONSTANTS = {
+    int("FFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF", 16): "P-256",
+    int("FFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551", 16): "P-256",
+    int("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFFFF0000000000000000FFFFFFFF", 16): "P-384",
+    2 ** 521 - 1: "P-521",
+    int("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F", 16): "secp256k1",
+    int("FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141", 16): "secp256k1",
+    2 ** 255 - 19: "Curve25519",
+}
+_CURVE_HEX = {format(value, "X"): name for value, name in _CURVE_CONSTANTS.items() if value.bit_length() % 4 == 0}
+# RFC 2409/3526 MODP 군과 RFC 7919 FFDHE 군의 소수는 공통 접두부로 시작합니다.
+_DH_PRIME_PREFIXES = ("FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD1", "FFFFFFFFFFFFFFFFADF85458A2BB4A9AAFDC5620273D3CF1")
+
+# 빅넘 라이브러리에서 흔히 쓰는 함수 이름 (호출 이름의 마지막 부분으로 비교)
+_LIB_PRIME_GENERATORS = {"getPrime", "getStrongPrime", "randprime", "nextprime", "next_prime", "generate_prime", "random_prime"}
+_LIB_PRIMALITY = {"isprime", "isPrime", "is_prime", "is_probable_prime", "isProbablePrime", "miller_rabin"}
+_LIB_INVERSES = {"inverse", "invert", "mod_inverse", "modinv", "modinverse", "inverse_mod", "invmod"}
+_LIB_MODEXP = {"powmod", "pow_mod", "modexp", "mod_pow"}
+_RANDOM_SOURCES = {"randbits", "getrandbits", "randrange", "randint", "randbelow", "urandom", "token_bytes", "token_hex"}
+
+_E_CONSTANTS = (3, 17, 65537)
+_GENERATORS = (2, 5)
+
+
+def source_language(file_name: str) -> Optional[str]:
+    extension = posixpath.splitext(file_name.replace("\\", "/").lower())[1]
+    return _LANGUAGES.get(extension)
+
+
+def scan_custom_crypto(content: bytes, file_name: str, tree: Optional[ast.AST] = None) -> List[Dict[str, Any]]:
+    """
+    직접 구현한 공개키 연산을 finding 목록으로 반환합니다. 소스 파일이 아니거나 발견하지 못하면 빈 목록.
+    호출한 쪽에서 이미 파싱한 Python AST가 있으면 tree로 넘겨 다시 파싱하지 않습니다.
+    """
+    language = source_language(file_name)
+    if language is None or len(content) > MAX_SOURCE_BYTES:
+        return []
+    if tree is not None:
+        return _PythonAnalyzer(tree, file_name).findings()
+    text = content.decode("utf-8", errors="replace")
+    if language == "python":
+        try:
+            tree = ast.parse(text)
+        except (SyntaxError, ValueError):
+            return _scan_text(text, file_name)
+        return _PythonAnalyzer(tree, file_name).findings()
+    return _scan_text(text, file_name)
+
+
+# --- 상수 판정 ---
+
+def _constant_tags(value: int) -> Set[str]:
+    if value in _CURVE_CONSTANTS:
+        return {"curve_constant"}
+    if value.bit_length() >= 512:
+        if format(value, "X").startswith(_DH_PRIME_PREFIXES):
+            return {"dh_prime"}
+        return {"big_constant"}
+    if value in _E_CONSTANTS:
+        return {"e_constant"}
+    if value in _GENERATORS:
+        return {"generator"}
+    return set()
+
+
+# --- Python AST 분석 ---
+
+def _key(node: ast.AST) -> Optional[str]:
+    """대입 대상/참조를 비교 가능한 문자열로 (x, self.first_prime, ctx.n[])."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _key(node.value)
+        return f"{base}.{node.attr}" if base else node.attr
+    if isinstance(node, ast.Subscript):
+        base = _key(node.value)
+        return f"{base}[]" if base else None
+    return None
+
+
+def _call_name(call: ast.Call) -> str:
+    if isinstance(call.func, ast.Name):
+        return call.func.id
+    if isinstance(call.func, ast.Attribute):
+        return call.func.attr
+    return ""
+
+
+def _const_int(node: ast.AST) -> Optional[int]:
+    """정수 상수와 2 ** 255 - 19 같은 상수식을 계산합니다. 상수가 아니면 None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, int) and not isinstance(node.value, bool):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _const_int(node.operand)
+        return -value if value is not None else None
+    if isinstance(node, ast.BinOp):
+        left, right = _const_int(node.left), _const_int(node.right)
+        if left is None or right is None:
+            return None
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, (ast.Pow, ast.LShift)) and 0 <= right <= 8192 and abs(left) < 2 ** 64:
+            return left ** right if isinstance(node.op, ast.Pow) else left << right
+    return None
+
+
+def _is_square(node: ast.AST) -> bool:
+    if not isinstance(node, ast.BinOp):
+        return False
+    if isinstance(node.op, ast.Mult):
+        key = _key(node.left)
+        return key is not None and key == _key(node.right)
+    return isinstance(node.op, ast.Pow) and _const_int(node.right) == 2
+
+
+def _is_point_formula(node: ast.AST) -> bool:
+    """타원곡선 점 덧셈/두 배 공식의 x좌표: λ² - x1 - x2 또는 λ² - 2·x."""
+    if not (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub)):
+        return False
+    left = node.left
+    if isinstance(left, ast.BinOp) and isinstance(left.op, ast.Sub) and _is_square(left.left):
+        return True
+    right = node.right
+    return _is_square(left) and isinstance(right, ast.BinOp) and isinstance(right.op, ast.Mult) \
+        and _const_int(right.left) == 2
+
+
+class _PythonAnalyzer:
+    def __init__(self, tree: ast.AST, file_name: str):
+        self.file_name = file_name
+        self.functions: List[ast.AST] = []
+        self.nodes: Dict[int, List[ast.AST]] = {}   # 함수 → 본문(중첩 함수 포함)의 모든 노드
+        self.assignments: List[ast.AST] = []
+        self.calls: List[ast.Call] = []
+        self.constants: List[ast.AST] = []
+        self._index(tree)
+
+        self.primality_tests: Set[str] = set()
+        self.prime_generators: Set[str] = set()
+        self.inverses: Set[str] = set()
+        self.modexps: Set[str] = set()
+        self.point_ops: List[ast.AST] = []
+        self.tags: Dict[str, Set[str]] = {}
+        self.lines: Dict[str, int] = {}   # 태그를 처음 얻은 줄 (근거 표시용)
+
+        self._classify_functions()
+        self._propagate()
+
+    def _index(self, tree: ast.AST) -> None:
+        """트리를 한 번만 순회하며 노드를 종류별, 감싸는 함수별로 모읍니다. (ast.walk 반복이 분석 시간의 대부분이었음)"""
+        pending: List[Tuple[ast.AST, Tuple[List[ast.AST], ...]]] = [(tree, ())]
+        while pending:
+            node, scopes = pending.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self.functions.append(node)
+                self.nodes[id(node)] = []
+                scopes = scopes + (self.nodes[id(node)],)
+            for scope in scopes:
+                scope.append(node)
+            if isinstance(node, ast.Call):
+                self.calls.append(node)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                self.assignments.append(node)
+            elif isinstance(node, (ast.Constant, ast.BinOp)):
+                self.constants.append(node)
+            pending.extend((child, scopes) for child in ast.iter_child_nodes(node))
+        # 스택 순회는 역순이므로 소스 순서로 되돌립니다. (대입문은 소스 순서로 전파해야 고정점에 빨리 도달)
+        for nodes in (self.functions, self.assignments, self.calls):
+            nodes.sort(key=lambda node: (node.lineno, node.col_offset))
+
+    # 1. 함수 역할 분류 (이름이 아니라 본문 구조로 판정)
+    def _classify_functions(self) -> None:
+        for fn in self.functions:
+            nodes = self.nodes[id(fn)]
+            calls = [n for n in nodes if isinstance(n, ast.Call)]
+            has_loop = any(isinstance(n, (ast.For, ast.While)) for n in nodes)
+            ops = {type(n.op) for n in nodes if isinstance(n, (ast.BinOp, ast.AugAssign))}
+
+            # 제곱-곱셈 모듈러 거듭제곱: 루프 안에서 지수를 1비트씩 줄이며 (a * b) % m
+            if has_loop and ast.Mod in ops and (ast.RShift in ops or ast.FloorDiv in ops) and ast.BitAnd in ops \
+                    and len(fn.args.args) >= 3:
+                self.modexps.add(fn.name)
+
+            # 밀러-라빈류 소수 판정: 루프 안의 모듈러 거듭제곱 결과를 n - 1과 비교
+            if has_loop and any(self._is_modexp(c) for c in calls) and any(
+                isinstance(n, ast.Compare) and any(
+                    isinstance(c, ast.BinOp) and isinstance(c.op, ast.Sub) and _const_int(c.right) == 1
+                    for c in n.comparators)
+                for n in nodes
+            ):
+                self.primality_tests.add(fn.name)
+
+            # 확장 유클리드: 몫(//)과 나머지(%)로 a - q * b 형태의 계수를 갱신 (재귀 또는 루프)
+            recursive = any(_call_name(c) == fn.name for c in calls)
+            if (recursive or has_loop) and ast.FloorDiv in ops and (ast.Mod in ops or recursive) and any(
+                isinstance(n, ast.BinOp) and isinstance(n.op, ast.Sub)
+                and isinstance(n.right, ast.BinOp) and isinstance(n.right.op, ast.Mult)
+                for n in nodes
+            ):
+                self.inverses.add(fn.name)
+
+            if any(_is_point_formula(n) for n in nodes) and (ast.Mod in ops or any(self._is_inverse(c) for c in calls)):
+                self.point_ops.append(fn)
+
+        # 소수 생성: 루프 안에서 난수를 뽑아 소수 판정 함수에 넣는 함수 (판정 함수 분류 후에 계산)
+        for fn in self.functions:
+            nodes = self.nodes[id(fn)]
+            names = {_call_name(n) for n in nodes if isinstance(n, ast.Call)}
+            if any(isinstance(n, (ast.For, ast.While)) for n in nodes) and names & _RANDOM_SOURCES \
+                    and names & (self.primality_tests | _LIB_PRIMALITY):
+                self.prime_generators.add(fn.name)
+        # 역원 계산을 호출해 결과를 돌려주는 래퍼(중첩 함수로 확장 유클리드를 감싼 경우 등)도 역원 함수로 봅니다.
+        for fn in self.functions:
+            if any(isinstance(n, ast.Call) and self._is_inverse(n) for n in self.nodes[id(fn)]) and len(fn.args.args) >= 2:
+                self.inverses.add(fn.name)
+
+    def _is_modexp(self, call: ast.Call) -> bool:
+        name = _call_name(call)
+        if len(call.args) == 3 and (name == "pow" or name in _LIB_MODEXP or name in self.modexps):
+            return not (name == "pow" and _const_int(call.args[1]) == -1)
+        return False
+
+    def _is_inverse(self, call: ast.Call) -> bool:
+        name = _call_name(call)
+        if name == "pow" and len(call.args) == 3:
+            exponent = call.args[1]
+            if _const_int(exponent) == -1:
+                return True
+            # 페르마 역원: pow(x, p - 2, p)
+            return isinstance(exponent, ast.BinOp) and isinstance(exponent.op, ast.Sub) \
+                and _const_int(exponent.right) == 2 and _key(exponent.left) is not None \
+                and _key(exponent.left) == _key(call.args[2])
+        return name in _LIB_INVERSES or name in self.inverses
+
+    # 2. 대입문을 따라 태그 전파 (메서드 사이의 self 속성도 같은 키로 연결됩니다)
+    def _expr_tags(self, node: ast.AST) -> Set[str]:
+        value = _const_int(node)
+        if value is not None:
+            return _constant_tags(abs(value))
+        if isinstance(node, (ast.Name, ast.Attribute, ast.Subscript)):
+            return self.tags.get(_key(node) or "", set())
+        if isinstance(node, ast.Call):
+            name = _call_name(node)
+            if name in self.prime_generators or name in _LIB_PRIME_GENERATORS:
+                return {"prime"}
+            if self._is_inverse(node):
+                args = node.args[1:] if name == "pow" else node.args
+                return {"private_exponent"} if any("totient" in self._expr_tags(a) for a in args) else {"inverse"}
+            if name == "lcm" and len(node.args) == 2 and all("prime_minus_one" in self._expr_tags(a) for a in node.args):
+                return {"totient"}
+            if name in ("int", "mpz", "Integer") and node.args:
+                return self._expr_tags(node.args[0])
+            return set()
+        if isinstance(node, ast.BinOp):
+            left, right = self._expr_tags(node.left), self._expr_tags(node.right)
+            if isinstance(node.op, ast.Mult):
+                if "prime" in left and "prime" in right:
+                    return {"modulus"}
+                if "prime_minus_one" in left and "prime_minus_one" in right:
+                    return {"totient"}
+            if isinstance(node.op, ast.Sub) and "prime" in left and _const_int(node.right) == 1:
+                return {"prime_minus_one"}
+        return set()
+
+    def _propagate(self) -> None:
+        for _ in range(4):   # 메서드 정의 순서와 무관하게 흐름이 이어지도록 고정점까지 반복
+            changed = False
+            for assignment in self.assignments:
+                targets = assignment.targets if isinstance(assignment, ast.Assign) else [assignment.target]
+                if assignment.value is None:
+                    continue
+                pairs: List[Tuple[ast.AST, ast.AST]] = []
+                for target in targets:
+                    if isinstance(target, ast.Tuple) and isinstance(assignment.value, ast.Tuple) \
+                            and len(target.elts) == len(assignment.value.elts):
+                        pairs.extend(zip(target.elts, assignment.value.elts))
+                    else:
+                        pairs.append((target, assignment.value))
+                for target, value in pairs:
+                    key = _key(target)
+                    if key is None:
+                        continue
+                    tags = self._expr_tags(value)
+                    if tags - self.tags.get(key, set()):
+                        self.tags.setdefault(key, set()).update(tags)
+                        self.lines.setdefault(key, assignment.lineno)
+                        changed = True
+            if not changed:
+                break
+
+    # 3. 판정
+    def _tagged(self, tag: str) -> List[Tuple[int, str]]:
+        return sorted((self.lines[key], key) for key, tags in self.tags.items() if tag in tags)
+
+    def findings(self) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        rsa_uses, dh_uses, ecc_uses = [], [], []
+        for call in self.calls:
+            if not self._is_modexp(call):
+                continue
+            base, modulus = self._expr_tags(call.args[0]), self._expr_tags(call.args[2])
+            source = ast.unparse(call)
+            if "modulus" in modulus or ("big_constant" in modulus and "e_constant" in self._expr_tags(call.args[1])):
+                # 생성한 소수의 곱, 또는 하드코딩된 공개 모듈러스에 대한 e 거듭제곱
+                rsa_uses.append((call.lineno, source))
+            elif "dh_prime" in modulus or ("big_constant" in modulus and "generator" in base):
+                dh_uses.append((call.lineno, source))
+            elif "curve_constant" in modulus:
+                ecc_uses.append((call.lineno, source))
+
+        moduli, totients, exponents = self._tagged("modulus"), self._tagged("totient"), self._tagged("private_exponent")
+        if rsa_uses or (moduli and (totients or exponents)):
+            evidence = [f"L{line}: 생성한 두 소수의 곱 ({key})" for line, key in moduli[:2]]
+            evidence += [f"L{line}: (p-1)(q-1) 토션트 ({key})" for line, key in totients[:1]]
+            evidence += [f"L{line}: 토션트에 대한 모듈러 역원 ({key})" for line, key in exponents[:1]]
+            evidence += [f"L{line}: 모듈러 거듭제곱 {source}" for line, source in rsa_uses[:3]]
+            line = rsa_uses[0][0] if rsa_uses else moduli[0][0]
+            results.append(self._finding("자체 구현 RSA", line, ["RSA"], evidence))
+
+        dh_constants = self._tagged("dh_prime")
+        if dh_uses or dh_constants:
+            evidence = [f"L{line}: 알려진 MODP/FFDHE 소수 ({key})" for line, key in dh_constants[:1]]
+            evidence += [f"L{line}: 모듈러 거듭제곱 {source}" for line, source in dh_uses[:3]]
+            line = dh_uses[0][0] if dh_uses else dh_constants[0][0]
+            results.append(self._finding("자체 구현 Diffie-Hellman", line, ["DH"], evidence))
+
+        curve_lines = sorted({node.lineno for node in self.constants if isinstance(node, (ast.Constant, ast.BinOp))
+                              and (_const_int(node) or 0) in _CURVE_CONSTANTS})
+        if self.point_ops or curve_lines or ecc_uses:
+            evidence = [f"L{fn.lineno}: 점 덧셈/두 배 공식 ({fn.name})" for fn in self.point_ops[:2]]
+            evidence += [f"L{line}: 표준 곡선 상수" for line in curve_lines[:2]]
+            evidence += [f"L{line}: 곡선 소수에 대한 모듈러 거듭제곱 {source}" for line, source in ecc_uses[:2]]
+            line = self.point_ops[0].lineno if self.point_ops else (curve_lines or [ecc_uses[0][0]])[0]
+            results.append(self._finding("자체 구현 타원곡선 연산", line, ["ECDSA", "ECDH"], evidence))
+        return [finding for finding in results if finding]
+
+    def _finding(self, value: str, line: int, families: Iterable[str], evidence: List[str]) -> Optional[Dict[str, Any]]:
+        return make_finding(value, f"{self.file_name}:{line}", "custom_crypto_dataflow", families,
+                            signals=evidence)
+
+
+# --- 그 밖의 언어: 정규식 신호 ---
+
+_IDENT = r"[\w.\[\]]+(?:->[\w.\[\]]+)*"
+_TEXT_SIGNALS = {
+    # (a - 1) * (b - 1)
+    "totient": re.compile(rf"\(\s*({_IDENT})\s*-\s*1\s*\)\s*\*\s*\(\s*(?!\1\s*-)({_IDENT})\s*-\s*1\s*\)"),
+    # 제곱-곱셈 루프의 제곱 단계: base = (base * base) % m
+    "modexp_loop": re.compile(rf"({_IDENT})\s*=\s*\(\s*\1\s*\*\s*\1\s*\)\s*%"),
+    "modexp_call": re.compile(r"\b(BN_mod_exp\w*|mpz_powm\w*|modPow|ModPow|powmod|pow_mod|mod_pow|modpow)\s*\(|\.Exp\s*\("),
+    # 확장 유클리드 계수 갱신: x = y - q * x
+    "extended_gcd": re.compile(rf"({_IDENT})\s*=\s*{_IDENT}\s*-\s*\(?{_IDENT}(?:\s*(?:/|//)\s*{_IDENT})?\)?\s*\*\s*\1\b"),
+    "inverse_call": re.compile(r"\b(BN_mod_inverse|mpz_invert|modInverse|ModInverse|mod_inverse|modinv|invmod)\s*\("),
+    # 밀러-라빈: 거듭제곱 결과를 n - 1과 비교
+    "primality": re.compile(rf"==\s*{_IDENT}\s*-\s*1\b|\b(BN_generate_prime\w*|BN_is_prime\w*|mpz_nextprime|mpz_probab_prime_p|probablePrime|isProbablePrime|ProbablyPrime)\s*\("),
+    "e_constant": re.compile(r"\b(65537|0x10001)\b"),
+}
+_SIGNAL_NAMES = {
+    "totient": "(p-1)*(q-1) 토션트",
+    "modexp_loop": "제곱-곱셈 모듈러 거듭제곱",
+    "modexp_call": "빅넘 모듈러 거듭제곱",
+    "extended_gcd": "확장 유클리드 역원",
+    "inverse_call": "빅넘 모듈러 역원",
+    "primality": "소수 판정/생성",
+    "e_constant": "공개 지수 65537",
+}
+
+
+def _scan_text(text: str, file_name: str) -> List[Dict[str, Any]]:
+    signals: Dict[str, int] = {}
+    for name, pattern in _TEXT_SIGNALS.items():
+        match = pattern.search(text)
+        if match:
+            signals[name] = text.count("\n", 0, match.start()) + 1
+
+    def finding(value: str, line: int, families: List[str], evidence: List[str]) -> Optional[Dict[str, Any]]:
+        return make_finding(value, f"{file_name}:{line}", "custom_crypto_heuristic", families, signals=evidence)
+
+    results = []
+    modexp = signals.keys() & {"modexp_loop", "modexp_call"}
+    inverse = signals.keys() & {"extended_gcd", "inverse_call"}
+    rsa_signals = ("totient" in signals) + bool(modexp) + bool(inverse) + ("primality" in signals) + ("e_constant" in signals)
+    if ("totient" in signals and (modexp or inverse)) or rsa_signals >= 4:
+        evidence = [f"L{line}: {_SIGNAL_NAMES[name]}" for name, line in sorted(signals.items(), key=lambda item: item[1])]
+        results.append(finding("자체 구현 RSA", signals.get("totient") or min(signals.values()), ["RSA"], evidence))
+
+    upper = text.upper()
+    for prefix in _DH_PRIME_PREFIXES:
+        position = upper.find(prefix)
+        if position >= 0:
+            line = text.count("\n", 0, position) + 1
+            results.append(finding("자체 구현 Diffie-Hellman", line, ["DH"], [f"L{line}: 알려진 MODP/FFDHE 소수"]))
+            break
+    for digits, curve in _CURVE_HEX.items():
+        position = upper.find(digits)
+        if position >= 0:
+            line = text.count("\n", 0, position) + 1
+            results.append(finding("자체 구현 타원곡선 연산", line, ["ECDSA", "ECDH"], [f"L{line}: {curve} 곡선 상수"]))
+            break
+    return [result for result in results if result]
@@ -0,0 +1,265 @@
+# File: pqc_inspector_server/scanners/dependencies.py
+# 📦 의존성 매니페스트/잠금 파일(requirements.txt, poetry.lock, Pipfile.lock, package-lock.json,
+# go.mod, go.sum, Cargo.lock, pom.xml)을 파싱해 공개키 암호를 노출하는 패키지를 찾습니다.
+# - 파일 전체를 트리로 만들지 않고 줄/정규식 단위로 흘려 읽으므로 수십 MB 잠금 파일도 한 번에 훑습니다.
+# - 패키지마다 crypto_packages 인덱스를 딕셔너리로 한 번 조회할 뿐이라 항목당 수 마이크로초면 충분합니다.
+
+import io
+import posixpath
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .crypto_packages import lookup, supports_pqc
+from .findings import make_finding
+
+
+class Dependency(NamedTuple):
+    ecosystem: str           # "pypi" | "npm" | "go" | "cargo" | "maven"
+    name: str
+    version: Optional[str]   # 고정되지 않았으면 None
+    line: int                # 파일 안의 줄 번호 (알 수 없으면 0)
+
+
+# --- 매니페스트 판별 (파일 이름만 사용) ---
+
+_MANIFESTS = {
+    "poetry.lock": "poetry",
+    "pipfile.lock": "pipfile",
+    "package-lock.json": "npm",
+    "npm-shrinkwrap.json": "npm",
+    "go.mod": "gomod",
+    "go.sum": "gosum",
+    "cargo.lock": "cargo",
+    "pom.xml": "maven",
+}
+_REQUIREMENTS_NAME = re.compile(r"(.*requirements.*|constraints)\.(txt|in)$")
+
+
+def detect_manifest(file_name: str) -> Optional[str]:
+    """의존성 매니페스트 형식을 반환합니다. 매니페스트가 아니면 None."""
+    name = posixpath.basename(file_name.replace("\\", "/")).lower()
+    if name in _MANIFESTS:
+        return _MANIFESTS[name]
+    if _REQUIREMENTS_NAME.match(name):
+        return "requirements"
+    return None
+
+
+# --- 형식별 스트리밍 파서 ---
+
+def _lines(content: bytes) -> Iterator[Tuple[int, str]]:
+    for number, raw in enumerate(io.BytesIO(content), 1):
+        yield number, raw.decode("utf-8", errors="replace").strip()
+
+
+_REQUIREMENT = re.compile(r"([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(?:(===|==|~=|>=|<=|!=|>|<)\s*([^\s,;#]+))?")
+_EGG = re.compile(r"#egg=([A-Za-z0-9][A-Za-z0-9._-]*)")
+_URL = re.compile(r"[A-Za-z][\w+.-]*://")
+
+
+def _parse_requirements(content: bytes) -> Iterator[Dependency]:
+    for number, line in _lines(content):
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("-") or _URL.match(line):
+            # -r/-c 참조 파일은 따라가지 않고, -e VCS 설치와 URL 줄(git+https://...)은 #egg= 이름만 사용합니다.
+            egg = _EGG.search(line)
+            if egg:
+                yield Dependency("pypi", egg.group(1), None, number)
+            continue
+        match = _REQUIREMENT.match(line)
+        if match:
+            operator, version = match.group(2), match.group(3)
+            yield Dependency("pypi", match.group(1), version if operator in ("==", "===") else None, number)
+
+
+_TOML_STRING = re.compile(r'^(name|version)\s*=\s*"([^"]*)"')
+
+
+def _parse_toml_packages(content: bytes, ecosystem: str) -> Iterator[Dependency]:
+    """poetry.lock/Cargo.lock의 [[package]] 표에서 name/version만 읽습니다."""
+    name = version = None
+    start = 0
+    in_package = False
+    for number, line in _lines(content):
+        if line.startswith("["):
+            if name:
+                yield Dependency(ecosystem, name, version, start)
+            name = version = None
+            in_package = line == "[[package]]"
+            start = number
+            continue
+        if in_package:
+            match = _TOML_STRING.match(line)
+            if match:
+                if match.group(1) == "name":
+                    name = match.group(2)
+                else:
+                    version = match.group(2)
+    if name:
+        yield Dependency(ecosystem, name, version, start)
+
+
+# package-lock v1은 "이름": {"version": ...}, v2/v3는 "node_modules/이름": {"version": ...} 형태입니다.
+# v2는 두 형태를 모두 담고 있으므로 (이름, 버전)으로 중복을 제거합니다. "requires"의 "이름": "범위"는 값이
+# 객체가 아니므로 걸리지 않습니다.
+_NPM_ENTRY = re.compile(rb'"(?:[^"]*node_modules/)?((?:@[^"/]+/)?[^"/]+)"\s*:\s*\{\s*"version"\s*:\s*"([^"]+)"')
+_PIPFILE_ENTRY = re.compile(rb'"([A-Za-z0-9][A-Za-z0-9._-]*)"\s*:\s*\{[^{}]*?"version"\s*:\s*"==([^"]+)"')
+
+
+def _parse_json_entries(content: bytes, pattern: "re.Pattern[bytes]", ecosystem: str) -> Iterator[Dependency]:
+    seen: Set[Tuple[bytes, bytes]] = set()
+    line, position = 1, 0
+    for match in pattern.finditer(content):
+        key = (match.group(1), match.group(2))
+        if key in seen:
+            continue
+        seen.add(key)
+        line += content.count(b"\n", position, match.start())
+        position = match.start()
+        yield Dependency(ecosystem, key[0].decode("utf-8", "replace"), key[1].decode("utf-8", "replace"), line)
+
+
+def _parse_go_sum(content: bytes) -> Iterator[Dependency]:
+    seen: Set[Tuple[str, str]] = set()
+    for number, line in _lines(content):
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        key = (parts[0], parts[1].split("/", 1)[0])   # "v0.21.0/go.mod" → "v0.21.0"
+        if key not in seen:
+            seen.add(key)
+            yield Dependency("go", key[0], key[1], number)
+
+
+def _parse_go_mod(content: bytes) -> Iterator[Dependency]:
+    in_block = False
+    for number, line in _lines(content):
+        line = line.split("//", 1)[0].strip()
+        if in_block:
+            if line == ")":
+                in_block = False
+                continue
+            parts = line.split()
+        elif line.startswith("require"):
+            parts = line[len("require"):].split()
+            if parts == ["("]:
+                in_block = True
+                continue
+        else:
+            continue
+        if len(parts) >= 2:
+            yield Dependency("go", parts[0], parts[1], number)
+
+
+_MAVEN_PROPERTY = re.compile(r"\$\{([^}]+)\}")
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_pom(content: bytes) -> Iterator[Dependency]:
+    """iterparse로 요소를 흘려 읽고 처리한 요소는 바로 비웁니다. ${속성} 버전은 <properties>로 치환합니다."""
+    properties: Dict[str, str] = {}
+    dependencies: List[Dict[str, str]] = []
+    path: List[str] = []
+    for event, element in ElementTree.iterparse(io.BytesIO(content), events=("start", "end")):
+        tag = _local(element.tag)
+        if event == "start":
+            path.append(tag)
+            continue
+        path.pop()
+        if len(path) >= 2 and path[-1] == "properties" and path[-2] == "project":
+            properties[tag] = (element.text or "").strip()
+        elif path == ["project"] and tag == "version":
+            properties.setdefault("project.version", (element.text or "").strip())
+        elif tag == "dependency":
+            dependencies.append({_local(child.tag): (child.text or "").strip() for child in element})
+            element.clear()
+        elif tag in ("dependencies", "plugin"):
+            element.clear()
+
+    def resolve(value: str) -> str:
+        return _MAVEN_PROPERTY.sub(lambda m: properties.get(m.group(1), m.group(0)), value)
+
+    for dependency in dependencies:
+        group, artifact = dependency.get("groupId"), dependency.get("artifactId")
+        if group and artifact:
+            version = resolve(dependency.get("version", "")) or None
+            if version and "${" in version:
+                version = None
+            yield Dependency("maven", f"{resolve(group)}:{resolve(artifact)}", version, 0)
+
+
+def iter_dependencies(content: bytes, fmt: str) -> Iterator[Dependency]:
+    if fmt == "requirements":
+        return _parse_requirements(content)
+    if fmt == "poetry":
+        return _parse_toml_packages(content, "pypi")
+    if fmt == "cargo":
+        return _parse_toml_packages(content, "cargo")
+    if fmt == "npm":
+        return _parse_json_entries(content, _NPM_ENTRY, "npm")
+    if fmt == "pipfile":
+        return _parse_json_entries(content, _PIPFILE_ENTRY, "pypi")
+    if fmt == "gosum":
+        return _parse_go_sum(content)
+    if fmt == "gomod":
+        return _parse_go_mod(content)
+    if fmt == "maven":
+        return _parse_pom(content)
+    raise ValueError(f"지원하지 않는 매니페스트 형식: {fmt}")
+
+
+# --- 인덱스 매칭 ---
+
+class DependencyScan:
+    """매니페스트 하나를 스캔한 결과."""
+
+    def __init__(self, fmt: str):
+        self.format = fmt
+        self.packages = 0
+        self.findings: List[Dict[str, Any]] = []
+        self.upgrades: List[str] = []   # 업그레이드만으로 PQC 알고리즘을 쓸 수 있는 패키지
+        self.notes: List[str] = []
+
+    def summary(self) -> List[str]:
+        lines = [f"{self.format}: 패키지 {self.packages}개 중 공개키 암호 패키지 {len(self.findings)}개"]
+        lines.extend(f"{finding['value']}: {finding['note']}" for finding in self.findings[:20])
+        return lines
+
+
+def scan_manifest(content: bytes, file_name: str) -> Optional[DependencyScan]:
+    """매니페스트를 스캔합니다. 매니페스트가 아니면 None."""
+    fmt = detect_manifest(file_name)
+    if fmt is None:
+        return None
+    scan = DependencyScan(fmt)
+    try:
+        for dependency in iter_dependencies(content, fmt):
+            scan.packages += 1
+            package = lookup(dependency.ecosystem, dependency.name)
+            if package is None:
+                continue
+            pqc = supports_pqc(package, dependency.version)
+            families = set(package.families)
+            if pqc:
+                families.update(package.pqc_families)
+            note = package.note
+            if pqc is False and package.pqc_since and package.pqc_since != "0":
+                scan.upgrades.append(f"{dependency.name} {dependency.version} → {package.pqc_since} 이상 "
+                                     f"({', '.join(package.pqc_families)} 제공)")
+            elif pqc is None:
+                note += f" (버전 미고정, {package.pqc_since}부터 PQC 지원)"
+            finding = make_finding(
+                f"{dependency.name}=={dependency.version}" if dependency.version else dependency.name,
+                f"{file_name}:{dependency.line}" if dependency.line else file_name,
+                "crypto_package", families, ecosystem=dependency.ecosystem, note=note,
+            )
+            if finding:
+                scan.findings.append(finding)
+    except (ElementTree.ParseError, UnicodeError) as e:
+        scan.notes.append(f"{file_name}: 매니페스트 파싱 실패 ({e})")
+    return scan
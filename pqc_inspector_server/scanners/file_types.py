@@ -0,0 +1,23 @@
+# File: pqc_inspector_server/scanners/file_types.py
+# 🗂️ 내용 구조만으로 확정할 수 있는 파일 타입(JVM 클래스/JAR, 의존성 매니페스트, 인증서/키, 서버 설정)을 판별합니다.
+# DER 인증서/키 판별은 구조 전체를 파싱하므로(수 MB PKCS#7 번들은 수십 ms) 오케스트레이터는 run_cpu_bound로 실행합니다.
+
+from typing import Optional
+
+from .certificates import detect_key_material
+from .dependencies import detect_manifest
+from .jvm import is_class_file, is_jvm_archive
+from .server_config import detect_dialect
+
+
+def rule_based_file_type(content: bytes, file_name: str) -> Optional[str]:
+    """구조로 확정되는 에이전트 타입을 반환합니다. 없으면 None (LLM 분류 대상)."""
+    if is_class_file(content) or is_jvm_archive(file_name, content):
+        return "binary"
+    if detect_manifest(file_name):
+        return "dependency"
+    if detect_key_material(file_name, content):
+        return "certificate"
+    if detect_dialect(file_name, content):
+        return "log_conf"
+    return None
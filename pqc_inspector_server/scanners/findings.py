@@ -0,0 +1,97 @@
+# File: pqc_inspector_server/scanners/findings.py
+# 🧾 결정적 스캐너들이 공통으로 사용하는 탐지 결과(finding) 형식과, 이를 에이전트 결과로 변환하는 헬퍼입니다.
+# finding은 다음 키를 가진 딕셔너리입니다.
+#   value     : 원본 표기 (예: "RS256", "ECDHE-RSA-AES128-GCM-SHA256")
+#   families  : 표준 알고리즘 계열 목록 (예: ["ECDH", "RSA"])
+#   status    : "classical" (양자 취약) | "hybrid" (고전 + PQC 혼합) | "pqc"
+#   location  : 파일 안의 위치 (키 경로, 줄 번호, 오프셋 등)
+#   rule      : 탐지 규칙 이름
+# 그 밖에 key_size, curve 등 스캐너별 추가 정보가 붙을 수 있습니다.
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .algorithms import CLASSICAL_FAMILIES, PQC_FAMILIES, canonical_families
+
+# 계열별 PQC 전환 권장사항
+RECOMMENDATIONS = {
+    "RSA": "서명은 ML-DSA(FIPS 204), 키 전송/암호화는 ML-KEM(FIPS 203)으로 전환하세요.",
+    "DSA": "ML-DSA(FIPS 204) 또는 SLH-DSA(FIPS 205) 서명으로 전환하세요.",
+    "ECDSA": "ML-DSA(FIPS 204) 서명으로 전환하거나 전환 기간에는 하이브리드 서명을 사용하세요.",
+    "EdDSA": "ML-DSA(FIPS 204) 서명으로 전환하세요.",
+    "ECDH": "X25519MLKEM768 등 하이브리드 키 교환을 거쳐 ML-KEM(FIPS 203)으로 전환하세요.",
+    "DH": "ML-KEM(FIPS 203) 기반 키 교환(또는 하이브리드 그룹)으로 전환하세요.",
+}
+
+
+def classify_families(families: Iterable[str]) -> Optional[str]:
+    """계열 집합의 양자내성 상태를 반환합니다. 공개키 알고리즘이 없으면 None."""
+    families = set(families)
+    classical = bool(families & set(CLASSICAL_FAMILIES))
+    pqc = bool(families & set(PQC_FAMILIES))
+    if classical and pqc:
+        return "hybrid"
+    if classical:
+        return "classical"
+    if pqc:
+        return "pqc"
+    return None
+
+
+def make_finding(value: str, location: str, rule: str, families: Optional[Iterable[str]] = None,
+                 **extra: Any) -> Optional[Dict[str, Any]]:
+    """
+    하나의 탐지 결과를 만듭니다. families를 주지 않으면 value에서 계열을 추론하며,
+    공개키 알고리즘으로 해석되지 않는 값이면 None을 반환합니다.
+    """
+    families = set(families) if families is not None else canonical_families(value)
+    status = classify_families(families)
+    if status is None:
+        return None
+    return {"value": value, "families": sorted(families), "status": status, "location": location, "rule": rule, **extra}
+
+
+def findings_to_result(findings: List[Dict[str, Any]], analyzer: str, max_evidence: int = 20) -> Dict[str, Any]:
+    """
+    결정적 탐지 결과 목록을 AgentAnalysisResult 호환 딕셔너리로 변환합니다.
+    규칙으로 확정한 결과이므로 신뢰도는 높게 설정합니다.
+    """
+    vulnerable = [f for f in findings if f["status"] == "classical"]
+    hybrid = [f for f in findings if f["status"] == "hybrid"]
+
+    families: List[str] = []
+    for finding in vulnerable + hybrid:
+        for family in finding["families"]:
+            if family not in families:
+                families.append(family)
+
+    evidence_lines = []
+    for finding in (vulnerable + hybrid)[:max_evidence]:
+        extras = ", ".join(f"{k}={finding[k]}" for k in ("key_size", "curve", "signature_algorithm", "not_after") if finding.get(k))
+        evidence_lines.append(
+            f"{finding['location']}: {finding['value']} [{finding['status']}]" + (f" ({extras})" if extras else "")
+        )
+    omitted = len(vulnerable) + len(hybrid) - len(evidence_lines)
+    if omitted > 0:
+        evidence_lines.append(f"... 외 {omitted}건")
+
+    if vulnerable:
+        details = f"{analyzer}: 양자 취약 공개키 알고리즘 {len(vulnerable)}건 탐지 ({', '.join(sorted({fam for f in vulnerable for fam in f['families'] if fam in CLASSICAL_FAMILIES}))})"
+        recommendations = " ".join(
+            RECOMMENDATIONS[family] for family in families if family in RECOMMENDATIONS
+            and any(family in f["families"] for f in vulnerable)
+        )
+    elif hybrid:
+        details = f"{analyzer}: 하이브리드 PQC 구성만 탐지되었습니다."
+        recommendations = "하이브리드 구성이 유지되는지 정기적으로 확인하세요."
+    else:
+        details = f"{analyzer}: 양자 취약 공개키 알고리즘이 발견되지 않았습니다."
+        recommendations = None
+
+    return {
+        "is_pqc_vulnerable": bool(vulnerable),
+        "vulnerability_details": details,
+        "detected_algorithms": families,
+        "recommendations": recommendations,
+        "evidence": "\n".join(evidence_lines) or None,
+        "confidence_score": 0.95 if findings else 0.9,
+    }
@@ -0,0 +1,430 @@
+# File: pqc_inspector_server/scanners/jvm.py
+# ☕ JVM 클래스 파일(.class)과 JAR/WAR/EAR을 파싱해 JCA/BouncyCastle 공개키 암호 API 사용을 찾습니다.
+# - 상수 풀(constant pool)에서 메서드/클래스 참조를 읽고, 관심 있는 참조가 있는 클래스만 바이트코드를 따라가며
+#   KeyPairGenerator.getInstance("RSA"), Signature.getInstance("SHA256withECDSA") 같은 호출과 문자열/정수 인자를 복원합니다.
+# - JAR 항목은 zip에서 하나씩 풀어 일정 크기 배치로 묶고, 클래스가 많으면 프로세스 풀에서 병렬로 분석합니다.
+#   중첩 JAR(Spring Boot BOOT-INF/lib/*.jar 등)도 펼칩니다.
+
+import io
+import logging
+import posixpath
+import re
+import struct
+import zipfile
+from collections import Counter
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ..core.process_pool import discard_process_pool, get_process_pool, resolve_workers
+from .algorithms import canonical_families
+from .findings import make_finding
+
+logger = logging.getLogger(__name__)
+
+CLASS_MAGIC = b"\xca\xfe\xba\xbe"
+JVM_ARCHIVE_EXTENSIONS = (".jar", ".war", ".ear")
+# 프로세스 풀로 보내는 배치 하나의 최대 크기와, 이보다 클래스가 적으면 현재 프로세스에서 처리하는 기준
+BATCH_BYTES = 1024 * 1024
+PARALLEL_MIN_CLASSES = 200
+# 중첩 JAR 최대 깊이, 클래스 하나의 최대 크기
+MAX_NESTING = 2
+MAX_CLASS_BYTES = 8 * 1024 * 1024
+
+# 관심 있는 메서드: (소유 클래스, 메서드 이름) → API 표시 이름
+_ALGORITHM_FACTORIES = {
+    "java/security/KeyPairGenerator": "KeyPairGenerator",
+    "java/security/Signature": "Signature",
+    "java/security/KeyFactory": "KeyFactory",
+    "java/security/AlgorithmParameters": "AlgorithmParameters",
+    "java/security/AlgorithmParameterGenerator": "AlgorithmParameterGenerator",
+    "javax/crypto/KeyAgreement": "KeyAgreement",
+    "javax/crypto/Cipher": "Cipher",
+    "javax/crypto/KEM": "KEM",
+}
+# 키 생성 API (initialize(int)/ECGenParameterSpec이 이 호출의 키 크기/곡선을 정합니다)
+_KEY_GENERATORS = {"KeyPairGenerator", "AlgorithmParameterGenerator"}
+_PARAMETER_SPECS = {
+    "java/security/spec/ECGenParameterSpec": "ECGenParameterSpec",
+    "java/security/spec/NamedParameterSpec": "NamedParameterSpec",
+    "java/security/spec/RSAKeyGenParameterSpec": "RSAKeyGenParameterSpec",
+}
+# 참조만으로도 공개키 알고리즘 사용을 알 수 있는 클래스 패키지
+_CRYPTO_PACKAGES = ("org/bouncycastle/", "java/security/interfaces/", "java/security/spec/", "javax/crypto/interfaces/")
+_EC_CLASS = re.compile(r"^EC[A-Z]")
+# getInstance 인자 중 API에 따라 계열이 달라지는 이름
+_AMBIGUOUS_ARGUMENTS = {"EC": ("ECDH", "ECDSA"), "XDH": ("ECDH", "ECDH")}
+
+# 바이트코드 명령어 길이 (0이면 가변 길이)
+_OPCODE_LENGTHS = bytearray([1]) * 256
+for _opcode, _length in (
+    (0x10, 2), (0x11, 3), (0x12, 2), (0x13, 3), (0x14, 3), (0x84, 3), (0xA9, 2), (0xBC, 2),
+    (0xB9, 5), (0xBA, 5), (0xC5, 4), (0xC8, 5), (0xC9, 5), (0xAA, 0), (0xAB, 0), (0xC4, 0),
+):
+    _OPCODE_LENGTHS[_opcode] = _length
+for _opcode in list(range(0x15, 0x1A)) + list(range(0x36, 0x3B)):
+    _OPCODE_LENGTHS[_opcode] = 2
+for _opcode in list(range(0x99, 0xA9)) + list(range(0xB2, 0xB9)) + [0xBB, 0xBD, 0xC0, 0xC1, 0xC6, 0xC7]:
+    _OPCODE_LENGTHS[_opcode] = 3
+_INVOKES = {0xB6, 0xB7, 0xB8, 0xB9}
+_ICONST = {opcode: opcode - 0x03 for opcode in range(0x02, 0x09)}
+
+class ClassFileError(ValueError):
+    """클래스 파일 구조가 잘못되었을 때 발생합니다."""
+
+
+def is_class_file(content: bytes) -> bool:
+    # Mach-O 유니버설 바이너리도 CAFEBABE로 시작하지만, 그 자리에는 작은 아키텍처 수가 옵니다 (클래스 파일 major ≥ 45).
+    return content[:4] == CLASS_MAGIC and len(content) >= 10 and 45 <= struct.unpack_from(">H", content, 6)[0] < 100
+
+
+def is_jvm_archive(file_name: str, content: bytes) -> bool:
+    """JAR/WAR/EAR 여부. 확장자가 없으면 zip 앞부분에 META-INF/ 또는 .class 항목 이름이 있는지 봅니다."""
+    if content[:4] != b"PK\x03\x04":
+        return False
+    if file_name.lower().endswith(JVM_ARCHIVE_EXTENSIONS):
+        return True
+    head = content[:4096]
+    return b"META-INF/" in head or b".class" in head
+
+
+class JvmScan:
+    """클래스/JAR 분석 결과입니다."""
+
+    def __init__(self):
+        self.findings: List[Dict[str, Any]] = []
+        self.dynamic: List[str] = []   # 알고리즘 인자가 상수가 아닌 호출 위치
+        self.notes: List[str] = []
+        self.classes = 0
+        self.archives = 0
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        self.findings.extend(other["findings"])
+        self.dynamic.extend(other["dynamic"])
+        self.notes.extend(other["notes"])
+        self.classes += other["classes"]
+
+    def summary(self, limit: int = 15) -> List[str]:
+        """호출/참조별 개수를 요약합니다. 같은 API가 수백 개 클래스에서 반복되는 대형 JAR용."""
+        groups = Counter(finding["value"] for finding in self.findings)
+        lines = [f"×{count} {value}" for value, count in groups.most_common(limit)]
+        if len(groups) > limit:
+            lines.append(f"... 외 {len(groups) - limit}종")
+        if self.dynamic:
+            lines.append(f"알고리즘 인자가 상수가 아닌 호출 {len(self.dynamic)}건 (예: {', '.join(self.dynamic[:3])})")
+        return lines
+
+
+# --- 클래스 파일 파싱 ---
+
+def _constant_pool(data: bytes) -> Tuple[List[Any], int]:
+    """상수 풀을 파싱해 (항목 목록, 상수 풀 뒤 오프셋)을 반환합니다. 문자열은 필요한 Utf8만 지연 디코딩합니다."""
+    (count,) = struct.unpack_from(">H", data, 8)
+    pool: List[Any] = [None] * count
+    offset = 10
+    index = 1
+    unpack = struct.unpack_from
+    while index < count:
+        tag = data[offset]
+        if tag == 1:
+            (length,) = unpack(">H", data, offset + 1)
+            pool[index] = (1, offset + 3, offset + 3 + length)
+            offset += 3 + length
+        elif tag in (7, 8, 16, 19, 20):
+            pool[index] = (tag, unpack(">H", data, offset + 1)[0])
+            offset += 3
+        elif tag in (9, 10, 11, 12, 17, 18):
+            pool[index] = (tag,) + unpack(">HH", data, offset + 1)
+            offset += 5
+        elif tag == 3:
+            pool[index] = (3, unpack(">i", data, offset + 1)[0])
+            offset += 5
+        elif tag == 4:
+            offset += 5
+        elif tag in (5, 6):
+            offset += 9
+            index += 1  # long/double는 두 칸을 차지합니다
+        elif tag == 15:
+            offset += 4
+        else:
+            raise ClassFileError(f"알 수 없는 상수 태그 {tag}")
+        index += 1
+    return pool, offset
+
+
+def _utf8(data: bytes, pool: List[Any], index: int) -> str:
+    entry = pool[index]
+    return data[entry[1]:entry[2]].decode("utf-8", errors="replace")
+
+
+def _class_name(data: bytes, pool: List[Any], index: int) -> str:
+    return _utf8(data, pool, pool[index][1])
+
+
+def _member_ref(data: bytes, pool: List[Any], index: int) -> Tuple[str, str]:
+    _, class_index, name_and_type = pool[index]
+    return _class_name(data, pool, class_index), _utf8(data, pool, pool[name_and_type][1])
+
+
+def _simple_name(class_name: str) -> str:
+    return class_name.rsplit("/", 1)[-1].split("$")[-1]
+
+
+def _reference_families(class_name: str) -> Set[str]:
+    simple = _simple_name(class_name)
+    families = canonical_families(simple)
+    if not families and _EC_CLASS.match(simple):
+        families = {"ECDSA"}
+    return families
+
+
+def _argument_families(api: str, argument: str) -> Set[str]:
+    ambiguous = _AMBIGUOUS_ARGUMENTS.get(argument.upper())
+    if ambiguous:
+        return {ambiguous[0] if api == "KeyAgreement" else ambiguous[1]}
+    return canonical_families(argument)
+
+
+def scan_class(data: bytes, location: str) -> Dict[str, Any]:
+    """
+    클래스 파일 하나를 분석합니다. 반환값은 프로세스 간 전달을 위해 단순 딕셔너리입니다.
+    관심 있는 메서드/클래스 참조가 없는 클래스는 상수 풀만 읽고 끝납니다.
+    """
+    result: Dict[str, Any] = {"findings": [], "dynamic": [], "notes": [], "classes": 1}
+    try:
+        pool, offset = _constant_pool(data)
+        calls: Dict[int, Tuple[str, str]] = {}
+        references: Set[str] = set()
+        for index, entry in enumerate(pool):
+            if entry is None:
+                continue
+            if entry[0] in (10, 11):
+                owner, name = _member_ref(data, pool, index)
+                if owner in _ALGORITHM_FACTORIES and name in ("getInstance", "initialize"):
+                    calls[index] = (_ALGORITHM_FACTORIES[owner], name)
+                elif owner in _PARAMETER_SPECS and name == "<init>":
+                    calls[index] = (_PARAMETER_SPECS[owner], name)
+            elif entry[0] == 7:
+                class_name = _class_name(data, pool, index)
+                if class_name.startswith(_CRYPTO_PACKAGES) and class_name not in _PARAMETER_SPECS:
+                    references.add(class_name)
+
+        for class_name in sorted(references):
+            finding = make_finding(class_name.replace("/", "."), location, "class_reference",
+                                   families=_reference_families(class_name))
+            if finding:
+                result["findings"].append(finding)
+        if calls:
+            _scan_methods(data, pool, offset, calls, location, result)
+    except (ClassFileError, struct.error, IndexError, TypeError) as e:
+        result["notes"].append(f"{location}: 클래스 파싱 실패 ({e})")
+    return result
+
+
+def _scan_methods(data: bytes, pool: List[Any], offset: int, calls: Dict[int, Tuple[str, str]],
+                  location: str, result: Dict[str, Any]) -> None:
+    unpack = struct.unpack_from
+    (interfaces,) = unpack(">H", data, offset + 6)
+    offset += 8 + 2 * interfaces
+    # 필드는 건너뜁니다.
+    (fields,) = unpack(">H", data, offset)
+    offset += 2
+    for _ in range(fields):
+        offset = _skip_attributes(data, offset + 6)
+    (methods,) = unpack(">H", data, offset)
+    offset += 2
+    for _ in range(methods):
+        _, name_index, _, attributes = unpack(">HHHH", data, offset)
+        offset += 8
+        method = _utf8(data, pool, name_index)
+        for _ in range(attributes):
+            attribute_name, length = unpack(">HI", data, offset)
+            if _utf8(data, pool, attribute_name) == "Code":
+                (code_length,) = unpack(">I", data, offset + 10)
+                code_start = offset + 14
+                _walk_code(data, code_start, code_start + code_length, pool, calls,
+                           f"{location}#{method}", result)
+            offset += 6 + length
+
+
+def _skip_attributes(data: bytes, offset: int) -> int:
+    (count,) = struct.unpack_from(">H", data, offset)
+    offset += 2
+    for _ in range(count):
+        (length,) = struct.unpack_from(">I", data, offset + 2)
+        offset += 6 + length
+    return offset
+
+
+def _walk_code(data: bytes, start: int, end: int, pool: List[Any], calls: Dict[int, Tuple[str, str]],
+               location: str, result: Dict[str, Any]) -> None:
+    """
+    바이트코드를 순서대로 읽으며 직전 호출 이후 적재된 문자열/정수 상수를 관심 메서드 호출의 인자로 연결합니다.
+    getInstance(alg, "BC")처럼 인자가 여럿이면 첫 문자열이 알고리즘입니다.
+    """
+    strings: List[str] = []
+    last_int: Optional[int] = None
+    last_generator: Optional[Dict[str, Any]] = None
+    position = start
+    lengths = _OPCODE_LENGTHS
+    while position < end:
+        opcode = data[position]
+        length = lengths[opcode]
+        if opcode in (0x12, 0x13):  # ldc, ldc_w
+            index = data[position + 1] if opcode == 0x12 else struct.unpack_from(">H", data, position + 1)[0]
+            entry = pool[index]
+            if entry is not None and entry[0] == 8:
+                strings.append(_utf8(data, pool, entry[1]))
+            elif entry is not None and entry[0] == 3:
+                last_int = entry[1]
+        elif opcode in _ICONST:
+            last_int = _ICONST[opcode]
+        elif opcode == 0x10:  # bipush
+            last_int = struct.unpack_from(">b", data, position + 1)[0]
+        elif opcode == 0x11:  # sipush
+            last_int = struct.unpack_from(">h", data, position + 1)[0]
+        elif opcode in _INVOKES:
+            (index,) = struct.unpack_from(">H", data, position + 1)
+            call = calls.get(index)
+            if call is not None:
+                last_generator = _record_call(call, strings, last_int, last_generator, location, result)
+            strings = []
+        elif length == 0:
+            length = _variable_length(data, position, start)
+        position += length
+
+
+def _record_call(call: Tuple[str, str], strings: List[str], last_int: Optional[int],
+                 last_generator: Optional[Dict[str, Any]], location: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    api, method = call
+    if method == "getInstance":
+        if not strings:
+            result["dynamic"].append(f"{location} {api}.getInstance")
+            return last_generator
+        argument = strings[0]
+        finding = make_finding(f'{api}.getInstance("{argument}")', location, "jca_call",
+                               families=_argument_families(api, argument))
+        if finding:
+            result["findings"].append(finding)
+            return finding if api in _KEY_GENERATORS else last_generator
+        return last_generator
+    # 키 크기/곡선: 같은 메서드에서 직전에 만든 키 생성기에 붙입니다.
+    if method == "initialize" and last_generator is not None and last_int is not None and last_int > 0:
+        last_generator["key_size"] = last_int
+    elif api == "RSAKeyGenParameterSpec" and last_int is not None and last_int > 0:
+        if last_generator is not None:
+            last_generator["key_size"] = last_int
+    elif api in ("ECGenParameterSpec", "NamedParameterSpec") and strings:
+        if last_generator is not None and api == "ECGenParameterSpec":
+            last_generator["curve"] = strings[0]
+        else:
+            finding = make_finding(f'{api}("{strings[0]}")', location, "jca_call",
+                                   families=_argument_families(api, strings[0]))
+            if finding:
+                result["findings"].append(finding)
+    return last_generator
+
+
+def _variable_length(data: bytes, position: int, code_start: int) -> int:
+    opcode = data[position]
+    if opcode == 0xC4:  # wide
+        return 6 if data[position + 1] == 0x84 else 4
+    # tableswitch/lookupswitch: 메서드 코드 시작 기준 4바이트 정렬 패딩 뒤에 테이블이 옵니다.
+    table = position + 1 + (3 - (position - code_start) % 4)
+    if opcode == 0xAA:
+        low, high = struct.unpack_from(">ii", data, table + 4)
+        return table + 12 + 4 * (high - low + 1) - position
+    (pairs,) = struct.unpack_from(">i", data, table + 4)
+    return table + 8 + 8 * pairs - position
+
+
+# --- JAR 스트리밍과 병렬 처리 ---
+
+def _iter_classes(content: bytes, prefix: str, scan: JvmScan, depth: int = 0) -> Iterator[Tuple[str, bytes]]:
+    """zip 항목을 하나씩 풀어 (위치, 클래스 바이트)를 돌려줍니다. 중첩 JAR은 재귀적으로 펼칩니다."""
+    try:
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            scan.archives += 1
+            for info in archive.infolist():
+                name = info.filename
+                if name.endswith(".class") and 0 < info.file_size <= MAX_CLASS_BYTES:
+                    if name.endswith(("module-info.class", "package-info.class")):
+                        continue
+                    yield f"{prefix}{name}", archive.read(info)
+                elif name.lower().endswith(JVM_ARCHIVE_EXTENSIONS) and depth < MAX_NESTING:
+                    yield from _iter_classes(archive.read(info), f"{prefix}{name}!/", scan, depth + 1)
+    except (zipfile.BadZipFile, OSError, EOFError) as e:
+        scan.notes.append(f"{prefix or 'archive'}: zip 읽기 실패 ({e})")
+
+
+def _iter_batches(classes: Iterator[Tuple[str, bytes]]) -> Iterator[List[Tuple[str, bytes]]]:
+    batch: List[Tuple[str, bytes]] = []
+    size = 0
+    for item in classes:
+        batch.append(item)
+        size += len(item[1])
+        if size >= BATCH_BYTES:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def scan_class_batch(batch: List[Tuple[str, bytes]]) -> Dict[str, Any]:
+    """프로세스 풀 작업 단위: 클래스 여러 개를 분석해 합친 결과를 반환합니다."""
+    merged: Dict[str, Any] = {"findings": [], "dynamic": [], "notes": [], "classes": 0}
+    for location, data in batch:
+        result = scan_class(data, location)
+        for key in ("findings", "dynamic", "notes"):
+            merged[key].extend(result[key])
+        merged["classes"] += 1
+    return merged
+
+
+def scan_jvm_content(content: bytes, file_name: str, workers: int = 0) -> JvmScan:
+    """
+    클래스 파일 또는 JAR/WAR/EAR을 분석합니다. 동기 함수이므로 이벤트 루프에서는 스레드로 실행하세요.
+    workers가 0이면 CPU 코어 수, 1이면 현재 프로세스에서만 처리합니다.
+    """
+    scan = JvmScan()
+    if is_class_file(content):
+        scan.merge(scan_class(content, posixpath.basename(file_name) or "class"))
+        return scan
+
+    workers = resolve_workers(workers)
+    batches = _iter_batches(_iter_classes(content, "", scan))
+    # 첫 배치들을 모아 보고 클래스가 적으면 프로세스 풀을 쓰지 않습니다 (풀 기동/직렬화 비용이 더 큼).
+    pending: List[List[Tuple[str, bytes]]] = []
+    buffered = 0
+    for batch in batches:
+        pending.append(batch)
+        buffered += len(batch)
+        if buffered >= PARALLEL_MIN_CLASSES:
+            break
+    if workers <= 1 or buffered < PARALLEL_MIN_CLASSES:
+        for batch in pending:
+            scan.merge(scan_class_batch(batch))
+        for batch in batches:
+            scan.merge(scan_class_batch(batch))
+        return scan
+
+    # 동시에 풀에 올리는 배치 수를 제한해 압축 해제한 클래스가 메모리에 한꺼번에 쌓이지 않게 합니다.
+    pool = get_process_pool(workers)
+    in_flight: List[Future] = []
+    try:
+        for batch in _chain(pending, batches):
+            in_flight.append(pool.submit(scan_class_batch, batch))
+            if len(in_flight) >= workers * 2:
+                scan.merge(in_flight.pop(0).result())
+        for future in in_flight:
+            scan.merge(future.result())
+    except BrokenProcessPool:
+        discard_process_pool(workers, pool)
+        raise
+    logger.debug("JAR 병렬 분석 완료", extra={"file_name": file_name, "classes": scan.classes, "workers": workers})
+    return scan
+
+
+def _chain(first: List[List[Tuple[str, bytes]]], rest: Iterator[List[Tuple[str, bytes]]]) -> Iterator[List[Tuple[str, bytes]]]:
+    yield from first
+    yield from rest
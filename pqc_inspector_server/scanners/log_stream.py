@@ -0,0 +1,244 @@
+# File: pqc_inspector_server/scanners/log_stream.py
+# 📜 수 GB 크기의 TLS/SSH 로그를 일정한 메모리로 훑는 스트리밍 스캐너입니다.
+# 입력을 청크 단위(업로드 버퍼 조각 또는 mmap 구간)로 받아 줄 경계에 맞춰 정규식 하나로 검사하고,
+# 협상된 암호군, 키 교환 그룹, 인증서 서명 알고리즘, SSH KEX/호스트 키 이름의 고유 값과 출현 횟수를 집계합니다.
+# LLM에는 원문 대신 이 집계 요약만 전달합니다.
+
+import mmap
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.process_pool import accepts_buffer
+from .algorithms import canonical_families
+from .findings import make_finding
+from .log_templates import TemplateMiner
+
+# 한 번에 검사하는 청크 크기
+CHUNK_SIZE = 1024 * 1024
+# 줄바꿈 없이 이보다 길어지면 잘라서 검사합니다 (한 줄이 메모리를 무한히 차지하지 않도록).
+MAX_LINE_BYTES = 64 * 1024
+# 범주별로 추적하는 최대 고유 값 수. 넘치는 값은 overflow 횟수로만 셉니다.
+MAX_DISTINCT = 256
+
+CATEGORIES = ("cipher_suite", "group", "signature_algorithm", "ssh_kex", "ssh_key")
+
+_PATTERN = re.compile(
+    rb"""
+    (?P<kv>\b(?P<kv_key>(?:ssl_|tls_)?(?:cipher(?:_?suite)?|named_group|group|curve|key_share|temp_key|
+        peer_sigalg|sigalg|sig_alg|signature_algorithm|kex_algorithm|host_key_algorithm|hostkey))
+        ["']?\s*[=:]\s*["']?(?P<kv_value>[A-Za-z0-9_@.+-]{3,}))
+    | (?P<cipher_suite>\bTLS_[A-Z0-9]+_WITH_[A-Z0-9_]+|\bTLS_(?:AES|CHACHA20)_[A-Z0-9_]+
+        |\b(?:ECDHE|DHE|ECDH|EDH|DH)-(?:RSA|ECDSA|DSS|PSK)-[A-Z0-9]+(?:-[A-Z0-9]+)*
+        |\bAES(?:128|256)(?:-GCM)?-SHA(?:256|384)?\b)
+    | (?P<group>\b(?:X25519MLKEM768|SecP256r1MLKEM768|SecP384r1MLKEM1024|X25519Kyber768Draft00
+        |x25519|x448|secp(?:256|384|521)r1|prime256v1|ffdhe(?:2048|3072|4096|6144|8192))\b)
+    | (?P<signature_algorithm>\b(?:sha\d+WithRSAEncryption|sha\d+WithRSA|ecdsa-with-SHA\d+|rsa_pss_(?:rsae|pss)_sha\d+
+        |rsa_pkcs1_sha\d+|ecdsa_secp\d+r1_sha\d+|mldsa\d+)\b)
+    | (?P<ssh_kex>\b(?:curve25519-sha256(?:@libssh\.org)?|diffie-hellman-group[\w-]*|ecdh-sha2-nistp\d+
+        |sntrup761x25519-sha512(?:@openssh\.com)?|mlkem768x25519-sha256)\b)
+    | (?P<ssh_key>\b(?:ssh-rsa|rsa-sha2-(?:256|512)|ssh-ed25519|ssh-ed448|ssh-dss|ecdsa-sha2-nistp\d+)\b
+        |\bssh2:\s(?:RSA|ECDSA|ED25519|DSA)\b)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# 정규식을 돌리기 전에 소문자로 바꾼 청크에서 bytes.find로 찾는 고정 문자열입니다.
+# 모든 패턴은 이 가운데 하나를 포함하므로, 어느 것도 없는 줄(대부분의 로그 줄)은 정규식 검사를 건너뜁니다.
+_ANCHORS = (
+    b"cipher", b"group", b"curve", b"key_share", b"temp_key", b"sigalg", b"sig_alg", b"signature", b"kex_",
+    b"hostkey", b"host_key", b"tls_", b"dh-", b"aes128-", b"aes256-", b"x25519", b"x448", b"secp", b"prime256",
+    b"ffdhe", b"withrsa", b"ecdsa", b"rsa_p", b"mldsa", b"diffie-hellman", b"sntrup", b"mlkem", b"ssh-", b"rsa-sha2",
+    b"ssh2:",
+)
+
+# key=value 형태에서 키 이름으로 범주를 정합니다.
+_KEY_CATEGORIES = (
+    ("cipher", "cipher_suite"),
+    ("sigalg", "signature_algorithm"), ("sig_alg", "signature_algorithm"), ("signature", "signature_algorithm"),
+    ("kex", "ssh_kex"),
+    ("host", "ssh_key"),
+    ("group", "group"), ("curve", "group"), ("key_share", "group"), ("temp_key", "group"),
+)
+# 키 교환 알고리즘이 명시되지 않은 OpenSSL 암호군(AES128-GCM-SHA256 등)은 RSA 키 전송을 사용합니다.
+_RSA_KX_SUITE = re.compile(r"^AES(128|256)(-GCM)?-SHA(256|384)?$", re.IGNORECASE)
+# 서명/키 교환 문맥에서 곡선 이름만 나온 경우
+_EC_CURVE = re.compile(r"^(secp\d+r1|prime256v1)$", re.IGNORECASE)
+
+
+class LogStreamScanner:
+    """
+    청크를 순서대로 feed()로 넣고 close()로 마무리하는 스트리밍 집계기입니다.
+    메모리 사용량은 청크 크기 + 범주별 고유 값 수에만 비례하고 로그 길이와는 무관합니다.
+    miner를 넘기면 같은 청크로 로그 템플릿도 함께 수집합니다 (입력을 한 번만 읽음).
+    """
+
+    def __init__(self, max_distinct: int = MAX_DISTINCT, miner: Optional[TemplateMiner] = None):
+        self.max_distinct = max_distinct
+        self.miner = miner
+        self.counts: Dict[str, Counter] = {category: Counter() for category in CATEGORIES}
+        self.overflow: Counter = Counter()
+        # (범주, 값) → 처음 나온 줄
+        self.examples: Dict[Tuple[str, str], str] = {}
+        self.lines = 0
+        self.bytes = 0
+        self._tail = b""
+
+    def feed(self, chunk) -> None:
+        """bytes, memoryview, mmap 조각 등 바이트 유사 객체를 받습니다. 마지막 미완성 줄은 다음 청크까지 보관합니다."""
+        self.bytes += len(chunk)
+        data = self._tail + chunk
+        cut = data.rfind(b"\n")
+        if cut < 0:
+            if len(data) > MAX_LINE_BYTES:
+                self._scan_block(data)
+                self._tail = b""
+            else:
+                self._tail = data
+            return
+        self._scan_block(data[:cut + 1])
+        self._tail = data[cut + 1:]
+
+    def close(self) -> "LogStreamScanner":
+        if self._tail:
+            self._scan_block(self._tail + b"\n")
+            self._tail = b""
+        return self
+
+    def _scan_block(self, block: bytes) -> None:
+        self.lines += block.count(b"\n")
+        if self.miner is not None:
+            self.miner.add_block(block)
+        for start, end in _candidate_lines(block):
+            for match in _PATTERN.finditer(block, start, end):
+                category, value = _categorize(match)
+                if category is None:
+                    continue
+                counter = self.counts[category]
+                if value not in counter and len(counter) >= self.max_distinct:
+                    self.overflow[category] += 1
+                    continue
+                counter[value] += 1
+                if (category, value) not in self.examples:
+                    self.examples[(category, value)] = _printable(block[start:min(end, start + 240)])
+
+    @property
+    def total_hits(self) -> int:
+        return sum(sum(counter.values()) for counter in self.counts.values())
+
+    def findings(self) -> List[Dict[str, Any]]:
+        """집계된 고유 값 가운데 공개키 알고리즘으로 판정되는 값을 finding으로 반환합니다."""
+        results = []
+        for category, counter in self.counts.items():
+            for value, count in counter.most_common():
+                families = _families(category, value)
+                finding = make_finding(value, f"{category} ×{count}", f"log_{category}", families=families)
+                if finding:
+                    finding["count"] = count
+                    finding["example"] = self.examples.get((category, value))
+                    results.append(finding)
+        return results
+
+    def summary(self, max_values: int = 20) -> Dict[str, Any]:
+        """JSON으로 직렬화할 수 있는 집계 요약입니다."""
+        return {
+            "lines": self.lines,
+            "bytes": self.bytes,
+            "categories": {
+                category: {
+                    "distinct": len(counter),
+                    "overflow": self.overflow.get(category, 0),
+                    "top": counter.most_common(max_values),
+                }
+                for category, counter in self.counts.items() if counter
+            },
+        }
+
+    def render(self, max_values: int = 10, max_examples: int = 2) -> str:
+        """LLM 프롬프트에 넣을 간결한 집계 텍스트를 만듭니다. 예시 줄은 범주별로 가장 많이 나온 값 몇 개에만 붙입니다."""
+        lines = [f"총 {self.lines}줄, {self.bytes}바이트"]
+        for category, counter in self.counts.items():
+            if not counter:
+                continue
+            extra = f", 추적 한도 초과 {self.overflow[category]}회" if self.overflow.get(category) else ""
+            lines.append(f"[{category}] 고유 값 {len(counter)}개{extra}")
+            for rank, (value, count) in enumerate(counter.most_common(max_values)):
+                example = f"  예: {self.examples[(category, value)][:120]}" if rank < max_examples else ""
+                lines.append(f"  {value} ×{count}{example}")
+            if len(counter) > max_values:
+                lines.append(f"  ... 외 {len(counter) - max_values}개")
+        return "\n".join(lines)
+
+
+def scan_bytes(content, chunk_size: int = CHUNK_SIZE, miner: Optional[TemplateMiner] = None) -> LogStreamScanner:
+    """메모리에 있는 버퍼를 디코딩하거나 복사하지 않고 청크 단위로 검사합니다."""
+    scanner = LogStreamScanner(miner=miner)
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        scanner.feed(view[start:start + chunk_size])
+    return scanner.close()
+
+
+@accepts_buffer
+def scan_with_templates(content) -> LogStreamScanner:
+    """scan_bytes와 같은 패스에서 로그 템플릿(scanner.miner)도 수집합니다. 프로세스 풀에 넘길 수 있는 모듈 수준 함수입니다."""
+    return scan_bytes(content, miner=TemplateMiner())
+
+
+def scan_file(path: str, chunk_size: int = CHUNK_SIZE, miner: Optional[TemplateMiner] = None) -> LogStreamScanner:
+    """디스크의 로그 파일을 mmap으로 열어 청크 단위로 검사합니다. 파일 전체를 메모리에 읽지 않습니다."""
+    scanner = LogStreamScanner(miner=miner)
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일은 mmap할 수 없습니다.
+            return scanner.close()
+        with mapped:
+            for start in range(0, len(mapped), chunk_size):
+                scanner.feed(mapped[start:start + chunk_size])
+    return scanner.close()
+
+
+def _categorize(match: "re.Match[bytes]") -> Tuple[Optional[str], str]:
+    if match.group("kv"):
+        key = match.group("kv_key").decode("ascii").lower()
+        category = next((c for k, c in _KEY_CATEGORIES if k in key), None)
+        return category, match.group("kv_value").decode("ascii", errors="replace")
+    category = match.lastgroup
+    value = match.group(category).decode("ascii", errors="replace")
+    if value.lower().startswith("ssh2:"):
+        value = value.split()[-1].upper()
+    return category, value
+
+
+def _families(category: str, value: str) -> Optional[set]:
+    """범주 문맥을 반영해 값의 알고리즘 계열을 정합니다. None이면 make_finding이 값에서 추론합니다."""
+    if category == "cipher_suite" and _RSA_KX_SUITE.match(value):
+        return {"RSA"}
+    if category == "group" and _EC_CURVE.match(value):
+        return {"ECDH"}
+    if category == "signature_algorithm" and _EC_CURVE.match(value):
+        return {"ECDSA"}
+    return canonical_families(value)
+
+
+def _candidate_lines(block: bytes) -> List[Tuple[int, int]]:
+    """앵커 문자열이 하나라도 들어 있는 줄의 (시작, 끝) 범위를 순서대로 반환합니다."""
+    lowered = block.lower()
+    lines = set()
+    for anchor in _ANCHORS:
+        position = lowered.find(anchor)
+        while position >= 0:
+            start = lowered.rfind(b"\n", 0, position) + 1
+            end = lowered.find(b"\n", position)
+            if end < 0:
+                end = len(lowered)
+            lines.add((start, end))
+            # 같은 줄의 나머지는 정규식이 처리하므로 다음 줄부터 찾습니다.
+            position = lowered.find(anchor, end)
+    return sorted(lines)
+
+
+def _printable(line: bytes) -> str:
+    text = line.decode("utf-8", errors="replace")
+    return "".join(ch if ch.isprintable() else " " for ch in text).strip()
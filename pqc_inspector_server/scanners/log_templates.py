@@ -0,0 +1,158 @@
+# File: pqc_inspector_server/scanners/log_templates.py
+# 🧩 Drain 방식의 온라인 로그 템플릿 마이너입니다.
+# 타임스탬프, IP, 숫자, 16진수처럼 줄마다 바뀌는 값을 <*>로 가린 뒤, 토큰 수와 앞 토큰으로 나눈 고정 깊이 트리에서
+# 가장 비슷한 템플릿에 줄을 묶습니다. 템플릿별 출현 횟수와 원문 예시 몇 줄만 보관하므로,
+# LLM 프롬프트 크기가 로그 길이가 아니라 로그의 다양성에 비례합니다.
+
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 줄마다 달라지는 값을 가리는 정규식. 숫자로 시작하는 토큰(시각, IP:포트, 숫자, UUID 등) 전체와
+# 영문자로 시작하는 8자 이상의 16진수 토큰(해시, 세션 ID)을 가립니다. 영문자 뒤에 붙은 숫자(AES128, TLSv1.2, x25519)는
+# 알고리즘 이름의 일부이므로 그대로 둡니다. 줄바꿈은 건드리지 않으므로 가린 뒤에도 원문과 줄 단위로 대응됩니다.
+# 대안(시각/IP/숫자를 각각 매칭하는 분기)보다 2~3배 빠릅니다.
+_VARIABLES = re.compile(rb"(?<![\w.-])(?:\d[\w.:+-]*|[a-fA-F][0-9a-fA-F]{7,}\b)")
+_MASK = b"<*>"
+MASK = _MASK.decode()
+
+# 템플릿이 암호 관련인지 판단하는 키워드 (소문자 템플릿/예시에서 검색)
+_CRYPTO_HINT = re.compile(
+    r"(?<![a-z])(?:rsa|dsa|pem|kex|ssl|tls)|withrsa|cipher|handshake|certificate|x509|ecdh|ecdsa|ed25519|x25519|"
+    r"secp|ffdhe|diffie|host key|publickey|signature|sigalg|crypto|pkcs|mlkem|ml-kem|kyber|sntrup"
+)
+
+# 기본값: 유사도 임계치, 트리에서 길이 다음으로 사용하는 (가려지지 않은) 앞 토큰 수, 최대 템플릿 수, 템플릿별 예시 수
+SIMILARITY_THRESHOLD = 0.5
+PREFIX_DEPTH = 2
+MAX_TEMPLATES = 2000
+MAX_EXEMPLARS = 3
+# 가린 줄 → 템플릿 캐시 크기
+_CACHE_LIMIT = 50000
+
+
+class LogTemplate:
+    __slots__ = ("template_id", "tokens", "count", "exemplars")
+
+    def __init__(self, template_id: int, tokens: List[str]):
+        self.template_id = template_id
+        self.tokens = tokens
+        self.count = 0
+        self.exemplars: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return " ".join(self.tokens)
+
+    @property
+    def mentions_crypto(self) -> bool:
+        return bool(_CRYPTO_HINT.search(self.text.lower())) or any(
+            _CRYPTO_HINT.search(exemplar.lower()) for exemplar in self.exemplars[:1]
+        )
+
+    def to_dict(self) -> Dict:
+        return {"template": self.text, "count": self.count, "exemplars": list(self.exemplars)}
+
+
+class TemplateMiner:
+    """
+    블록(줄바꿈으로 끝나는 바이트 덩어리) 단위로 add_block()을 호출하는 온라인 템플릿 마이너입니다.
+    가리기(masking)와 동일 줄 집계는 블록 전체에 대해 C 수준에서 처리하고,
+    Drain 트리 탐색은 블록 안의 서로 다른 가린 줄에 대해서만 수행합니다.
+    """
+
+    def __init__(self, similarity_threshold: float = SIMILARITY_THRESHOLD, prefix_depth: int = PREFIX_DEPTH,
+                 max_templates: int = MAX_TEMPLATES, max_exemplars: int = MAX_EXEMPLARS):
+        self.similarity_threshold = similarity_threshold
+        self.prefix_depth = prefix_depth
+        self.max_templates = max_templates
+        self.max_exemplars = max_exemplars
+        self.templates: List[LogTemplate] = []
+        # (토큰 수, 앞 토큰들) → 템플릿 목록
+        self._tree: Dict[Tuple, List[LogTemplate]] = {}
+        self._cache: Dict[bytes, LogTemplate] = {}
+        self.unclustered = 0
+        self.lines = 0
+
+    def add_block(self, block: bytes) -> None:
+        raw_lines = block.split(b"\n")
+        masked_lines = _VARIABLES.sub(_MASK, block).split(b"\n")
+        counts = Counter(masked_lines)
+        counts.pop(b"", None)
+        # 가린 줄마다 처음 나온 원문 줄 (뒤에서부터 채워 앞의 값이 남도록 함)
+        first_raw = dict(zip(reversed(masked_lines), reversed(raw_lines)))
+        for masked, count in counts.items():
+            self.lines += count
+            template = self._cache.get(masked)
+            if template is None:
+                template = self._match(masked.decode("utf-8", errors="replace").split())
+                if template is None:
+                    self.unclustered += count
+                    continue
+                if len(self._cache) < _CACHE_LIMIT:
+                    self._cache[masked] = template
+            template.count += count
+            if len(template.exemplars) < self.max_exemplars:
+                exemplar = first_raw[masked].decode("utf-8", errors="replace").strip()[:300]
+                if exemplar not in template.exemplars:
+                    template.exemplars.append(exemplar)
+
+    def add_line(self, line: str) -> None:
+        self.add_block(line.encode("utf-8", errors="replace") + b"\n")
+
+    def _match(self, tokens: List[str]) -> Optional[LogTemplate]:
+        if not tokens:
+            return None
+        # 줄 앞의 시각/호스트/PID처럼 가려진 토큰은 건너뛰고, 처음 나오는 고정 토큰들로 트리 경로를 정합니다.
+        fixed = [token for token in tokens if MASK not in token][:self.prefix_depth]
+        key = (len(tokens),) + tuple(fixed)
+        leaf = self._tree.setdefault(key, [])
+
+        best, best_similarity = None, -1.0
+        for template in leaf:
+            similarity = _similarity(template.tokens, tokens)
+            if similarity > best_similarity:
+                best, best_similarity = template, similarity
+        if best is not None and best_similarity >= self.similarity_threshold:
+            best.tokens = [a if a == b else MASK for a, b in zip(best.tokens, tokens)]
+            return best
+
+        if len(self.templates) >= self.max_templates:
+            return None
+        template = LogTemplate(len(self.templates), tokens)
+        self.templates.append(template)
+        leaf.append(template)
+        return template
+
+    def top(self, limit: Optional[int] = None, crypto_only: bool = False) -> List[LogTemplate]:
+        """출현 횟수 순으로 템플릿을 반환합니다."""
+        templates = [t for t in self.templates if t.count and (not crypto_only or t.mentions_crypto)]
+        templates.sort(key=lambda t: t.count, reverse=True)
+        return templates[:limit] if limit else templates
+
+    def render(self, limit: int, crypto_only: bool = True, exemplars: int = 2, size: Callable[[str], int] = len) -> str:
+        """
+        LLM 프롬프트용 템플릿 목록을 limit 이내로 만듭니다. 크기는 size로 잽니다 (기본은 글자 수, 토큰 수를 세는 함수도 가능).
+        템플릿마다 횟수, 템플릿, 원문 예시 몇 줄을 넣고 예산을 넘으면 멈춥니다.
+        """
+        selected = self.top(crypto_only=crypto_only)
+        crypto_count = len(selected) if crypto_only else sum(1 for t in selected if t.mentions_crypto)
+        header = f"총 {self.lines}줄 → 템플릿 {len(self.templates)}개 (암호 관련 {crypto_count}개)"
+        lines = [header]
+        used = size(header)
+        for index, template in enumerate(selected):
+            entry = f"×{template.count} {template.text}"
+            for exemplar in template.exemplars[:exemplars]:
+                entry += f"\n    예: {exemplar[:200]}"
+            entry_size = size(entry) + 1
+            if used + entry_size > limit:
+                lines.append(f"... 외 {len(selected) - index}개 템플릿 생략")
+                break
+            lines.append(entry)
+            used += entry_size
+        return "\n".join(lines)
+
+
+def _similarity(template: List[str], tokens: List[str]) -> float:
+    same = sum(1 for a, b in zip(template, tokens) if a == b or a == MASK)
+    return same / len(tokens)
@@ -0,0 +1,164 @@
+# File: pqc_inspector_server/scanners/openssl_ciphers.py
+# 🔐 OpenSSL 암호 문자열(예: "HIGH:!aNULL:!MD5", "ECDHE+AESGCM:DHE+AESGCM")을 구체적인 TLS 1.2 암호군 목록으로 펼칩니다.
+# OpenSSL의 ciphers(1) 규칙(!, -, + 연산자, '+'로 묶은 교집합, @STRENGTH)을 따르며,
+# 각 암호군의 키 교환/인증 알고리즘에서 양자 취약 계열을 계산합니다.
+
+from typing import Callable, Dict, List, Set, Tuple
+
+from .algorithms import canonical_families
+
+# OpenSSL 3.x가 지원하는 주요 TLS 1.2 암호군 (기본 우선순위 순서)
+SUITES = (
+    "ECDHE-ECDSA-AES256-GCM-SHA384", "ECDHE-RSA-AES256-GCM-SHA384", "DHE-DSS-AES256-GCM-SHA384",
+    "DHE-RSA-AES256-GCM-SHA384", "ECDHE-ECDSA-CHACHA20-POLY1305", "ECDHE-RSA-CHACHA20-POLY1305",
+    "DHE-RSA-CHACHA20-POLY1305", "ECDHE-ECDSA-AES256-CCM", "DHE-RSA-AES256-CCM",
+    "ECDHE-ECDSA-AES128-GCM-SHA256", "ECDHE-RSA-AES128-GCM-SHA256", "DHE-DSS-AES128-GCM-SHA256",
+    "DHE-RSA-AES128-GCM-SHA256", "ECDHE-ECDSA-AES128-CCM", "DHE-RSA-AES128-CCM",
+    "ECDHE-ECDSA-AES256-SHA384", "ECDHE-RSA-AES256-SHA384", "DHE-RSA-AES256-SHA256", "DHE-DSS-AES256-SHA256",
+    "ECDHE-ECDSA-CAMELLIA256-SHA384", "ECDHE-RSA-CAMELLIA256-SHA384", "DHE-RSA-CAMELLIA256-SHA256",
+    "ECDHE-ECDSA-AES128-SHA256", "ECDHE-RSA-AES128-SHA256", "DHE-RSA-AES128-SHA256", "DHE-DSS-AES128-SHA256",
+    "ECDHE-ECDSA-CAMELLIA128-SHA256", "ECDHE-RSA-CAMELLIA128-SHA256", "DHE-RSA-CAMELLIA128-SHA256",
+    "ECDHE-ECDSA-AES256-SHA", "ECDHE-RSA-AES256-SHA", "DHE-RSA-AES256-SHA", "DHE-DSS-AES256-SHA",
+    "DHE-RSA-CAMELLIA256-SHA", "ECDHE-ECDSA-AES128-SHA", "ECDHE-RSA-AES128-SHA", "DHE-RSA-AES128-SHA",
+    "DHE-DSS-AES128-SHA", "DHE-RSA-CAMELLIA128-SHA",
+    "AES256-GCM-SHA384", "AES256-CCM", "AES128-GCM-SHA256", "AES128-CCM", "AES256-SHA256", "AES128-SHA256",
+    "CAMELLIA256-SHA256", "CAMELLIA128-SHA256", "AES256-SHA", "CAMELLIA256-SHA", "AES128-SHA", "CAMELLIA128-SHA",
+    "ECDHE-RSA-DES-CBC3-SHA", "EDH-RSA-DES-CBC3-SHA", "DES-CBC3-SHA",
+    # 익명(aNULL) 암호군: "ALL"에는 포함되지만 DEFAULT/HIGH 구성에서는 보통 !aNULL로 제외됩니다.
+    "AECDH-AES256-SHA", "ADH-AES256-GCM-SHA384", "ADH-AES128-GCM-SHA256", "AECDH-AES128-SHA",
+)
+
+# TLS 1.3 암호군은 대칭 암호만 지정합니다 (키 교환은 groups, 서명은 sigalgs가 결정).
+TLS13_SUITES = ("TLS_AES_256_GCM_SHA384", "TLS_CHACHA20_POLY1305_SHA256", "TLS_AES_128_GCM_SHA256",
+                "TLS_AES_128_CCM_SHA256", "TLS_AES_128_CCM_8_SHA256")
+
+# 키 교환/인증 방식 → 양자 취약 계열
+_KX_FAMILIES = {"ECDHE": "ECDH", "DHE": "DH", "RSA": "RSA"}
+_AU_FAMILIES = {"ECDSA": "ECDSA", "RSA": "RSA", "DSS": "DSA"}
+
+
+def suite_attributes(name: str) -> Dict[str, object]:
+    """OpenSSL 암호군 이름에서 키 교환(kx), 인증(au), 대칭 암호(enc), 강도(bits), MAC을 추출합니다."""
+    upper = name.upper()
+    if upper.startswith("AECDH-"):
+        kx, au = "ECDHE", "NULL"
+    elif upper.startswith("ADH-"):
+        kx, au = "DHE", "NULL"
+    elif upper.startswith("ECDHE-"):
+        kx, au = "ECDHE", "ECDSA" if upper.startswith("ECDHE-ECDSA-") else "RSA"
+    elif upper.startswith(("DHE-", "EDH-")):
+        kx, au = "DHE", "DSS" if "-DSS-" in upper else "RSA"
+    else:
+        kx, au = "RSA", "RSA"
+
+    if "CHACHA20" in upper:
+        enc, bits = "CHACHA20", 256
+    elif "DES-CBC3" in upper:
+        enc, bits = "3DES", 112
+    elif "CAMELLIA" in upper:
+        enc, bits = "CAMELLIA", 256 if "CAMELLIA256" in upper else 128
+    else:
+        enc = "AESGCM" if "GCM" in upper else ("AESCCM" if "CCM" in upper else "AES")
+        bits = 256 if "AES256" in upper else 128
+    mac = "AEAD" if enc in ("AESGCM", "AESCCM", "CHACHA20") else (
+        "SHA384" if upper.endswith("SHA384") else "SHA256" if upper.endswith("SHA256") else "SHA1"
+    )
+    return {"kx": kx, "au": au, "enc": enc, "bits": bits, "mac": mac}
+
+
+_ATTRIBUTES = {name: suite_attributes(name) for name in SUITES}
+
+_Predicate = Callable[[Dict[str, object]], bool]
+
+# 암호 문자열 키워드 → 암호군 조건
+_KEYWORDS: Dict[str, _Predicate] = {
+    "ALL": lambda a: True,
+    "DEFAULT": lambda a: a["au"] != "NULL",
+    "COMPLEMENTOFDEFAULT": lambda a: a["au"] == "NULL",
+    "HIGH": lambda a: a["bits"] >= 128 and a["enc"] != "3DES",
+    "MEDIUM": lambda a: a["enc"] == "3DES",
+    "LOW": lambda a: False, "EXPORT": lambda a: False, "EXP": lambda a: False,
+    "ENULL": lambda a: False, "NULL": lambda a: False, "MD5": lambda a: False, "RC4": lambda a: False,
+    "ANULL": lambda a: a["au"] == "NULL",
+    "KRSA": lambda a: a["kx"] == "RSA", "RSA": lambda a: a["kx"] == "RSA",
+    "ARSA": lambda a: a["au"] == "RSA",
+    "KEECDH": lambda a: a["kx"] == "ECDHE", "KECDHE": lambda a: a["kx"] == "ECDHE",
+    "ECDHE": lambda a: a["kx"] == "ECDHE" and a["au"] != "NULL",
+    "EECDH": lambda a: a["kx"] == "ECDHE" and a["au"] != "NULL",
+    "AECDH": lambda a: a["kx"] == "ECDHE" and a["au"] == "NULL",
+    "KEDH": lambda a: a["kx"] == "DHE", "KDHE": lambda a: a["kx"] == "DHE",
+    "DHE": lambda a: a["kx"] == "DHE" and a["au"] != "NULL",
+    "EDH": lambda a: a["kx"] == "DHE" and a["au"] != "NULL",
+    "ADH": lambda a: a["kx"] == "DHE" and a["au"] == "NULL",
+    "AECDSA": lambda a: a["au"] == "ECDSA", "ECDSA": lambda a: a["au"] == "ECDSA",
+    "ADSS": lambda a: a["au"] == "DSS", "DSS": lambda a: a["au"] == "DSS",
+    "AES": lambda a: str(a["enc"]).startswith("AES"),
+    "AES128": lambda a: str(a["enc"]).startswith("AES") and a["bits"] == 128,
+    "AES256": lambda a: str(a["enc"]).startswith("AES") and a["bits"] == 256,
+    "AESGCM": lambda a: a["enc"] == "AESGCM", "AESCCM": lambda a: a["enc"] == "AESCCM",
+    "CHACHA20": lambda a: a["enc"] == "CHACHA20", "CAMELLIA": lambda a: a["enc"] == "CAMELLIA",
+    "3DES": lambda a: a["enc"] == "3DES",
+    "SHA1": lambda a: a["mac"] == "SHA1", "SHA": lambda a: a["mac"] == "SHA1",
+    "SHA256": lambda a: a["mac"] == "SHA256", "SHA384": lambda a: a["mac"] == "SHA384",
+    "AEAD": lambda a: a["mac"] == "AEAD",
+}
+
+
+def _select(term: str) -> Tuple[List[str], bool]:
+    """'+'로 묶인 조건(예: ECDHE+AESGCM) 또는 암호군 이름에 해당하는 암호군 목록과, 알려진 용어인지 여부를 반환합니다."""
+    if term in _ATTRIBUTES:
+        return [term], True
+    predicates = []
+    for part in term.split("+"):
+        predicate = _KEYWORDS.get(part.upper())
+        if predicate is None:
+            return [], False
+        predicates.append(predicate)
+    return [name for name in SUITES if all(p(_ATTRIBUTES[name]) for p in predicates)], True
+
+
+def expand_cipher_string(cipher_string: str) -> Tuple[List[str], List[str]]:
+    """
+    암호 문자열을 최종 암호군 목록(우선순위 순)으로 펼칩니다.
+    반환값: (암호군 목록, 해석하지 못한 용어 목록). IANA 이름(TLS_ECDHE_RSA_WITH_...)과 TLS 1.3 이름은 그대로 유지합니다.
+    """
+    active: List[str] = []
+    removed: Set[str] = set()
+    unknown: List[str] = []
+    for token in cipher_string.replace(",", ":").replace(" ", ":").split(":"):
+        token = token.strip().strip('"\'')
+        # "DEFAULT@SECLEVEL=2"처럼 용어 뒤에 붙은 @지시어는 분리합니다. (@SECLEVEL은 암호군 목록에 영향 없음)
+        token, _, special = token.partition("@")
+        if special.upper() == "STRENGTH":
+            active.sort(key=lambda name: -int(_ATTRIBUTES.get(name, {"bits": 0})["bits"]))
+        if not token:
+            continue
+        operator, term = (token[0], token[1:]) if token[0] in "!-+" else ("", token)
+        selected, known = _select(term)
+        if not known:
+            if term.upper().startswith("TLS_") or "-" in term:
+                selected = [term]  # 표에 없는 구체적인 암호군 이름
+            else:
+                unknown.append(token)
+                continue
+        if operator == "!":
+            removed.update(selected)
+            active = [name for name in active if name not in selected]
+        elif operator == "-":
+            active = [name for name in active if name not in selected]
+        elif operator == "+":
+            moved = [name for name in active if name in selected]
+            active = [name for name in active if name not in selected] + moved
+        else:
+            active.extend(name for name in selected if name not in active and name not in removed)
+    return active, unknown
+
+
+def suite_families(name: str) -> Set[str]:
+    """암호군의 키 교환/인증에 쓰이는 양자 취약 계열을 반환합니다. TLS 1.3 암호군은 빈 집합입니다."""
+    if name.upper() in TLS13_SUITES:
+        return set()
+    attributes = _ATTRIBUTES.get(name)
+    if attributes is None:
+        return canonical_families(name)
+    return {family for family in (_KX_FAMILIES.get(attributes["kx"]), _AU_FAMILIES.get(attributes["au"])) if family}
@@ -0,0 +1,110 @@
+# File: pqc_inspector_server/scanners/prescan.py
+# 🔎 LLM 호출 전에 실행하는 결정적(deterministic) 사전 스캔입니다.
+# 파일 바이트 전체에서 암호 알고리즘 키워드를 찾아, 표준 알고리즘 계열별 근거를 모읍니다.
+# PRESCAN_ENABLED 설정이 켜져 있으면 키워드가 하나도 없는 파일은 모델 호출 없이 안전으로 판정합니다.
+
+from typing import Dict, List
+
+from .algorithms import canonical_families
+from .custom_crypto import scan_custom_crypto
+
+# 소문자로 바꾼 내용에서 찾는 키워드. 앞뒤가 영문자가 아닐 때만 인정합니다. (예: "traversal"의 "rsa" 제외)
+_BOUNDED_KEYWORDS = (
+    b"rsa", b"dsa", b"ecdsa", b"ecdh", b"ecdhe", b"ed25519", b"ed448", b"x25519", b"x448", b"curve25519",
+    b"diffie-hellman", b"ssh-dss", b"rs256", b"rs384", b"rs512", b"ps256", b"ps384", b"ps512",
+    b"es256", b"es384", b"es512", b"mlkem", b"ml-kem", b"ml-dsa", b"kyber", b"dilithium", b'"dh"', b'"dhe"',
+)
+# 원본 내용에서 대소문자를 구분해 찾는 키워드. 식별자 중간(RSA_public_encrypt, sha256WithRSAEncryption)에서도 인정합니다.
+_EMBEDDED_KEYWORDS = (b"RSA", b"ECDSA", b"ECDH", b"EdDSA", b"DH_", b"DHE-", b"DHE_")
+
+_KEYWORD_FAMILIES = {
+    keyword: canonical_families(keyword.decode("ascii")) for keyword in _BOUNDED_KEYWORDS + _EMBEDDED_KEYWORDS
+}
+
+# 계열별로 보관하는 최대 근거 개수
+_MAX_EVIDENCE = 3
+
+# 관련도 점수에만 쓰는 보조 키워드 (알고리즘 이름은 없지만 암호 API를 쓰는 부분). 알고리즘 키워드보다 낮게 칩니다.
+_CONTEXT_KEYWORDS = (
+    b"crypt", b"cipher", b"sign", b"verify", b"keypair", b"publickey", b"privatekey", b"public_key", b"private_key",
+    b"x509", b"pem", b"cert", b"tls", b"ssl", b"ssh", b"jwt", b"jwk", b"kex", b"curve", b"modulus", b"exponent",
+)
+_ALGORITHM_WEIGHT = 4
+
+
+def prescan(content: bytes) -> Dict[str, List[str]]:
+    """
+    파일 내용에서 알고리즘 키워드를 찾아 {계열: [근거 줄, ...]} 형태로 반환합니다.
+    바이너리에도 그대로 적용할 수 있도록 디코딩하지 않고 바이트 단위로 검색합니다.
+    정규식 대신 키워드별 bytes.find를 사용하여 수 MB 파일도 수 ms 안에 끝납니다.
+    """
+    findings: Dict[str, List[str]] = {}
+    lowered = content.lower()
+    for keywords, haystack, bounded in ((_BOUNDED_KEYWORDS, lowered, True), (_EMBEDDED_KEYWORDS, content, False)):
+        for keyword in keywords:
+            families = _KEYWORD_FAMILIES[keyword]
+            position = haystack.find(keyword)
+            # 해당 키워드의 모든 계열에 근거가 충분히 모이면 더 찾지 않습니다.
+            while position >= 0 and not all(len(findings.get(f, ())) >= _MAX_EVIDENCE for f in families):
+                end = position + len(keyword)
+                if bounded:
+                    accepted = not _is_letter(lowered, position - 1) and not _is_letter(lowered, end)
+                else:
+                    # "ECDHE-RSA"의 "DHE-"처럼 EC 뒤에 붙은 DH는 유한체 DH가 아닙니다.
+                    accepted = not (keyword.startswith(b"DH") and lowered[position - 1:position] == b"c")
+                if accepted:
+                    evidence = _line_around(content, position, end)
+                    for family in families:
+                        bucket = findings.setdefault(family, [])
+                        if len(bucket) < _MAX_EVIDENCE:
+                            bucket.append(evidence)
+                position = haystack.find(keyword, end)
+    return findings
+
+
+def prescan_indicators(content: bytes, file_name: str) -> Dict[str, List[str]]:
+    """
+    사전 스캔 단계의 판정 근거입니다. 키워드가 없어도 공개키 연산을 직접 구현한 소스는 자체 구현 탐지 근거로 채웁니다.
+    빈 딕셔너리면 LLM 호출 없이 안전으로 판정할 수 있습니다.
+    """
+    indicators = prescan(content)
+    if not indicators:
+        for finding in scan_custom_crypto(content, file_name):
+            for family in finding["families"]:
+                indicators.setdefault(family, []).extend(finding["signals"][:3])
+    return indicators
+
+
+def relevance_score(content: bytes) -> int:
+    """
+    청크가 암호 사용 판정에 얼마나 관련 있는지 나타내는 점수입니다. 프롬프트에 넣을 청크를 고를 때 씁니다.
+    알고리즘 키워드 한 번에 _ALGORITHM_WEIGHT점, 보조 키워드 한 번에 1점입니다.
+    """
+    lowered = content.lower()
+    score = 0
+    for keyword in _BOUNDED_KEYWORDS:
+        position = lowered.find(keyword)
+        while position >= 0:
+            end = position + len(keyword)
+            if not _is_letter(lowered, position - 1) and not _is_letter(lowered, end):
+                score += _ALGORITHM_WEIGHT
+            position = lowered.find(keyword, end)
+    for keyword in _EMBEDDED_KEYWORDS:
+        score += _ALGORITHM_WEIGHT * content.count(keyword)
+    for keyword in _CONTEXT_KEYWORDS:
+        score += lowered.count(keyword)
+    return score
+
+
+def _is_letter(data: bytes, index: int) -> bool:
+    return 0 <= index < len(data) and 97 <= data[index] <= 122
+
+
+def _line_around(content: bytes, start: int, end: int, width: int = 80) -> str:
+    line_start = max(content.rfind(b"\n", max(0, start - width), start) + 1, start - width)
+    line_end = content.find(b"\n", end, end + width)
+    if line_end < 0:
+        line_end = min(len(content), end + width)
+    snippet = content[line_start:line_end].decode("utf-8", errors="replace")
+    # 바이너리의 NUL 등 제어 문자는 공백으로 바꿔 사람이 읽을 수 있게 만듭니다.
+    return "".join(ch if ch.isprintable() else " " for ch in snippet).strip()
@@ -0,0 +1,517 @@
+# File: pqc_inspector_server/scanners/server_config.py
+# 🖥️ nginx, Apache httpd, HAProxy, OpenSSH(sshd/ssh), OpenSSL 설정 파일을 지시어(directive) 단위로 파싱해
+# TLS/SSH 암호 설정을 모델 호출 없이 판정합니다.
+# - 암호 문자열은 openssl_ciphers로 구체적인 암호군까지 펼쳐 키 교환/인증 계열을 계산합니다.
+# - include 지시어는 함께 업로드된 파일(압축 파일 항목) 안에서 찾아 재귀적으로 펼칩니다.
+# - 키 교환과 서명을 각각 non-PQC / hybrid-PQC / mixed 로 분류합니다.
+# - 암호 지시어가 없으면 서버 기본값(OpenSSH 기본 알고리즘, TLS를 켠 nginx/Apache/HAProxy의 기본 암호 문자열)으로 판정합니다.
+
+import fnmatch
+import posixpath
+import re
+from collections import Counter
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .algorithms import canonical_families
+from .findings import make_finding
+from .openssl_ciphers import expand_cipher_string, suite_families
+
+# 최대 include 깊이
+MAX_INCLUDE_DEPTH = 10
+# 방언 판별에 사용하는 앞부분 크기
+_SNIFF_BYTES = 64 * 1024
+
+
+class Directive(NamedTuple):
+    name: str         # 소문자로 정규화한 지시어 이름
+    args: List[str]
+    file: str
+    line: int
+    context: str      # 블록/섹션 경로 (예: "http/server", "frontend web", "Match User git")
+    default: bool = False  # 파일에 없어서 서버 기본값으로 채운 지시어
+
+
+# --- 방언 판별 ---
+
+_CONTENT_SIGNATURES = (
+    ("sshd", re.compile(rb"^[ \t]*(KexAlgorithms|HostKeyAlgorithms|HostKey|PubkeyAcceptedAlgorithms|PubkeyAcceptedKeyTypes|PermitRootLogin)[ \t=]", re.M | re.I)),
+    ("apache", re.compile(rb"^[ \t]*(SSLCipherSuite|SSLProtocol|SSLEngine|SSLOpenSSLConfCmd|<VirtualHost)\b", re.M)),
+    ("haproxy", re.compile(rb"^[ \t]*(ssl-default-bind-ciphers|ssl-default-bind-curves|frontend\s+\S+|backend\s+\S+)", re.M)),
+    ("nginx", re.compile(rb"^[ \t]*(ssl_ciphers|ssl_protocols|ssl_ecdh_curve|ssl_certificate|server\s*\{|http\s*\{|upstream\s+\S+\s*\{)", re.M)),
+    ("openssl", re.compile(rb"^[ \t]*(CipherString|Ciphersuites|default_md|openssl_conf|default_bits)\s*=", re.M)),
+)
+
+
+def detect_dialect(file_name: str, content: bytes) -> Optional[str]:
+    """파일 이름과 앞부분 내용으로 설정 방언을 판별합니다. 서버 설정이 아니면 None."""
+    name = posixpath.basename(file_name.replace("\\", "/")).lower()
+    if name in ("sshd_config", "ssh_config") or name.endswith((".sshd_config", "_sshd_config")):
+        return "sshd"
+    if name.startswith("haproxy") and name.endswith((".cfg", ".conf")):
+        return "haproxy"
+    if name.endswith(".cnf"):
+        return "openssl"
+    head = content[:_SNIFF_BYTES]
+    if b"\x00" in head:
+        return None
+    for dialect, signature in _CONTENT_SIGNATURES:
+        if signature.search(head):
+            return dialect
+    return None
+
+
+# --- 방언별 파서 ---
+
+_NGINX_TOKEN = re.compile(r'#[^\n]*|"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|[{};]|[^\s{};#"\']+')
+_WORDS = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|\S+')
+
+
+def _unquote(word: str) -> str:
+    return word[1:-1] if len(word) >= 2 and word[0] == word[-1] and word[0] in "\"'" else word
+
+
+def _parse_nginx(text: str, file: str) -> List[Directive]:
+    directives, words, stack = [], [], []
+    line, position, start_line = 1, 0, 1
+    for match in _NGINX_TOKEN.finditer(text):
+        line += text.count("\n", position, match.start())
+        position = match.start()
+        token = match.group()
+        if token.startswith("#"):
+            continue
+        if token in (";", "{"):
+            if words:
+                directives.append(Directive(words[0].lower(), words[1:], file, start_line, "/".join(stack)))
+                if token == "{":
+                    stack.append(" ".join(words))
+            words = []
+        elif token == "}":
+            if stack:
+                stack.pop()
+            words = []
+        else:
+            if not words:
+                start_line = line
+            words.append(_unquote(token))
+    return directives
+
+
+def _logical_lines(text: str):
+    """백슬래시 줄 이어붙이기를 처리하고 주석/빈 줄을 제외한 (줄 번호, 내용)을 돌려줍니다."""
+    buffer, start = "", 0
+    for number, raw in enumerate(text.splitlines(), 1):
+        stripped = raw.strip()
+        if not buffer:
+            start = number
+        if stripped.endswith("\\"):
+            buffer += stripped[:-1] + " "
+            continue
+        logical = (buffer + stripped).strip()
+        buffer = ""
+        if logical and not logical.startswith(("#", ";")):
+            yield start, logical
+
+
+def _parse_apache(text: str, file: str) -> List[Directive]:
+    directives, stack = [], []
+    for number, line in _logical_lines(text):
+        if line.startswith("</"):
+            if stack:
+                stack.pop()
+            continue
+        if line.startswith("<"):
+            stack.append(line.strip("<>"))
+            continue
+        words = [_unquote(w) for w in _WORDS.findall(line)]
+        directives.append(Directive(words[0].lower(), words[1:], file, number, "/".join(stack)))
+    return directives
+
+
+_HAPROXY_SECTIONS = ("global", "defaults", "frontend", "backend", "listen", "resolvers", "peers", "userlist", "program")
+
+
+def _parse_haproxy(text: str, file: str) -> List[Directive]:
+    directives, section = [], ""
+    for number, line in _logical_lines(text):
+        words = [_unquote(w) for w in _WORDS.findall(line)]
+        if words[0].lower() in _HAPROXY_SECTIONS:
+            section = " ".join(words)
+            continue
+        directives.append(Directive(words[0].lower(), words[1:], file, number, section))
+        # bind/server 줄 안의 옵션(ciphers, curves, sigalgs ...)도 개별 지시어로 펼칩니다.
+        if words[0].lower() in ("bind", "server", "default-server"):
+            for index, word in enumerate(words[:-1]):
+                if word.lower() in ("ciphers", "ciphersuites", "curves", "sigalgs", "client-sigalgs"):
+                    directives.append(Directive(f"{words[0].lower()}.{word.lower()}", [words[index + 1]], file, number, section))
+    return directives
+
+
+def _parse_sshd(text: str, file: str) -> List[Directive]:
+    directives, context = [], ""
+    for number, line in _logical_lines(text):
+        key, _, value = _split_keyword(line)
+        if key.lower() in ("match", "host"):
+            context = f"{key} {value}"
+        directives.append(Directive(key.lower(), [_unquote(w) for w in _WORDS.findall(value)], file, number, context))
+    return directives
+
+
+def _split_keyword(line: str) -> Tuple[str, str, str]:
+    match = re.match(r"(\S+?)(\s*=\s*|\s+)(.*)$", line)
+    if not match:
+        return line, "", ""
+    return match.group(1), match.group(2), match.group(3)
+
+
+def _parse_openssl(text: str, file: str) -> List[Directive]:
+    directives, section = [], "default"
+    for number, line in _logical_lines(text):
+        header = re.match(r"\[\s*([^\]]+?)\s*\]$", line)
+        if header:
+            section = header.group(1)
+            continue
+        include = re.match(r"\.include\s*=?\s*(.+)$", line)
+        if include:
+            directives.append(Directive("include", [include.group(1).strip()], file, number, section))
+            continue
+        key, _, value = line.partition("=")
+        value = value.split("#", 1)[0].strip()
+        directives.append(Directive(key.strip().lower(), [_unquote(value)] if value else [], file, number, section))
+    return directives
+
+
+_PARSERS = {
+    "nginx": _parse_nginx,
+    "apache": _parse_apache,
+    "haproxy": _parse_haproxy,
+    "sshd": _parse_sshd,
+    "openssl": _parse_openssl,
+}
+
+_INCLUDE_DIRECTIVES = {"include", "includeoptional"}
+
+
+# --- 지시어 규칙 ---
+# 방언별 지시어 → 규칙. 값이 "prefixed"이면 첫 인자가 하위 명령(SSLOpenSSLConfCmd Curves ...)입니다.
+_RULES: Dict[str, Dict[str, str]] = {
+    "nginx": {
+        "ssl_ciphers": "cipher_string", "proxy_ssl_ciphers": "cipher_string", "grpc_ssl_ciphers": "cipher_string",
+        "ssl_ecdh_curve": "groups", "ssl_dhparam": "dhparam", "ssl_conf_command": "prefixed",
+        "proxy_ssl_conf_command": "prefixed",
+    },
+    "apache": {
+        "sslciphersuite": "apache_cipher_suite", "sslproxyciphersuite": "apache_cipher_suite",
+        "sslopensslconfcmd": "prefixed", "ssldhparametersfile": "dhparam",
+    },
+    "haproxy": {
+        "ssl-default-bind-ciphers": "cipher_string", "ssl-default-server-ciphers": "cipher_string",
+        "ssl-default-bind-ciphersuites": "tls13_suites", "ssl-default-server-ciphersuites": "tls13_suites",
+        "ssl-default-bind-curves": "groups", "ssl-default-server-curves": "groups",
+        "ssl-default-bind-sigalgs": "sigalgs", "ssl-default-server-sigalgs": "sigalgs",
+        "ssl-dh-param-file": "dhparam",
+        "bind.ciphers": "cipher_string", "server.ciphers": "cipher_string", "default-server.ciphers": "cipher_string",
+        "bind.ciphersuites": "tls13_suites", "bind.curves": "groups", "server.curves": "groups",
+        "bind.sigalgs": "sigalgs", "bind.client-sigalgs": "sigalgs", "server.sigalgs": "sigalgs",
+    },
+    "sshd": {
+        "kexalgorithms": "ssh_kex", "hostkeyalgorithms": "ssh_sig", "pubkeyacceptedalgorithms": "ssh_sig",
+        "pubkeyacceptedkeytypes": "ssh_sig", "hostbasedacceptedalgorithms": "ssh_sig",
+        "casignaturealgorithms": "ssh_sig", "hostkey": "ssh_hostkey_file",
+    },
+    "openssl": {
+        "cipherstring": "cipher_string", "ciphersuites": "tls13_suites", "groups": "groups", "curves": "groups",
+        "signaturealgorithms": "sigalgs", "clientsignaturealgorithms": "sigalgs", "default_md": "digest",
+        "default_bits": "keygen_bits",
+    },
+}
+# SSLOpenSSLConfCmd / ssl_conf_command 하위 명령
+_CONF_COMMANDS = {
+    "ciphersuites": "tls13_suites", "cipherstring": "cipher_string", "groups": "groups", "curves": "groups",
+    "signaturealgorithms": "sigalgs", "clientsignaturealgorithms": "sigalgs", "dhparameters": "dhparam",
+}
+
+# OpenSSH 9.9 기본 알고리즘 (+, -, ^ 접두 문법 처리용)
+_SSH_DEFAULTS = {
+    "ssh_kex": ["mlkem768x25519-sha256", "sntrup761x25519-sha512", "sntrup761x25519-sha512@openssh.com",
+                "curve25519-sha256", "curve25519-sha256@libssh.org", "ecdh-sha2-nistp256", "ecdh-sha2-nistp384",
+                "ecdh-sha2-nistp521", "diffie-hellman-group-exchange-sha256", "diffie-hellman-group16-sha512",
+                "diffie-hellman-group18-sha512", "diffie-hellman-group14-sha256"],
+    "ssh_sig": ["ssh-ed25519", "ecdsa-sha2-nistp256", "ecdsa-sha2-nistp384", "ecdsa-sha2-nistp521",
+                "sk-ssh-ed25519@openssh.com", "sk-ecdsa-sha2-nistp256@openssh.com", "rsa-sha2-512", "rsa-sha2-256"],
+}
+# 암호 문자열 지시어를 생략했을 때 서버가 쓰는 값 (nginx ssl_ciphers 기본값, Apache 2.4 mod_ssl 기본값, HAProxy는 OpenSSL 기본값)
+_TLS_DEFAULT_CIPHERS = {
+    "nginx": ("ssl_ciphers", "HIGH:!aNULL:!MD5"),
+    "apache": ("sslciphersuite", "DEFAULT:!aNULL:!eNULL"),
+    "haproxy": ("ssl-default-bind-ciphers", "DEFAULT"),
+}
+_LIST_SPLIT = re.compile(r"[\s:,]+")
+# 서명/키 교환 역할 (분류 요약용)
+_ROLE = {"cipher_string": "cipher_suite", "groups": "key_exchange", "dhparam": "key_exchange", "ssh_kex": "key_exchange",
+         "sigalgs": "signature", "ssh_sig": "signature", "ssh_hostkey_file": "signature", "keygen_bits": "signature"}
+_SIGALG_CURVE = re.compile(r"^(ecdsa_)?(secp\d+r1|prime256v1|P-\d+)", re.IGNORECASE)
+
+
+class ServerConfigScan:
+    """서버 설정 파일 묶음의 규칙 기반 분석 결과입니다."""
+
+    def __init__(self):
+        self.dialects: Counter = Counter()
+        self.files: List[str] = []
+        self.directives = 0
+        self.findings: List[Dict[str, Any]] = []
+        self.notes: List[str] = []
+        self.unresolved_includes: List[str] = []
+
+    def classification(self) -> Dict[str, str]:
+        """키 교환과 서명 각각을 non-PQC / hybrid-PQC / mixed / pqc / not-configured 로 분류합니다."""
+        result = {}
+        for role in ("key_exchange", "signature"):
+            statuses = {
+                f["status"] for f in self.findings
+                if f.get("role") == role or (f.get("role") == "cipher_suite")
+            }
+            if not statuses:
+                result[role] = "not-configured"
+            elif statuses == {"classical"}:
+                result[role] = "non-PQC"
+            elif "classical" in statuses:
+                result[role] = "mixed (PQC + classical fallback)"
+            elif "hybrid" in statuses:
+                result[role] = "hybrid-PQC"
+            else:
+                result[role] = "pqc"
+        return result
+
+
+def scan_server_configs(files: Dict[str, bytes]) -> Optional[ServerConfigScan]:
+    """
+    {경로: 내용} 묶음에서 서버 설정 파일을 찾아 분석합니다. 다른 파일이 include하는 파일은
+    진입점으로 따로 분석하지 않고 include한 위치에서 펼칩니다. 서버 설정이 하나도 없으면 None.
+    """
+    dialects = {path: detect_dialect(path, content) for path, content in files.items()}
+    candidates = sorted(path for path, dialect in dialects.items() if dialect)
+    if not candidates:
+        return None
+
+    parsed: Dict[str, List[Directive]] = {}
+    for path in candidates:
+        text = files[path].decode("utf-8", errors="replace")
+        parsed[path] = _PARSERS[dialects[path]](text, path)
+
+    # include 대상은 진입점에서 제외합니다.
+    included: Set[str] = set()
+    for path in candidates:
+        for directive in parsed[path]:
+            if directive.name in _INCLUDE_DIRECTIVES and directive.args:
+                included.update(_resolve_include(directive.args[0], path, files))
+
+    scan = ServerConfigScan()
+    for path in candidates:
+        if path in included:
+            continue
+        dialect = dialects[path]
+        scan.dialects[dialect] += 1
+        first_seen: Dict[str, Directive] = {}
+        applied: List[Directive] = []
+        for directive in _expand(path, dialect, parsed, files, scan, stack=[]):
+            scan.directives += 1
+            # OpenSSH는 같은 키워드가 여러 번 나오면 처음 값만 사용합니다 (Match 블록 밖 기준).
+            if dialect == "sshd" and not directive.context and directive.name in _RULES["sshd"] and directive.name != "hostkey":
+                earlier = first_seen.setdefault(directive.name, directive)
+                if earlier is not directive:
+                    scan.notes.append(
+                        f"{directive.file}:{directive.line} {directive.name} 무시됨 "
+                        f"(sshd는 처음 값 사용: {earlier.file}:{earlier.line})"
+                    )
+                    continue
+            applied.append(directive)
+            _apply_rules(dialect, directive, scan)
+        # 지시어가 없다고 안전한 것이 아니라 서버 기본값(고전 RSA/ECDHE 등)으로 동작하므로 기본값을 판정에 넣습니다.
+        for directive in _default_directives(dialect, path, applied):
+            scan.notes.append(f"{path}: {directive.name} 미설정 → 기본값 적용")
+            _apply_rules(dialect, directive, scan)
+    return scan
+
+
+def _default_directives(dialect: str, path: str, directives: List[Directive]) -> List[Directive]:
+    """진입점 하나(include 포함)에서 생략된 암호 지시어를 서버 기본값으로 채운 지시어 목록을 돌려줍니다."""
+    names = {directive.name for directive in directives}
+    if dialect == "sshd":
+        defaults = []
+        if "kexalgorithms" not in names:
+            defaults.append(Directive("kexalgorithms", list(_SSH_DEFAULTS["ssh_kex"]), path, 0, "", True))
+        # HostKey 파일을 지정하지 않으면 sshd는 기본 호스트 키(RSA/ECDSA/Ed25519)를 모두 읽습니다.
+        if not names & {"hostkeyalgorithms", "hostkey"}:
+            defaults.append(Directive("hostkeyalgorithms", list(_SSH_DEFAULTS["ssh_sig"]), path, 0, "", True))
+        return defaults
+    if dialect not in _TLS_DEFAULT_CIPHERS or not _tls_enabled(dialect, directives):
+        return []
+    if any(_rule_of(dialect, directive)[0] == "cipher_string" for directive in directives):
+        return []
+    name, cipher_string = _TLS_DEFAULT_CIPHERS[dialect]
+    return [Directive(name, [cipher_string], path, 0, "", True)]
+
+
+def _tls_enabled(dialect: str, directives: List[Directive]) -> bool:
+    """TLS를 켜는 지시어(listen ... ssl, SSLEngine on, bind ... ssl 등)가 있는지 봅니다."""
+    for directive in directives:
+        args = [arg.lower() for arg in directive.args]
+        if dialect == "nginx" and (directive.name == "listen" and "ssl" in args or directive.name == "ssl_certificate"
+                                   or directive.name == "ssl" and args[:1] == ["on"]):
+            return True
+        if dialect == "apache" and (directive.name == "sslengine" and args[:1] == ["on"]
+                                    or directive.name == "sslcertificatefile"):
+            return True
+        if dialect == "haproxy" and directive.name == "bind" and "ssl" in args:
+            return True
+    return False
+
+
+def scan_server_config_blob(blob: bytes, layout: List[Tuple[str, int]]) -> Optional[ServerConfigScan]:
+    """run_cpu_bound용 진입점. 이어 붙인 파일 내용(blob)을 layout(경로, 길이) 순서대로 나눠 scan_server_configs를 실행합니다."""
+    files, offset = {}, 0
+    for path, size in layout:
+        files[path] = blob[offset:offset + size]
+        offset += size
+    return scan_server_configs(files)
+
+
+def _expand(path: str, dialect: str, parsed: Dict[str, List[Directive]], files: Dict[str, bytes],
+            scan: ServerConfigScan, stack: List[str]):
+    """include를 펼치면서 지시어를 순서대로 돌려줍니다. 순환 include와 과도한 깊이는 건너뜁니다."""
+    if path in stack or len(stack) >= MAX_INCLUDE_DEPTH:
+        scan.notes.append(f"include 순환 또는 깊이 초과: {' → '.join(stack + [path])}")
+        return
+    scan.files.append(path)
+    directives = parsed.get(path)
+    if directives is None:
+        directives = _PARSERS[dialect](files[path].decode("utf-8", errors="replace"), path)
+    for directive in directives:
+        if directive.name in _INCLUDE_DIRECTIVES and directive.args:
+            targets = _resolve_include(directive.args[0], path, files)
+            if not targets:
+                scan.unresolved_includes.append(f"{path}:{directive.line} {directive.args[0]}")
+            for target in targets:
+                yield from _expand(target, dialect, parsed, files, scan, stack + [path])
+        else:
+            yield directive
+
+
+def _resolve_include(pattern: str, including: str, files: Dict[str, bytes]) -> List[str]:
+    """
+    include 경로(글롭 가능)를 업로드된 파일 경로와 맞춥니다.
+    상대 경로는 include한 파일의 디렉터리 기준으로, 절대 경로는 뒤쪽 경로 성분이 가장 길게 일치하는 파일로 찾습니다.
+    (예: /etc/nginx/conf.d/*.conf → 압축 파일 안의 nginx/conf.d/a.conf)
+    """
+    pattern = pattern.strip().strip('"\'')
+    relative = posixpath.normpath(posixpath.join(posixpath.dirname(including), pattern))
+    matches = sorted(path for path in files if fnmatch.fnmatchcase(path, relative) and path != including)
+    if matches or not pattern.startswith("/") and "/" not in pattern:
+        return matches
+    parts = pattern.lstrip("/").split("/")
+    # 마지막 성분만 남는 경우(예: "*.conf")는 너무 넓어서 시도하지 않습니다.
+    for start in range(len(parts) - 1):
+        suffix = "/".join(parts[start:])
+        matches = sorted(
+            path for path in files
+            if path != including and (fnmatch.fnmatchcase(path, suffix) or fnmatch.fnmatchcase(path, "*/" + suffix))
+        )
+        if matches:
+            return matches
+    return []
+
+
+def _rule_of(dialect: str, directive: Directive) -> Tuple[Optional[str], List[str]]:
+    """지시어에 적용할 규칙과 인자. 하위 명령(SSLOpenSSLConfCmd Curves ...)과 SSLCipherSuite 접두를 풀어 줍니다."""
+    rule = _RULES[dialect].get(directive.name)
+    args = directive.args
+    if rule == "prefixed":
+        if len(args) < 2:
+            return None, []
+        rule, args = _CONF_COMMANDS.get(args[0].lower()), args[1:]
+    if rule == "apache_cipher_suite" and args:
+        # SSLCipherSuite [TLSv1.3|SSL] cipher-spec
+        if args[0].upper() == "TLSV1.3":
+            return "tls13_suites", args[1:]
+        rule, args = "cipher_string", args[1:] if args[0].upper() == "SSL" and len(args) > 1 else args
+    return rule, args
+
+
+def _apply_rules(dialect: str, directive: Directive, scan: ServerConfigScan) -> None:
+    rule, args = _rule_of(dialect, directive)
+    if rule is None or not args:
+        return
+
+    location = f"{directive.file} (미설정 → 기본값)" if directive.default else f"{directive.file}:{directive.line}"
+    label = f"{directive.name} {' '.join(args)}"
+    role = _ROLE.get(rule)
+
+    if rule == "cipher_string":
+        suites, unknown = expand_cipher_string(":".join(args))
+        if unknown:
+            scan.notes.append(f"{location} 해석하지 못한 암호 문자열 용어: {', '.join(unknown)}")
+        families: Counter = Counter()
+        for suite in suites:
+            families.update(suite_families(suite))
+        if families:
+            summary = ", ".join(f"{family}×{count}" for family, count in families.most_common())
+            finding = make_finding(label, location, dialect + "." + directive.name, families=families.keys(),
+                                   role=role, suites=len(suites), detail=f"{len(suites)}개 암호군으로 펼쳐짐: {summary}")
+            _add(scan, finding)
+        return
+
+    if rule == "tls13_suites":
+        return  # TLS 1.3 암호군은 대칭 암호만 지정합니다.
+
+    if rule == "dhparam":
+        _add(scan, make_finding(label, location, dialect + "." + directive.name, families=["DH"], role=role,
+                                detail="유한체 DH 파라미터가 설정되어 DHE 키 교환이 활성화됩니다."))
+        return
+
+    if rule == "digest":
+        scan.notes.append(f"{location} {label} (해시 알고리즘: Shor 알고리즘 대상 아님)")
+        return
+
+    if rule == "keygen_bits":
+        # openssl req의 기본 키 타입은 RSA입니다.
+        _add(scan, make_finding(label, location, dialect + "." + directive.name, families=["RSA"], role=role,
+                                key_size=args[0]))
+        return
+
+    if rule == "ssh_hostkey_file":
+        name = posixpath.basename(args[0]).lower()
+        for marker, family in (("ed25519", "EdDSA"), ("ecdsa", "ECDSA"), ("rsa", "RSA"), ("dsa", "DSA")):
+            if marker in name:
+                _add(scan, make_finding(label, location, "sshd.hostkey", families=[family], role=role))
+                break
+        return
+
+    values = [v for v in _LIST_SPLIT.split(" ".join(args)) if v]
+    if rule in ("ssh_kex", "ssh_sig"):
+        values = _apply_ssh_modifiers(rule, values)
+    for value in values:
+        families = None
+        # 곡선 이름만 있는 값(prime256v1, P-384)은 지시어 역할로 계열을 정합니다.
+        if rule in ("groups", "sigalgs") and not canonical_families(value) and _SIGALG_CURVE.match(value):
+            families = ["ECDH"] if rule == "groups" else ["ECDSA"]
+        _add(scan, make_finding(value, location, dialect + "." + directive.name, families=families, role=role))
+
+
+def _apply_ssh_modifiers(rule: str, values: List[str]) -> List[str]:
+    """OpenSSH의 +(기본값에 추가), -(기본값에서 제거), ^(기본값 앞에 추가) 문법을 처리합니다."""
+    if not values or values[0][0] not in "+-^":
+        return values
+    modifier, first = values[0][0], values[0][1:]
+    listed = [first] + values[1:]
+    defaults = list(_SSH_DEFAULTS[rule])
+    if modifier == "+":
+        return defaults + [v for v in listed if v not in defaults]
+    if modifier == "^":
+        return listed + [v for v in defaults if v not in listed]
+    return [v for v in defaults if not any(fnmatch.fnmatchcase(v, pattern) for pattern in listed)]
+
+
+def _add(scan: ServerConfigScan, finding: Optional[Dict[str, Any]]) -> None:
+    if finding:
+        scan.findings.append(finding)
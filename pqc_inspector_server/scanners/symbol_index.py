@@ -0,0 +1,538 @@
+# File: pqc_inspector_server/scanners/symbol_index.py
+# 🗂️ 프로젝트(압축 파일/저장소) 전체의 함수 정의와 호출 지점을 색인해, 암호 래퍼를 파일 경계를 넘어 추적합니다.
+# - 파일마다 정의(함수/메서드), 정의 안의 호출, import 별칭을 뽑은 요약을 만듭니다.
+#   Python은 AST, 그 밖의 언어는 주석/문자열을 지운 텍스트에서 정의 헤더와 중괄호 범위를 정규식으로 찾습니다.
+# - 정의 안에서 공개키 API(rsa.encrypt, KeyPairGenerator.getInstance("RSA") 등)를 직접 호출하거나 자체 구현 암호
+#   (custom_crypto)가 있으면 시작점으로 삼고, 호출 그래프를 거꾸로 따라 호출자에게 알고리즘 계열을 전이합니다.
+#   utils/crypto.py의 secure_send()가 rsa.encrypt를 감싸면 secure_send를 부르는 모든 파일이 LLM 호출 없이 표시됩니다.
+# - 파일 요약 추출은 프로세스 풀에서 병렬로 실행하고, 색인은 저장소 스냅샷(경로 + 내용 해시) 단위 JSON으로 저장해 재사용합니다.
+
+import ast
+import bisect
+import hashlib
+import json
+import logging
+import os
+import posixpath
+import re
+from collections import defaultdict
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..core.process_pool import discard_process_pool, get_process_pool, resolve_workers
+from .custom_crypto import MAX_SOURCE_BYTES, scan_custom_crypto, source_language
+from .findings import make_finding
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올려서 예전 스냅샷 파일을 무시합니다.
+INDEX_VERSION = 1
+# 이보다 소스 파일이 적으면 현재 프로세스에서 처리합니다. 배치 하나의 최대 크기는 JAR 분석과 같습니다.
+PARALLEL_MIN_FILES = 64
+BATCH_BYTES = 1024 * 1024
+# 호출 체인 근거를 몇 단계까지 보여 줄지
+MAX_CHAIN = 6
+
+MODULE_SCOPE = "<module>"
+
+# 호출 이름/문자열 인자를 단어로 나눈 뒤 이 표로 고전 공개키 계열을 찾습니다. ("traversal"의 "rsa" 같은 부분 일치 방지)
+_FAMILY_TOKENS = {
+    **dict.fromkeys(("rsa", "pkcs1", "oaep", "rs256", "rs384", "rs512", "ps256", "ps384", "ps512"), "RSA"),
+    **dict.fromkeys(("dsa", "dss"), "DSA"),
+    **dict.fromkeys(("ecdsa", "ec", "ecc", "elliptic", "es256", "es384", "es512", "nistp256", "nistp384", "nistp521"), "ECDSA"),
+    **dict.fromkeys(("ed25519", "ed448", "eddsa"), "EdDSA"),
+    **dict.fromkeys(("ecdh", "ecdhe", "x25519", "x448", "curve25519"), "ECDH"),
+    **dict.fromkeys(("dh", "dhe", "diffie", "ffdhe"), "DH"),
+}
+_CURVE_LITERALS = {"secp256r1", "secp384r1", "secp521r1", "prime256v1", "secp256k1", "p-256", "p-384", "p-521"}
+_PQC_PREFIXES = {"ml", "slh"}   # ML-DSA, SLH-DSA의 "dsa"는 고전 DSA가 아닙니다.
+_TOKEN = re.compile(r"[A-Z]+\d*(?=[A-Z][a-z])|[A-Z]?[a-z]+\d*|[A-Z]+\d*|\d+")
+_LITERAL = re.compile(r"^[\w./+-]{2,48}$")
+
+# 이름만으로 프로젝트 전체에서 찾을 때 제외하는 흔한 함수 이름 (라이브러리 메서드와 구분할 수 없음)
+_COMMON_NAMES = {
+    "main", "run", "get", "set", "put", "post", "init", "close", "open", "read", "write", "send", "recv", "update",
+    "process", "handle", "execute", "start", "stop", "call", "load", "save", "encode", "decode", "encrypt", "decrypt",
+    "sign", "verify", "new", "create", "build", "parse", "format", "append", "add", "remove", "delete", "copy", "join",
+    "split", "toString", "equals", "hashCode", "print", "log", "size", "keys", "values", "items", "next", "apply",
+    "test", "setUp", "generate", "String", "len", "str", "int", "dict", "list",
+}
+
+# --- 정규식 기반 추출 (Python 이외) ---
+_KEYWORDS = {
+    "if", "for", "while", "switch", "catch", "return", "sizeof", "typeof", "function", "func", "fn", "fun", "new",
+    "else", "elif", "do", "try", "throw", "await", "yield", "super", "this", "when", "match", "case", "defer", "go",
+    "select", "delete", "instanceof", "in", "of", "synchronized", "using", "lock", "foreach", "unless", "until",
+    "def", "class", "struct", "enum", "interface", "impl", "where", "loop", "assert", "print",
+}
+_DEF_PATTERNS = (
+    re.compile(r"\b(?:func|function|fun|fn)\s*\*?\s+(?:\([^)]*\)\s*)?([A-Za-z_$][\w$]*)"),
+    re.compile(r"^[ \t]*(?:[\w$<>\[\],.*&:?]+[ \t]+)*([A-Za-z_$][\w$]*)[ \t]*\([^;{}()]*(?:\([^()]*\)[^;{}()]*)*\)"
+               r"[^;{}=()]*\{", re.MULTILINE),
+    re.compile(r"\b([A-Za-z_$][\w$]*)\s*[:=]\s*(?:async\s+)?(?:function\b|\([^()]*\)\s*=>|[A-Za-z_$][\w$]*\s*=>)"),
+    re.compile(r"^[ \t]*def\s+(?:self\.)?([A-Za-z_]\w*[?!]?)", re.MULTILINE),
+)
+_CALL = re.compile(r"([A-Za-z_$][\w$]*(?:\s*(?:\.|->|::)\s*[A-Za-z_$][\w$]*)*)\s*\(")
+_STRING = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`[^`]*`')
+_CHAR = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n]){0,2}\'')
+_COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+_HASH_COMMENT = re.compile(r"#[^\n]*")
+
+
+def call_families(callee: str, literals: Iterable[str] = ()) -> Set[str]:
+    """호출 이름과 문자열 인자에서 고전 공개키 계열을 찾습니다."""
+    families = _token_families(callee)
+    for literal in literals:
+        if literal.lower() in _CURVE_LITERALS:
+            families.add("ECDSA")
+        elif _LITERAL.match(literal):
+            families |= _token_families(literal)
+    return families
+
+
+def _token_families(name: str) -> Set[str]:
+    families = set()
+    tokens = [token.lower() for token in _TOKEN.findall(name)]
+    for position, token in enumerate(tokens):
+        family = _FAMILY_TOKENS.get(token)
+        if family and not (family == "DSA" and position and tokens[position - 1] in _PQC_PREFIXES):
+            families.add(family)
+    return families
+
+
+# --- 파일 요약 추출 ---
+
+def extract_symbols(content: bytes, path: str) -> Optional[Dict[str, Any]]:
+    """
+    소스 파일 하나의 요약을 만듭니다. 소스 파일이 아니면 None.
+    definitions[0]은 모듈 최상위 코드이며, 호출은 가장 안쪽 정의에 속합니다.
+    """
+    language = source_language(path)
+    if language is None or len(content) > MAX_SOURCE_BYTES:
+        return None
+    text = content.decode("utf-8", errors="replace")
+    summary: Dict[str, Any] = {
+        "language": language, "module": _module_name(path), "imports": {},
+        "definitions": [{"name": MODULE_SCOPE, "line": 1, "families": [], "evidence": []}], "calls": [],
+    }
+    tree = None
+    if language == "python":
+        try:
+            tree = ast.parse(text)
+        except (SyntaxError, ValueError):
+            pass
+    if tree is not None:
+        spans = _python_symbols(tree, summary)
+    else:
+        spans = _text_symbols(text, language, summary)
+
+    # 직접 사용: 공개키 API 호출과 자체 구현 암호가 있는 정의가 전이의 시작점입니다.
+    definitions = summary["definitions"]
+    for call in summary["calls"]:
+        families = call_families(call["callee"], call.pop("literals"))
+        if families:
+            _add_direct(definitions[call["caller"]], families, f"{call['callee']}() ({path}:{call['line']})")
+    for finding in scan_custom_crypto(content, path, tree):
+        line = int(finding["location"].rsplit(":", 1)[1])
+        _add_direct(definitions[_innermost(spans, line)], finding["families"], f"{finding['value']} ({finding['location']})")
+    return summary
+
+
+def _add_direct(definition: Dict[str, Any], families: Iterable[str], evidence: str) -> None:
+    definition["families"] = sorted(set(definition["families"]) | set(families))
+    if len(definition["evidence"]) < 3:
+        definition["evidence"].append(evidence)
+
+
+def _module_name(path: str) -> str:
+    stem = posixpath.splitext(path.replace("\\", "/"))[0]
+    if stem.endswith("/__init__"):
+        stem = stem[:-len("/__init__")]
+    return stem.strip("/").replace("/", ".")
+
+
+def _innermost(spans: List[Tuple[int, int, int]], line: int) -> int:
+    """(시작 줄, 끝 줄, 정의 번호) 목록에서 line을 포함하는 가장 안쪽 정의. 없으면 모듈(0)."""
+    owner = 0
+    for start, end, index in spans:
+        if start > line:
+            break
+        if line <= end:
+            owner = index
+    return owner
+
+
+def _python_symbols(tree: ast.AST, summary: Dict[str, Any]) -> List[Tuple[int, int, int]]:
+    definitions, calls, imports = summary["definitions"], summary["calls"], summary["imports"]
+    package = summary["module"].rsplit(".", 1)[0] if "." in summary["module"] else ""
+    spans = []
+    stack: List[Tuple[ast.AST, int, str]] = [(tree, 0, "")]
+    while stack:
+        node, owner, prefix = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = prefix + child.name
+                definitions.append({"name": name, "line": child.lineno, "families": [], "evidence": []})
+                spans.append((child.lineno, child.end_lineno or child.lineno, len(definitions) - 1))
+                stack.append((child, len(definitions) - 1, name + "."))
+                continue
+            if isinstance(child, ast.ClassDef):
+                stack.append((child, owner, prefix + child.name + "."))
+                continue
+            if isinstance(child, ast.Call):
+                callee = _dotted(child.func)
+                if callee:
+                    literals = [arg.value for arg in list(child.args) + [kw.value for kw in child.keywords]
+                                if isinstance(arg, ast.Constant) and isinstance(arg.value, str)]
+                    calls.append({"caller": owner, "callee": callee, "line": child.lineno, "literals": literals})
+            elif isinstance(child, ast.Import):
+                for alias in child.names:
+                    if alias.asname:
+                        imports[alias.asname] = alias.name
+                    else:
+                        head = alias.name.split(".")[0]
+                        imports[head] = head
+            elif isinstance(child, ast.ImportFrom):
+                base = child.module or ""
+                if child.level:
+                    parts = package.split(".") if package else []
+                    parent = ".".join(parts[:len(parts) - child.level + 1]) if child.level <= len(parts) + 1 else ""
+                    base = ".".join(filter(None, [parent, child.module]))
+                for alias in child.names:
+                    if alias.name != "*":
+                        imports[alias.asname or alias.name] = ".".join(filter(None, [base, alias.name]))
+            stack.append((child, owner, prefix))
+    spans.sort()
+    return spans
+
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted(node.value)
+        return f"{base}.{node.attr}" if base else f"?.{node.attr}"
+    return None
+
+
+def _blank(match: "re.Match") -> str:
+    return re.sub(r"[^\n]", " ", match.group(0))
+
+
+def _text_symbols(text: str, language: str, summary: Dict[str, Any]) -> List[Tuple[int, int, int]]:
+    """주석과 문자열을 같은 길이의 공백으로 지운 텍스트에서 정의와 호출을 찾습니다. (위치/줄 번호 유지)"""
+    strings = _CHAR if language in ("c", "java", "go", "rust", "csharp", "swift") else _STRING
+    literal_spans = [(m.start(), m.group(0)[1:-1]) for m in strings.finditer(text)]
+    stripped = strings.sub(_blank, text)
+    stripped = _COMMENT.sub(_blank, stripped)
+    if language in ("ruby", "php"):
+        stripped = _HASH_COMMENT.sub(_blank, stripped)
+    line_starts = [0] + [m.end() for m in re.finditer(r"\n", stripped)]
+
+    def line_of(position: int) -> int:
+        return bisect.bisect_right(line_starts, position)
+
+    definitions = summary["definitions"]
+    headers: Dict[int, Tuple[str, int]] = {}
+    for pattern in _DEF_PATTERNS:
+        for match in pattern.finditer(stripped):
+            name = match.group(1)
+            if name not in _KEYWORDS and match.start(1) not in headers:
+                headers[match.start(1)] = (name, match.end())
+    spans = []
+    ranges: List[Tuple[int, int, int]] = []
+    for start in sorted(headers):
+        name, header_end = headers[start]
+        body_start = stripped.find("{", start, header_end + 200)
+        if body_start < 0 or ";" in stripped[header_end:body_start]:
+            end = stripped.find("\n", header_end)   # 중괄호 없는 화살표 함수/루비 한 줄 정의
+            end = len(stripped) if end < 0 else end
+        else:
+            end = _matching_brace(stripped, body_start)
+        definitions.append({"name": name, "line": line_of(start), "families": [], "evidence": []})
+        ranges.append((start, end, len(definitions) - 1))
+        spans.append((line_of(start), line_of(end), len(definitions) - 1))
+
+    calls = summary["calls"]
+    open_ranges: List[Tuple[int, int, int]] = []
+    pending = iter(ranges)
+    next_range = next(pending, None)
+    for match in _CALL.finditer(stripped):
+        callee = re.sub(r"\s+", "", match.group(1)).replace("->", ".").replace("::", ".")
+        position = match.start(1)
+        last = callee.rsplit(".", 1)[-1]
+        if last in _KEYWORDS or match.end(1) - len(last) in headers:
+            continue
+        while next_range is not None and next_range[0] <= position:
+            open_ranges.append(next_range)
+            next_range = next(pending, None)
+        while open_ranges and open_ranges[-1][1] < position:
+            open_ranges.pop()
+        owner = open_ranges[-1][2] if open_ranges else 0
+        line = line_of(position)
+        # 같은 줄에서 호출 뒤에 오는 문자열 인자 (getInstance("RSA"), generateKeyPairSync('rsa'))
+        line_end = line_starts[line] if line < len(line_starts) else len(text)
+        index = bisect.bisect_left(literal_spans, (match.end(),))
+        literals = []
+        while index < len(literal_spans) and literal_spans[index][0] < line_end:
+            literals.append(literal_spans[index][1])
+            index += 1
+        calls.append({"caller": owner, "callee": callee, "line": line, "literals": literals})
+    spans.sort()
+    return spans
+
+
+def _matching_brace(text: str, start: int) -> int:
+    depth = 0
+    for match in re.compile(r"[{}]").finditer(text, start):
+        depth += 1 if match.group(0) == "{" else -1
+        if depth == 0:
+            return match.start()
+    return len(text)
+
+
+def extract_batch(batch: List[Tuple[str, bytes]]) -> Dict[str, Dict[str, Any]]:
+    """프로세스 풀 작업 단위: 파일 여러 개의 요약을 반환합니다."""
+    summaries = {}
+    for path, content in batch:
+        summary = extract_symbols(content, path)
+        if summary is not None:
+            summaries[path] = summary
+    return summaries
+
+
+# --- 프로젝트 색인 ---
+
+class ProjectIndex:
+    """프로젝트 전체 정의/호출 색인과 암호 사용 전이 결과입니다."""
+
+    def __init__(self, files: Dict[str, Dict[str, Any]], snapshot: str):
+        self.files = files
+        self.snapshot = snapshot
+        self.loaded = False    # 저장된 스냅샷에서 읽었는지
+        self.reused = 0        # 기준 스냅샷에서 요약을 그대로 가져온 파일 수
+        # 모듈 경로의 모든 접미사 → 파일 경로 (src/utils/crypto.py는 utils.crypto, crypto로도 찾음). 모호하면 None
+        self._modules: Dict[str, Optional[str]] = {}
+        self._by_name: Dict[str, Dict[str, List[int]]] = {}
+        self._unique: Dict[Tuple[str, str], Optional[Tuple[str, int]]] = {}
+        for path, summary in files.items():
+            parts = summary["module"].split(".")
+            for i in range(len(parts)):
+                suffix = ".".join(parts[i:])
+                self._modules[suffix] = path if self._modules.get(suffix, path) == path else None
+            names = self._by_name.setdefault(path, defaultdict(list))
+            for index, definition in enumerate(summary["definitions"][1:], 1):
+                names[definition["name"]].append(index)
+                simple = definition["name"].rsplit(".", 1)[-1]
+                key = (summary["language"], simple)
+                self._unique[key] = (path, index) if key not in self._unique else None
+        self.tainted: Dict[Tuple[str, int], Tuple[Set[str], Optional[Tuple[str, int]]]] = {}
+        self.direct_paths: Set[str] = set()
+        self._propagate()
+
+    @property
+    def definitions(self) -> int:
+        return sum(len(summary["definitions"]) - 1 for summary in self.files.values())
+
+    def _resolve(self, path: str, caller: int, callee: str) -> Optional[Tuple[str, int]]:
+        summary = self.files[path]
+        names = self._by_name[path]
+        parts = callee.split(".")
+        if summary["language"] == "python":
+            if parts[0] in ("self", "cls") and len(parts) == 2:
+                method = f"{summary['definitions'][caller]['name'].rsplit('.', 1)[0]}.{parts[1]}"
+                if names.get(method):
+                    return path, names[method][0]
+            elif parts[0] in summary["imports"]:
+                target = ".".join([summary["imports"][parts[0]]] + parts[1:]).split(".")
+                for split in range(len(target) - 1, 0, -1):
+                    module_path = self._modules.get(".".join(target[:split]))
+                    if module_path:
+                        found = self._by_name[module_path].get(".".join(target[split:]))
+                        return (module_path, found[0]) if found else None
+        if len(parts) == 1 and names.get(parts[0]):
+            return path, names[parts[0]][0]
+        simple = parts[-1]
+        if simple in _COMMON_NAMES or len(simple) < 3 or simple.startswith("__"):
+            return None
+        return self._unique.get((summary["language"], simple))
+
+    def _propagate(self) -> None:
+        callers: Dict[Tuple[str, int], List[Tuple[str, int]]] = defaultdict(list)
+        self._resolved: Dict[str, List[Tuple[Dict[str, Any], Tuple[str, int]]]] = defaultdict(list)
+        queue: List[Tuple[str, int]] = []
+        for path, summary in self.files.items():
+            for index, definition in enumerate(summary["definitions"]):
+                if definition["families"]:
+                    self.tainted[(path, index)] = (set(definition["families"]), None)
+                    self.direct_paths.add(path)
+                    queue.append((path, index))
+            for call in summary["calls"]:
+                target = self._resolve(path, call["caller"], call["callee"])
+                if target is not None and target != (path, call["caller"]):
+                    callers[target].append((path, call["caller"]))
+                    self._resolved[path].append((call, target))
+        # 계열 집합이 커질 때만 다시 전파하므로 계열 수(최대 6) × 정의 수 안에 끝납니다.
+        while queue:
+            key = queue.pop()
+            families = self.tainted[key][0]
+            for caller in callers.get(key, ()):
+                known, via = self.tainted.get(caller, (set(), key))
+                if not families <= known:
+                    self.tainted[caller] = (known | families, via)
+                    queue.append(caller)
+
+    def _display(self, key: Tuple[str, int]) -> str:
+        path, index = key
+        definition = self.files[path]["definitions"][index]
+        return f"{path}:{definition['name']}"
+
+    def chain(self, key: Tuple[str, int]) -> List[str]:
+        """key 정의에서 직접 암호를 사용하는 정의까지의 호출 경로와 그 근거."""
+        hops = []
+        seen = set()
+        while key is not None and key not in seen and len(hops) < MAX_CHAIN:
+            seen.add(key)
+            hops.append(self._display(key))
+            families, via = self.tainted[key]
+            if via is None:
+                path, index = key
+                hops.extend(self.files[path]["definitions"][index]["evidence"][:1])
+            key = via
+        return hops
+
+    def findings(self, path: str) -> List[Dict[str, Any]]:
+        """path 파일에서 암호 사용이 전이된 정의를 부르는 호출 지점들."""
+        findings = []
+        seen = set()
+        for call, target in self._resolved.get(path, ()):
+            if target not in self.tainted or (call["line"], target) in seen:
+                continue
+            seen.add((call["line"], target))
+            finding = make_finding(
+                f"{call['callee']}() → {self._display(target)}", f"{path}:{call['line']}", "symbol_index",
+                families=self.tainted[target][0], chain=self.chain(target), cross_file=target[0] != path,
+            )
+            if finding is not None:
+                findings.append(finding)
+        return findings
+
+    def affected_paths(self) -> Set[str]:
+        return {path for path, resolved in self._resolved.items() if any(t in self.tainted for _, t in resolved)}
+
+    def summary(self) -> List[str]:
+        wrappers = len(self.tainted) - sum(1 for _, via in self.tainted.values() if via is None)
+        return [
+            f"심볼 색인: 소스 {len(self.files)}개, 정의 {self.definitions}개, 스냅샷 {self.snapshot[:12]}"
+            + (" (저장된 색인 재사용)" if self.loaded else f" (이전 스냅샷 요약 {self.reused}개 재사용)" if self.reused else ""),
+            f"암호 직접 사용 파일 {len(self.direct_paths)}개, 암호를 전이받은 래퍼/호출자 정의 {wrappers}개, "
+            f"영향받는 호출 파일 {len(self.affected_paths())}개",
+        ]
+
+
+def snapshot_id(files: Dict[str, bytes]) -> str:
+    """소스 파일 경로와 내용 해시로 저장소 스냅샷을 식별합니다."""
+    return _snapshot_id({path: hashlib.sha256(content).hexdigest() for path, content in files.items()})
+
+
+def _snapshot_id(digests: Dict[str, str]) -> str:
+    digest = hashlib.sha256(f"v{INDEX_VERSION}\n".encode())
+    for path in sorted(digests):
+        digest.update(f"{path}\0{digests[path]}\n".encode("utf-8", errors="replace"))
+    return digest.hexdigest()
+
+
+def build_project_index(files: Dict[str, bytes], workers: int = 0, cache_dir: str = "",
+                        base_snapshot: str = "") -> ProjectIndex:
+    """
+    {경로: 내용} 묶음으로 프로젝트 색인을 만듭니다. 동기 함수이므로 이벤트 루프에서는 스레드로 실행하세요.
+    cache_dir가 있으면 같은 스냅샷의 색인을 읽어 재사용하고, 새로 만든 색인은 저장합니다.
+    base_snapshot(이전 커밋의 스냅샷)을 주면 내용이 같은 파일의 요약은 다시 추출하지 않습니다.
+    """
+    sources = {path: content for path, content in files.items()
+               if source_language(path) and len(content) <= MAX_SOURCE_BYTES}
+    digests = {path: hashlib.sha256(content).hexdigest() for path, content in sources.items()}
+    snapshot = _snapshot_id(digests)
+    cached = _load(cache_dir, snapshot)
+    if cached is not None:
+        index = ProjectIndex(cached, snapshot)
+        index.loaded = True
+        return index
+
+    base = (_load(cache_dir, base_snapshot) if base_snapshot else None) or {}
+    summaries = {path: base[path] for path in sources if base.get(path, {}).get("sha256") == digests[path]}
+    pending = {path: content for path, content in sources.items() if path not in summaries}
+    workers = resolve_workers(workers)
+    if workers <= 1 or len(pending) < PARALLEL_MIN_FILES:
+        extracted = extract_batch(list(pending.items()))
+    else:
+        extracted = {}
+        pool = get_process_pool(workers)
+        in_flight: List[Future] = []
+        try:
+            for batch in _iter_batches(pending):
+                in_flight.append(pool.submit(extract_batch, batch))
+                if len(in_flight) >= workers * 2:
+                    extracted.update(in_flight.pop(0).result())
+            for future in in_flight:
+                extracted.update(future.result())
+        except BrokenProcessPool:
+            discard_process_pool(workers, pool)
+            raise
+    for path, summary in extracted.items():
+        summary["sha256"] = digests[path]
+        summaries[path] = summary
+    index = ProjectIndex(summaries, snapshot)
+    index.reused = len(summaries) - len(extracted)
+    _save(cache_dir, snapshot, summaries)
+    logger.debug("심볼 색인 생성", extra={
+        "files": len(summaries), "extracted": len(extracted), "definitions": index.definitions, "workers": workers,
+    })
+    return index
+
+
+def _iter_batches(sources: Dict[str, bytes]) -> Iterator[List[Tuple[str, bytes]]]:
+    batch: List[Tuple[str, bytes]] = []
+    size = 0
+    for path, content in sources.items():
+        batch.append((path, content))
+        size += len(content)
+        if size >= BATCH_BYTES:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def _snapshot_path(cache_dir: str, snapshot: str) -> str:
+    return os.path.join(cache_dir, f"{snapshot}.json")
+
+
+def _load(cache_dir: str, snapshot: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    if not cache_dir:
+        return None
+    try:
+        with open(_snapshot_path(cache_dir, snapshot), encoding="utf-8") as handle:
+            stored = json.load(handle)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("저장된 심볼 색인 읽기 실패", extra={"snapshot": snapshot, "error": str(e)})
+        return None
+    if stored.get("version") != INDEX_VERSION:
+        return None
+    return stored["files"]
+
+
+def _save(cache_dir: str, snapshot: str, summaries: Dict[str, Dict[str, Any]]) -> None:
+    if not cache_dir:
+        return
+    path = _snapshot_path(cache_dir, snapshot)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as handle:
+            json.dump({"version": INDEX_VERSION, "snapshot": snapshot, "files": summaries}, handle, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        logger.warning("심볼 색인 저장 실패", extra={"snapshot": snapshot, "error": str(e)})
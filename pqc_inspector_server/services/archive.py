@@ -0,0 +1,93 @@
+# File: pqc_inspector_server/services/archive.py
+# 📦 업로드된 압축 파일(zip, tar, tar.gz/bz2/xz, 단일 .gz)을 메모리에서 안전하게 풀어 {경로: 내용} 딕셔너리로 만듭니다.
+# 경로 탐색(../), 심볼릭 링크, 압축 폭탄을 막기 위해 항목 수와 크기에 상한을 둡니다.
+
+import gzip
+import io
+import logging
+import posixpath
+import tarfile
+import zipfile
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMBERS = 10000
+MAX_MEMBER_BYTES = 64 * 1024 * 1024
+MAX_TOTAL_BYTES = 512 * 1024 * 1024
+
+
+def is_archive(content: bytes) -> bool:
+    """내용의 매직 바이트로 압축 파일 여부를 판단합니다."""
+    return (
+        content[:4] == b"PK\x03\x04"
+        or content[:2] == b"\x1f\x8b"
+        or content[257:262] == b"ustar"
+        or content[:3] == b"BZh"
+        or content[:6] == b"\xfd7zXZ\x00"
+    )
+
+
+def _safe_path(name: str) -> Optional[str]:
+    path = posixpath.normpath(name.replace("\\", "/")).lstrip("/")
+    if not path or path == "." or path.startswith("../") or path == "..":
+        return None
+    return path
+
+
+def read_archive(content: bytes, archive_name: str = "") -> Dict[str, bytes]:
+    """
+    압축 파일의 일반 파일 항목을 읽어 반환합니다. 압축 파일이 아니거나 손상되었으면 빈 딕셔너리를 반환합니다.
+    상한을 넘는 항목은 건너뜁니다.
+    """
+    files: Dict[str, bytes] = {}
+    total = 0
+
+    def _add(name: str, size: int, read) -> bool:
+        nonlocal total
+        path = _safe_path(name)
+        if path is None or size > MAX_MEMBER_BYTES:
+            return True
+        if len(files) >= MAX_MEMBERS or total + size > MAX_TOTAL_BYTES:
+            logger.warning("압축 파일 상한 초과, 나머지 항목 생략", extra={"archive": archive_name, "members": len(files)})
+            return False
+        data = read()
+        total += len(data)
+        files[path] = data
+        return True
+
+    try:
+        if content[:4] == b"PK\x03\x04":
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                for info in archive.infolist():
+                    if info.is_dir():
+                        continue
+                    if not _add(info.filename, info.file_size, lambda: archive.read(info)[:MAX_MEMBER_BYTES]):
+                        break
+            return files
+
+        try:
+            with tarfile.open(fileobj=io.BytesIO(content), mode="r:*") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue  # 디렉터리, 심볼릭/하드 링크, 장치 파일 제외
+                    extracted = archive.extractfile(member)
+                    if extracted is None:
+                        continue
+                    if not _add(member.name, member.size, lambda: extracted.read(MAX_MEMBER_BYTES)):
+                        break
+            return files
+        except tarfile.ReadError:
+            if content[:2] != b"\x1f\x8b":
+                return {}
+
+        # tar가 아닌 단일 gzip 파일 (예: access.log.gz)
+        with gzip.GzipFile(fileobj=io.BytesIO(content)) as single:
+            data = single.read(MAX_MEMBER_BYTES + 1)
+        if len(data) <= MAX_MEMBER_BYTES:
+            base = posixpath.basename(archive_name) or "content"
+            files[base[:-3] if base.endswith(".gz") else base] = data
+        return files
+    except (zipfile.BadZipFile, tarfile.TarError, OSError, EOFError) as e:
+        logger.warning("압축 파일 읽기 실패", extra={"archive": archive_name, "error": str(e)})
+        return {}
@@ -0,0 +1,83 @@
+# File: pqc_inspector_server/services/chunking.py
+# ✂️ 내용 기반 청크 분할(content-defined chunking)입니다.
+# 고정 길이로 자르면 앞부분에 한 줄만 추가해도 뒤의 모든 청크 경계가 밀리지만, 줄 해시의 롤링(Gear) 해시로
+# 경계를 정하면 경계가 주변 몇십 줄의 내용에만 의존하므로, 함수 하나를 고친 파일은 그 주변 청크만 달라집니다.
+# 청크별 LLM 분석 결과를 캐시해 재스캔 시 바뀐 청크만 모델에 보낼 수 있습니다.
+
+import hashlib
+import math
+from typing import List, Sequence, Tuple
+
+from ..scanners.prescan import relevance_score
+
+_MASK64 = (1 << 64) - 1
+# 경계 확률을 정할 때 가정하는 평균 줄 길이 (소스코드 기준)
+AVERAGE_LINE_CHARS = 40
+
+
+def _line_hash(line: str) -> int:
+    return int.from_bytes(hashlib.blake2b(line.encode("utf-8", errors="replace"), digest_size=8).digest(), "little")
+
+
+def content_defined_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    텍스트를 줄 단위로 나눕니다. 청크는 max_chars // 4 글자 이상 max_chars 글자 이하이고 평균 max_chars // 2 글자 정도이며,
+    창보다 긴 줄이 아니면 항상 줄 끝에서 끊습니다.
+    """
+    min_chars = max_chars // 4
+    lines_per_chunk = max(2, (max_chars // 2) // AVERAGE_LINE_CHARS)
+    bits = max(1, round(math.log2(lines_per_chunk)))
+    chunks: List[str] = []
+    current: List[str] = []
+    size = rolling = 0
+    for line in text.splitlines(keepends=True):
+        if current and size + len(line) > max_chars:
+            chunks.append("".join(current))
+            current, size = [], 0
+        while len(line) > max_chars:
+            chunks.append(line[:max_chars])
+            line = line[max_chars:]
+        if not line:
+            continue
+        current.append(line)
+        size += len(line)
+        # Gear 해시: 한 줄마다 한 비트씩 밀어 넣으므로 상위 비트는 최근 줄들의 내용으로만 정해집니다.
+        rolling = ((rolling << 1) + _line_hash(line)) & _MASK64
+        if size >= min_chars and rolling >> (64 - bits) == 0:
+            chunks.append("".join(current))
+            current, size = [], 0
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+def scored_chunks(content: bytes, max_chars: int) -> List[Tuple[str, int]]:
+    """
+    UTF-8 텍스트를 내용 기반 청크로 나누고 청크마다 암호 관련도 점수(scanners.prescan.relevance_score)를 붙입니다.
+    큰 파일은 수십 ms가 걸리므로 CPU 풀(run_cpu_bound)에서 실행합니다.
+    """
+    return [(chunk, relevance_score(chunk.encode("utf-8", errors="replace")))
+            for chunk in content_defined_chunks(content.decode("utf-8", errors="replace"), max_chars)]
+
+
+def group_chunks(chunks: Sequence[str], sizes: Sequence[int], limit: int, every: int) -> List[List[int]]:
+    """
+    이어지는 청크들을 창 하나에 limit(크기 합) 이하로 묶어 청크 번호 목록들을 반환합니다.
+    창은 청크 내용 해시로 평균 every개마다 닫으므로, 청크 하나를 고쳐도 그 청크가 속한 창만 달라지고
+    (크기 상한에 걸려 경계가 밀려도 다음 내용 경계에서 다시 맞춰짐) 나머지 창은 그대로여서 청크 캐시가 맞습니다.
+    """
+    groups: List[List[int]] = []
+    current: List[int] = []
+    used = 0
+    for index, (chunk, size) in enumerate(zip(chunks, sizes)):
+        if current and used + size > limit:
+            groups.append(current)
+            current, used = [], 0
+        current.append(index)
+        used += size
+        if _line_hash(chunk) % max(1, every) == 0:
+            groups.append(current)
+            current, used = [], 0
+    if current:
+        groups.append(current)
+    return groups
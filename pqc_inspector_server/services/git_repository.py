@@ -0,0 +1,91 @@
+# File: pqc_inspector_server/services/git_repository.py
+# 🌿 로컬 git 저장소(체크아웃 또는 bare)와 git 번들에서 커밋 트리와 blob을 읽습니다.
+# 작업 트리를 건드리지 않고 ls-tree / cat-file 같은 배관(plumbing) 명령만 사용합니다.
+# blob ID가 곧 내용 해시이므로, 이전 스캔과 비교할 때 파일을 읽지 않고도 변경 여부를 알 수 있습니다.
+
+import contextlib
+import logging
+import os
+import subprocess
+import tempfile
+from typing import Dict, Iterator, NamedTuple, Tuple
+
+from .archive import MAX_MEMBER_BYTES
+
+logger = logging.getLogger(__name__)
+
+GIT_TIMEOUT = 600
+
+
+class GitError(RuntimeError):
+    """git 명령이 실패했거나 저장소/ref를 찾을 수 없을 때 발생합니다."""
+
+
+class TreeEntry(NamedTuple):
+    blob: str
+    size: int
+
+
+def _git(git_dir: str, *args: str, stdin: bytes = b"") -> bytes:
+    try:
+        completed = subprocess.run(
+            ["git", "-C", git_dir, *args], input=stdin, capture_output=True, timeout=GIT_TIMEOUT, check=False
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise GitError(f"git {args[0]} 실행 실패: {e}") from e
+    if completed.returncode != 0:
+        raise GitError(f"git {args[0]} 실패: {completed.stderr.decode('utf-8', errors='replace').strip()}")
+    return completed.stdout
+
+
+def list_tree(git_dir: str, ref: str = "HEAD") -> Tuple[str, Dict[str, TreeEntry]]:
+    """
+    ref가 가리키는 커밋 ID와 {경로: (blob ID, 크기)}를 반환합니다.
+    심볼릭 링크, 서브모듈, 압축 파일 항목 상한보다 큰 파일은 제외합니다.
+    """
+    if not ref or ref.startswith("-"):
+        raise GitError(f"잘못된 ref: {ref!r}")
+    commit = _git(git_dir, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}").decode().strip()
+    entries: Dict[str, TreeEntry] = {}
+    for record in _git(git_dir, "ls-tree", "-r", "-z", "-l", "--full-tree", commit).split(b"\0"):
+        if not record:
+            continue
+        meta, _, path = record.partition(b"\t")
+        mode, kind, blob, size = meta.split()
+        if kind != b"blob" or mode == b"120000" or not size.isdigit() or int(size) > MAX_MEMBER_BYTES:
+            continue
+        entries[path.decode("utf-8", errors="replace")] = TreeEntry(blob.decode("ascii"), int(size))
+    return commit, entries
+
+
+def read_blobs(git_dir: str, entries: Dict[str, TreeEntry]) -> Dict[str, bytes]:
+    """cat-file --batch 한 번으로 여러 blob을 읽어 {경로: 내용}을 반환합니다. 같은 내용의 파일은 한 번만 읽습니다."""
+    blobs = list(dict.fromkeys(entry.blob for entry in entries.values()))
+    if not blobs:
+        return {}
+    output = _git(git_dir, "cat-file", "--batch", stdin=("\n".join(blobs) + "\n").encode("ascii"))
+    contents: Dict[str, bytes] = {}
+    offset = 0
+    for _ in blobs:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].split()
+        offset = header_end + 1
+        if len(header) != 3:   # "<id> missing"
+            continue
+        size = int(header[2])
+        contents[header[0].decode("ascii")] = output[offset:offset + size]
+        offset += size + 1
+    return {path: contents[entry.blob] for path, entry in entries.items() if entry.blob in contents}
+
+
+@contextlib.contextmanager
+def bundle_repository(bundle: bytes) -> Iterator[str]:
+    """git 번들을 임시 bare 저장소로 풀어 그 경로를 돌려줍니다. 블록을 벗어나면 삭제합니다."""
+    with tempfile.TemporaryDirectory(prefix="pqc-bundle-") as workdir:
+        bundle_path = os.path.join(workdir, "repository.bundle")
+        with open(bundle_path, "wb") as handle:
+            handle.write(bundle)
+        repository = os.path.join(workdir, "repository.git")
+        _git(workdir, "clone", "--bare", "--quiet", bundle_path, repository)
+        logger.debug("git 번들 풀기 완료", extra={"bundle_bytes": len(bundle)})
+        yield repository
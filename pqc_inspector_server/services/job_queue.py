@@ -0,0 +1,238 @@
+# File: pqc_inspector_server/services/job_queue.py
+# 📮 API 노드와 워커 프로세스 사이의 작업 대기열입니다. 외부 브로커 없이 SQLite 파일 하나로 동작합니다.
+# API 노드는 작업(파일 내용 포함)을 넣기만 하고, 워커(python main.py worker)가 작업을 임대(lease)해 분석합니다.
+# 워커는 처리하는 동안 임대를 연장하며, 임대 시간 안에 완료/연장되지 않은 작업(워커 종료 등)은 다른 워커가 다시 가져갑니다.
+# WAL 대신 롤백 저널을 쓰므로, 파일 잠금을 지원하는 공유 파일시스템에 두면 여러 머신의 워커가 같은 대기열을 쓸 수 있습니다.
+#
+# 작업마다 lane(interactive/bulk)을 저장하고, 워커는 LLM 스케줄러(services/scheduler.py)와 같은 가상 시간 방식으로
+# lane 가중치에 비례해 번갈아 작업을 꺼냅니다. lane별 가상 시간은 대기열 파일에 두므로 모든 워커가 같은 순서를 따릅니다.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# 완료된 작업의 처리 시간이 없을 때 쓰는 작업 1건의 예상 처리 시간(초)과, 평균을 낼 최근 완료 작업 수
+INITIAL_JOB_SECONDS = 30.0
+_RECENT_JOBS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    options TEXT NOT NULL,
+    payload BLOB,
+    lane TEXT NOT NULL DEFAULT 'interactive',
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, id);
+CREATE INDEX IF NOT EXISTS jobs_task ON jobs (task_id);
+CREATE TABLE IF NOT EXISTS lane_clock (
+    lane TEXT PRIMARY KEY,           -- ''은 전체 가상 시각
+    virtual_time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS saved_results (
+    task_id TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    saved_at REAL NOT NULL,
+    PRIMARY KEY (task_id, file_name)
+);
+"""
+
+
+class Job(NamedTuple):
+    id: int
+    task_id: str
+    kind: str               # "file" | "project" | "repository"
+    filename: str
+    options: Dict[str, Any]
+    payload: Optional[bytes]
+    attempts: int
+
+
+class JobQueue:
+    """
+    작업 상태: queued → running → done | failed
+    실패하거나 임대가 만료된 작업은 max_attempts번까지 다시 queued로 돌아갑니다.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        # lane 열이 없던 이전 버전의 대기열 파일은 열을 추가합니다. (기존 작업은 interactive)
+        if "lane" not in {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}:
+            connection.execute("ALTER TABLE jobs ADD COLUMN lane TEXT NOT NULL DEFAULT 'interactive'")
+        connection.execute("CREATE INDEX IF NOT EXISTS jobs_lane ON jobs (status, lane, id)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 사이에 공유할 수 없으므로 (asyncio.to_thread의 작업 스레드마다) 따로 엽니다.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    def enqueue(self, kind: str, task_id: str, filename: str, payload: Optional[bytes] = None,
+                options: Optional[Dict[str, Any]] = None, lane: str = "interactive") -> int:
+        cursor = self._connection().execute(
+            "INSERT INTO jobs (task_id, kind, filename, options, payload, lane, enqueued_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (task_id, kind, filename, json.dumps(options or {}, ensure_ascii=False), payload, lane, time.time()),
+        )
+        return cursor.lastrowid
+
+    def claim(self, worker: str, lease_seconds: float, weights: Optional[Dict[str, float]] = None) -> Optional[Job]:
+        """
+        대기 중이거나 임대가 만료된 작업을 임대합니다. 없으면 None.
+        작업이 있는 lane 중 가상 시간이 가장 작은 lane의 가장 오래된 작업을 꺼내고, 그 lane의 가상 시간을 1/가중치만큼 늘립니다.
+        weights에 없는 lane은 가장 낮은 가중치로, weights가 없으면 모든 lane을 같은 가중치로 번갈아 꺼냅니다.
+        """
+        weights = weights or {}
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            clocks = dict(connection.execute("SELECT lane, virtual_time FROM lane_clock").fetchall())
+            clock = clocks.get("", 0.0)
+            while True:
+                candidates = connection.execute(
+                    "SELECT lane, MIN(id) FROM jobs WHERE status = 'queued' "
+                    "OR (status = 'running' AND lease_until < ?) GROUP BY lane", (now,)
+                ).fetchall()
+                if not candidates:
+                    connection.execute("COMMIT")
+                    return None
+                # 쉬던 lane은 현재 가상 시각부터 다시 셉니다. (같으면 오래된 작업 먼저)
+                lane, job_id = min(candidates, key=lambda row: (max(clocks.get(row[0], 0.0), clock), row[1]))
+                status, attempts = connection.execute("SELECT status, attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                if status == "running" and attempts >= self.max_attempts:
+                    # 처리하던 워커가 매번 죽는 작업은 더 이상 나눠 주지 않습니다.
+                    connection.execute(
+                        "UPDATE jobs SET status = 'failed', payload = NULL, finished_at = ?, "
+                        "error = '임대 만료 (워커 비정상 종료)' WHERE id = ?", (now, job_id)
+                    )
+                    logger.error("작업 재시도 횟수 초과", extra={"job_id": job_id, "attempts": attempts})
+                    continue
+                if status == "running":
+                    logger.warning("임대가 만료된 작업을 다시 가져옴", extra={"job_id": job_id, "attempts": attempts})
+                connection.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, lease_until = ?, "
+                    "started_at = ? WHERE id = ?", (worker, now + lease_seconds, now, job_id)
+                )
+                start = max(clocks.get(lane, 0.0), clock)
+                weight = weights.get(lane) or min(weights.values(), default=1.0)
+                connection.executemany(
+                    "INSERT OR REPLACE INTO lane_clock (lane, virtual_time) VALUES (?, ?)",
+                    (("", start), (lane, start + 1.0 / weight)),
+                )
+                row = connection.execute(
+                    "SELECT id, task_id, kind, filename, options, payload, attempts FROM jobs WHERE id = ?", (job_id,)
+                ).fetchone()
+                connection.execute("COMMIT")
+                return Job(row[0], row[1], row[2], row[3], json.loads(row[4]), row[5], row[6])
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def extend(self, job_id: int, worker: str, lease_seconds: float) -> bool:
+        """임대를 연장합니다. 이미 다른 워커가 가져간 작업이면 False."""
+        cursor = self._connection().execute(
+            "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time() + lease_seconds, job_id, worker),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str) -> None:
+        self._connection().execute(
+            "UPDATE jobs SET status = 'done', payload = NULL, finished_at = ? WHERE id = ? AND worker = ?",
+            (time.time(), job_id, worker),
+        )
+
+    def fail(self, job_id: int, worker: str, error: str) -> None:
+        """재시도 횟수가 남았으면 다시 대기열에 넣고, 아니면 실패로 끝냅니다."""
+        self._connection().execute(
+            "UPDATE jobs SET status = CASE WHEN attempts < ? THEN 'queued' ELSE 'failed' END, "
+            "payload = CASE WHEN attempts < ? THEN payload END, worker = NULL, lease_until = NULL, "
+            "finished_at = ?, error = ? WHERE id = ? AND worker = ?",
+            (self.max_attempts, self.max_attempts, time.time(), error, job_id, worker),
+        )
+
+    def estimated_wait(self, lane: str, weights: Optional[Dict[str, float]] = None) -> float:
+        """
+        지금 lane에 작업 하나를 넣으면 워커가 꺼내기까지 걸릴 예상 시간(초)입니다. API 서버의 429 판정에 씁니다.
+        같은 lane의 대기 작업은 모두 앞서고, 다른 lane의 대기 작업은 가중치 비율만큼만 앞선다고 봅니다(FairScheduler와 같은 방식).
+        처리 속도는 처리 중인 작업 수(워커 슬롯)와 최근 완료 작업의 평균 처리 시간으로 어림합니다.
+        """
+        weights = weights or {}
+        connection = self._connection()
+
+        def weight(name: str) -> float:
+            return weights.get(name) or min(weights.values(), default=1.0)
+
+        backlog = connection.execute("SELECT lane, COUNT(*) FROM jobs WHERE status = 'queued' GROUP BY lane").fetchall()
+        ahead = sum(count if other == lane else count * min(1.0, weight(other) / weight(lane)) for other, count in backlog)
+        if ahead == 0:
+            return 0.0
+        running = connection.execute(
+            "SELECT COUNT(*) FROM jobs WHERE status = 'running' AND lease_until >= ?", (time.time(),)
+        ).fetchone()[0]
+        average = connection.execute(
+            "SELECT AVG(finished_at - started_at) FROM (SELECT finished_at, started_at FROM jobs "
+            "WHERE status = 'done' ORDER BY id DESC LIMIT ?)", (_RECENT_JOBS,)
+        ).fetchone()[0]
+        return ahead / max(1, running) * (average or INITIAL_JOB_SECONDS)
+
+    def is_saved(self, task_id: str, file_name: str) -> bool:
+        """작업의 파일 결과를 이미 외부 API에 저장했는지 확인합니다. 재시도한 작업이 같은 결과를 다시 저장하지 않게 합니다."""
+        row = self._connection().execute(
+            "SELECT 1 FROM saved_results WHERE task_id = ? AND file_name = ?", (task_id, file_name)
+        ).fetchone()
+        return row is not None
+
+    def mark_saved(self, task_id: str, file_name: str) -> None:
+        self._connection().execute(
+            "INSERT OR IGNORE INTO saved_results (task_id, file_name, saved_at) VALUES (?, ?, ?)",
+            (task_id, file_name, time.time()),
+        )
+
+    def status(self, task_id: str) -> List[Dict[str, Any]]:
+        rows = self._connection().execute(
+            "SELECT id, kind, filename, status, attempts, worker, enqueued_at, started_at, finished_at, error "
+            "FROM jobs WHERE task_id = ? ORDER BY id", (task_id,)
+        ).fetchall()
+        keys = ("job_id", "kind", "filename", "status", "attempts", "worker", "enqueued_at", "started_at", "finished_at", "error")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue(path: str, max_attempts: int) -> JobQueue:
+    """프로세스 전체가 공유하는 대기열. 경로가 바뀌면 새로 엽니다."""
+    global _queue
+    with _queue_lock:
+        if _queue is None or _queue.path != path:
+            _queue = JobQueue(path, max_attempts)
+        _queue.max_attempts = max_attempts
+        return _queue
@@ -1,85 +1,332 @@
 # File: pqc_inspector_server/services/ollama_service.py
 # 🤖 Ollama AI 모델과 통신하는 서비스입니다.
+# 여러 추론 서버(OLLAMA_HOSTS)를 풀로 묶어, 요청한 모델을 가진 서버 중 처리 중인 요청이 가장 적은 곳으로 보냅니다.
+# 연속으로 실패한 서버는 회로를 열어 잠시 제외하고(수동 상태 확인), 주기적으로 모델 목록을 조회해 상태와 보유 모델을
+# 갱신합니다(능동 상태 확인). OLLAMA_HEDGE_DELAY초 안에 응답이 없으면 다른 서버에도 같은 요청을 보내 먼저 온 응답을 씁니다.
 
+import asyncio
+import logging
+import time
+import httpx
 import ollama
-from typing import Dict, Any, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 from ..core.config import settings
+from ..core.telemetry import record_failure, record_llm_usage, registry
+from .scheduler import current_client, current_lane, get_llm_scheduler
+
+logger = logging.getLogger(__name__)
+
+# Ollama는 마지막 사용 후 기본 5분 동안 모델을 메모리에 올려 둡니다. 그 안에 같은 모델을 쓴 서버는 모델 로딩 없이 바로 응답합니다.
+WARM_SECONDS = 300.0
+HEALTH_TIMEOUT = 5.0
+# num_ctx를 지정하지 않았을 때 Ollama가 쓰는 기본 컨텍스트 길이(토큰)
+DEFAULT_NUM_CTX = 2048
+# 모델 어휘(토크나이저)까지 포함한 모델 정보는 수 MB라 상태 확인보다 넉넉히 기다립니다.
+MODEL_INFO_TIMEOUT = 60.0
+
+
+def _model_key(name: str) -> str:
+    """태그가 없는 모델 이름은 Ollama와 같이 :latest로 봅니다."""
+    return name if ":" in name else f"{name}:latest"
+
+
+class OllamaHost:
+    """추론 서버 하나의 상태 (보유 모델, 처리 중인 요청 수, 연속 실패 수, 회로 상태, 응답 시간 EWMA)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.client = ollama.AsyncClient(host=url)
+        self.models: Optional[Set[str]] = None   # 아직 조회하지 못했으면 None (모든 모델의 후보)
+        self.warm: Dict[str, float] = {}         # 모델 → 마지막 응답 시각
+        self.in_flight = 0
+        self.failures = 0
+        self.open_until = 0.0
+        self.checked_at = 0.0
+        self.latency = 0.0
+
+    def available(self, now: float) -> bool:
+        return now >= self.open_until
+
+    def has_model(self, model: str) -> bool:
+        return self.models is None or _model_key(model) in self.models
+
+    def is_warm(self, model: str, now: float) -> bool:
+        return now - self.warm.get(_model_key(model), -WARM_SECONDS) < WARM_SECONDS
+
+    def release(self) -> None:
+        self.in_flight -= 1
+
+    def record_success(self, model: str, duration: float) -> None:
+        if self.failures >= settings.OLLAMA_FAILURE_THRESHOLD:
+            logger.info("Ollama 서버 회로 닫힘", extra={"host": self.url})
+        self.failures = 0
+        self.open_until = 0.0
+        self.warm[_model_key(model)] = time.monotonic()
+        self.latency = duration if not self.latency else 0.8 * self.latency + 0.2 * duration
+        registry.set_gauge("pqc_llm_host_up", 1, host=self.url)
+
+    def record_failure(self, error: BaseException) -> None:
+        self.failures += 1
+        if self.failures >= settings.OLLAMA_FAILURE_THRESHOLD:
+            # 회로가 열린 뒤 대기 시간이 지나면 요청 하나를 다시 보내 보고, 또 실패하면 곧바로 다시 엽니다.
+            self.open_until = time.monotonic() + settings.OLLAMA_CIRCUIT_COOLDOWN
+            registry.set_gauge("pqc_llm_host_up", 0, host=self.url)
+            logger.warning("Ollama 서버 회로 열림", extra={
+                "host": self.url, "failures": self.failures, "cooldown_s": settings.OLLAMA_CIRCUIT_COOLDOWN,
+                "error": str(error),
+            })
+
+
+class OllamaHostPool:
+    def __init__(self, urls: Sequence[str], loop: asyncio.AbstractEventLoop):
+        self.urls = tuple(urls)
+        self.loop = loop
+        self.hosts = [OllamaHost(url) for url in self.urls]
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def select(self, model: str, exclude: Sequence[OllamaHost] = ()) -> Optional[OllamaHost]:
+        """
+        회로가 닫힌 서버 중 모델을 가진 서버를 고르고, 그중 처리 중인 요청이 가장 적은 서버를 반환합니다.
+        최근 같은 모델을 처리한 서버는 모델 로딩이 없으므로 요청 하나만큼 덜 바쁜 것으로 칩니다.
+        """
+        now = time.monotonic()
+        candidates = [host for host in self.hosts if host not in exclude and host.available(now)]
+        candidates = [host for host in candidates if host.has_model(model)] or candidates
+        if not candidates:
+            if exclude:
+                return None
+            # 모든 서버의 회로가 열려 있으면 가장 먼저 닫힐 서버로 시도합니다.
+            candidates = [min(self.hosts, key=lambda host: host.open_until)]
+        return min(candidates, key=lambda host: (host.in_flight + (0 if host.is_warm(model, now) else 1), host.latency))
+
+    def maybe_refresh(self) -> None:
+        """확인한 지 OLLAMA_HEALTH_INTERVAL이 지난 서버의 모델 목록을 백그라운드에서 다시 조회합니다."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        now = time.monotonic()
+        stale = [host for host in self.hosts if now - host.checked_at >= settings.OLLAMA_HEALTH_INTERVAL]
+        if stale:
+            self._refresh_task = asyncio.create_task(self._refresh(stale))
+
+    async def refresh_all(self) -> None:
+        await self._refresh(self.hosts)
+
+    async def _refresh(self, hosts: List[OllamaHost]) -> None:
+        await asyncio.gather(*(self._refresh_host(host) for host in hosts))
+
+    async def _refresh_host(self, host: OllamaHost) -> None:
+        host.checked_at = time.monotonic()
+        try:
+            response = await asyncio.wait_for(host.client.list(), HEALTH_TIMEOUT)
+        except Exception as e:
+            # 상태 조회에 실패한 서버는 연속 실패 수와 관계없이 곧바로 회로를 엽니다.
+            host.failures = max(host.failures, settings.OLLAMA_FAILURE_THRESHOLD - 1)
+            host.record_failure(e)
+            return
+        host.models = {_model_key(m.get("model") or m.get("name")) for m in response["models"]}
+        if host.failures >= settings.OLLAMA_FAILURE_THRESHOLD:
+            logger.info("Ollama 서버 상태 확인 성공, 회로 닫힘", extra={"host": host.url})
+        host.failures = 0
+        host.open_until = 0.0
+        registry.set_gauge("pqc_llm_host_up", 1, host=host.url)
+        logger.debug("Ollama 서버 모델 목록 갱신", extra={"host": host.url, "models": sorted(host.models)})
+
+
+_pool: Optional[OllamaHostPool] = None
+
+
+def get_host_pool() -> OllamaHostPool:
+    """
+    프로세스 전체가 공유하는 서버 풀. 서버별 처리 중인 요청 수를 모든 에이전트가 함께 봐야 하므로 하나만 둡니다.
+    비동기 클라이언트는 이벤트 루프에 묶이므로 루프나 서버 목록 설정이 바뀌면 새로 만듭니다.
+    """
+    global _pool
+    urls = tuple(url.strip().rstrip("/") for url in (settings.OLLAMA_HOSTS or settings.OLLAMA_BASE_URL).split(",") if url.strip())
+    loop = asyncio.get_running_loop()
+    if _pool is None or _pool.urls != urls or _pool.loop is not loop:
+        _pool = OllamaHostPool(urls, loop)
+    return _pool
+
 
 class OllamaService:
     def __init__(self):
-        self.base_url = settings.OLLAMA_BASE_URL
-        self.client = ollama.Client(host=self.base_url)
-        print("OllamaService가 초기화되었습니다.")
+        logger.debug("OllamaService가 초기화되었습니다.")
 
-    async def generate_response(self, model: str, prompt: str, system_prompt: Optional[str] = None) -> Dict[str, Any]:
+    async def generate_response(self, model: str, prompt: str, system_prompt: Optional[str] = None,
+                                prompt_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
         Ollama 모델에게 프롬프트를 전송하고 응답을 받습니다.
+        LLM 슬롯은 현재 작업의 lane/클라이언트별 가중 공정 큐에서 받습니다 (services/scheduler.py).
+        prompt_tokens는 호출자가 모델 토크나이저로 센 프롬프트 토큰 수로, 로그에만 씁니다.
         """
-        try:
-            print(f"🤖 Ollama 모델 호출 시작: {model}")
-            print(f"📝 프롬프트 길이: {len(prompt)} characters")
-            
-            messages = []
-            
-            if system_prompt:
-                messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-                print(f"📋 시스템 프롬프트 길이: {len(system_prompt)} characters")
-            
+        async with get_llm_scheduler().slot(current_lane.get(), current_client.get()):
+            return await self._generate_response(model, prompt, system_prompt, prompt_tokens)
+
+    async def _generate_response(self, model: str, prompt: str, system_prompt: Optional[str],
+                                 prompt_tokens: Optional[int]) -> Dict[str, Any]:
+        """서버 풀에서 고른 서버가 실패하면 다른 서버로 한 번 더 시도합니다."""
+        messages = []
+
+        if system_prompt:
             messages.append({
-                "role": "user", 
-                "content": prompt
+                "role": "system",
+                "content": system_prompt
+            })
+
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+
+        logger.debug("Ollama 모델 호출 시작", extra={
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "num_ctx": settings.LLM_NUM_CTX or DEFAULT_NUM_CTX,
+        })
+        pool = get_host_pool()
+        pool.maybe_refresh()
+        tried: List[OllamaHost] = []
+        error: Optional[BaseException] = None
+        for _ in range(min(2, len(pool.hosts))):
+            host = pool.select(model, exclude=tried)
+            if host is None:
+                break
+            tried.append(host)
+            try:
+                host, response, duration = await self._chat_hedged(pool, host, model, messages, tried)
+            except Exception as e:
+                error = e
+                record_failure("llm", e)
+                logger.warning("Ollama 모델 호출 실패", extra={"model": model, "host": host.url, "error": str(e)})
+                continue
+
+            record_llm_usage(model, response, duration)
+            num_ctx = settings.LLM_NUM_CTX or DEFAULT_NUM_CTX
+            if response.get('prompt_eval_count', 0) >= num_ctx:
+                # Ollama는 컨텍스트를 넘는 프롬프트의 앞부분을 말없이 잘라냅니다.
+                logger.warning("프롬프트가 컨텍스트 길이를 넘어 잘림", extra={
+                    "model": model, "prompt_eval_count": response.get('prompt_eval_count'), "num_ctx": num_ctx,
+                    "prompt_tokens": prompt_tokens,
+                })
+            logger.info("Ollama 응답 완료", extra={
+                "model": model,
+                "host": host.url,
+                "duration_s": round(duration, 3),
+                "response_chars": len(response['message']['content']),
+                "prompt_eval_count": response.get('prompt_eval_count', 0),
+                "eval_count": response.get('eval_count', 0),
             })
 
-            import time
-            start_time = time.time()
-            
-            response = self.client.chat(
-                model=model,
-                messages=messages,
-                stream=False
-            )
-            
-            end_time = time.time()
-            duration = end_time - start_time
-            
-            print(f"✅ Ollama 응답 완료: {duration:.2f}초")
-            print(f"📊 응답 길이: {len(response['message']['content'])} characters")
-            print(f"🧠 토큰 사용량 - 입력: {response.get('prompt_eval_count', 0)}, 출력: {response.get('eval_count', 0)}")
-            
             return {
                 "success": True,
                 "content": response['message']['content'],
                 "model": model,
+                "host": host.url,
                 "total_duration": response.get('total_duration', 0),
                 "load_duration": response.get('load_duration', 0),
                 "prompt_eval_count": response.get('prompt_eval_count', 0),
                 "eval_count": response.get('eval_count', 0),
                 "actual_duration": duration
             }
-            
-        except Exception as e:
-            print(f"❌ Ollama 모델 '{model}' 호출 중 오류 발생: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "content": None
-            }
 
-    async def check_model_availability(self, model: str) -> bool:
+        logger.error("Ollama 모델 호출 중 오류 발생", extra={"model": model, "error": str(error)})
+        return {
+            "success": False,
+            "error": str(error),
+            "content": None
+        }
+
+    async def _chat_hedged(self, pool: OllamaHostPool, host: OllamaHost, model: str, messages: List[Dict[str, str]],
+                           tried: List[OllamaHost]) -> Tuple[OllamaHost, Any, float]:
+        """
+        OLLAMA_HEDGE_DELAY가 지나도록 응답이 없으면 다른 서버에도 같은 요청을 보내고, 먼저 성공한 응답을 반환합니다.
+        늦은 쪽 요청은 취소합니다.
+        """
+        tasks = [self._start_chat(host, model, messages)]
+        try:
+            delay = settings.OLLAMA_HEDGE_DELAY
+            if delay > 0:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                backup = None if done else pool.select(model, exclude=tried)
+                if backup is not None:
+                    tried.append(backup)
+                    registry.inc("pqc_llm_hedged_requests_total", model=model)
+                    logger.debug("느린 요청을 다른 서버에도 전송", extra={"model": model, "host": host.url, "backup": backup.url})
+                    tasks.append(self._start_chat(backup, model, messages))
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def _start_chat(self, host: OllamaHost, model: str, messages: List[Dict[str, str]]) -> asyncio.Task:
         """
-        지정된 모델이 사용 가능한지 확인합니다.
+        요청을 태스크로 시작합니다. 처리 중인 요청 수는 태스크가 실행되기 전에 올려야 동시에 들어온 다음 요청이
+        같은 서버를 고르지 않고, 시작 전에 취소되어도 줄어들도록 완료 콜백에서 내립니다.
         """
+        host.in_flight += 1
+        task = asyncio.create_task(self._chat(host, model, messages))
+        task.add_done_callback(lambda _: host.release())
+        return task
+
+    async def _chat(self, host: OllamaHost, model: str, messages: List[Dict[str, str]]) -> Tuple[OllamaHost, Any, float]:
+        start_time = time.perf_counter()
         try:
-            models = self.client.list()
-            available_models = [m['name'] for m in models['models']]
-            return model in available_models
+            options = {"num_ctx": settings.LLM_NUM_CTX} if settings.LLM_NUM_CTX > 0 else None
+            response = await host.client.chat(model=model, messages=messages, stream=False, options=options)
+        except ollama.ResponseError as e:
+            if e.status_code != 404:
+                host.record_failure(e)
+            elif host.models is not None:
+                # 서버는 정상이지만 모델이 없습니다. 다음 상태 조회 전까지 이 모델은 다른 서버로 보냅니다.
+                host.models.discard(_model_key(model))
+            raise
         except Exception as e:
-            print(f"모델 '{model}' 확인 중 오류 발생: {e}")
-            return False
+            host.record_failure(e)
+            raise
+        duration = time.perf_counter() - start_time
+        host.record_success(model, duration)
+        return host, response, duration
+
+    async def fetch_model_info(self, model: str) -> Optional[Dict[str, Any]]:
+        """
+        모델을 가진 서버에서 토크나이저 어휘를 포함한 모델 메타데이터(/api/show의 model_info)를 가져옵니다.
+        Python 클라이언트의 show()는 어휘 배열을 빼고 돌려주므로 verbose 요청을 직접 보냅니다. 실패하면 None.
+        """
+        pool = get_host_pool()
+        host = pool.select(model)
+        if host is None:
+            return None
+        try:
+            async with httpx.AsyncClient(base_url=host.url, timeout=MODEL_INFO_TIMEOUT) as client:
+                response = await client.post("/api/show", json={"model": model, "verbose": True})
+                response.raise_for_status()
+                info = await asyncio.to_thread(response.json)
+                return info.get("model_info") or None
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("모델 정보 조회 실패", extra={"model": model, "host": host.url, "error": str(e)})
+            return None
+
+    async def check_model_availability(self, model: str) -> bool:
+        """
+        지정된 모델을 가진 서버가 하나라도 있는지 확인합니다. 모든 서버의 모델 목록을 새로 조회합니다.
+        """
+        pool = get_host_pool()
+        await pool.refresh_all()
+        available = any(host.models is not None and _model_key(model) in host.models for host in pool.hosts)
+        if not available:
+            logger.warning("모델을 가진 Ollama 서버 없음", extra={"model": model, "hosts": list(pool.urls)})
+        return available
 
 # 의존성 주입을 위한 함수
 def get_ollama_service():
-    return OllamaService()
\ No newline at end of file
+    return OllamaService()
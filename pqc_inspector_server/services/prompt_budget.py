@@ -0,0 +1,310 @@
+# File: pqc_inspector_server/services/prompt_budget.py
+# 📏 모델 토크나이저로 프롬프트 토큰 수를 세고, 시스템 프롬프트/참고 정보/파일 내용을 컨텍스트(LLM_NUM_CTX)에 맞춰 채웁니다.
+# 글자 수는 토큰 수의 대용으로 부정확합니다. 영문 코드는 토큰당 3~4글자지만, 한국어 시스템 프롬프트나 어휘에 없는 문자는
+# 글자 하나가 토큰 여러 개(바이트 폴백)가 되므로, 글자 수로 자르면 컨텍스트를 넘겨 앞부분이 잘리거나 반대로 절반을 비워 둡니다.
+#
+# 토크나이저: Ollama의 /api/show(verbose)가 돌려주는 GGUF 어휘(tokenizer.ggml.*)로 모델마다 한 번 만들어 캐시합니다.
+#   - "llama"(SentencePiece BPE: Llama/CodeLlama/Gemma/Mistral): 점수가 가장 높은 인접 쌍부터 병합, 어휘에 없으면 바이트 수만큼
+#   - "gpt2"(바이트 수준 BPE: Llama 3/Qwen 등): 정규식으로 단어를 나눈 뒤 병합 순위대로 병합
+#   어휘를 가져오지 못하거나 다른 방식이면 UTF-8 바이트 수 / 3으로 넉넉히 어림하고, OLLAMA_HEALTH_INTERVAL 뒤 다시 시도합니다.
+# 같은 단어/들여쓰기는 계속 반복되므로 공백 단위 조각별 토큰 수를 캐시해, 이미 본 조각은 사전 조회 한 번으로 끝납니다.
+
+import asyncio
+import heapq
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..core.config import settings
+from .ollama_service import DEFAULT_NUM_CTX, get_ollama_service
+
+logger = logging.getLogger(__name__)
+
+# 채팅 템플릿이 메시지마다 붙이는 역할 표시/특수 토큰 몫
+CHAT_OVERHEAD_TOKENS = 32
+# 시스템 프롬프트가 아무리 길어도 내용에 남겨 두는 최소 토큰 수
+MIN_CONTENT_TOKENS = 128
+# 관련도로 고른 청크 사이에서 생략된 부분을 표시하는 줄
+ELISION = "...\n"
+# 조각별 토큰 수 캐시 크기와 캐시하는 조각의 최대 길이
+_PIECE_CACHE_SIZE = 200000
+_PIECE_CACHE_MAX_CHARS = 64
+# 관련도 순으로 청크를 채우다가 들어가지 않는 청크가 이만큼 나오면 그만 찾습니다.
+_PACK_MAX_MISSES = 8
+
+_SPM_SPACE = "▁"
+_SPM_PIECE = re.compile(f"{_SPM_SPACE}*[^{_SPM_SPACE}]+|{_SPM_SPACE}+")
+# GPT-2 계열 사전 분할 규칙. \p{L}/\p{N} 대신 표준 re로 표현할 수 있는 [^\W\d_]와 \d를 씁니다.
+_GPT2_PIECE = re.compile(r"""'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+[\r\n]*|\s*[\r\n]+|\s+(?!\S)|\s+""")
+# GGUF token_type: 3 = control(<s>, </s> 등). 본문 텍스트에서는 만들어지지 않으므로 병합 후보에서 뺍니다.
+_CONTROL_TOKEN = 3
+
+
+def _merge(symbols: List[str], priority: Callable[[str, str], Optional[float]]) -> List[str]:
+    """
+    인접한 두 기호 중 priority가 가장 작은 쌍부터 병합합니다(같으면 왼쪽 먼저). priority가 None이면 병합할 수 없는 쌍입니다.
+    연결 리스트와 힙을 써서 긴 조각(공백 없는 base64 등)도 O(n log n)에 끝납니다.
+    """
+    count = len(symbols)
+    if count < 2:
+        return symbols
+    alive: List[Optional[str]] = list(symbols)
+    prev = list(range(-1, count - 1))
+    nxt = list(range(1, count + 1))
+    nxt[-1] = -1
+    heap: List[Tuple[float, int, str]] = []
+
+    def push(left: int, right: int) -> None:
+        rank = priority(alive[left], alive[right])
+        if rank is not None:
+            heapq.heappush(heap, (rank, left, alive[left] + alive[right]))
+
+    for index in range(count - 1):
+        push(index, index + 1)
+    while heap:
+        _, left, merged = heapq.heappop(heap)
+        right = nxt[left]
+        # 이미 다른 병합으로 바뀐 쌍이면 건너뜁니다.
+        if alive[left] is None or right < 0 or alive[left] + alive[right] != merged:
+            continue
+        alive[left], alive[right] = merged, None
+        nxt[left] = nxt[right]
+        if nxt[left] >= 0:
+            prev[nxt[left]] = left
+        if prev[left] >= 0:
+            push(prev[left], left)
+        if nxt[left] >= 0:
+            push(left, nxt[left])
+    return [symbol for symbol in alive if symbol is not None]
+
+
+class TokenCounter(ABC):
+    """
+    텍스트의 토큰 수를 셉니다. 조각별 결과를 잠금 없는 캐시에 넣으므로 이벤트 루프 스레드에서만 사용합니다
+    (asyncio.to_thread 등 다른 스레드에서 부르지 않음). 세는 양은 실제로 보내는 창/프롬프트와 소스 축소 전 원문으로 한정합니다.
+    """
+
+    kind = ""
+    vocabulary = 0
+
+    def __init__(self):
+        self._cache: Dict[str, int] = {}
+
+    def count(self, text: str) -> int:
+        total = 0
+        for piece in self._pieces(text):
+            if len(piece) > _PIECE_CACHE_MAX_CHARS:
+                total += self._count_piece(piece)
+                continue
+            tokens = self._cache.get(piece)
+            if tokens is None:
+                if len(self._cache) >= _PIECE_CACHE_SIZE:
+                    self._cache.clear()
+                tokens = self._cache[piece] = self._count_piece(piece)
+            total += tokens
+        return total
+
+    @abstractmethod
+    def _pieces(self, text: str) -> Sequence[str]:
+        """text를 토큰 경계가 걸치지 않는 조각들로 나눕니다."""
+        pass
+
+    @abstractmethod
+    def _count_piece(self, piece: str) -> int:
+        """조각 하나의 토큰 수를 셉니다."""
+        pass
+
+
+class EstimateCounter(TokenCounter):
+    kind = "estimate"
+
+    def count(self, text: str) -> int:
+        # 조각으로 나누거나 캐시할 필요가 없으므로 바로 셉니다.
+        return self._count_piece(text)
+
+    def _pieces(self, text: str) -> Sequence[str]:
+        return (text,)
+
+    def _count_piece(self, piece: str) -> int:
+        # 영문 코드는 토큰당 3~4바이트, 한글은 글자(3바이트)당 1토큰 이상이므로 바이트 / 3은 대체로 실제보다 많이 셉니다.
+        return (len(piece.encode("utf-8", errors="replace")) + 2) // 3
+
+
+class SentencePieceCounter(TokenCounter):
+    kind = "llama"
+
+    def __init__(self, tokens: Sequence[str], scores: Sequence[float], types: Sequence[int] = ()):
+        super().__init__()
+        self.scores: Dict[str, float] = {}
+        for index, token in enumerate(tokens):
+            if index < len(types) and types[index] == _CONTROL_TOKEN:
+                continue
+            self.scores[token] = scores[index] if index < len(scores) else 0.0
+        self.vocabulary = len(tokens)
+
+    def _pieces(self, text: str) -> Sequence[str]:
+        # SentencePiece는 공백을 ▁로 바꿔 다음 단어에 붙입니다. ▁가 단어 가운데 오는 토큰은 드물어 ▁ 앞에서 나눠 셉니다.
+        return _SPM_PIECE.findall(text.replace(" ", _SPM_SPACE))
+
+    def _count_piece(self, piece: str) -> int:
+        symbols = _merge(list(piece), self._priority)
+        # 어휘에 없는 기호는 UTF-8 바이트 토큰(<0xXX>)으로 나뉩니다.
+        return sum(1 if symbol in self.scores else len(symbol.encode("utf-8", errors="replace")) for symbol in symbols)
+
+    def _priority(self, left: str, right: str) -> Optional[float]:
+        score = self.scores.get(left + right)
+        return None if score is None else -score
+
+
+class BytePairCounter(TokenCounter):
+    kind = "gpt2"
+
+    def __init__(self, tokens: Sequence[str], merges: Sequence[str]):
+        super().__init__()
+        self.ranks: Dict[Tuple[str, str], int] = {}
+        for rank, merge in enumerate(merges):
+            left, _, right = merge.partition(" ")
+            self.ranks[(left, right)] = rank
+        self.vocabulary = len(tokens)
+        # 바이트 수준 BPE는 모든 바이트를 출력 가능한 유니코드 문자 하나에 대응시킨 뒤 병합합니다.
+        printable = list(range(ord("!"), ord("~") + 1)) + list(range(ord("¡"), ord("¬") + 1)) + list(range(ord("®"), ord("ÿ") + 1))
+        mapping = {byte: chr(byte) for byte in printable}
+        extra = 0
+        for byte in range(256):
+            if byte not in mapping:
+                mapping[byte] = chr(256 + extra)
+                extra += 1
+        self._byte_chars = [mapping[byte] for byte in range(256)]
+
+    def _pieces(self, text: str) -> Sequence[str]:
+        return _GPT2_PIECE.findall(text)
+
+    def _count_piece(self, piece: str) -> int:
+        symbols = [self._byte_chars[byte] for byte in piece.encode("utf-8", errors="replace")]
+        return len(_merge(symbols, lambda left, right: self.ranks.get((left, right))))
+
+
+def counter_from_model_info(info: Dict[str, Any]) -> Optional[TokenCounter]:
+    """/api/show의 model_info(GGUF 메타데이터)에서 토큰 카운터를 만듭니다. 지원하지 않는 토크나이저면 None."""
+    tokens = info.get("tokenizer.ggml.tokens") or []
+    if not tokens:
+        return None
+    kind = info.get("tokenizer.ggml.model")
+    if kind == "llama":
+        return SentencePieceCounter(tokens, info.get("tokenizer.ggml.scores") or [], info.get("tokenizer.ggml.token_type") or [])
+    if kind == "gpt2" and info.get("tokenizer.ggml.merges"):
+        return BytePairCounter(tokens, info["tokenizer.ggml.merges"])
+    return None
+
+
+class PromptBudget:
+    """모델 하나의 토큰 카운터와 컨텍스트 길이. 프롬프트 고정 부분을 뺀 나머지에 내용을 채웁니다."""
+
+    def __init__(self, counter: TokenCounter, num_ctx: int, reserve: int):
+        self.counter = counter
+        self.num_ctx = num_ctx
+        self.reserve = reserve
+
+    def count(self, text: str) -> int:
+        return self.counter.count(text)
+
+    def available(self, *fixed: str) -> int:
+        """고정 부분(시스템 프롬프트, 내용을 비운 프롬프트 틀 등)과 응답 몫을 빼고 내용에 쓸 수 있는 토큰 수입니다."""
+        left = self.num_ctx - self.reserve - CHAT_OVERHEAD_TOKENS - sum(self.count(part) for part in fixed)
+        return max(left, MIN_CONTENT_TOKENS)
+
+    def fit(self, text: str, tokens: int) -> str:
+        """text의 앞부분을 tokens 안에 들어가도록 줄 단위로 자릅니다. 첫 줄부터 넘치면 그 줄을 글자 단위로 자릅니다."""
+        kept: List[str] = []
+        used = 0
+        for line in text.splitlines(keepends=True):
+            size = self.count(line)
+            if used + size > tokens:
+                if not kept:
+                    kept.append(self._fit_line(line, tokens))
+                break
+            kept.append(line)
+            used += size
+        return "".join(kept)
+
+    def pack(self, chunks: Sequence[str], tokens: int, scores: Sequence[int]) -> str:
+        """
+        관련도 점수가 높은 청크부터 tokens가 찰 때까지 고르고, 원래 순서대로 이어 붙입니다.
+        고르지 않은 부분은 ELISION 줄로 표시합니다. 모든 청크가 들어가면 원문 그대로입니다.
+        """
+        elision = self.count(ELISION)
+        chosen: List[int] = []
+        used = misses = 0
+        for index in sorted(range(len(chunks)), key=lambda i: (-scores[i], i)):
+            size = self.count(chunks[index]) + elision
+            if used + size > tokens:
+                misses += 1
+                if misses >= _PACK_MAX_MISSES or tokens - used < MIN_CONTENT_TOKENS:
+                    break
+                continue
+            chosen.append(index)
+            used += size
+        if len(chosen) == len(chunks):
+            return "".join(chunks)
+        if not chosen:
+            best = max(range(len(chunks)), key=lambda i: (scores[i], -i))
+            return self.fit(chunks[best], tokens)
+
+        parts: List[str] = []
+        previous = -1
+        for index in sorted(chosen):
+            if index != previous + 1:
+                parts.append(ELISION)
+            parts.append(chunks[index])
+            previous = index
+        if previous != len(chunks) - 1:
+            parts.append(ELISION)
+        return "".join(parts)
+
+    def _fit_line(self, line: str, tokens: int) -> str:
+        low, high = 0, len(line)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count(line[:middle]) <= tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return line[:low]
+
+
+_counters: Dict[str, Tuple[TokenCounter, float]] = {}   # 모델 → (카운터, 다시 불러올 시각; 0이면 계속 사용)
+_loading: Dict[str, "asyncio.Task[TokenCounter]"] = {}
+
+
+async def get_prompt_budget(model: str) -> PromptBudget:
+    """모델의 토큰 카운터(처음 한 번 불러와 캐시)와 현재 컨텍스트 설정으로 예산을 만듭니다."""
+    counter = await _get_counter(model)
+    return PromptBudget(counter, settings.LLM_NUM_CTX or DEFAULT_NUM_CTX, settings.LLM_RESPONSE_TOKENS)
+
+
+async def _get_counter(model: str) -> TokenCounter:
+    key = model if ":" in model else f"{model}:latest"
+    cached = _counters.get(key)
+    if cached is not None and (not cached[1] or time.monotonic() < cached[1]):
+        return cached[0]
+    # 같은 모델을 여러 에이전트가 동시에 요청해도 어휘는 한 번만 가져옵니다.
+    task = _loading.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = _loading[key] = asyncio.create_task(_load_counter(key, model))
+        task.add_done_callback(lambda done: _loading.pop(key, None) if _loading.get(key) is done else None)
+    return await asyncio.shield(task)
+
+
+async def _load_counter(key: str, model: str) -> TokenCounter:
+    info = await get_ollama_service().fetch_model_info(model)
+    counter = await asyncio.to_thread(counter_from_model_info, info) if info else None
+    if counter is None:
+        logger.warning("모델 토크나이저를 불러오지 못해 토큰 수를 어림합니다", extra={"model": model})
+        counter = EstimateCounter()
+        _counters[key] = (counter, time.monotonic() + settings.OLLAMA_HEALTH_INTERVAL)
+    else:
+        logger.info("모델 토크나이저 로드", extra={"model": model, "tokenizer": counter.kind, "vocabulary": counter.vocabulary})
+        _counters[key] = (counter, 0.0)
+    return counter
@@ -1,19 +1,22 @@
 # File: pqc_inspector_server/services/rag_manager.py
 # 📚 RAG(검색 증강 생성)를 위한 지식 베이스를 관리하고 검색하는 파일입니다.
 
+import logging
 from typing import List
 
+logger = logging.getLogger(__name__)
+
 class RAGManager:
     def __init__(self, knowledge_base_path: str):
         self.path = knowledge_base_path
-        print(f"'{self.path}' 경로에서 RAG 지식 베이스를 로딩합니다... (시뮬레이션)")
+        logger.info("RAG 지식 베이스를 로딩합니다... (시뮬레이션)", extra={"path": self.path})
         # 실제로는 여기서 FAISS, LlamaIndex 등을 사용하여 벡터 DB를 로드합니다.
 
     def search(self, query: str, top_k: int = 3) -> List[str]:
         """
         지식 베이스에서 쿼리와 가장 관련 높은 문서를 검색합니다.
         """
-        print(f"지식 베이스 검색: '{query}' (top_k={top_k})")
+        logger.debug("지식 베이스 검색", extra={"query": query, "top_k": top_k})
         # 시뮬레이션된 검색 결과
         return [
             f"검색 결과 1: '{query}'에 대한 정보입니다.",
@@ -1,8 +1,118 @@
 # File: pqc_inspector_server/services/reporting.py
 # 📄 분석 결과를 바탕으로 사용자 친화적인 보고서를 생성하는 로직을 담은 파일입니다.
+# 대량 스캔(수만 개 파일)에서도 메모리 사용량이 일정하도록, 결과 저장소에서 한 행씩 받아
+# Markdown / CSV / JSON Lines / SARIF 형식으로 점진적으로 렌더링합니다.
 
-from typing import List, Dict, Any
+import csv
+import io
+import json
+import posixpath
+from collections import Counter
 from datetime import datetime
+from typing import List, Dict, Any, AsyncIterator, Iterable
+
+# 지원하는 보고서 형식과 HTTP 응답 미디어 타입
+REPORT_MEDIA_TYPES = {
+    "markdown": "text/markdown; charset=utf-8",
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson",
+    "sarif": "application/sarif+json",
+}
+
+# 스트리밍 응답으로 내보낼 때 한 번에 묶어서 보내는 최소 크기 (너무 잘게 쪼개지지 않도록)
+_FLUSH_SIZE = 64 * 1024
+
+_CSV_COLUMNS = [
+    "task_id", "file_name", "file_type", "is_pqc_vulnerable", "detected_algorithms",
+    "confidence_score", "vulnerability_details", "recommendations", "evidence",
+]
+
+
+class ReportSummary:
+    """
+    결과를 한 번 순회하면서 알고리즘별, 파일 타입별, 디렉터리별 요약을 누적합니다.
+    행 자체는 보관하지 않으므로 메모리 사용량은 서로 다른 키의 개수에만 비례합니다.
+    """
+
+    def __init__(self, directory_depth: int = 2):
+        self.directory_depth = directory_depth
+        self.total_files = 0
+        self.vulnerable_files = 0
+        self.failed_files = 0
+        self.by_algorithm: Counter = Counter()
+        self.by_file_type: Dict[str, Counter] = {}
+        self.by_directory: Dict[str, Counter] = {}
+
+    def add(self, result: Dict[str, Any]) -> None:
+        vulnerable = bool(result.get("is_pqc_vulnerable"))
+        self.total_files += 1
+        if vulnerable:
+            self.vulnerable_files += 1
+        if (result.get("vulnerability_details") or "").startswith("분석 실패"):
+            self.failed_files += 1
+
+        for algorithm in set(_algorithms(result)):
+            self.by_algorithm[algorithm] += 1
+
+        for key, bucket in (
+            (result.get("file_type") or "unknown", self.by_file_type),
+            (self._directory_of(result.get("file_name") or ""), self.by_directory),
+        ):
+            counts = bucket.setdefault(key, Counter())
+            counts["files"] += 1
+            if vulnerable:
+                counts["vulnerable"] += 1
+
+    def _directory_of(self, file_name: str) -> str:
+        directory = posixpath.dirname(file_name.replace("\\", "/"))
+        if not directory:
+            return "."
+        return "/".join(directory.split("/")[:self.directory_depth])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_files": self.total_files,
+            "vulnerable_files": self.vulnerable_files,
+            "failed_files": self.failed_files,
+            "by_algorithm": dict(self.by_algorithm.most_common()),
+            "by_file_type": {k: dict(v) for k, v in sorted(self.by_file_type.items())},
+            "by_directory": {k: dict(v) for k, v in sorted(self.by_directory.items())},
+        }
+
+
+def _algorithms(result: Dict[str, Any]) -> List[str]:
+    return [str(a) for a in (result.get("detected_algorithms") or []) if a]
+
+
+def _md_cell(value: Any) -> str:
+    text = "N/A" if value is None or value == "" else str(value)
+    return text.replace("|", "\\|").replace("\r", "").replace("\n", "<br>")
+
+
+def _markdown_row(result: Dict[str, Any]) -> str:
+    status = "Non-PQC" if result.get("is_pqc_vulnerable") else "OK"
+    algorithms = ", ".join(_algorithms(result)) or "N/A"
+    return (
+        f"| {_md_cell(result.get('file_name'))} | {_md_cell(result.get('file_type'))} "
+        f"| **{status}** | {_md_cell(algorithms)} | {_md_cell(result.get('evidence'))} |\n"
+    )
+
+
+def _markdown_summary(summary: ReportSummary) -> Iterable[str]:
+    yield "\n---\n\n## 📊 요약\n\n"
+    yield f"- **총 분석 파일 수**: {summary.total_files}개\n"
+    yield f"- **Non-PQC 탐지 수**: {summary.vulnerable_files}개\n"
+    yield f"- **분석 실패 수**: {summary.failed_files}개\n\n"
+
+    yield "### 알고리즘별\n\n| 알고리즘 | 파일 수 |\n|---|---|\n"
+    for algorithm, count in summary.by_algorithm.most_common():
+        yield f"| {_md_cell(algorithm)} | {count} |\n"
+
+    for title, bucket in (("파일 타입별", summary.by_file_type), ("디렉터리별", summary.by_directory)):
+        yield f"\n### {title}\n\n| 구분 | 파일 수 | Non-PQC |\n|---|---|---|\n"
+        for key, counts in sorted(bucket.items()):
+            yield f"| {_md_cell(key)} | {counts['files']} | {counts['vulnerable']} |\n"
+
 
 def generate_markdown_report(analysis_results: List[Dict[str, Any]]) -> str:
     """
@@ -11,28 +121,132 @@ def generate_markdown_report(analysis_results: List[Dict[str, Any]]) -> str:
     if not analysis_results:
         return "# 분석 결과 보고서\n\n해당 기간의 분석 결과가 없습니다."
 
+    summary = ReportSummary()
+    parts = [_markdown_header()]
+    for result in analysis_results:
+        summary.add(result)
+        parts.append(_markdown_row(result))
+    parts.extend(_markdown_summary(summary))
+    return "".join(parts)
+
+
+def _markdown_header() -> str:
     report_time = datetime.now().strftime("%Y년 %m월 %d일 %H:%M:%S")
-    total_files = len(analysis_results)
-    non_pqc_count = sum(1 for r in analysis_results if r.get("pqc_status") == "non-pqc")
+    return (
+        "# PQC Inspector 분석 결과 보고서\n\n"
+        f"- **보고서 생성 시각**: {report_time}\n\n"
+        "---\n\n"
+        "## 📝 상세 탐지 내역\n\n"
+        "| 파일명 | 파일 타입 | 탐지 상태 | 탐지 알고리즘 | 근거 |\n"
+        "|---|---|---|---|---|\n"
+    )
 
-    # 보고서 헤더 생성
-    report = f"# PQC Inspector 분석 결과 보고서\n\n"
-    report += f"- **보고서 생성 시각**: {report_time}\n"
-    report += f"- **총 분석 파일 수**: {total_files}개\n"
-    report += f"- **Non-PQC 탐지 수**: {non_pqc_count}개\n\n"
-    report += "---\n\n"
 
-    # 각 탐지 항목 상세 정보 추가
-    report += "## 📝 상세 탐지 내역\n\n"
-    report += "| 파일명 | 파일 타입 | 탐지 상태 | 탐지 알고리즘 | 근거 |\n"
-    report += "|---|---|---|---|---|\n"
+async def stream_markdown_report(results: AsyncIterator[Dict[str, Any]], summary: ReportSummary) -> AsyncIterator[str]:
+    """행을 받는 즉시 표에 추가하고, 요약은 마지막에 덧붙입니다."""
+    yield _markdown_header()
+    async for result in results:
+        summary.add(result)
+        yield _markdown_row(result)
+    if summary.total_files == 0:
+        yield "| N/A | N/A | N/A | N/A | 분석 결과가 없습니다. |\n"
+    for part in _markdown_summary(summary):
+        yield part
 
-    for result in analysis_results:
-        file_name = result.get('file_name', 'N/A')
-        file_type = result.get('file_type', 'N/A')
-        pqc_status = result.get('pqc_status', 'N/A')
-        algorithm = result.get('detected_algorithm', 'N/A')
-        evidence = result.get('evidence', 'N/A').replace('\n', '<br>')
-        report += f"| {file_name} | {file_type} | **{pqc_status}** | {algorithm} | {evidence} |\n"
-    
-    return report
\ No newline at end of file
+
+async def stream_csv_report(results: AsyncIterator[Dict[str, Any]], summary: ReportSummary) -> AsyncIterator[str]:
+    """한 행씩 CSV로 직렬화합니다. 버퍼는 매 행마다 비워서 재사용합니다."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_COLUMNS)
+    async for result in results:
+        summary.add(result)
+        row = dict(result, detected_algorithms=";".join(_algorithms(result)))
+        writer.writerow(["" if row.get(column) is None else row.get(column) for column in _CSV_COLUMNS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def stream_jsonl_report(results: AsyncIterator[Dict[str, Any]], summary: ReportSummary) -> AsyncIterator[str]:
+    """결과 한 건당 한 줄의 JSON을 내보내고, 마지막 줄에 요약 레코드를 추가합니다."""
+    async for result in results:
+        summary.add(result)
+        yield json.dumps({"record_type": "result", **result}, ensure_ascii=False) + "\n"
+    yield json.dumps({"record_type": "summary", **summary.to_dict()}, ensure_ascii=False) + "\n"
+
+
+async def stream_sarif_report(results: AsyncIterator[Dict[str, Any]], summary: ReportSummary) -> AsyncIterator[str]:
+    """
+    SARIF 2.1.0 로그를 점진적으로 작성합니다.
+    취약한 파일만 result로 기록하며, 규칙과 요약은 results 배열 뒤에 닫습니다.
+    """
+    yield (
+        '{"$schema": "https://json.schemastore.org/sarif-2.1.0.json", "version": "2.1.0", '
+        '"runs": [{"results": ['
+    )
+    first = True
+    async for result in results:
+        summary.add(result)
+        if not result.get("is_pqc_vulnerable"):
+            continue
+        confidence = result.get("confidence_score") or 0.0
+        sarif_result = {
+            "ruleId": "PQC001",
+            "level": "error" if confidence >= 0.7 else "warning",
+            "message": {"text": result.get("vulnerability_details") or "비양자내성암호 사용이 탐지되었습니다."},
+            "locations": [{"physicalLocation": {"artifactLocation": {"uri": result.get("file_name") or ""}}}],
+            "properties": {
+                "task_id": result.get("task_id"),
+                "file_type": result.get("file_type"),
+                "detected_algorithms": _algorithms(result),
+                "confidence_score": confidence,
+                "evidence": result.get("evidence"),
+                "recommendations": result.get("recommendations"),
+            },
+        }
+        yield ("" if first else ", ") + json.dumps(sarif_result, ensure_ascii=False)
+        first = False
+
+    tool = {
+        "driver": {
+            "name": "PQC Inspector",
+            "rules": [{
+                "id": "PQC001",
+                "name": "NonPqcCryptography",
+                "shortDescription": {"text": "Non-quantum-resistant public-key cryptography"},
+            }],
+        }
+    }
+    yield '], "tool": ' + json.dumps(tool) + ', "properties": {"summary": '
+    yield json.dumps(summary.to_dict(), ensure_ascii=False) + "}}]}\n"
+
+
+_RENDERERS = {
+    "markdown": stream_markdown_report,
+    "csv": stream_csv_report,
+    "jsonl": stream_jsonl_report,
+    "sarif": stream_sarif_report,
+}
+
+
+async def render_report(results: AsyncIterator[Dict[str, Any]], report_format: str) -> AsyncIterator[bytes]:
+    """
+    선택한 형식의 렌더러로 결과 스트림을 변환하고, StreamingResponse에 넘기기 좋은
+    크기로 묶어서 바이트로 내보냅니다.
+    """
+    renderer = _RENDERERS.get(report_format)
+    if renderer is None:
+        raise ValueError(f"지원하지 않는 보고서 형식: {report_format}")
+
+    pending: List[str] = []
+    pending_size = 0
+    async for part in renderer(results, ReportSummary()):
+        pending.append(part)
+        pending_size += len(part)
+        if pending_size >= _FLUSH_SIZE:
+            yield "".join(pending).encode("utf-8")
+            pending, pending_size = [], 0
+    if pending:
+        yield "".join(pending).encode("utf-8")
@@ -0,0 +1,261 @@
+# File: pqc_inspector_server/services/result_cache.py
+# ♻️ 분석 결과 캐시입니다. 내용 해시(SHA-256)가 같은 파일은 결과를 그대로 재사용하고,
+# 여러 서비스에 복사된 OpenSSL 래퍼나 설정 템플릿처럼 조금만 고친 파일은 SimHash 스케치로 찾아 결과를 이어받습니다.
+# 에이전트가 창(청크) 단위로 LLM을 호출할 때 쓰는 청크별 결과 캐시(ChunkResultCache)도 여기 있습니다.
+#
+# 정규화: 공백/줄바꿈 차이를 없애기 위해 내용을 토큰(식별자, 숫자, 기호)으로 나누고 소문자로 맞춥니다.
+# 스케치: 토큰 4개짜리 shingle의 64비트 해시로 SimHash를 만듭니다. 내용이 비슷할수록 해밍 거리가 작습니다.
+# 조회: 해밍 거리 k 이내의 스케치는 64비트를 k+1개 블록으로 나눴을 때 적어도 한 블록이 정확히 같으므로(비둘기집 원리),
+#       블록별 해시 테이블에서 후보만 꺼내 거리를 잽니다. k=3이면 16비트 블록이라 스케치 수백만 개에서도 후보가 수십 개입니다.
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 shingle 해시와 비트 합계를 순수 파이썬으로 계산합니다.
+    np = None
+
+from ..scanners.prescan import prescan_indicators
+
+_TOKEN = re.compile(rb"[A-Za-z_][A-Za-z0-9_]*|\d+|[^\sA-Za-z0-9_]")
+SHINGLE = 4
+# shingle이 이보다 적은 짧은 파일은 스케치가 불안정하므로 정확히 같은 내용만 재사용합니다.
+MIN_SHINGLES = 16
+# 앞부분에 NUL이 있으면 바이너리로 보고 스케치하지 않습니다. (바이너리는 정확히 같은 내용만 재사용)
+_BINARY_PROBE = 8192
+_MASK64 = (1 << 64) - 1
+
+
+class ContentSketch(NamedTuple):
+    sha256: str
+    simhash: Optional[int]   # 바이너리이거나 너무 짧으면 None
+
+
+class CacheEntry(NamedTuple):
+    file_name: str
+    sketch: ContentSketch
+    signature: Tuple[Any, ...]   # 재사용 전에 새 파일과 비교하는 값싼 규칙 판정 (규칙 분류, 사전 스캔 알고리즘 계열)
+    result: Dict[str, Any]
+
+
+class CacheHit(NamedTuple):
+    entry: CacheEntry
+    distance: int            # 0이고 exact면 내용이 완전히 같음
+    exact: bool
+
+
+def sketch_content(content: bytes) -> ContentSketch:
+    """내용 해시와 SimHash 스케치를 계산합니다. 큰 파일은 수십~수백 ms가 걸리므로 이벤트 루프에서는 스레드로 실행하세요."""
+    digest = hashlib.sha256(content).hexdigest()
+    if b"\0" in content[:_BINARY_PROBE]:
+        return ContentSketch(digest, None)
+    tokens = _TOKEN.findall(content.lower())
+    if len(tokens) < SHINGLE + MIN_SHINGLES - 1:
+        return ContentSketch(digest, None)
+    ids = {token: _token_hash(token) for token in set(tokens)}
+    hashes = [ids[token] for token in tokens]
+    return ContentSketch(digest, _simhash_numpy(hashes) if np is not None else _simhash_python(hashes))
+
+
+def sketch_with_indicators(content: bytes, file_name: str) -> Tuple[ContentSketch, Dict[str, List[str]]]:
+    """
+    캐시 조회용 스케치와 사전 스캔 근거(prescan_indicators)를 한 번에 계산합니다. run_cpu_bound로 실행하는 작업 하나로 묶어
+    키워드가 없는 소스의 자체 구현 탐지(AST 파싱)를 서명용과 사전 스캔용으로 두 번 하지 않습니다.
+    """
+    return sketch_content(content), prescan_indicators(content, file_name)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _token_hash(token: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(token, digest_size=8).digest(), "little")
+
+
+def _rotl(value: int, bits: int) -> int:
+    return ((value << bits) | (value >> (64 - bits))) & _MASK64
+
+
+def _mix(value: int) -> int:
+    """splitmix64 마무리 함수. 토큰 해시를 XOR로 합친 값의 비트를 고르게 섞습니다."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _simhash_python(hashes: List[int]) -> int:
+    count = len(hashes) - SHINGLE + 1
+    votes = [0] * 64
+    for i in range(count):
+        value = hashes[i]
+        for offset in range(1, SHINGLE):
+            value ^= _rotl(hashes[i + offset], offset)
+        value = _mix(value)
+        for bit in range(64):
+            votes[bit] += (value >> bit) & 1
+    return sum(1 << bit for bit in range(64) if votes[bit] * 2 > count)
+
+
+def _simhash_numpy(hashes: List[int]) -> int:
+    ids = np.array(hashes, dtype=np.uint64)
+    count = len(hashes) - SHINGLE + 1
+    values = ids[:count].copy()
+    for offset in range(1, SHINGLE):
+        part = ids[offset:offset + count]
+        values ^= (part << np.uint64(offset)) | (part >> np.uint64(64 - offset))
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    bits = np.unpackbits(values.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    votes = bits.sum(axis=0, dtype=np.int64)
+    return sum(1 << bit for bit in range(64) if votes[bit] * 2 > count)
+
+
+def _blocks(max_distance: int) -> List[Tuple[int, int]]:
+    """64비트를 max_distance+1개의 (시프트, 마스크) 블록으로 나눕니다."""
+    count = max_distance + 1
+    blocks, start = [], 0
+    for index in range(count):
+        width = 64 // count + (1 if index < 64 % count else 0)
+        blocks.append((start, (1 << width) - 1))
+        start += width
+    return blocks
+
+
+class ResultCache:
+    """
+    내용 해시 → 결과(정확히 같은 내용)와 SimHash 블록 테이블(비슷한 내용)을 함께 관리하는 LRU 캐시입니다.
+    max_distance는 비슷하다고 볼 최대 해밍 거리(64비트 중)이며, 클수록 블록이 좁아져 후보가 많아지고 조회가 느려집니다.
+    """
+
+    def __init__(self, max_distance: int = 3, capacity: int = 100000):
+        if max_distance >= 32:
+            raise ValueError("max_distance는 32 미만이어야 합니다.")
+        self.max_distance = max_distance
+        self.capacity = capacity
+        # 음수면 비슷한 파일은 찾지 않고 같은 내용만 재사용합니다.
+        self._blocks = _blocks(max_distance) if max_distance >= 0 else []
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._tables: List[Dict[int, List[str]]] = [{} for _ in self._blocks]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, sketch: ContentSketch) -> Optional[CacheHit]:
+        """같은 내용이 있으면 그 결과를, 없으면 해밍 거리가 가장 가까운 비슷한 파일의 결과를 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(sketch.sha256)
+            if entry is not None:
+                self._entries.move_to_end(sketch.sha256)
+                return CacheHit(entry, 0, True)
+            if sketch.simhash is None or not self._blocks:
+                return None
+            best: Optional[Tuple[int, str]] = None
+            seen = set()
+            for table, (shift, mask) in zip(self._tables, self._blocks):
+                for key in table.get((sketch.simhash >> shift) & mask, ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    distance = hamming(sketch.simhash, self._entries[key].sketch.simhash)
+                    if distance <= self.max_distance and (best is None or distance < best[0]):
+                        best = (distance, key)
+            if best is None:
+                return None
+            self._entries.move_to_end(best[1])
+            return CacheHit(self._entries[best[1]], best[0], False)
+
+    def store(self, entry: CacheEntry) -> None:
+        with self._lock:
+            key = entry.sketch.sha256
+            if key in self._entries:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = entry
+            if entry.sketch.simhash is not None:
+                for table, (shift, mask) in zip(self._tables, self._blocks):
+                    table.setdefault((entry.sketch.simhash >> shift) & mask, []).append(key)
+            while len(self._entries) > self.capacity:
+                self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for table in self._tables:
+                table.clear()
+
+    def _evict(self) -> None:
+        key, entry = self._entries.popitem(last=False)
+        if entry.sketch.simhash is None or not self._blocks:
+            return
+        for table, (shift, mask) in zip(self._tables, self._blocks):
+            block = (entry.sketch.simhash >> shift) & mask
+            bucket = table[block]
+            bucket.remove(key)
+            if not bucket:
+                del table[block]
+
+
+class ChunkResultCache:
+    """
+    에이전트의 창(청크)별 LLM 분석 결과 LRU 캐시입니다. 키는 (에이전트, 모델, 확장자, 청크 내용 해시)이므로
+    큰 파일의 함수 하나만 고쳤다면 나머지 청크는 LLM을 다시 호출하지 않고 이 결과를 씁니다.
+    """
+
+    def __init__(self, capacity: int = 50000):
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[str, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(agent: str, model: str, file_name: str, chunk: str) -> Tuple[str, ...]:
+        extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+        return agent, model, extension, hashlib.sha256(chunk.encode("utf-8", errors="replace")).hexdigest()
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple[str, ...], result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+
+_cache: Optional[ResultCache] = None
+_chunk_cache: Optional[ChunkResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache(max_distance: int, capacity: int) -> ResultCache:
+    """프로세스 전체가 공유하는 캐시. 설정(거리/용량)이 바뀌면 새로 만듭니다."""
+    global _cache
+    with _cache_lock:
+        if _cache is None or _cache.max_distance != max_distance or _cache.capacity != capacity:
+            _cache = ResultCache(max_distance, capacity)
+        return _cache
+
+
+def get_chunk_cache(capacity: int) -> ChunkResultCache:
+    global _chunk_cache
+    with _cache_lock:
+        if _chunk_cache is None or _chunk_cache.capacity != capacity:
+            _chunk_cache = ChunkResultCache(capacity)
+        return _chunk_cache
@@ -0,0 +1,129 @@
+# File: pqc_inspector_server/services/scan_manifest.py
+# 🧾 저장소 증분 스캔의 상태를 저장합니다. 저장소마다 JSON 하나에 경로별 blob ID, 심볼 색인 지문, 분석 결과를 보관하고
+# 다음 스캔에서 바뀌지 않은 파일의 결과를 그대로 이어받습니다. 이전 스캔과 비교한 변경(delta) 보고서도 여기서 만듭니다.
+
+import json
+import logging
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+# 서버 설정 묶음 결과(include를 펼쳐 한꺼번에 분석)는 경로 하나에 속하지 않으므로 이 키로 보관합니다.
+CONFIG_BUNDLE_KEY = "<server-configs>"
+
+
+def repository_key(name: str) -> str:
+    """저장소 이름을 파일 이름으로 쓸 수 있게 바꿉니다."""
+    return re.sub(r"[^\w.-]", "_", name).strip(".")[:100] or "repository"
+
+
+class ScanManifest:
+    """
+    files: {경로: {"blob", "symbols", "base", "result"}}
+      blob    : git blob ID (내용 해시)
+      symbols : 심볼 색인 호출 지점 지문 (다른 파일의 래퍼가 바뀌면 달라짐)
+      base    : 파일 자체 분석 결과 (심볼 색인 결과를 합치기 전, 색인만으로 판정했으면 None)
+      result  : 최종 결과
+    서버 설정 묶음에 포함된 파일은 {"blob", "config": True}만 가지며 결과는 config_result에 있습니다.
+    """
+
+    def __init__(self, repository: str, commit: str = "", symbol_snapshot: str = "",
+                 files: Optional[Dict[str, Dict[str, Any]]] = None, config_result: Optional[Dict[str, Any]] = None,
+                 scanned_at: str = ""):
+        self.repository = repository
+        self.commit = commit
+        self.symbol_snapshot = symbol_snapshot
+        self.files: Dict[str, Dict[str, Any]] = files or {}
+        self.config_result = config_result
+        self.scanned_at = scanned_at
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """{경로 (또는 설정 묶음 키): 최종 결과}"""
+        results = {path: entry["result"] for path, entry in self.files.items() if entry.get("result")}
+        if self.config_result:
+            results[CONFIG_BUNDLE_KEY] = self.config_result
+        return results
+
+    @classmethod
+    def load(cls, directory: str, repository: str) -> Optional["ScanManifest"]:
+        path = os.path.join(directory, f"{repository_key(repository)}.json")
+        try:
+            with open(path, encoding="utf-8") as handle:
+                stored = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("이전 스캔 매니페스트 읽기 실패, 전체 스캔으로 진행", extra={"repository": repository, "error": str(e)})
+            return None
+        if stored.get("version") != MANIFEST_VERSION:
+            return None
+        return cls(repository, stored["commit"], stored.get("symbol_snapshot", ""), stored["files"],
+                   stored.get("config_result"), stored.get("scanned_at", ""))
+
+    def save(self, directory: str) -> None:
+        self.scanned_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        _write_json(os.path.join(directory, f"{repository_key(self.repository)}.json"), {
+            "version": MANIFEST_VERSION, "repository": self.repository, "commit": self.commit,
+            "scanned_at": self.scanned_at, "symbol_snapshot": self.symbol_snapshot,
+            "files": self.files, "config_result": self.config_result,
+        })
+
+
+def build_delta(previous: Optional[ScanManifest], current: ScanManifest, added: List[str], modified: List[str],
+                removed: List[str], analyzed: List[str], reevaluated: List[str]) -> Dict[str, Any]:
+    """
+    이전 스캔과 이번 스캔의 결과를 비교합니다.
+    analyzed는 에이전트로 다시 분석한 경로(다시 분석한 서버 설정 묶음의 파일 포함), reevaluated는 내용은 같지만 다른 파일의 래퍼가 바뀌어 색인 결과만 다시 합친 경로입니다.
+    """
+    before = previous.results() if previous else {}
+    after = current.results()
+    newly_vulnerable, resolved, algorithm_changes = [], [], []
+    for key in sorted(set(before) | set(after)):
+        old, new = before.get(key) or {}, after.get(key) or {}
+        was, now = bool(old.get("is_pqc_vulnerable")), bool(new.get("is_pqc_vulnerable"))
+        old_algorithms, new_algorithms = sorted(old.get("detected_algorithms") or []), sorted(new.get("detected_algorithms") or [])
+        if now and not was:
+            newly_vulnerable.append({"file": key, "algorithms": new_algorithms})
+        elif was and not now:
+            resolved.append({"file": key, "algorithms": old_algorithms, "removed": key not in after})
+        elif was and now and old_algorithms != new_algorithms:
+            algorithm_changes.append({"file": key, "before": old_algorithms, "after": new_algorithms})
+
+    tracked = len(current.files)
+    return {
+        "repository": current.repository,
+        "base_commit": previous.commit if previous else None,
+        "commit": current.commit,
+        "scanned_at": current.scanned_at,
+        "added": added, "modified": modified, "removed": removed,
+        "analyzed": len(analyzed), "reevaluated": reevaluated,
+        "carried_forward": tracked - len(set(analyzed) | set(reevaluated)),
+        "vulnerable_files": sum(1 for result in after.values() if result.get("is_pqc_vulnerable")),
+        "newly_vulnerable": newly_vulnerable,
+        "resolved": resolved,
+        "algorithm_changes": algorithm_changes,
+    }
+
+
+def save_delta(directory: str, delta: Dict[str, Any]) -> None:
+    _write_json(os.path.join(directory, f"{repository_key(delta['repository'])}.delta.json"), delta)
+
+
+def load_delta(directory: str, repository: str) -> Optional[Dict[str, Any]]:
+    """가장 최근 스캔의 변경 보고서. 스캔한 적이 없으면 None."""
+    try:
+        with open(os.path.join(directory, f"{repository_key(repository)}.delta.json"), encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as handle:
+        json.dump(data, handle, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
@@ -0,0 +1,207 @@
+# File: pqc_inspector_server/services/scheduler.py
+# 🚦 LLM 호출 슬롯을 요청 종류(lane)별 가중 공정 큐로 나눠 주는 스케줄러입니다.
+# 단일 파일 업로드(interactive)와 프로젝트/저장소 스캔(bulk)이 같은 Ollama를 쓰더라도, 대기 중인 호출은 lane별 큐에 따로 쌓이고
+# 빈 슬롯은 가중치(SCHEDULER_LANE_WEIGHTS)에 비례해 번갈아 배정되므로 대량 스캔 뒤에 단일 파일이 줄 서지 않습니다.
+# 클라이언트별 동시 슬롯 한도(CLIENT_MAX_CONCURRENCY)로 한 클라이언트가 슬롯을 독차지하지 못하게 하고,
+# 예상 대기 시간(estimated_wait)이 ADMISSION_MAX_WAIT를 넘으면 API가 새 요청을 429로 거절합니다.
+#
+# 공정성: lane마다 가상 시간을 두고, 슬롯을 받을 때마다 1/가중치만큼 늘립니다. 대기 중인 lane 중 가상 시간이 가장 작은 lane이 먼저 받습니다.
+# 쉬던 lane은 현재 가상 시간에서 다시 시작하므로, 한동안 요청이 없었다고 슬롯을 몰아 받지는 않습니다.
+
+import asyncio
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional
+
+from ..core.config import settings
+from ..core.telemetry import registry
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# 현재 분석 작업의 lane과 클라이언트. 분석을 시작할 때 설정하면 그 안의 모든 LLM 호출이 이 값으로 스케줄됩니다.
+current_lane: ContextVar[str] = ContextVar("current_lane", default=INTERACTIVE)
+current_client: ContextVar[str] = ContextVar("current_client", default="")
+
+# LLM 호출 1건의 예상 처리 시간 초기값(초). 실제 호출이 끝날 때마다 지수 이동 평균으로 갱신합니다.
+INITIAL_SERVICE_SECONDS = 5.0
+SERVICE_EWMA_ALPHA = 0.2
+
+
+def parse_lane_weights(spec: str) -> Dict[str, float]:
+    """"interactive=4,bulk=1" 형식의 설정을 {lane: 가중치}로 바꿉니다."""
+    weights: Dict[str, float] = {}
+    for item in spec.split(","):
+        if "=" not in item:
+            continue
+        lane, weight = item.split("=", 1)
+        weights[lane.strip()] = max(float(weight), 0.01)
+    return weights or {INTERACTIVE: 1.0}
+
+
+@contextmanager
+def request_class(lane: str, client: str) -> Iterator[None]:
+    """블록 안에서 시작한 LLM 호출을 lane과 client로 스케줄합니다."""
+    lane_token = current_lane.set(lane)
+    client_token = current_client.set(client)
+    try:
+        yield
+    finally:
+        current_client.reset(client_token)
+        current_lane.reset(lane_token)
+
+
+class _Waiter:
+    __slots__ = ("lane", "client", "future", "enqueued")
+
+    def __init__(self, lane: str, client: str, future: "asyncio.Future[None]"):
+        self.lane = lane
+        self.client = client
+        self.future = future
+        self.enqueued = time.monotonic()
+
+
+class FairScheduler:
+    """
+    capacity개(0이면 제한 없음)의 슬롯을 lane별 가중 공정 큐로 나눠 줍니다.
+    client_limit이 0보다 크면 클라이언트 하나가 동시에 쥘 수 있는 슬롯 수를 제한합니다. 이벤트 루프 하나에서만 사용합니다.
+    """
+
+    def __init__(self, capacity: int, weights: Dict[str, float], client_limit: int = 0):
+        self.capacity = capacity
+        self.weights = weights
+        self.client_limit = client_limit
+        self.queues: Dict[str, Deque[_Waiter]] = {}
+        self.virtual_time: Dict[str, float] = {}
+        self.clock = 0.0
+        self.running = 0
+        self.by_client: Counter = Counter()
+        self.service_seconds = INITIAL_SERVICE_SECONDS
+
+    def lane_of(self, lane: str) -> str:
+        """설정에 없는 lane은 가중치가 가장 낮은 lane으로 취급합니다."""
+        return lane if lane in self.weights else min(self.weights, key=self.weights.get)
+
+    @asynccontextmanager
+    async def slot(self, lane: str, client: str = "") -> AsyncIterator[None]:
+        lane = self.lane_of(lane)
+        await self._acquire(lane, client)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(client, time.monotonic() - started)
+
+    def estimated_wait(self, lane: str) -> float:
+        """
+        지금 lane에 호출 하나를 넣으면 슬롯을 받기까지 걸릴 예상 시간(초)입니다.
+        같은 lane의 대기 호출은 모두 앞서고, 다른 lane의 대기 호출은 가중치 비율만큼만 앞선다고 봅니다.
+        """
+        lane = self.lane_of(lane)
+        weight = self.weights[lane]
+        ahead = sum(len(queue) * min(1.0, self._weight(other) / weight) if other != lane else len(queue)
+                    for other, queue in self.queues.items())
+        if self.capacity <= 0 or (ahead == 0 and self._has_room()):
+            return 0.0
+        return (ahead + 1) / self.capacity * self.service_seconds
+
+    def waiting(self, lane: Optional[str] = None) -> int:
+        if lane is not None:
+            return len(self.queues.get(self.lane_of(lane), ()))
+        return sum(len(queue) for queue in self.queues.values())
+
+    async def _acquire(self, lane: str, client: str) -> None:
+        waiter = _Waiter(lane, client, asyncio.get_running_loop().create_future())
+        queue = self.queues.setdefault(lane, deque())
+        if not queue:
+            # 쉬던 lane은 현재 가상 시간부터 다시 셉니다.
+            self.virtual_time[lane] = max(self.virtual_time.get(lane, 0.0), self.clock)
+        queue.append(waiter)
+        self._dispatch()
+        self._report(lane)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 받은 직후에 취소되었으면 반납합니다.
+                self._release(client, 0.0)
+            elif waiter in queue:
+                queue.remove(waiter)
+                self._report(lane)
+            raise
+        registry.observe("pqc_llm_queue_wait_seconds", time.monotonic() - waiter.enqueued, lane=lane)
+
+    def _release(self, client: str, held: float) -> None:
+        self.running -= 1
+        self.by_client[client] -= 1
+        if self.by_client[client] <= 0:
+            del self.by_client[client]
+        if held > 0:
+            self.service_seconds += SERVICE_EWMA_ALPHA * (held - self.service_seconds)
+        registry.set_gauge("pqc_llm_slots_in_use", self.running)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._has_room():
+            best: Optional[_Waiter] = None
+            for lane, queue in self.queues.items():
+                # 기다리다 취소된 호출은 아직 큐에 남아 있을 수 있으므로 건너뜁니다.
+                while queue and queue[0].future.done():
+                    queue.popleft()
+                if best is not None and self.virtual_time[lane] >= self.virtual_time[best.lane]:
+                    continue
+                # 한도에 걸린 클라이언트의 호출은 건너뛰고 같은 lane의 다음 호출을 봅니다.
+                waiter = next((w for w in queue if not w.future.done() and self._client_free(w.client)), None)
+                if waiter is not None:
+                    best = waiter
+            if best is None:
+                return
+            self.queues[best.lane].remove(best)
+            self._report(best.lane)
+            self._grant(best.lane, best.client)
+            best.future.set_result(None)
+
+    def _grant(self, lane: str, client: str) -> None:
+        start = max(self.virtual_time.get(lane, 0.0), self.clock)
+        self.clock = start
+        self.virtual_time[lane] = start + 1.0 / self._weight(lane)
+        self.running += 1
+        self.by_client[client] += 1
+        registry.set_gauge("pqc_llm_slots_in_use", self.running)
+
+    def _has_room(self) -> bool:
+        return self.capacity <= 0 or self.running < self.capacity
+
+    def _weight(self, lane: str) -> float:
+        """대기 중에 가중치 설정에서 빠진 lane은 가장 낮은 가중치로 계속 처리합니다."""
+        return self.weights.get(lane) or min(self.weights.values())
+
+    def _client_free(self, client: str) -> bool:
+        return self.client_limit <= 0 or not client or self.by_client[client] < self.client_limit
+
+    def _report(self, lane: str) -> None:
+        registry.set_gauge("pqc_llm_queue_depth", len(self.queues.get(lane, ())), lane=lane)
+
+
+_scheduler: Optional[FairScheduler] = None
+_scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_llm_scheduler() -> FairScheduler:
+    """
+    프로세스 전체가 공유하는 LLM 슬롯 스케줄러. 대기 Future가 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만들고,
+    슬롯 수/가중치/클라이언트 한도 설정은 대기열을 유지한 채 반영합니다.
+    """
+    global _scheduler, _scheduler_loop
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler_loop is not loop:
+        _scheduler = FairScheduler(settings.LLM_MAX_CONCURRENCY, parse_lane_weights(settings.SCHEDULER_LANE_WEIGHTS),
+                                   settings.CLIENT_MAX_CONCURRENCY)
+        _scheduler_loop = loop
+    else:
+        _scheduler.capacity = settings.LLM_MAX_CONCURRENCY
+        _scheduler.weights = parse_lane_weights(settings.SCHEDULER_LANE_WEIGHTS)
+        _scheduler.client_limit = settings.CLIENT_MAX_CONCURRENCY
+    return _scheduler
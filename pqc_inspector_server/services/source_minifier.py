@@ -0,0 +1,191 @@
+# File: pqc_inspector_server/services/source_minifier.py
+# 🗜️ 소스코드를 LLM에 보내기 전에 판정에 영향이 없는 부분을 걷어내 프롬프트 토큰을 줄입니다.
+# 라이선스 헤더를 포함한 주석, 파이썬 독스트링, 빈 줄, 줄 끝 공백, 줄 가운데의 연속 공백을 지우고,
+# 긴 문자열 리터럴은 앞부분만 남긴 뒤 잘라낸 부분에 있던 알고리즘 이름만 표시합니다.
+# 짧은 문자열("RSA/ECB/PKCS1Padding", "P-256" 등)과 import/호출 코드는 그대로 두므로 판정 근거는 유지됩니다.
+#
+# 언어는 확장자로 정하고, 언어별 정규식 하나로 주석/문자열/공백/코드 토큰을 한 번에 훑습니다(C 구현 정규식이라 수 MB도 빠름).
+# 축소본의 줄마다 원본 줄 번호를 기록해, 모델이 인용한 근거를 원본 위치로 되돌릴 수 있습니다.
+
+import re
+from typing import Dict, List, NamedTuple, Pattern, Tuple
+
+from ..scanners.prescan import prescan
+
+# C 계열 주석(//, /* */)을 쓰는 언어
+_C_STYLE = {
+    ".c", ".h", ".cc", ".cpp", ".cxx", ".hpp", ".hh", ".java", ".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx",
+    ".go", ".rs", ".cs", ".kt", ".kts", ".swift", ".scala", ".php", ".dart", ".m", ".mm",
+}
+# 작은따옴표도 문자열인 언어 (나머지 C 계열에서 작은따옴표는 짧은 문자 리터럴)
+_SINGLE_QUOTE_STRINGS = {".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".php", ".dart"}
+# 백틱 문자열(템플릿 리터럴, Go 원시 문자열)을 쓰는 언어
+_BACKTICK_STRINGS = {".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".go"}
+_PYTHON = {".py", ".pyw", ".pyi"}
+# 줄 주석이 #인 스크립트 언어
+_HASH_STYLE = {".sh", ".bash", ".zsh", ".rb", ".pl", ".pm", ".r"}
+
+_DOUBLE = r'"(?:\\.|[^"\\\n])*"'
+_SINGLE = r"'(?:\\.|[^'\\\n])*'"
+_CHAR = r"'(?:\\.|[^'\\\n]){1,8}'"
+_BACKTICK = r"`[^`]*`"
+_TRIPLE = r"'''(?:\\.|[^\\])*?'''|\"\"\"(?:\\.|[^\\])*?\"\"\""
+_WHITESPACE = r"(?P<newline>\n)|(?P<space>[^\S\n]+)"
+# 파이썬 문자열 접두사(r, b, f 등)만 있는 줄에서 시작한 문자열도 독스트링 후보로 봅니다.
+_PY_PREFIXES = {"r", "u", "b", "f", "br", "rb", "fr", "rf"}
+_BRACKETS = {"(": 1, "[": 1, "{": 1, ")": -1, "]": -1, "}": -1}
+
+
+def _c_style(extension: str) -> Pattern[str]:
+    strings = [_DOUBLE, _SINGLE if extension in _SINGLE_QUOTE_STRINGS else _CHAR]
+    if extension in _BACKTICK_STRINGS:
+        strings.append(_BACKTICK)
+    return re.compile(
+        rf"(?P<comment>/\*.*?(?:\*/|\Z)|//[^\n]*)|(?P<string>{'|'.join(strings)})|{_WHITESPACE}|(?P<code>[^\s/\"'`]+|.)",
+        re.S,
+    )
+
+
+_PATTERNS: Dict[str, Pattern[str]] = {extension: _c_style(extension) for extension in _C_STYLE}
+_PATTERNS.update({extension: re.compile(
+    rf"(?P<comment>#[^\n]*)|(?P<string>{_TRIPLE}|{_DOUBLE}|{_SINGLE})|{_WHITESPACE}|(?P<code>[^\s#\"']+|.)", re.S,
+) for extension in _PYTHON})
+_PATTERNS.update({extension: re.compile(
+    # 셸의 $#, ${#var}처럼 단어 중간의 #은 주석이 아닙니다.
+    rf"(?P<comment>(?<![^\s;])#[^\n]*)|(?P<string>{_DOUBLE}|'[^']*')|{_WHITESPACE}|(?P<code>[^\s#\"']+|.)", re.S,
+) for extension in _HASH_STYLE})
+_PLAIN = re.compile(rf"{_WHITESPACE}|(?P<code>[^\s]+)")
+
+
+class MinifiedSource(NamedTuple):
+    text: str
+    line_map: List[int]      # 축소본 i번째 줄(0부터) → 원본 줄 번호(1부터)
+    language: str            # 축소 규칙을 고른 확장자 (규칙이 없으면 "")
+
+    def original_lines(self, snippet: str, limit: int = 5) -> List[int]:
+        """모델이 인용한 근거(snippet)에 나오는 축소본 줄들의 원본 줄 번호를 찾습니다."""
+        fragments = [fragment.strip().strip("`") for fragment in snippet.splitlines()]
+        fragments = [fragment for fragment in fragments if len(fragment) >= 8]
+        found: List[int] = []
+        for index, line in enumerate(self.text.splitlines()):
+            line = line.strip()
+            if len(line) < 8:
+                continue
+            if any(fragment in line or line in fragment for fragment in fragments):
+                found.append(self.line_map[index])
+                if len(found) >= limit:
+                    break
+        return found
+
+
+def minify_source(content: bytes, file_name: str, max_literal_chars: int) -> MinifiedSource:
+    """
+    content를 UTF-8로 읽어 축소합니다. 규칙이 없는 확장자는 빈 줄과 공백만 정리합니다.
+    max_literal_chars보다 긴 문자열 리터럴은 앞부분만 남깁니다 (0 이하면 그대로 둠).
+    """
+    text = content.decode("utf-8", errors="replace")
+    extension = "." + file_name.rsplit(".", 1)[-1].lower() if "." in file_name else ""
+    pattern = _PATTERNS.get(extension)
+    return _Minifier(extension if pattern else "", max_literal_chars).run(text, pattern or _PLAIN)
+
+
+class _Minifier:
+    def __init__(self, language: str, max_literal_chars: int):
+        self.language = language
+        self.python = language in _PYTHON
+        self.max_literal_chars = max_literal_chars
+        self.lines: List[str] = []
+        self.line_map: List[int] = []
+        self.buffer: List[str] = []
+        self.line = 1          # 지금 읽고 있는 원본 줄 번호
+        self.origin = 1        # 버퍼 첫 토큰의 원본 줄 번호
+        self.depth = 0         # 파이썬 괄호 깊이 (괄호 안의 문자열은 독스트링이 아님)
+        self.continued = False # 직전 줄이 \로 이어짐
+
+    def run(self, text: str, pattern: Pattern[str]) -> MinifiedSource:
+        for match in pattern.finditer(text):
+            kind = match.lastgroup
+            token = match.group()
+            if kind == "newline":
+                self._flush()
+                self.line += 1
+            elif kind == "space":
+                # 들여쓰기는 구조를 나타내므로 두고, 줄 가운데 연속 공백(지운 주석 양쪽 포함)은 하나로 줄입니다.
+                if not self.buffer:
+                    self.origin = self.line
+                    self.buffer.append(token)
+                elif not self.buffer[-1].isspace():
+                    self.buffer.append(" ")
+            elif kind == "comment":
+                self._skip(token)
+            elif kind == "string":
+                if self.python and self._is_docstring(text, match):
+                    self.buffer.clear()
+                    self._skip(token)
+                else:
+                    self._emit(self._shorten(token), token.count("\n"))
+            else:
+                if self.python:
+                    self.depth = max(0, self.depth + sum(_BRACKETS.get(char, 0) for char in token))
+                self._emit(token, 0)
+        self._flush()
+        return MinifiedSource("\n".join(self.lines), self.line_map, self.language)
+
+    def _emit(self, token: str, newlines: int) -> None:
+        if not self.buffer:
+            self.origin = self.line
+        if "\n" not in token:
+            self.buffer.append(token)
+            self.line += newlines
+            return
+        # 여러 줄 문자열을 그대로 둘 때는 줄마다 원본 줄 번호를 기록합니다.
+        first, *rest = token.split("\n")
+        self.buffer.append(first)
+        for part in rest:
+            self._flush(keep_blank=True)
+            self.line += 1
+            self.origin = self.line
+            self.buffer.append(part)
+
+    def _skip(self, token: str) -> None:
+        newlines = token.count("\n")
+        if newlines:
+            self._flush()
+            self.line += newlines
+
+    def _flush(self, keep_blank: bool = False) -> None:
+        line = "".join(self.buffer).rstrip()
+        self.buffer.clear()
+        # 그대로 둔 여러 줄 문자열 안의 빈 줄은 문자열 내용이므로 남깁니다.
+        if line.strip() or keep_blank:
+            self.lines.append(line)
+            self.line_map.append(self.origin)
+            self.continued = line.endswith("\\")
+
+    def _is_docstring(self, text: str, match: "re.Match[str]") -> bool:
+        """괄호 밖에서 줄 처음에 홀로 있는 문자열 문장(모듈/클래스/함수 독스트링 등)인지 봅니다."""
+        prefix = "".join(self.buffer).strip().lower()
+        if self.depth or self.continued or (prefix and prefix not in _PY_PREFIXES):
+            return False
+        end = text.find("\n", match.end())
+        rest = text[match.end():end if end >= 0 else len(text)].strip()
+        return not rest or rest.startswith("#")
+
+    def _shorten(self, token: str) -> str:
+        if self.max_literal_chars <= 0 or len(token) <= self.max_literal_chars:
+            return token
+        opening, closing = _quotes(token)
+        body = token[len(opening):len(token) - len(closing)]
+        keep = max(8, self.max_literal_chars // 2)
+        head = body[:keep].replace("\n", "\\n")
+        # 잘라낸 부분에 알고리즘 이름(PEM 헤더, 암호군 목록 등)이 있으면 계열 이름만 남깁니다.
+        families = sorted(prescan(body[keep:].encode("utf-8", errors="replace")))
+        note = f"…(+{len(body) - keep}자{': ' + ', '.join(families) if families else ''})"
+        return f"{opening}{head}{note}{closing}"
+
+
+def _quotes(token: str) -> Tuple[str, str]:
+    for quote in ('"""', "'''", '"', "'", "`"):
+        if token.startswith(quote) and token.endswith(quote) and len(token) >= 2 * len(quote):
+            return quote, quote
+    return "", ""
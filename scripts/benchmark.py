@@ -0,0 +1,239 @@
+# File: scripts/benchmark.py
+# 📈 실제 Ollama 없이 분석 파이프라인의 처리량과 단계별 지연 시간을 측정하는 벤치마크입니다.
+# 스텁 Ollama 서버(stub_ollama.py)를 띄우고, 합성 코퍼스(소스, 설정, 로그, ELF 바이너리)를
+# 지정한 동시성으로 /api/v1/analyze 에 업로드한 뒤 결과를 JSON으로 기록합니다.
+#
+# 실행 예:
+#   python scripts/benchmark.py --files 200 --concurrency 16 --output bench.json
+#   python scripts/benchmark.py --files 200 --compare bench.json --max-regression 0.10
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from stub_ollama import StubBehaviour, StubOllamaServer, parse_latency_options  # noqa: E402
+
+
+# --- 합성 코퍼스 ---
+
+def _source_file(rng: random.Random, index: int, vulnerable: bool) -> Tuple[str, bytes]:
+    body = [f"def helper_{i}(x):\n    return x * {i} + {rng.randint(0, 999)}\n" for i in range(rng.randint(20, 80))]
+    if vulnerable:
+        body.insert(rng.randrange(len(body)), "import rsa\n(pub, priv) = rsa.newkeys(2048)\nsig = rsa.sign(b'm', priv, 'SHA-256')\n")
+    return f"synthetic/src/module_{index}.py", "".join(body).encode()
+
+
+def _config_file(rng: random.Random, index: int, vulnerable: bool) -> Tuple[str, bytes]:
+    config = {
+        "service": f"svc-{index}",
+        "replicas": rng.randint(1, 8),
+        "jwt": {"algorithm": "RS256" if vulnerable else "HS256", "issuer": "bench"},
+        "tls": {"min_version": "1.2", "ciphers": ["TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256"] if vulnerable else []},
+        "padding": ["x" * 40 for _ in range(rng.randint(5, 50))],
+    }
+    return f"synthetic/config/service_{index}.json", json.dumps(config, indent=2).encode()
+
+
+def _log_file(rng: random.Random, index: int, vulnerable: bool) -> Tuple[str, bytes]:
+    lines = []
+    for n in range(rng.randint(200, 1000)):
+        ip = ".".join(str(rng.randint(1, 254)) for _ in range(4))
+        if vulnerable and n % 7 == 0:
+            lines.append(f"2024-05-01T12:00:{n % 60:02d}Z nginx: SSL handshake from {ip} cipher=ECDHE-RSA-AES128-GCM-SHA256 group=secp256r1")
+        else:
+            lines.append(f"2024-05-01T12:00:{n % 60:02d}Z nginx: GET /api/{n} 200 from {ip}")
+    return f"synthetic/logs/access_{index}.log", "\n".join(lines).encode()
+
+
+def _elf_file(rng: random.Random, index: int, vulnerable: bool) -> Tuple[str, bytes]:
+    header = b"\x7fELF\x02\x01\x01" + b"\x00" * 9
+    payload = bytearray(rng.getrandbits(8) for _ in range(rng.randint(16, 64) * 1024))
+    marker = b"RSA_public_encrypt\x00EVP_PKEY_RSA\x00" if vulnerable else b"memcpy\x00strlen\x00"
+    offset = rng.randrange(len(payload) - len(marker))
+    payload[offset:offset + len(marker)] = marker
+    return f"synthetic/bin/tool_{index}", header + bytes(payload)
+
+
+GENERATORS = {"source": _source_file, "config": _config_file, "log": _log_file, "elf": _elf_file}
+
+
+def build_corpus(count: int, kinds: List[str], vulnerable_ratio: float, seed: int) -> List[Tuple[str, bytes]]:
+    rng = random.Random(seed)
+    return [GENERATORS[kinds[i % len(kinds)]](rng, i, rng.random() < vulnerable_ratio) for i in range(count)]
+
+
+# --- 통계 ---
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+        "p50": percentile(ordered, 0.50),
+        "p95": percentile(ordered, 0.95),
+        "p99": percentile(ordered, 0.99),
+        "max": ordered[-1] if ordered else 0.0,
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# --- 실행 ---
+
+async def run_benchmark(args, stub_url: str) -> Dict:
+    # 설정은 임포트 시점에 환경 변수에서 읽히므로, 스텁 주소를 먼저 지정한 뒤 앱을 불러옵니다.
+    os.environ["OLLAMA_BASE_URL"] = stub_url
+    os.environ["EXTERNAL_API_BASE_URL"] = stub_url
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    # 합성 코퍼스는 서로 비슷한 파일이 많아 결과 캐시를 켜면 파이프라인이 아니라 캐시를 측정하게 됩니다.
+    os.environ["RESULT_CACHE_ENABLED"] = "true" if args.result_cache else "false"
+    os.environ["CHUNK_CACHE_ENABLED"] = "true" if args.result_cache else "false"
+
+    import httpx
+    import main
+    from pqc_inspector_server.core.telemetry import add_span_listener, registry
+
+    stage_durations: Dict[str, List[float]] = defaultdict(list)
+    add_span_listener(lambda stage, duration, status, labels: stage_durations[stage].append(duration))
+
+    corpus = build_corpus(args.files, args.kinds, args.vulnerable_ratio, args.seed)
+    corpus_bytes = sum(len(content) for _, content in corpus)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    end_to_end: List[float] = []
+    errors = 0
+
+    # ASGI 전송을 사용하면 응답은 백그라운드 분석까지 끝난 뒤 반환되므로, 요청 시간이 곧 파일당 전체 처리 시간입니다.
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def submit(name: str, content: bytes):
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/api/v1/analyze", files={"file": (name, content)})
+                end_to_end.append(time.perf_counter() - started)
+                if response.status_code != 202:
+                    errors += 1
+
+        tracemalloc.start()
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(submit(name, content) for name, content in corpus))
+        wall = time.perf_counter() - wall_start
+        _, peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    tokens = {
+        f"{dict(key)['model']}:{dict(key)['kind']}": value
+        for key, value in registry.counters.get("pqc_llm_tokens_total", {}).items()
+    }
+    llm_latency = {
+        dict(key)["model"]: {"count": histogram.count, "mean": histogram.sum / histogram.count if histogram.count else 0.0}
+        for key, histogram in registry.histograms.get("pqc_llm_request_duration_seconds", {}).items()
+    }
+
+    return {
+        "schema": "pqc-inspector-benchmark/1",
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": {
+            "files": args.files,
+            "concurrency": args.concurrency,
+            "kinds": args.kinds,
+            "vulnerable_ratio": args.vulnerable_ratio,
+            "seed": args.seed,
+            "latency": args.latency or [],
+            "default_latency": args.default_latency,
+            "corpus_bytes": corpus_bytes,
+        },
+        "wall_seconds": wall,
+        "throughput_files_per_s": len(corpus) / wall if wall else 0.0,
+        "throughput_bytes_per_s": corpus_bytes / wall if wall else 0.0,
+        "errors": errors,
+        "latency_seconds": {
+            "end_to_end": summarize(end_to_end),
+            **{stage: summarize(values) for stage, values in sorted(stage_durations.items())},
+        },
+        "llm": {"tokens": tokens, "request_latency_seconds": llm_latency},
+        "memory": {
+            "python_heap_peak_bytes": peak_traced,
+            # Linux에서 ru_maxrss 단위는 KB, macOS에서는 바이트입니다.
+            "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024),
+        },
+    }
+
+
+def compare(current: Dict, baseline: Dict, max_regression: float) -> List[str]:
+    """기준 결과 대비 처리량 감소와 p95 지연 증가가 허용치를 넘는 항목을 반환합니다."""
+    regressions = []
+    base_tp, cur_tp = baseline["throughput_files_per_s"], current["throughput_files_per_s"]
+    if base_tp and (base_tp - cur_tp) / base_tp > max_regression:
+        regressions.append(f"throughput {base_tp:.2f} → {cur_tp:.2f} files/s")
+    for stage, stats in current["latency_seconds"].items():
+        base = baseline["latency_seconds"].get(stage)
+        if base and base["p95"] and (stats["p95"] - base["p95"]) / base["p95"] > max_regression:
+            regressions.append(f"{stage} p95 {base['p95'] * 1000:.1f}ms → {stats['p95'] * 1000:.1f}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PQC Inspector 오프라인 벤치마크")
+    parser.add_argument("--files", type=int, default=100, help="합성 파일 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 업로드 수")
+    parser.add_argument("--kinds", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--vulnerable-ratio", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", action="append", help="모델별 지연 분포 (예: gemma:7b=lognormal:-0.5:0.4)")
+    parser.add_argument("--default-latency", default="uniform:0.05:0.15")
+    parser.add_argument("--result-cache", action="store_true", help="파일/청크 결과 캐시를 켠 채로 측정")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="허용하는 성능 저하 비율")
+    args = parser.parse_args()
+
+    behaviour = StubBehaviour(parse_latency_options(args.latency), args.default_latency)
+    with StubOllamaServer(behaviour) as server:
+        result = asyncio.run(run_benchmark(args, server.url))
+
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.max_regression)
+        for line in regressions:
+            print(f"REGRESSION: {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
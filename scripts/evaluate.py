@@ -0,0 +1,218 @@
+# File: scripts/evaluate.py
+# 🎯 라벨이 붙은 코퍼스(data/eval_corpus/labels.jsonl)로 파이프라인 설정별 탐지 정확도와 비용을 비교하는 평가 도구입니다.
+# 내용 창 크기(truncation), 청크 분석, 결정적 사전 스캔, 오케스트레이터 검증을 조합한 각 설정에 대해
+# 알고리즘별 정밀도(precision)/재현율(recall)과 처리 시간, 토큰 사용량을 함께 보고합니다.
+# 탐지를 잃지 않는 설정 중 가장 빠른 설정을 추천합니다.
+#
+# 실행 예:
+#   python scripts/evaluate.py                                   # 실제 Ollama 사용
+#   python scripts/evaluate.py --stub --output eval.json         # 스텁 Ollama로 배관(plumbing)만 확인
+#   python scripts/evaluate.py --max-chars 2000 --prescan on --validation off on
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_LABELS = os.path.join(ROOT, "data", "eval_corpus", "labels.jsonl")
+
+
+def load_corpus(labels_path: str) -> List[Dict]:
+    corpus = []
+    with open(labels_path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            with open(os.path.join(ROOT, entry["path"]), "rb") as sample:
+                entry["content"] = sample.read()
+            corpus.append(entry)
+    return corpus
+
+
+def build_grid(args) -> List[Dict]:
+    on_off = {"on": True, "off": False}
+    return [
+        {
+            "max_chars": max_chars,
+            "max_tokens": max_tokens,
+            "chunking": on_off[chunking],
+            "prescan": on_off[prescan],
+            "validation": on_off[validation],
+        }
+        for max_chars, max_tokens, chunking, prescan, validation in itertools.product(
+            args.max_chars, args.max_tokens, args.chunking, args.prescan, args.validation
+        )
+    ]
+
+
+def config_name(config: Dict) -> str:
+    return (
+        f"chars={config['max_chars']} tokens={config['max_tokens'] or 'ctx'} chunk={'on' if config['chunking'] else 'off'} "
+        f"prescan={'on' if config['prescan'] else 'off'} validate={'on' if config['validation'] else 'off'}"
+    )
+
+
+def _ratio(numerator: int, denominator: int) -> Optional[float]:
+    return numerator / denominator if denominator else None
+
+
+async def evaluate_config(config: Dict, corpus: List[Dict]) -> Dict:
+    from pqc_inspector_server.core.config import settings
+    from pqc_inspector_server.core.telemetry import registry
+    from pqc_inspector_server.orchestrator.controller import OrchestratorController
+    from pqc_inspector_server.scanners.algorithms import CLASSICAL_FAMILIES, canonicalize
+
+    settings.AGENT_MAX_CONTENT_CHARS = config["max_chars"]
+    settings.AGENT_MAX_CONTENT_TOKENS = config["max_tokens"]
+    settings.AGENT_CHUNKING_ENABLED = config["chunking"]
+    settings.PRESCAN_ENABLED = config["prescan"]
+    settings.VALIDATION_ENABLED = config["validation"]
+    # 설정 조합끼리 결과를 재사용하면 비교가 무의미하므로 결과 캐시는 끕니다.
+    settings.RESULT_CACHE_ENABLED = False
+    settings.CHUNK_CACHE_ENABLED = False
+    controller = OrchestratorController(api_client=None)
+
+    def tokens_used() -> float:
+        return sum(registry.counters.get("pqc_llm_tokens_total", {}).values())
+
+    counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {"tp": 0, "fp": 0, "fn": 0})
+    by_file_type: Dict[str, Dict[str, int]] = defaultdict(lambda: {"tp": 0, "fp": 0, "fn": 0})
+    samples = []
+    wall_total = 0.0
+    tokens_start = tokens_used()
+
+    for entry in corpus:
+        expected: Set[str] = set(entry["expected_algorithms"])
+        tokens_before = tokens_used()
+        started = time.perf_counter()
+        result = await controller.analyze_content(entry["path"], entry["content"])
+        elapsed = time.perf_counter() - started
+        wall_total += elapsed
+
+        predicted: Set[str] = set()
+        if result.is_pqc_vulnerable:
+            predicted = {f for f in canonicalize(result.detected_algorithms or []) if f in CLASSICAL_FAMILIES}
+
+        for family in predicted | expected:
+            outcome = "tp" if family in predicted and family in expected else ("fp" if family in predicted else "fn")
+            counts[family][outcome] += 1
+            by_file_type[result.file_type][outcome] += 1
+
+        samples.append({
+            "path": entry["path"],
+            "file_type": result.file_type,
+            "expected": sorted(expected),
+            "predicted": sorted(predicted),
+            "missed": sorted(expected - predicted),
+            "false_positives": sorted(predicted - expected),
+            "seconds": elapsed,
+            "tokens": tokens_used() - tokens_before,
+        })
+
+    def score(c: Dict[str, int]) -> Dict:
+        return {**c, "precision": _ratio(c["tp"], c["tp"] + c["fp"]), "recall": _ratio(c["tp"], c["tp"] + c["fn"])}
+
+    micro = {k: sum(c[k] for c in counts.values()) for k in ("tp", "fp", "fn")}
+    return {
+        "name": config_name(config),
+        "config": config,
+        "wall_seconds": wall_total,
+        "seconds_per_file": wall_total / len(corpus) if corpus else 0.0,
+        "tokens": tokens_used() - tokens_start,
+        "micro": score(micro),
+        "per_algorithm": {family: score(c) for family, c in sorted(counts.items())},
+        "per_file_type": {file_type: score(c) for file_type, c in sorted(by_file_type.items())},
+        "samples": samples,
+    }
+
+
+def recommend(results: List[Dict], recall_tolerance: float) -> Optional[Dict]:
+    """가장 높은 재현율에서 허용치 이내인 설정 중 가장 빠른 설정을 고릅니다."""
+    recalls = [r["micro"]["recall"] or 0.0 for r in results]
+    if not recalls:
+        return None
+    best = max(recalls)
+    eligible = [r for r, recall in zip(results, recalls) if recall >= best - recall_tolerance]
+    return min(eligible, key=lambda r: r["wall_seconds"])
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "  -  " if value is None else f"{value:.3f}"
+
+
+def print_table(results: List[Dict], recommended: Optional[Dict]) -> None:
+    families = sorted({family for r in results for family in r["per_algorithm"]})
+    header = f"{'configuration':<52} {'P':>6} {'R':>6} {'sec/file':>9} {'tokens':>8}  " + " ".join(f"{f:>11}" for f in families)
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        per_algorithm = " ".join(
+            f"{_fmt(r['per_algorithm'].get(f, {}).get('precision'))}/{_fmt(r['per_algorithm'].get(f, {}).get('recall'))}"
+            for f in families
+        )
+        marker = " *" if r is recommended else ""
+        print(
+            f"{r['name']:<52} {_fmt(r['micro']['precision']):>6} {_fmt(r['micro']['recall']):>6} "
+            f"{r['seconds_per_file']:>9.3f} {int(r['tokens']):>8}  {per_algorithm}{marker}"
+        )
+    if recommended:
+        print(f"\n추천 설정 (*): {recommended['name']}")
+
+
+async def run(args) -> Dict:
+    corpus = load_corpus(args.labels)
+    results = []
+    for config in build_grid(args):
+        result = await evaluate_config(config, corpus)
+        results.append(result)
+        print(f"평가 완료: {result['name']} (recall={_fmt(result['micro']['recall'])}, {result['wall_seconds']:.1f}s)", file=sys.stderr)
+    recommended = recommend(results, args.recall_tolerance)
+    print_table(results, recommended)
+    return {
+        "schema": "pqc-inspector-evaluation/1",
+        "labels": os.path.relpath(args.labels, ROOT),
+        "corpus_size": len(corpus),
+        "recommended": recommended["name"] if recommended else None,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PQC Inspector 탐지 정확도 대비 지연 시간 평가")
+    parser.add_argument("--labels", default=DEFAULT_LABELS, help="라벨 파일 (JSON Lines)")
+    parser.add_argument("--max-chars", nargs="+", type=int, default=[1000, 2000, 4000], help="청크 크기(글자) 후보")
+    parser.add_argument("--max-tokens", nargs="+", type=int, default=[0], help="프롬프트 내용 토큰 상한 후보 (0이면 컨텍스트를 채움)")
+    parser.add_argument("--chunking", nargs="+", choices=["on", "off"], default=["off", "on"])
+    parser.add_argument("--prescan", nargs="+", choices=["on", "off"], default=["off", "on"])
+    parser.add_argument("--validation", nargs="+", choices=["on", "off"], default=["on", "off"])
+    parser.add_argument("--recall-tolerance", type=float, default=0.0, help="추천 시 허용하는 재현율 손실")
+    parser.add_argument("--stub", action="store_true", help="스텁 Ollama 서버를 사용 (정확도 수치는 의미 없음)")
+    parser.add_argument("--output", help="전체 결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.stub:
+        from stub_ollama import StubBehaviour, StubOllamaServer
+        with StubOllamaServer(StubBehaviour()) as server:
+            os.environ["OLLAMA_BASE_URL"] = server.url
+            report = asyncio.run(run(args))
+    else:
+        report = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
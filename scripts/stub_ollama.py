@@ -0,0 +1,219 @@
+# File: scripts/stub_ollama.py
+# 🧪 GPU 없이 성능을 측정하기 위한 Ollama 채팅 API 스텁 서버입니다.
+# /api/chat, /api/tags 를 흉내 내며, 모델별로 설정한 지연 분포만큼 기다린 뒤 미리 정해진 JSON 응답을 돌려줍니다.
+# 외부 결과 저장 API(/posts)도 함께 흉내 내므로 벤치마크 전체를 오프라인으로 실행할 수 있습니다.
+#
+# 단독 실행 예:
+#   python scripts/stub_ollama.py --port 11555 --latency "gemma:7b=lognormal:-0.5:0.4" --latency "codellama:7b=uniform:0.5:1.5"
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+CRYPTO_PATTERNS = {
+    "RSA": re.compile(r"\brsa|RS256|RS384|RS512|PS256|sha\d+WithRSA", re.IGNORECASE),
+    "ECDSA": re.compile(r"ecdsa|ES256|ES384|secp\d+r1|prime256v1", re.IGNORECASE),
+    "ECDH": re.compile(r"ecdhe?|x25519\b", re.IGNORECASE),
+    "DSA": re.compile(r"\bdsa\b", re.IGNORECASE),
+}
+
+EXTENSION_TYPES = {
+    ".py": "source_code", ".java": "source_code", ".c": "source_code", ".go": "source_code", ".js": "source_code",
+    ".json": "parameter", ".yaml": "parameter", ".yml": "parameter", ".xml": "parameter", ".toml": "parameter",
+    ".log": "log_conf", ".conf": "log_conf",
+}
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    지연 분포 명세를 샘플링 함수로 변환합니다. (단위: 초)
+    fixed:S | uniform:LO:HI | normal:MEAN:STD | lognormal:MU:SIGMA | exponential:MEAN
+    """
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+    if kind == "fixed":
+        return lambda: values[0]
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda: max(0.0, random.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(values[0], values[1])
+    if kind == "exponential":
+        return lambda: random.expovariate(1.0 / values[0])
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+
+class StubBehaviour:
+    """모델별 지연 분포와 역할(분류/에이전트/검증)별 고정 응답을 보관합니다."""
+
+    def __init__(self, latencies: Optional[Dict[str, str]] = None, default_latency: str = "fixed:0",
+                 canned: Optional[Dict[str, str]] = None):
+        self.default_latency = parse_latency(default_latency)
+        self.latencies = {model: parse_latency(spec) for model, spec in (latencies or {}).items()}
+        self.canned = canned or {}
+        self.models = sorted(set(self.latencies) | {"gemma:7b", "codellama:7b"})
+
+    def latency_for(self, model: str) -> float:
+        return self.latencies.get(model, self.default_latency)()
+
+    def respond(self, system_prompt: str, prompt: str) -> str:
+        if "분류 전문가" in system_prompt:
+            return self.canned.get("classify") or self._classify(prompt)
+        if "검증" in system_prompt:
+            return self.canned.get("validate") or self._validate(prompt)
+        return self.canned.get("agent") or self._agent(prompt)
+
+    @staticmethod
+    def _classify(prompt: str) -> str:
+        match = re.search(r"파일명: (\S+)", prompt)
+        extension = os.path.splitext(match.group(1))[1].lower() if match else ""
+        file_type = EXTENSION_TYPES.get(extension, "binary")
+        return json.dumps({"file_type": file_type, "confidence": 0.9, "reasoning": "stub: extension"})
+
+    @staticmethod
+    def _agent(prompt: str) -> str:
+        algorithms = [name for name, pattern in CRYPTO_PATTERNS.items() if pattern.search(prompt)]
+        return json.dumps({
+            "is_pqc_vulnerable": bool(algorithms),
+            "vulnerability_details": f"stub detected {', '.join(algorithms)}" if algorithms else "stub: clean",
+            "detected_algorithms": algorithms,
+            "recommendations": "Migrate to ML-KEM / ML-DSA" if algorithms else "",
+            "evidence": "stub",
+            "confidence_score": 0.8 if algorithms else 0.6,
+        })
+
+    @staticmethod
+    def _validate(prompt: str) -> str:
+        start = prompt.find("에이전트 분석 결과:")
+        start = prompt.find("{", start)
+        end = prompt.find("\n}", start)
+        try:
+            result = json.loads(prompt[start:end + 2])
+        except ValueError:
+            result = {"is_pqc_vulnerable": False, "detected_algorithms": [], "confidence_score": 0.0}
+        result["orchestrator_summary"] = "stub validation"
+        return json.dumps(result, ensure_ascii=False)
+
+
+def _make_handler(behaviour: StubBehaviour):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):  # 요청마다 stderr에 찍지 않도록 비활성화
+            pass
+
+        def _send_json(self, status: int, payload) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def do_GET(self):
+            if self.path.startswith("/api/tags"):
+                self._send_json(200, {"models": [{"name": m, "model": m} for m in behaviour.models]})
+            elif self.path.startswith("/posts"):
+                self._send_json(200, [])
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            request = self._read_json()
+            if self.path.startswith("/posts"):
+                self._send_json(201, {"id": 101, **request})
+                return
+            if not self.path.startswith("/api/chat"):
+                self._send_json(404, {"error": "not found"})
+                return
+
+            model = request.get("model", "")
+            messages = request.get("messages") or []
+            system_prompt = next((m["content"] for m in messages if m.get("role") == "system"), "")
+            prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+
+            started = time.perf_counter()
+            time.sleep(behaviour.latency_for(model))
+            content = behaviour.respond(system_prompt, prompt)
+            elapsed_ns = int((time.perf_counter() - started) * 1e9)
+
+            self._send_json(200, {
+                "model": model,
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+                "done_reason": "stop",
+                "total_duration": elapsed_ns,
+                "load_duration": 0,
+                # 토큰 수는 글자 수 / 4 로 근사합니다.
+                "prompt_eval_count": (len(system_prompt) + len(prompt)) // 4,
+                "eval_count": len(content) // 4,
+            })
+
+    return Handler
+
+
+class StubOllamaServer:
+    """백그라운드 스레드에서 동작하는 스텁 서버. with 문으로 사용할 수 있습니다."""
+
+    def __init__(self, behaviour: StubBehaviour, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(behaviour))
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubOllamaServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def parse_latency_options(options) -> Dict[str, str]:
+    """'model=spec' 형태의 옵션 목록을 딕셔너리로 변환합니다."""
+    latencies = {}
+    for option in options or []:
+        model, _, spec = option.partition("=")
+        parse_latency(spec)  # 형식 검증
+        latencies[model] = spec
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama 채팅 API 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11555)
+    parser.add_argument("--latency", action="append", help="모델별 지연 분포 (예: gemma:7b=lognormal:-0.5:0.4)")
+    parser.add_argument("--default-latency", default="fixed:0")
+    parser.add_argument("--canned", help="역할(classify/agent/validate)별 고정 응답을 담은 JSON 파일")
+    args = parser.parse_args()
+
+    canned = json.load(open(args.canned, encoding="utf-8")) if args.canned else None
+    behaviour = StubBehaviour(parse_latency_options(args.latency), args.default_latency, canned)
+    with StubOllamaServer(behaviour, args.host, args.port) as server:
+        print(f"스텁 Ollama 서버 실행 중: {server.url}  (Ctrl+C로 종료)")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
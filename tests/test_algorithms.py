@@ -0,0 +1,40 @@
+# File: tests/test_algorithms.py
+# 알고리즘 표기 정규화 테이블 테스트
+
+import pytest
+
+from pqc_inspector_server.scanners.algorithms import canonical_families, canonicalize
+
+
+@pytest.mark.parametrize("name, families", [
+    ("RS256", {"RSA"}),
+    ("PS512", {"RSA"}),
+    ("ES256K", {"ECDSA"}),
+    ("sha256WithRSAEncryption", {"RSA"}),
+    ("SHA256withRSA", {"RSA"}),
+    ("rsaEncryption", {"RSA"}),
+    ("BCRSAPublicKey", {"RSA"}),
+    ("JsonRsaKey", {"RSA"}),
+    ("EVP_PKEY_RSA", {"RSA"}),
+    ("ECDHE-RSA-AES128-GCM-SHA256", {"ECDH", "RSA"}),
+    ("DHE-RSA-AES256-SHA", {"DH", "RSA"}),
+    ("ssh-ed25519", {"EdDSA"}),
+    ("ecdsa-sha2-nistp256", {"ECDSA"}),
+    ("ssh-dss", {"DSA"}),
+    ("X25519MLKEM768", {"ECDH", "ML-KEM"}),
+    ("sntrup761x25519-sha512", {"ECDH", "NTRU-Prime"}),
+    ("ML-DSA-65", {"ML-DSA"}),
+    ("SLH-DSA-SHA2-128s", {"SLH-DSA"}),
+])
+def test_canonical_families(name, families):
+    assert canonical_families(name) == families
+
+
+@pytest.mark.parametrize("name", ["universal", "traversal", "conversation", "Reversal", "TRAVERSAL", "UNIVERSAL", "PARSABLE",
+                                  "AES-256-GCM", "HMAC-SHA256", "HS256", "ADHESIVE"])
+def test_non_public_key_names(name):
+    assert canonical_families(name) == set()
+
+
+def test_canonicalize_deduplicates():
+    assert canonicalize(["RS256", "rsaEncryption", "ECDHE-ECDSA-AES128-GCM-SHA256"]) == ["ECDH", "ECDSA", "RSA"]
@@ -0,0 +1,22 @@
+# File: tests/test_carving.py
+# 바이너리 속 인증서/키 카빙과 엔트로피 구간 테스트
+
+import random
+
+from pqc_inspector_server.scanners.carving import carve
+from test_certificates import _cert, _ec_spki, _pem, _rsa_spki
+
+
+def test_carve_finds_embedded_objects_with_offsets():
+    certificate = _cert(_rsa_spki())
+    blob = b"\x00" * 5000 + certificate + b"\xff" * 3000 + _pem("PUBLIC KEY", _ec_spki()) + b"\x00" * 100
+    result = carve(blob, "firmware.bin")
+    found = [(obj["kind"], obj["key_algorithm"], obj["offset"]) for obj in result.objects]
+    assert found == [("certificate", "RSA", 5000), ("public_key", "EC", 5000 + len(certificate) + 3000)]
+
+
+def test_carve_random_bytes_are_high_entropy_without_objects():
+    data = random.Random(1).randbytes(300000)
+    result = carve(data, "random.bin")
+    assert result.objects == []
+    assert result.high_entropy and result.high_entropy[0][0] == 0
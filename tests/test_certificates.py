@@ -0,0 +1,121 @@
+# File: tests/test_certificates.py
+# DER 워커, 인증서/키 파서 테스트 (DER은 테스트 안에서 직접 인코딩합니다)
+
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from pqc_inspector_server.scanners import asn1
+from pqc_inspector_server.scanners.certificates import detect_key_material, scan_key_material
+
+_RSA = "1.2.840.113549.1.1.1"
+_EC = "1.2.840.10045.2.1"
+_P256 = "1.2.840.10045.3.1.7"
+_SHA256_RSA = "1.2.840.113549.1.1.11"
+_ECDSA_SHA256 = "1.2.840.10045.4.3.2"
+_ML_DSA_65 = "2.16.840.1.101.3.4.3.18"
+
+
+def _tlv(tag, body):
+    if len(body) < 0x80:
+        length = bytes([len(body)])
+    else:
+        size = len(body).to_bytes((len(body).bit_length() + 7) // 8, "big")
+        length = bytes([0x80 | len(size)]) + size
+    return bytes([tag]) + length + body
+
+
+def _seq(*parts):
+    return _tlv(0x30, b"".join(parts))
+
+
+def _oid(dotted):
+    return _tlv(0x06, asn1.encode_oid(dotted))
+
+
+def _int(value):
+    return _tlv(0x02, value.to_bytes(value.bit_length() // 8 + 1, "big"))
+
+
+def _bits(body):
+    return _tlv(0x03, b"\x00" + body)
+
+
+def _rsa_spki(size=2048):
+    return _seq(_seq(_oid(_RSA), b"\x05\x00"), _bits(_seq(_int((1 << (size - 1)) | 1), _int(65537))))
+
+
+def _ec_spki():
+    return _seq(_seq(_oid(_EC), _oid(_P256)), _bits(b"\x04" + b"\x11" * 64))
+
+
+def _pqc_spki():
+    return _seq(_seq(_oid(_ML_DSA_65)), _bits(b"\x22" * 1952))
+
+
+def _name(common_name):
+    return _seq(_tlv(0x31, _seq(_oid("2.5.4.3"), _tlv(0x0C, common_name.encode()))))
+
+
+def _cert(spki, signature=_SHA256_RSA, not_after=b"351231000000Z"):
+    algorithm = _seq(_oid(signature), b"\x05\x00")
+    validity = _seq(_tlv(0x17, b"240101000000Z"), _tlv(0x17, not_after))
+    tbs = _seq(_tlv(0xA0, _int(2)), _int(1), algorithm, _name("test"), validity, _name("test"), spki)
+    return _seq(tbs, algorithm, _bits(b"\x00" * 256))
+
+
+def _pem(label, der):
+    return f"-----BEGIN {label}-----\n".encode() + base64.encodebytes(der) + f"-----END {label}-----\n".encode()
+
+
+def test_asn1_oid_round_trip_and_truncation():
+    assert asn1.decode_oid(asn1.encode_oid(_ML_DSA_65)) == _ML_DSA_65
+    der = _rsa_spki()
+    assert asn1.read(der, 0)[3] == len(der)
+    with pytest.raises(asn1.DERError):
+        asn1.read(der[:-10], 0)
+
+
+def test_asn1_indefinite_length():
+    # BER 무한 길이 SEQUENCE { INTEGER 5 } EOC
+    data = b"\x30\x80\x02\x01\x05\x00\x00"
+    tag, start, end, following = asn1.read(data, 0)
+    assert (tag, following) == (0x30, len(data))
+    assert asn1.child_list(data, (tag, start, end, following))[0][0] == asn1.INTEGER
+
+
+def test_der_public_key():
+    scan = scan_key_material(_rsa_spki(3072), "server.der")
+    [obj] = scan.objects
+    assert (scan.format, obj["kind"], obj["key_algorithm"], obj["key_size"]) == ("der", "public_key", "RSA", 3072)
+    assert scan.findings[0]["status"] == "classical"
+
+
+def test_pem_certificate_fields():
+    scan = scan_key_material(_pem("CERTIFICATE", _cert(_ec_spki(), _ECDSA_SHA256)), "chain.crt")
+    [obj] = scan.objects
+    assert (obj["kind"], obj["curve"], obj["signature_algorithm"]) == ("certificate", "P-256", "ecdsa-with-SHA256")
+    assert obj["subject"] == "CN=test"
+    assert obj["not_after"] == datetime(2035, 12, 31, tzinfo=timezone.utc)
+    assert scan.findings[0]["families"] == ["ECDSA"]
+
+
+def test_pqc_key_signed_with_rsa_is_classical():
+    scan = scan_key_material(_cert(_pqc_spki()), "pqc.der")
+    [finding] = scan.findings
+    assert set(finding["families"]) == {"ML-DSA", "RSA"} and finding["status"] == "classical"
+
+
+def test_summary_counts_long_lived_classical_certificates():
+    bundle = b"".join(_pem("CERTIFICATE", _cert(_rsa_spki())) for _ in range(3))
+    scan = scan_key_material(bundle, "ca-bundle.pem")
+    lines = scan.summary(now=datetime(2025, 1, 1, tzinfo=timezone.utc))
+    assert lines[0].startswith("×3 인증서 RSA-2048")
+    assert "고전 키 인증서 3개" in lines[-1]
+
+
+def test_not_key_material():
+    assert detect_key_material("notes.txt", b"hello") is None
+    # 확장자가 없는 DER은 파일 전체가 구조 하나일 때만 인정합니다.
+    assert detect_key_material("blob", _rsa_spki() + b"trailing") is None
@@ -0,0 +1,106 @@
+# File: tests/test_chunking.py
+# 내용 기반 청크 분할과 청크 캐시용 창 구성 테스트
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from pqc_inspector_server.agents import base_agent
+from pqc_inspector_server.agents.base_agent import merge_agent_results
+from pqc_inspector_server.agents.source_code import SourceCodeAgent
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.chunking import content_defined_chunks, group_chunks, scored_chunks
+from pqc_inspector_server.services.prompt_budget import EstimateCounter, PromptBudget
+from pqc_inspector_server.services.result_cache import ChunkResultCache
+
+
+def _source(lines=2000, seed=7):
+    rng = random.Random(seed)
+    return "".join(f"def function_{i}(value):\n    return value * {rng.randint(1, 10 ** 6)}\n\n" for i in range(lines // 3))
+
+
+def test_chunks_cover_text_within_size():
+    text = _source()
+    chunks = content_defined_chunks(text, 2000)
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 2000 for chunk in chunks)
+
+
+def test_local_edit_changes_few_chunks():
+    text = _source()
+    lines = text.splitlines(keepends=True)
+    lines.insert(len(lines) // 2, "    # 한 줄 추가\n")
+    before = content_defined_chunks(text, 2000)
+    after = content_defined_chunks("".join(lines), 2000)
+    assert len(set(after) - set(before)) <= 2
+
+
+def test_scored_chunks_rank_crypto_higher():
+    text = _source(300) + "key = rsa.generate_private_key(public_exponent=65537, key_size=2048)\n" + _source(300, seed=8)
+    chunks = scored_chunks(text.encode(), 2000)
+    best = max(chunks, key=lambda chunk: chunk[1])[0]
+    assert "rsa.generate_private_key" in best
+
+
+def test_group_chunks_respects_limit_and_order():
+    chunks = [f"chunk {i}\n" for i in range(100)]
+    groups = group_chunks(chunks, [10] * 100, 60, 4)
+    assert [index for group in groups for index in group] == list(range(100))
+    assert all(len(group) * 10 <= 60 for group in groups)
+
+
+def test_cache_windows_change_locally_without_chunking(monkeypatch):
+    # 회귀: 청크 분석이 꺼진 기본 설정에서는 창이 하나여서, 어느 청크를 고쳐도 프롬프트 전체를 다시 보냈습니다.
+    monkeypatch.setattr(settings, "AGENT_CHUNKING_ENABLED", False)
+    monkeypatch.setattr(settings, "CHUNK_CACHE_ENABLED", True)
+    agent = SourceCodeAgent()
+    budget = PromptBudget(EstimateCounter(), 4096, 512)
+    text = _source(3000)
+    lines = text.splitlines(keepends=True)
+    middle = len(lines) // 2 // 3 * 3 + 1  # 가운데 함수의 return 줄
+    lines[middle] = lines[middle].replace("return", "return -")
+    before, _ = asyncio.run(agent._content_windows(text, budget, 3000))
+    after, _ = asyncio.run(agent._content_windows("".join(lines), budget, 3000))
+    assert len(before) > 3 and "".join(before) == text
+    assert all(budget.count(window) <= 3000 for window in before)
+    assert 1 <= len(set(after) - set(before)) <= 2
+
+
+def test_single_window_without_cache(monkeypatch):
+    monkeypatch.setattr(settings, "AGENT_CHUNKING_ENABLED", False)
+    monkeypatch.setattr(settings, "CHUNK_CACHE_ENABLED", False)
+    budget = PromptBudget(EstimateCounter(), 4096, 512)
+    windows, _ = asyncio.run(SourceCodeAgent()._content_windows(_source(3000), budget, 3000))
+    assert len(windows) == 1 and budget.count(windows[0]) <= 3000
+
+
+def test_chunk_cache_key_ignores_file_name_but_not_extension():
+    assert ChunkResultCache.key("source", "m", "a/x.py", "body") == ChunkResultCache.key("source", "m", "b/y.py", "body")
+    assert ChunkResultCache.key("source", "m", "x.py", "body") != ChunkResultCache.key("source", "m", "x.js", "body")
+
+
+def test_zero_max_chunks_still_analyzes_one_window(monkeypatch):
+    # 회귀: AGENT_MAX_CHUNKS=0이면 LLM에 보낸 창이 없어 merge_agent_results의 max()가 ValueError를 냈습니다.
+    monkeypatch.setattr(settings, "AGENT_MAX_CHUNKS", 0)
+    monkeypatch.setattr(settings, "CHUNK_CACHE_ENABLED", False)
+    budget = PromptBudget(EstimateCounter(), 4096, 512)
+
+    async def prompt_budget(model):
+        return budget
+
+    prompts = []
+
+    async def call_llm(prompt):
+        prompts.append(prompt)
+        return {"success": True, "content": json.dumps({"is_pqc_vulnerable": True, "detected_algorithms": ["RSA"],
+                                                        "confidence_score": 0.8})}
+
+    monkeypatch.setattr(base_agent, "get_prompt_budget", prompt_budget)
+    agent = SourceCodeAgent()
+    agent._call_llm = call_llm
+    result = asyncio.run(agent._analyze_text("key = rsa.generate_private_key()\n", "a.py"))
+    assert len(prompts) == 1 and result["detected_algorithms"] == ["RSA"]
+    with pytest.raises(ValueError):
+        merge_agent_results([])
@@ -0,0 +1,66 @@
+# File: tests/test_config_tree.py
+# 설정 트리 규칙 테이블 테스트
+
+import json
+
+from pqc_inspector_server.scanners.config_tree import detect_format, scan_config
+
+
+def _scan(data, name="app.json"):
+    raw = data if isinstance(data, bytes) else json.dumps(data).encode()
+    scan = scan_config(raw, name)
+    assert scan is not None
+    return scan
+
+
+def test_detect_format():
+    assert detect_format("a.yml", "") == "yaml"
+    assert detect_format("a.toml", "") == "toml"
+    assert detect_format("noext", '{"a": 1}') == "json"
+
+
+def test_jwt_algorithm_rule():
+    scan = _scan({"jwt": {"alg": "RS256"}})
+    [finding] = scan.findings
+    assert finding["families"] == ["RSA"] and finding["location"] == "jwt.alg"
+    assert scan.decided
+
+
+def test_jwk_curve_depends_on_use():
+    sign = _scan({"keys": [{"kty": "EC", "crv": "P-256", "use": "sig"}]})
+    enc = _scan({"keys": [{"kty": "EC", "crv": "P-256", "use": "enc"}]})
+    assert {f for finding in sign.findings for f in finding["families"]} == {"ECDSA"}
+    assert {f for finding in enc.findings for f in finding["families"]} == {"ECDH"}
+
+
+def test_key_size_is_attached():
+    scan = _scan({"signing": {"algorithm": "RSA", "keySize": 2048}})
+    assert scan.findings[0]["key_size"] == 2048
+
+
+def test_symmetric_only_config_is_decided_clean():
+    scan = _scan({"jwt": {"alg": "HS256"}, "storage": {"cipher": "AES-256-GCM"}})
+    assert scan.findings == [] and scan.decided
+
+
+def test_placeholder_is_undecided():
+    scan = _scan({"jwt": {"alg": "${JWT_ALG}"}})
+    assert scan.findings == [] and "jwt.alg" in scan.undecided
+
+
+def test_ini_cipher_list():
+    scan = _scan(b"[tls]\nciphers = ECDHE-ECDSA-AES128-GCM-SHA256:TLS_AES_128_GCM_SHA256\n", "server.ini")
+    assert {f for finding in scan.findings for f in finding["families"]} == {"ECDH", "ECDSA"}
+    assert scan.decided
+
+
+def test_plain_words_under_unknown_keys_are_not_algorithms():
+    # 회귀: 규칙 밖의 키 값은 알고리즘 식별자 전체와 일치할 때만 인정합니다.
+    scan = _scan({"chat": {"mode": "conversation", "layout": "universal", "theme": "dhcp", "user": "rsa_test_fixture"}})
+    assert scan.findings == []
+
+
+def test_algorithm_identifier_under_unknown_key():
+    scan = _scan({"signer": {"jca": "SHA256withRSA", "suite": "TLS_ECDHE_RSA_WITH_AES_128_GCM_SHA256"}})
+    assert [finding["rule"] for finding in scan.findings] == ["value", "value"]
+    assert {f for finding in scan.findings for f in finding["families"]} == {"RSA", "ECDH"}
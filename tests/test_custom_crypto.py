@@ -0,0 +1,48 @@
+# File: tests/test_custom_crypto.py
+# 자체 구현 암호(교과서식 RSA 등) 탐지 테스트
+
+from pqc_inspector_server.scanners.custom_crypto import scan_custom_crypto
+
+# 이름에 "rsa"/"prime"이 없어도 소수 생성 → 곱 → φ → 모듈러 역원 흐름으로 찾아야 합니다.
+_TEXTBOOK_RSA = b'''
+import random
+
+def check(n, rounds=8):
+    d = n - 1
+    for _ in range(rounds):
+        a = random.randrange(2, n - 1)
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        return False
+    return True
+
+def draw(bits):
+    while True:
+        candidate = random.getrandbits(bits) | 1
+        if check(candidate):
+            return candidate
+
+def make():
+    first = draw(1024)
+    second = draw(1024)
+    composite_modulus = first * second
+    phi = (first - 1) * (second - 1)
+    forward_exponent = 65537
+    backward = pow(forward_exponent, -1, phi)
+    return composite_modulus, backward
+'''
+
+
+def test_python_dataflow_finds_renamed_rsa():
+    [finding] = scan_custom_crypto(_TEXTBOOK_RSA, "k.py")
+    assert (finding["value"], finding["rule"], finding["location"]) == ("자체 구현 RSA", "custom_crypto_dataflow", "k.py:23")
+
+
+def test_python_without_modulus_product_is_ignored():
+    assert scan_custom_crypto(_TEXTBOOK_RSA.replace(b"first * second", b"first + second"), "k.py") == []
+
+
+def test_c_heuristic():
+    [finding] = scan_custom_crypto(b"BN_mod_exp(r, a, p, m, ctx);\nBIGNUM *phi = (p-1)*(q-1);\n", "x.c")
+    assert finding["rule"] == "custom_crypto_heuristic" and finding["families"] == ["RSA"]
@@ -0,0 +1,68 @@
+# File: tests/test_dependencies.py
+# 의존성 매니페스트/잠금 파일 스캐너 테스트
+
+from pqc_inspector_server.scanners.crypto_packages import lookup, supports_pqc, version_key
+from pqc_inspector_server.scanners.dependencies import detect_manifest, iter_dependencies, scan_manifest
+
+
+def _findings(content, name):
+    scan = scan_manifest(content, name)
+    assert scan is not None
+    return {finding["value"]: finding for finding in scan.findings}, scan
+
+
+def test_detect_manifest():
+    assert detect_manifest("sub/requirements-dev.txt") == "requirements"
+    assert detect_manifest("Cargo.lock") == "cargo"
+    assert detect_manifest("setup.py") is None
+
+
+def test_requirements_pins_and_extras():
+    findings, scan = _findings(b"requests==2.31\nPyJWT[crypto]>=2.8\nrsa==4.9  # pinned\n", "requirements.txt")
+    assert scan.packages == 3
+    assert set(findings) == {"PyJWT", "rsa==4.9"}
+    assert findings["rsa==4.9"]["location"] == "requirements.txt:3"
+    assert "버전 미고정" not in findings["rsa==4.9"]["note"]
+
+
+def test_requirements_url_lines_use_egg_name():
+    # 회귀: -e 없이 쓴 VCS 줄은 "git"이라는 패키지로 읽혀 ecdsa를 놓쳤습니다.
+    dependencies = list(iter_dependencies(b"git+https://example.com/ecdsa.git#egg=ecdsa\nhttps://example.com/x.whl\n",
+                                          "requirements"))
+    assert [(dependency.name, dependency.line) for dependency in dependencies] == [("ecdsa", 1)]
+
+
+def test_package_lock_and_pqc_package():
+    content = (b'{"packages": {"": {"version": "1.0.0"}, "node_modules/jsonwebtoken": {"version": "9.0.0"},'
+               b' "node_modules/lodash": {"version": "4.17.21"}, "node_modules/@noble/post-quantum": {"version": "0.2.0"}}}')
+    findings, _ = _findings(content, "package-lock.json")
+    assert findings["jsonwebtoken==9.0.0"]["status"] == "classical"
+    assert findings["@noble/post-quantum==0.2.0"]["status"] == "pqc"
+
+
+def test_go_sum_skips_go_mod_lines():
+    content = b"golang.org/x/crypto v0.17.0 h1:abc=\ngolang.org/x/crypto v0.17.0/go.mod h1:def=\n"
+    findings, scan = _findings(content, "go.sum")
+    assert scan.packages == 1 and list(findings) == ["golang.org/x/crypto==v0.17.0"]
+
+
+def test_cargo_lock():
+    findings, scan = _findings(b'[[package]]\nname = "rsa"\nversion = "0.9.6"\n\n[[package]]\nname = "serde"\nversion = "1.0"\n',
+                               "Cargo.lock")
+    assert scan.packages == 2 and list(findings) == ["rsa==0.9.6"]
+
+
+def test_pom_property_version_suggests_upgrade():
+    content = (b'<project xmlns="http://maven.apache.org/POM/4.0.0"><properties><bc.version>1.78</bc.version></properties>'
+               b'<dependencies><dependency><groupId>org.bouncycastle</groupId><artifactId>bcprov-jdk18on</artifactId>'
+               b'<version>${bc.version}</version></dependency></dependencies></project>')
+    findings, scan = _findings(content, "pom.xml")
+    assert list(findings) == ["org.bouncycastle:bcprov-jdk18on==1.78"]
+    assert scan.upgrades and "1.79" in scan.upgrades[0]
+
+
+def test_supports_pqc_by_version():
+    package = lookup("maven", "org.bouncycastle:bcprov-jdk18on")
+    assert supports_pqc(package, "1.79") and not supports_pqc(package, "1.78")
+    assert supports_pqc(package, None) is None
+    assert version_key("v0.31.0+incompatible") == (0, 31, 0)
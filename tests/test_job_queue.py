@@ -0,0 +1,163 @@
+# File: tests/test_job_queue.py
+# SQLite 작업 대기열과 워커 실패 처리 테스트
+
+import asyncio
+import io
+import sqlite3
+import zipfile
+
+import pytest
+from fastapi import HTTPException
+
+from pqc_inspector_server.api.endpoints import _admit
+from pqc_inspector_server.api.schemas import AnalysisResultCreate
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.orchestrator.worker import _process
+from pqc_inspector_server.services.job_queue import INITIAL_JOB_SECONDS, JobQueue, get_job_queue
+
+
+def _queue(tmp_path, max_attempts=2):
+    return JobQueue(str(tmp_path / "jobs.sqlite3"), max_attempts)
+
+
+def test_claim_complete(tmp_path):
+    queue = _queue(tmp_path)
+    job_id = queue.enqueue("file", "task-1", "a.py", b"print(1)", {"lane": "interactive"})
+    job = queue.claim("w1", 60)
+    assert (job.id, job.payload, job.options, job.attempts) == (job_id, b"print(1)", {"lane": "interactive"}, 1)
+    assert queue.claim("w2", 60) is None
+    assert queue.extend(job_id, "w1", 60) and not queue.extend(job_id, "w2", 60)
+    queue.complete(job_id, "w1")
+    assert queue.status("task-1")[0]["status"] == "done"
+
+
+def test_fail_retries_then_fails(tmp_path):
+    queue = _queue(tmp_path, max_attempts=2)
+    job_id = queue.enqueue("file", "task-1", "a.py", b"x")
+    queue.fail(queue.claim("w1", 60).id, "w1", "boom")
+    assert queue.status("task-1")[0]["status"] == "queued"
+    queue.fail(queue.claim("w1", 60).id, "w1", "boom")
+    [status] = queue.status("task-1")
+    assert (status["job_id"], status["status"], status["attempts"], status["error"]) == (job_id, "failed", 2, "boom")
+    assert queue.claim("w1", 60) is None
+
+
+def test_expired_lease_is_reclaimed(tmp_path):
+    queue = _queue(tmp_path)
+    queue.enqueue("file", "task-1", "a.py", b"x")
+    queue.claim("w1", -1)
+    job = queue.claim("w2", 60)
+    assert job is not None and job.attempts == 2
+
+
+class _FailingClient:
+    def __init__(self, error=None):
+        self.error = error
+
+    async def save_analysis_result(self, task_id, result_data):
+        if self.error:
+            raise self.error
+        return False
+
+
+async def _analysis(filename, file_content):
+    return AnalysisResultCreate(file_name=filename, file_type="source_code", is_pqc_vulnerable=False,
+                                vulnerability_details="", detected_algorithms=[], confidence_score=0.9)
+
+
+def test_worker_records_save_failure(tmp_path):
+    # 회귀: 저장 실패가 start_* 안에서 삼켜져 작업이 done으로 끝나던 문제
+    for client in (_FailingClient(ConnectionError("api down")), _FailingClient()):
+        queue = _queue(tmp_path / type(client.error).__name__, max_attempts=1)
+        controller = OrchestratorController(api_client=client)
+        controller.analyze_content = _analysis
+        queue.enqueue("file", "task-1", "a.py", b"x")
+        asyncio.run(_process(controller, queue, "w1", queue.claim("w1", 60)))
+        [status] = queue.status("task-1")
+        assert status["status"] == "failed" and status["error"]
+
+
+class _RecordingClient:
+    def __init__(self, fail_on):
+        self.fail_on = fail_on
+        self.saved = []
+
+    async def save_analysis_result(self, task_id, result_data):
+        if result_data["file_name"] == self.fail_on:
+            self.fail_on = None
+            return False
+        self.saved.append(result_data["file_name"])
+        return True
+
+
+def test_project_retry_does_not_save_results_twice(tmp_path, monkeypatch):
+    # 회귀: 프로젝트 작업을 재시도하면 이미 저장한 파일 결과를 같은 작업 ID로 다시 저장했습니다.
+    monkeypatch.setattr(settings, "JOB_QUEUE_PATH", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(settings, "SYMBOL_INDEX_DIR", "")
+    queue = get_job_queue(settings.JOB_QUEUE_PATH, 2)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name in ("a.py", "b.py", "c.py"):
+            archive.writestr(name, "print(1)\n")
+    client = _RecordingClient("b.py")
+    controller = OrchestratorController(api_client=client)
+    controller.analyze_content = _analysis
+    queue.enqueue("project", "task-1", "project.zip", buffer.getvalue())
+    asyncio.run(_process(controller, queue, "w1", queue.claim("w1", 60)))
+    asyncio.run(_process(controller, queue, "w1", queue.claim("w1", 60)))
+    assert queue.status("task-1")[0]["status"] == "done"
+    assert sorted(client.saved) == ["a.py", "b.py", "c.py"]
+
+
+def test_claim_follows_lane_weights(tmp_path):
+    # 회귀: 대기열이 FIFO여서 대량 스캔 작업 뒤에 단일 파일 작업이 줄 섰습니다.
+    queue = _queue(tmp_path)
+    for i in range(4):
+        queue.enqueue("project", f"bulk-{i}", "p.zip", b"x", {"lane": "bulk"}, lane="bulk")
+    for i in range(5):
+        queue.enqueue("file", f"interactive-{i}", "a.py", b"x", lane="interactive")
+    weights = {"interactive": 4.0, "bulk": 1.0}
+    order = [queue.claim("w1", 60, weights).task_id for _ in range(9)]
+    assert order == ["bulk-0", "interactive-0", "interactive-1", "interactive-2", "interactive-3",
+                     "bulk-1", "interactive-4", "bulk-2", "bulk-3"]
+
+
+def test_lane_column_is_added_to_old_queue_files(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.executescript(
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, task_id TEXT NOT NULL, kind TEXT NOT NULL, "
+        "filename TEXT NOT NULL, options TEXT NOT NULL, payload BLOB, status TEXT NOT NULL DEFAULT 'queued', "
+        "attempts INTEGER NOT NULL DEFAULT 0, worker TEXT, lease_until REAL, enqueued_at REAL NOT NULL, "
+        "started_at REAL, finished_at REAL, error TEXT);"
+        "INSERT INTO jobs (task_id, kind, filename, options, enqueued_at) VALUES ('old', 'file', 'a.py', '{}', 0);"
+    )
+    connection.close()
+    assert JobQueue(str(path)).claim("w1", 60).task_id == "old"
+
+
+def test_estimated_wait_counts_backlog_by_lane_weight(tmp_path):
+    queue = _queue(tmp_path)
+    weights = {"interactive": 4.0, "bulk": 1.0}
+    assert queue.estimated_wait("interactive", weights) == 0.0
+    for _ in range(8):
+        queue.enqueue("project", "bulk", "p.zip", lane="bulk")
+    queue.enqueue("file", "one", "a.py", lane="interactive")
+    # bulk 작업 8개는 interactive 입장에서 가중치 비율(1/4)만큼만 앞섭니다.
+    assert queue.estimated_wait("interactive", weights) == 3 * INITIAL_JOB_SECONDS
+    assert queue.estimated_wait("bulk", weights) == 9 * INITIAL_JOB_SECONDS
+
+
+def test_admission_uses_queue_backlog(tmp_path, monkeypatch):
+    # 회귀: 작업 대기열 모드에서는 429 판정을 건너뛰어 밀린 작업이 얼마든 요청을 받았습니다.
+    monkeypatch.setattr(settings, "JOB_QUEUE_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_QUEUE_PATH", str(tmp_path / "jobs.sqlite3"))
+    monkeypatch.setattr(settings, "ADMISSION_MAX_WAIT", 60.0)
+    queue = get_job_queue(settings.JOB_QUEUE_PATH, 2)
+    asyncio.run(_admit("interactive"))
+    for _ in range(3):
+        queue.enqueue("file", "t", "a.py", lane="interactive")
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(_admit("interactive"))
+    assert error.value.status_code == 429 and error.value.headers["Retry-After"] == "30"
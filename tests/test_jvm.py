@@ -0,0 +1,115 @@
+# File: tests/test_jvm.py
+# JVM 클래스 파일/JAR 스캐너 테스트 (클래스 파일은 테스트 안에서 직접 조립합니다)
+
+import io
+import struct
+import zipfile
+
+from pqc_inspector_server.scanners.jvm import is_class_file, scan_class, scan_jvm_content
+
+
+class _Pool:
+    """상수 풀 빌더. 같은 항목은 한 번만 넣고 번호(1부터)를 돌려줍니다."""
+
+    def __init__(self):
+        self.entries = []
+        self.index = {}
+
+    def _add(self, key, raw):
+        if key not in self.index:
+            self.entries.append(raw)
+            self.index[key] = len(self.entries)
+        return self.index[key]
+
+    def utf8(self, text):
+        raw = text.encode()
+        return self._add(("utf8", text), b"\x01" + struct.pack(">H", len(raw)) + raw)
+
+    def cls(self, name):
+        return self._add(("class", name), b"\x07" + struct.pack(">H", self.utf8(name)))
+
+    def string(self, text):
+        return self._add(("string", text), b"\x08" + struct.pack(">H", self.utf8(text)))
+
+    def method(self, owner, name, descriptor):
+        name_and_type = self._add(("nat", name, descriptor),
+                                  b"\x0c" + struct.pack(">HH", self.utf8(name), self.utf8(descriptor)))
+        return self._add(("method", owner, name, descriptor), b"\x0a" + struct.pack(">HH", self.cls(owner), name_and_type))
+
+
+def _class_file(build_code, references=()):
+    """메서드 run() 하나짜리 클래스. build_code(pool)가 바이트코드를 돌려줍니다."""
+    pool = _Pool()
+    this, parent = pool.cls("Sample"), pool.cls("java/lang/Object")
+    for reference in references:
+        pool.cls(reference)
+    code = build_code(pool)
+    code_attribute = struct.pack(">HHI", 4, 1, len(code)) + code + struct.pack(">HH", 0, 0)
+    method = (struct.pack(">HHHH", 0x09, pool.utf8("run"), pool.utf8("()V"), 1)
+              + struct.pack(">HI", pool.utf8("Code"), len(code_attribute)) + code_attribute)
+    return (b"\xca\xfe\xba\xbe" + struct.pack(">HHH", 0, 52, len(pool.entries) + 1) + b"".join(pool.entries)
+            + struct.pack(">HHHHHH", 0x21, this, parent, 0, 0, 1) + method + struct.pack(">H", 0))
+
+
+def _get_instance(pool, owner, argument=None):
+    factory = pool.method(owner, "getInstance", "(Ljava/lang/String;)Ljava/lang/Object;")
+    load = bytes([0x12, pool.string(argument)]) if argument else b"\x2a"  # ldc "..." 또는 aload_0
+    return load + b"\xb8" + struct.pack(">H", factory)
+
+
+def _rsa_keygen(pool):
+    initialize = pool.method("java/security/KeyPairGenerator", "initialize", "(I)V")
+    return (_get_instance(pool, "java/security/KeyPairGenerator", "RSA") + b"\x4c\x2b"  # astore_1, aload_1
+            + b"\x11" + struct.pack(">h", 3072) + b"\xb6" + struct.pack(">H", initialize) + b"\xb1")
+
+
+def _jar(entries):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_is_class_file_rejects_mach_o_universal():
+    assert is_class_file(_class_file(lambda pool: b"\xb1"))
+    assert not is_class_file(b"\xca\xfe\xba\xbe\x00\x00\x00\x02" + b"\x00" * 32)
+
+
+def test_getinstance_argument_and_key_size():
+    [finding] = scan_class(_class_file(_rsa_keygen), "Sample.class")["findings"]
+    assert finding["value"] == 'KeyPairGenerator.getInstance("RSA")'
+    assert (finding["location"], finding["key_size"], finding["families"]) == ("Sample.class#run", 3072, ["RSA"])
+
+
+def test_ec_argument_depends_on_api():
+    def code(pool):
+        return (_get_instance(pool, "javax/crypto/KeyAgreement", "EC")
+                + _get_instance(pool, "java/security/Signature", "SHA256withECDSA") + b"\xb1")
+    findings = scan_class(_class_file(code), "Sample.class")["findings"]
+    assert [finding["families"] for finding in findings] == [["ECDH"], ["ECDSA"]]
+
+
+def test_non_constant_argument_is_reported_as_dynamic():
+    result = scan_class(_class_file(lambda pool: _get_instance(pool, "java/security/Signature") + b"\xb1"), "Sample.class")
+    assert result["findings"] == [] and result["dynamic"] == ["Sample.class#run Signature.getInstance"]
+
+
+def test_bouncycastle_class_reference():
+    data = _class_file(lambda pool: b"\xb1", ["org/bouncycastle/crypto/params/ECPublicKeyParameters"])
+    [finding] = scan_class(data, "Sample.class")["findings"]
+    assert finding["rule"] == "class_reference" and finding["families"] == ["ECDSA"]
+
+
+def test_truncated_class_is_noted():
+    result = scan_class(_class_file(_rsa_keygen)[:40], "Broken.class")
+    assert result["findings"] == [] and result["notes"]
+
+
+def test_nested_jar():
+    inner = _jar({"com/lib/KeyGen.class": _class_file(_rsa_keygen)})
+    outer = _jar({"META-INF/MANIFEST.MF": "Manifest-Version: 1.0\n", "BOOT-INF/lib/lib.jar": inner,
+                  "com/app/Main.class": _class_file(lambda pool: b"\xb1")})
+    scan = scan_jvm_content(outer, "app.jar", workers=1)
+    assert (scan.classes, scan.archives) == (2, 2)
+    assert [finding["location"] for finding in scan.findings] == ["BOOT-INF/lib/lib.jar!/com/lib/KeyGen.class#run"]
@@ -0,0 +1,28 @@
+# File: tests/test_log_stream.py
+# 대용량 로그 스트리밍 스캐너 테스트
+
+from pqc_inspector_server.scanners.log_stream import scan_bytes
+
+_LOG = (b"".join(b"2024-01-01T00:00:%02d 10.0.0.%d nginx: SSL handshake cipher=ECDHE-RSA-AES128-GCM-SHA256 group=x25519\n"
+                 % (i % 60, i % 250) for i in range(500))
+        + b"sshd[12]: kex: algorithm: curve25519-sha256 host key algorithm: ssh-ed25519\n" * 3
+        + b"GET /index.html 200\n" * 100)
+
+
+def _findings(scan):
+    return {finding["value"]: (finding["families"], finding["count"]) for finding in scan.findings()}
+
+
+def test_findings_are_counted_per_value():
+    scan = scan_bytes(_LOG)
+    assert scan.lines == 603
+    findings = _findings(scan)
+    assert findings["ECDHE-RSA-AES128-GCM-SHA256"] == (["ECDH", "RSA"], 500)
+    assert findings["curve25519-sha256"] == (["ECDH"], 3)
+    assert findings["ssh-ed25519"] == (["EdDSA"], 3)
+    assert findings["x25519"][0] == ["ECDH"]
+
+
+def test_chunk_boundaries_do_not_split_matches():
+    whole, pieces = scan_bytes(_LOG), scan_bytes(_LOG, chunk_size=7)
+    assert pieces.lines == whole.lines and _findings(pieces) == _findings(whole)
@@ -0,0 +1,12 @@
+# File: tests/test_log_templates.py
+# 로그 템플릿 마이닝 테스트
+
+from pqc_inspector_server.scanners.log_stream import scan_with_templates
+from test_log_stream import _LOG
+
+
+def test_templates_mask_variable_fields():
+    templates = {template.text: template for template in scan_with_templates(_LOG).miner.top()}
+    handshake = "<*> <*> nginx: SSL handshake cipher=ECDHE-RSA-AES128-GCM-SHA256 group=x25519"
+    assert templates[handshake].count == 500 and templates[handshake].mentions_crypto
+    assert templates["GET /index.html <*>"].count == 100 and not templates["GET /index.html <*>"].mentions_crypto
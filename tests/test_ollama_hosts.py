@@ -0,0 +1,130 @@
+# File: tests/test_ollama_hosts.py
+# 여러 Ollama 서버 풀의 서버 선택, 회로 차단, 느린 요청 헤징 테스트
+
+import asyncio
+import time
+from typing import Optional
+
+import pytest
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.services.ollama_service import OllamaHostPool, OllamaService
+
+_MODEL = "gemma:7b"
+_MESSAGES = [{"role": "user", "content": "ping"}]
+
+
+class _StubClient:
+    """delay초 뒤 응답하거나(error가 있으면) 실패하는 가짜 Ollama 클라이언트"""
+
+    def __init__(self, delay: float = 0.0, error: Optional[Exception] = None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def chat(self, model, messages, stream=False, options=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return {"message": {"content": "{}"}, "model": model}
+
+
+def _pool(**clients: _StubClient) -> OllamaHostPool:
+    pool = OllamaHostPool([f"http://{name}" for name in clients], loop=None)
+    for host, client in zip(pool.hosts, clients.values()):
+        host.client = client
+    return pool
+
+
+@pytest.fixture
+def circuit(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(settings, "OLLAMA_CIRCUIT_COOLDOWN", 0.05)
+
+
+def test_select_prefers_least_loaded_then_warm_host():
+    pool = _pool(a=_StubClient(), b=_StubClient())
+    a, b = pool.hosts
+    a.in_flight = 1
+    assert pool.select(_MODEL) is b
+    # 모델이 올라가 있는 서버는 요청 하나만큼 덜 바쁜 것으로 칩니다.
+    b.in_flight = 1
+    a.warm["gemma:7b"] = time.monotonic()
+    assert pool.select(_MODEL) is a
+    # 모델이 없는 서버는 다른 서버가 더 바빠도 고르지 않습니다.
+    a.models = {"codellama:7b"}
+    assert pool.select(_MODEL) is b
+    assert pool.select(_MODEL, exclude=[b]) is a
+
+
+def test_circuit_opens_after_threshold_and_recovers_after_cooldown(circuit):
+    pool = _pool(slow=_StubClient(), bad=_StubClient())
+    slow, bad = pool.hosts
+    slow.in_flight = 5
+    bad.record_failure(ConnectionError("refused"))
+    assert bad.available(time.monotonic()) and pool.select(_MODEL) is bad
+    bad.record_failure(ConnectionError("refused"))
+    assert not bad.available(time.monotonic()) and pool.select(_MODEL) is slow
+    assert pool.select(_MODEL, exclude=[slow]) is None
+
+    time.sleep(0.06)
+    # 대기 시간이 지나면 요청 하나를 다시 보내 보고, 또 실패하면 곧바로 다시 엽니다.
+    assert pool.select(_MODEL) is bad
+    bad.record_failure(ConnectionError("refused"))
+    assert not bad.available(time.monotonic())
+    time.sleep(0.06)
+    bad.record_success(_MODEL, 0.1)
+    assert bad.failures == 0 and bad.available(time.monotonic())
+
+
+def test_hedge_fires_after_delay_and_cancels_the_slow_request(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_HEDGE_DELAY", 0.02)
+    slow_client, fast_client = _StubClient(delay=5.0), _StubClient()
+
+    async def run():
+        pool = _pool(slow=slow_client, fast=fast_client)
+        slow, fast = pool.hosts
+        tried = [slow]
+        host, _, _ = await OllamaService()._chat_hedged(pool, slow, _MODEL, _MESSAGES, tried)
+        await asyncio.sleep(0)  # 취소된 태스크가 완료 콜백을 실행하도록 한 번 양보
+        return pool, host, tried
+
+    start = time.perf_counter()
+    pool, host, tried = asyncio.run(run())
+    slow, fast = pool.hosts
+    assert host is fast and tried == [slow, fast]
+    assert time.perf_counter() - start < 1.0
+    assert slow_client.cancelled == 1 and slow.in_flight == 0 and fast.in_flight == 0
+
+
+def test_hedge_uses_slow_response_when_backup_fails(monkeypatch, circuit):
+    monkeypatch.setattr(settings, "OLLAMA_HEDGE_DELAY", 0.02)
+    slow_client, bad_client = _StubClient(delay=0.1), _StubClient(error=ConnectionError("refused"))
+
+    async def run():
+        pool = _pool(slow=slow_client, bad=bad_client)
+        host, _, _ = await OllamaService()._chat_hedged(pool, pool.hosts[0], _MODEL, _MESSAGES, [pool.hosts[0]])
+        return pool, host
+
+    pool, host = asyncio.run(run())
+    slow, bad = pool.hosts
+    assert host is slow and bad_client.calls == 1 and bad.failures == 1
+    assert slow_client.cancelled == 0
+
+
+def test_fast_response_does_not_hedge(monkeypatch):
+    monkeypatch.setattr(settings, "OLLAMA_HEDGE_DELAY", 0.5)
+    fast_client, other_client = _StubClient(), _StubClient()
+
+    async def run():
+        pool = _pool(fast=fast_client, other=other_client)
+        return await OllamaService()._chat_hedged(pool, pool.hosts[0], _MODEL, _MESSAGES, [pool.hosts[0]])
+
+    host, _, _ = asyncio.run(run())
+    assert host.url == "http://fast" and other_client.calls == 0
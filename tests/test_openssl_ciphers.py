@@ -0,0 +1,29 @@
+# File: tests/test_openssl_ciphers.py
+# OpenSSL 암호 문자열 전개 테스트
+
+from pqc_inspector_server.scanners.openssl_ciphers import expand_cipher_string, suite_families
+
+
+def test_expand_with_exclusions():
+    suites, unknown = expand_cipher_string("ECDHE+AESGCM:!ECDSA")
+    assert suites == ["ECDHE-RSA-AES256-GCM-SHA384", "ECDHE-RSA-AES128-GCM-SHA256"]
+    assert unknown == []
+
+
+def test_aliases_and_counts():
+    assert len(expand_cipher_string("HIGH:!aNULL:!MD5")[0]) == 51
+    assert len(expand_cipher_string("ALL")[0]) == 58
+    assert len(expand_cipher_string("3DES")[0]) == 3
+
+
+def test_default_seclevel_and_unknown_term():
+    suites, unknown = expand_cipher_string("DEFAULT@SECLEVEL=2:FOO")
+    assert len(suites) == 54 and unknown == ["FOO"]
+    # DEFAULT는 인증 없는 익명(ADH/AECDH) 스위트를 제외합니다.
+    assert not any(suite.startswith(("ADH", "AECDH")) for suite in suites)
+
+
+def test_suite_families():
+    assert suite_families("ECDHE-ECDSA-AES128-GCM-SHA256") == {"ECDSA", "ECDH"}
+    assert suite_families("DHE-DSS-AES256-SHA") == {"DSA", "DH"}
+    assert suite_families("TLS_AES_128_GCM_SHA256") == set()
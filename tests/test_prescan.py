@@ -0,0 +1,14 @@
+# File: tests/test_prescan.py
+# 바이트 수준 암호 지표 사전 스캔 테스트
+
+from pqc_inspector_server.scanners.prescan import prescan
+
+
+def test_word_boundaries_avoid_false_positives():
+    # 단어 안의 "rsa"(traversal, universal)는 RSA 지표가 아닙니다.
+    assert prescan(b"path traversal universal") == {}
+
+
+def test_api_and_cipher_suite_indicators():
+    assert set(prescan(b"RSA_public_encrypt(len, from, to, key, pad);")) == {"RSA"}
+    assert set(prescan(b"ssl_ciphers ECDHE-RSA-AES128-GCM-SHA256;")) == {"RSA", "ECDH"}
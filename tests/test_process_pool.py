@@ -0,0 +1,91 @@
+# File: tests/test_process_pool.py
+# CPU 풀 실행과 비정상 종료 후 복구 테스트
+
+import asyncio
+import os
+
+import pytest
+
+from pqc_inspector_server.core import process_pool
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.core.process_pool import INLINE_MAX_BYTES, accepts_buffer, run_cpu_bound
+from pqc_inspector_server.scanners.log_stream import scan_with_templates
+
+
+def _length(content: bytes, extra: int) -> int:
+    return len(content) + extra
+
+
+def _crash_once(content: bytes, marker: str) -> int:
+    # 처음 실행한 풀 프로세스를 죽여 BrokenProcessPool을 일으킵니다.
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return len(content)
+
+
+def _crash(content: bytes) -> int:
+    os._exit(1)
+
+
+def _content_type(content) -> str:
+    return type(content).__name__
+
+
+@accepts_buffer
+def _buffer_type(content) -> str:
+    return type(content).__name__
+
+
+@accepts_buffer
+def _buffer_error(content) -> None:
+    head = content[:16]  # 예외가 난 프레임에 버퍼 조각이 남아 있어도 원래 예외가 올라와야 합니다.
+    raise ValueError(len(head))
+
+
+@pytest.fixture
+def pool_workers(monkeypatch):
+    monkeypatch.setattr(settings, "CPU_POOL_WORKERS", 2)
+    yield
+    for pool in process_pool._pools.values():
+        pool.shutdown(cancel_futures=True)
+    process_pool._pools.clear()
+
+
+def test_small_content_runs_inline():
+    assert asyncio.run(run_cpu_bound("test", _length, b"abc", 1)) == 4
+
+
+def test_large_content_uses_pool_and_shared_memory(pool_workers):
+    content = b"x" * (process_pool.SHARED_MEMORY_MIN_BYTES + 1)
+    assert asyncio.run(run_cpu_bound("test", _length, content, 0)) == len(content)
+
+
+def test_shared_memory_is_passed_as_view_only_to_buffer_scanners(pool_workers):
+    # 회귀: 풀 프로세스가 공유 메모리를 항상 bytes로 복사해 큰 로그가 메모리에 세 벌 있었습니다.
+    content = b"x" * process_pool.SHARED_MEMORY_MIN_BYTES
+    assert asyncio.run(run_cpu_bound("test", _buffer_type, content)) == "memoryview"
+    assert asyncio.run(run_cpu_bound("test", _content_type, content)) == "bytes"
+    with pytest.raises(ValueError):
+        asyncio.run(run_cpu_bound("test", _buffer_error, content))
+
+
+def test_log_scanner_reads_shared_memory_view(pool_workers):
+    line = b"2024-01-01 accepted cipher=ECDHE-RSA-AES128-GCM-SHA256 group=x25519\n"
+    content = line * (process_pool.SHARED_MEMORY_MIN_BYTES // len(line) + 1)
+    scanner = asyncio.run(run_cpu_bound("log_conf", scan_with_templates, content))
+    assert scanner.lines == content.count(b"\n") and scanner.total_hits > 0
+
+
+def test_broken_pool_is_replaced(pool_workers, tmp_path):
+    # 회귀: 풀 프로세스 하나가 죽으면 이후 모든 스캔이 BrokenProcessPool로 실패하던 문제
+    content = b"x" * INLINE_MAX_BYTES
+    assert asyncio.run(run_cpu_bound("test", _crash_once, content, str(tmp_path / "crashed"))) == len(content)
+    assert asyncio.run(run_cpu_bound("test", _length, content, 0)) == len(content)
+
+
+def test_repeated_crash_is_reported_and_pool_recovers(pool_workers):
+    content = b"x" * INLINE_MAX_BYTES
+    with pytest.raises(process_pool.BrokenProcessPool):
+        asyncio.run(run_cpu_bound("test", _crash, content))
+    assert asyncio.run(run_cpu_bound("test", _length, content, 0)) == len(content)
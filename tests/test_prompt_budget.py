@@ -0,0 +1,47 @@
+# File: tests/test_prompt_budget.py
+# 토큰 카운터, 프롬프트 예산(자르기/청크 채우기), 청크 관련도 점수 테스트
+
+import pytest
+
+from pqc_inspector_server.scanners.prescan import relevance_score
+from pqc_inspector_server.services.prompt_budget import (
+    ELISION, MIN_CONTENT_TOKENS, EstimateCounter, PromptBudget, SentencePieceCounter, TokenCounter,
+)
+
+
+def test_token_counter_is_abstract():
+    with pytest.raises(TypeError):
+        TokenCounter()
+
+
+def test_estimate_counter_counts_utf8_bytes():
+    counter = EstimateCounter()
+    assert counter.count("abcdef") == 2
+    assert counter.count("한글") == 2
+
+
+def test_sentencepiece_merges_by_score_and_falls_back_to_bytes():
+    counter = SentencePieceCounter(["▁", "a", "b", "ab", "▁ab"], [0.0, 0.0, 0.0, 1.0, 2.0])
+    assert counter.count("ab ab") == 2
+    assert counter.count("é") == 2
+
+
+def test_available_and_fit():
+    budget = PromptBudget(EstimateCounter(), 1000, 200)
+    assert budget.available("x" * 300) == 1000 - 200 - 32 - 100
+    assert budget.available("x" * 3000) == MIN_CONTENT_TOKENS
+    assert budget.fit("aaa\nbbb\nccc\n", 4) == "aaa\nbbb\n"
+    assert budget.fit("a" * 30, 4) == "a" * 12
+
+
+def test_pack_keeps_order_and_marks_gaps():
+    budget = PromptBudget(EstimateCounter(), 4096, 512)
+    chunks = ["a" * 600, "b" * 600, "c" * 600, "d" * 600]
+    assert budget.pack(chunks, 10000, [0, 0, 0, 0]) == "".join(chunks)
+    packed = budget.pack(chunks, 420, [1, 5, 0, 5])
+    assert packed == ELISION + chunks[1] + ELISION + chunks[3]
+
+
+def test_relevance_score_counts_crypto_terms():
+    assert relevance_score(b"hello") == 0
+    assert relevance_score(b"def sign(x): rsa.verify") == 6
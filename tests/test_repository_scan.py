@@ -0,0 +1,98 @@
+# File: tests/test_repository_scan.py
+# 저장소 증분 스캔의 변경(delta) 보고서 테스트
+
+import asyncio
+import shutil
+import subprocess
+
+import pytest
+
+from pqc_inspector_server.api.schemas import AnalysisResultCreate
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git이 필요합니다")
+
+_FILES = {
+    "app.py": "print('hello')\n",
+    "util.py": "def add(a, b):\n    return a + b\n",
+    "README.txt": "sample\n",
+    "nginx.conf": "server {\n    listen 443 ssl;\n    ssl_protocols TLSv1.2;\n    ssl_ciphers ECDHE-RSA-AES128-GCM-SHA256;\n}\n",
+}
+
+
+async def _analysis(filename, file_content):
+    return AnalysisResultCreate(file_name=filename, file_type="source_code", is_pqc_vulnerable=False,
+                                vulnerability_details="", detected_algorithms=[], confidence_score=0.9)
+
+
+def _commit(repo, files):
+    for name, text in files.items():
+        (repo / name).write_text(text)
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "scan"], cwd=repo, check=True)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "REPO_SCAN_DIR", str(tmp_path / "scans"))
+    monkeypatch.setattr(settings, "SYMBOL_INDEX_DIR", "")
+    path = tmp_path / "repo"
+    path.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    _commit(path, _FILES)
+    return path
+
+
+def _scan(controller, repo):
+    return asyncio.run(controller.analyze_repository(str(repo), "HEAD", "sample"))[1]
+
+
+def test_first_scan_carries_nothing_forward(repo):
+    # 회귀: 다시 분석한 설정 묶음의 파일(nginx.conf)을 이어받은 파일로 세어 첫 스캔에 carried_forward가 1이었습니다.
+    controller = OrchestratorController(api_client=None)
+    controller.analyze_content = _analysis
+    delta = _scan(controller, repo)
+    assert (delta["analyzed"], delta["carried_forward"]) == (4, 0)
+
+
+def test_rescan_counts_only_changed_files(repo):
+    controller = OrchestratorController(api_client=None)
+    controller.analyze_content = _analysis
+    _scan(controller, repo)
+    _commit(repo, {"util.py": "def add(a, b):\n    return b + a\n"})
+    delta = _scan(controller, repo)
+    assert delta["modified"] == ["util.py"]
+    assert (delta["analyzed"], delta["carried_forward"]) == (1, 3)
+
+
+class _FlakyClient:
+    """처음 한 번은 fail_on 파일의 저장에 실패하고, 저장한 파일 이름을 순서대로 기록합니다."""
+
+    def __init__(self, fail_on):
+        self.fail_on = fail_on
+        self.saved = []
+
+    async def save_analysis_result(self, task_id, result_data):
+        if result_data["file_name"] == self.fail_on:
+            self.fail_on = None
+            return False
+        self.saved.append(result_data["file_name"])
+        return True
+
+
+def test_worker_retry_stores_results_before_advancing_manifest(repo, tmp_path, monkeypatch):
+    # 회귀: 저장 실패 전에 매니페스트를 먼저 갱신해, 재시도가 바뀐 파일 없음으로 끝나 결과를 영영 저장하지 못했습니다.
+    monkeypatch.setattr(settings, "JOB_QUEUE_PATH", str(tmp_path / "jobs.sqlite3"))
+    client = _FlakyClient("util.py")
+    controller = OrchestratorController(api_client=client)
+    controller.analyze_content = _analysis
+
+    def run():
+        asyncio.run(controller.start_repository_analysis("sample", "task-1", "HEAD", str(repo), None, raise_errors=True))
+
+    with pytest.raises(RuntimeError):
+        run()
+    run()
+    assert "util.py" in client.saved and len(client.saved) == len(set(client.saved)) == 4
+    assert _scan(controller, repo)["carried_forward"] == 4
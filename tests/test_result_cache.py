@@ -0,0 +1,78 @@
+# File: tests/test_result_cache.py
+# 내용 해시/SimHash 결과 캐시 테스트
+
+import asyncio
+import random
+
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.scanners import custom_crypto
+from pqc_inspector_server.services.result_cache import CacheEntry, ResultCache, hamming, sketch_content
+
+
+def _source(seed, functions=40):
+    rng = random.Random(seed)
+    return "".join(f"def handler_{rng.randint(0, 10 ** 6)}(request):\n    return request.value * {rng.randint(1, 99)}\n"
+                   for _ in range(functions)).encode()
+
+
+def _store(cache, content, name="a.py"):
+    cache.store(CacheEntry(name, sketch_content(content), ("rule",), {"file_name": name}))
+
+
+def test_exact_match():
+    cache = ResultCache()
+    _store(cache, _source(1))
+    hit = cache.lookup(sketch_content(_source(1)))
+    assert hit is not None and hit.exact and hit.distance == 0
+
+
+def test_near_duplicate_within_distance():
+    original = _source(1)
+    edited = original.replace(b"* ", b"+ ", 1)
+    assert hamming(sketch_content(original).simhash, sketch_content(edited).simhash) <= 3
+    cache = ResultCache(max_distance=3)
+    _store(cache, original)
+    hit = cache.lookup(sketch_content(edited))
+    assert hit is not None and not hit.exact and hit.entry.file_name == "a.py"
+
+
+def test_dissimilar_content_misses():
+    cache = ResultCache(max_distance=3)
+    _store(cache, _source(1))
+    assert cache.lookup(sketch_content(_source(2))) is None
+
+
+def test_short_and_binary_content_only_match_exactly():
+    assert sketch_content(b"x = 1\n").simhash is None
+    assert sketch_content(b"\0" + _source(1)).simhash is None
+    cache = ResultCache()
+    _store(cache, b"x = 1\n")
+    assert cache.lookup(sketch_content(b"x = 2\n")) is None
+    assert cache.lookup(sketch_content(b"x = 1\n")).exact
+
+
+def test_lru_eviction_drops_block_tables():
+    cache = ResultCache(max_distance=3, capacity=2)
+    for seed in range(3):
+        _store(cache, _source(seed), f"{seed}.py")
+    assert len(cache) == 2
+    assert cache.lookup(sketch_content(_source(0))) is None
+    assert cache.lookup(sketch_content(_source(2))).entry.file_name == "2.py"
+
+
+def test_cache_probe_indicators_are_reused_by_prescan(monkeypatch):
+    # 회귀: 키워드가 없는 소스는 캐시 서명과 사전 스캔 단계에서 자체 구현 탐지(AST 파싱)를 두 번 했습니다.
+    calls = []
+
+    class CountingAnalyzer(custom_crypto._PythonAnalyzer):
+        def __init__(self, tree, file_name):
+            calls.append(file_name)
+            super().__init__(tree, file_name)
+
+    monkeypatch.setattr(custom_crypto, "_PythonAnalyzer", CountingAnalyzer)
+    monkeypatch.setattr(settings, "RESULT_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "PRESCAN_ENABLED", True)
+    controller = OrchestratorController(api_client=None)
+    result = asyncio.run(controller._analyze_with_cache("plain.py", _source(3)))
+    assert not result.is_pqc_vulnerable and calls == ["plain.py"]
@@ -0,0 +1,87 @@
+# File: tests/test_scheduler.py
+# LLM 호출 공정 스케줄러(레인 가중치, 클라이언트 한도) 테스트
+
+import asyncio
+
+from pqc_inspector_server.services.scheduler import FairScheduler
+
+
+async def _run(scheduler, jobs):
+    """첫 슬롯을 잡아 둔 채 jobs(레인, 클라이언트, 이름)를 모두 대기시킨 뒤 풀고, 실행 순서를 돌려줍니다."""
+    order, gate = [], asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot("bulk"):
+            await gate.wait()
+
+    async def job(lane, client, name):
+        async with scheduler.slot(lane, client):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    held = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    tasks = [asyncio.create_task(job(*spec)) for spec in jobs]
+    await asyncio.sleep(0)
+    waits = {lane: scheduler.estimated_wait(lane) for lane in ("interactive", "bulk")}
+    waiting = scheduler.waiting()
+    gate.set()
+    await asyncio.gather(held, *tasks)
+    return order, waiting, waits
+
+
+def test_weighted_lanes():
+    scheduler = FairScheduler(1, {"interactive": 4.0, "bulk": 1.0})
+    jobs = [("bulk", "", f"b{i}") for i in range(5)] + [("interactive", "", f"i{i}") for i in range(5)]
+    order, waiting, waits = asyncio.run(_run(scheduler, jobs))
+    assert order == ["i0", "i1", "i2", "i3", "b0", "i4", "b1", "b2", "b3", "b4"]
+    assert waiting == 10 and waits == {"interactive": 36.25, "bulk": 55.0}
+    assert scheduler.running == 0
+
+
+def test_client_limit():
+    async def scenario():
+        scheduler = FairScheduler(2, {"bulk": 1.0}, client_limit=1)
+        order = []
+
+        async def job(client, index):
+            async with scheduler.slot("bulk", client):
+                order.append(f"{client}{index}")
+                await asyncio.sleep(0.01)
+
+        tasks = [asyncio.create_task(job("a", i)) for i in range(3)] + [asyncio.create_task(job("b", 0))]
+        await asyncio.sleep(0)
+        state = scheduler.running, dict(scheduler.by_client), scheduler.waiting()
+        await asyncio.gather(*tasks)
+        return state, order
+
+    state, order = asyncio.run(scenario())
+    assert state == (2, {"a": 1, "b": 1}, 2)
+    assert order == ["a0", "b0", "a1", "a2"]
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def scenario():
+        scheduler = FairScheduler(1, {"bulk": 1.0})
+        gate = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot("bulk"):
+                await gate.wait()
+
+        async def wait():
+            async with scheduler.slot("bulk"):
+                pass
+
+        held = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        waiting = scheduler.waiting()
+        gate.set()
+        await held
+        return waiting, scheduler.running
+
+    assert asyncio.run(scenario()) == (0, 0)
@@ -0,0 +1,80 @@
+# File: tests/test_server_config.py
+# 서버 설정 파서/규칙 테스트
+
+import asyncio
+
+from pqc_inspector_server.agents.log_conf import LogConfAgent
+from pqc_inspector_server.scanners.findings import findings_to_result
+from pqc_inspector_server.scanners.server_config import detect_dialect, scan_server_configs
+
+
+def _scan(files):
+    scan = scan_server_configs(files)
+    assert scan is not None
+    return scan
+
+
+def test_detect_dialect():
+    assert detect_dialect("etc/ssh/sshd_config", b"") == "sshd"
+    assert detect_dialect("haproxy.cfg", b"") == "haproxy"
+    assert detect_dialect("site.conf", b"server {\n listen 443 ssl;\n}\n") == "nginx"
+    assert detect_dialect("ssl.conf", b"SSLProtocol all\n") == "apache"
+    assert detect_dialect("notes.txt", b"hello\n") is None
+
+
+def test_nginx_cipher_string_is_expanded():
+    scan = _scan({"nginx.conf": b"http {\n server {\n  listen 443 ssl;\n  ssl_ciphers ECDHE-RSA-AES128-GCM-SHA256;\n }\n}\n"})
+    [finding] = scan.findings
+    assert finding["location"] == "nginx.conf:4"
+    assert set(finding["families"]) == {"ECDH", "RSA"}
+    assert scan.classification()["key_exchange"] == "non-PQC"
+
+
+def test_include_is_resolved_inside_bundle():
+    scan = _scan({
+        "nginx/nginx.conf": b"http {\n include /etc/nginx/conf.d/*.conf;\n}\n",
+        "nginx/conf.d/tls.conf": b"ssl_ecdh_curve X25519MLKEM768;\n",
+    })
+    assert scan.files == ["nginx/nginx.conf", "nginx/conf.d/tls.conf"]
+    assert [finding["status"] for finding in scan.findings] == ["hybrid"]
+
+
+def test_sshd_first_value_wins():
+    scan = _scan({"sshd_config": b"KexAlgorithms mlkem768x25519-sha256\nHostKey /etc/ssh/ssh_host_ed25519_key\n"
+                                 b"KexAlgorithms diffie-hellman-group14-sha256\n"})
+    assert scan.classification() == {"key_exchange": "hybrid-PQC", "signature": "non-PQC"}
+    assert any("무시됨" in note for note in scan.notes)
+
+
+def test_sshd_modifier_appends_to_defaults():
+    scan = _scan({"sshd_config": b"KexAlgorithms -ecdh-*,diffie-hellman-*\nHostKey /etc/ssh/ssh_host_ed25519_key\n"})
+    values = {finding["value"] for finding in scan.findings}
+    assert "mlkem768x25519-sha256" in values
+    assert not any(value.startswith(("ecdh-", "diffie-hellman-")) for value in values)
+
+
+def test_sshd_without_algorithms_uses_openssh_defaults():
+    # 지시어가 없으면 안전한 것이 아니라 OpenSSH 기본값(고전 알고리즘 포함)으로 동작합니다.
+    scan = _scan({"sshd_config": b"Port 22\nPermitRootLogin no\n"})
+    result = findings_to_result(scan.findings, "test")
+    assert result["is_pqc_vulnerable"]
+    assert scan.classification()["key_exchange"] == "mixed (PQC + classical fallback)"
+    assert all(finding["location"] == "sshd_config (미설정 → 기본값)" for finding in scan.findings)
+
+
+def test_tls_without_cipher_directive_uses_server_defaults():
+    for files in (
+        {"nginx.conf": b"http {\n server {\n  listen 443 ssl;\n  ssl_certificate /etc/tls/a.pem;\n }\n}\n"},
+        {"httpd.conf": b"<VirtualHost *:443>\nSSLEngine on\n</VirtualHost>\n"},
+        {"haproxy.cfg": b"frontend web\n  bind :443 ssl crt /etc/tls/a.pem\n"},
+    ):
+        scan = _scan(files)
+        assert findings_to_result(scan.findings, "test")["is_pqc_vulnerable"], files
+        assert scan.classification()["key_exchange"] == "non-PQC"
+
+
+def test_config_without_crypto_is_left_to_llm():
+    agent = LogConfAgent()
+    assert asyncio.run(agent.analyze_server_configs({"nginx.conf": b"http {\n server {\n  listen 80;\n }\n}\n"})) is None
+    result = asyncio.run(agent.analyze_server_configs({"sshd_config": b"Port 22\n"}))
+    assert result["is_pqc_vulnerable"] and "LLM 검증 생략" in result["orchestrator_summary"]
@@ -0,0 +1,93 @@
+# File: tests/test_single_flight.py
+# 같은 파일의 동시 분석 요청 합치기(single-flight) 테스트
+
+import asyncio
+
+import pytest
+
+from pqc_inspector_server.api.schemas import AnalysisResultCreate
+from pqc_inspector_server.orchestrator import controller as controller_module
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+
+_CONTENT = b"import rsa\nkey = rsa.newkeys(2048)\n"
+
+
+class _Pipeline:
+    """분석 파이프라인(_analyze_with_cache) 대신 호출 횟수를 세고, 첫 호출만 release가 설정될 때까지 붙잡아 둡니다."""
+
+    def __init__(self, fail_first: bool = False):
+        self.calls = 0
+        self.fail_first = fail_first
+        self.release = asyncio.Event()
+
+    async def __call__(self, filename, file_content):
+        self.calls += 1
+        if self.calls == 1:
+            await self.release.wait()
+            if self.fail_first:
+                raise RuntimeError("agent failed")
+        return AnalysisResultCreate(file_name=filename, file_type="source_code", is_pqc_vulnerable=True,
+                                    vulnerability_details="RSA", detected_algorithms=["RSA"], confidence_score=0.9)
+
+
+def _controller(pipeline: _Pipeline) -> OrchestratorController:
+    controller = OrchestratorController(api_client=None)
+    controller._analyze_with_cache = pipeline
+    return controller
+
+
+def test_concurrent_uploads_run_one_pipeline():
+    async def run():
+        pipeline = _Pipeline()
+        controller = _controller(pipeline)
+        tasks = [asyncio.create_task(controller.analyze_content(f"upload-{i}/app.py", _CONTENT)) for i in range(20)]
+        await asyncio.sleep(0.01)
+        pipeline.release.set()
+        return pipeline, await asyncio.gather(*tasks)
+
+    pipeline, results = asyncio.run(run())
+    assert pipeline.calls == 1
+    assert [result.file_name for result in results] == [f"upload-{i}/app.py" for i in range(20)]
+    assert all(result.detected_algorithms == ["RSA"] for result in results)
+    assert not controller_module._inflight
+
+
+def test_followers_rerun_when_leader_is_cancelled():
+    async def run():
+        pipeline = _Pipeline()
+        controller = _controller(pipeline)
+        leader = asyncio.create_task(controller.analyze_content("app.py", _CONTENT))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(controller.analyze_content("app.py", _CONTENT)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return pipeline, results
+
+    pipeline, results = asyncio.run(run())
+    # 취소된 선행 분석은 결과가 없으므로 기다리던 요청이 각자 다시 분석합니다.
+    assert pipeline.calls == 3
+    assert all(result.detected_algorithms == ["RSA"] for result in results)
+    assert not controller_module._inflight
+
+
+def test_leader_exception_resolves_future_to_none():
+    async def run():
+        pipeline = _Pipeline(fail_first=True)
+        controller = _controller(pipeline)
+        leader = asyncio.create_task(controller.analyze_content("app.py", _CONTENT))
+        await asyncio.sleep(0)
+        [future] = controller_module._inflight.values()
+        follower = asyncio.create_task(controller.analyze_content("app.py", _CONTENT))
+        await asyncio.sleep(0.01)
+        pipeline.release.set()
+        with pytest.raises(RuntimeError):
+            await leader
+        return pipeline, future, await follower
+
+    pipeline, future, result = asyncio.run(run())
+    assert future.done() and future.result() is None
+    assert pipeline.calls == 2 and result.detected_algorithms == ["RSA"]
+    assert not controller_module._inflight
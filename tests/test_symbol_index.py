@@ -0,0 +1,64 @@
+# File: tests/test_symbol_index.py
+# 프로젝트 심볼 인덱스(파일 간 암호 호출 전파) 테스트
+
+import asyncio
+import io
+import zipfile
+
+from pqc_inspector_server.api.schemas import AnalysisResultCreate
+from pqc_inspector_server.core.config import settings
+from pqc_inspector_server.orchestrator.controller import OrchestratorController
+from pqc_inspector_server.scanners.symbol_index import build_project_index, call_families
+
+_FILES = {
+    "src/utils/crypto.py": b"import rsa\n\ndef secure_send(data, key):\n    return rsa.encrypt(data, key)\n",
+    "app/main.py": b"from utils.crypto import secure_send\n\ndef handler(req):\n    return secure_send(req.body, KEY)\n",
+    "app/other.py": b"def path_traversal(x):\n    return x\n",
+}
+
+
+def test_wrapper_call_is_traced_across_files(tmp_path):
+    index = build_project_index(_FILES, workers=1, cache_dir=str(tmp_path))
+    [finding] = index.findings("app/main.py")
+    assert finding["families"] == ["RSA"] and finding["cross_file"]
+    assert finding["chain"] == ["src/utils/crypto.py:secure_send", "rsa.encrypt() (src/utils/crypto.py:4)"]
+    assert "src/utils/crypto.py" in index.direct_paths
+    assert index.findings("app/other.py") == []
+
+
+def test_index_is_reloaded_from_cache(tmp_path):
+    build_project_index(_FILES, workers=1, cache_dir=str(tmp_path))
+    assert build_project_index(_FILES, workers=1, cache_dir=str(tmp_path)).loaded
+
+
+def test_call_families():
+    assert call_families("getInstance", ["RSA"]) == {"RSA"}
+    assert call_families("path_traversal") == set()
+    assert call_families("ml_dsa_sign") == set()
+
+
+def test_project_members_are_analyzed_concurrently(monkeypatch):
+    # 회귀: 압축 파일의 파일을 하나씩 기다려 분석해 LLM 슬롯이 남아도 호출이 하나씩만 나갔습니다.
+    monkeypatch.setattr(settings, "SYMBOL_INDEX_DIR", "")
+    monkeypatch.setattr(settings, "PROJECT_FILE_CONCURRENCY", 3)
+    names = [f"pkg/m{i}.py" for i in range(8)]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name in names:
+            archive.writestr(name, f"VALUE = {len(name)}\n")
+    running = peak = 0
+
+    async def analysis(filename, file_content):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 if filename.endswith("0.py") else 0)
+        running -= 1
+        return AnalysisResultCreate(file_name=filename, file_type="source_code", is_pqc_vulnerable=False,
+                                    vulnerability_details="", detected_algorithms=[], confidence_score=0.9)
+
+    controller = OrchestratorController(api_client=None)
+    controller.analyze_content = analysis
+    results = asyncio.run(controller.analyze_project("project.zip", buffer.getvalue()))
+    assert [result.file_name for result in results] == names
+    assert peak == 3